@@ -0,0 +1,32 @@
+"""Add district to tourist attractions
+
+Revision ID: 5c2a9e7d41b3
+Revises: 0ef1d64110e5
+Create Date: 2026-10-19 10:12:44.215390
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5c2a9e7d41b3'
+down_revision: str | Sequence[str] | None = '0ef1d64110e5'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tourist_attractions', sa.Column('district', sa.String(), nullable=True))
+    op.create_index(
+        op.f('ix_tourist_attractions_district'), 'tourist_attractions', ['district'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_tourist_attractions_district'), table_name='tourist_attractions')
+    op.drop_column('tourist_attractions', 'district')
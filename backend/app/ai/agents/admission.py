@@ -0,0 +1,225 @@
+"""Process-wide, token-aware admission control for LLM requests.
+
+Concurrent plan generations used to hit the provider all at once and trip
+its RPM/TPM limits, after which nodes failed. Every LLM request (including
+hedged backups) now acquires capacity first:
+- A rolling 60-second window tracks requests and estimated tokens
+  (prompt tokens counted locally + expected completion tokens for the task),
+  acting as a semaphore weighted by tokens against LLM_RATE_LIMIT_TPM and
+  LLM_RATE_LIMIT_RPM.
+- Requests that do not fit wait in a priority queue: interactive review
+  calls go ahead of bulk plan generation, and within a priority order is
+  first come, first served. Only the head of the queue may be admitted, so
+  large requests are not starved by small ones.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+WINDOW_SECONDS = 60.0
+
+# Priorities (lower is served first)
+INTERACTIVE = 0
+BULK = 1
+
+# Review calls are interactive; everything else is bulk generation
+INTERACTIVE_TASKS = frozenset({"parse_feedback", "modify_section", "modify_plan"})
+
+# Expected completion tokens per task (admission estimate)
+DEFAULT_OUTPUT_TOKENS = 1000
+OUTPUT_TOKENS = {
+    "collect_info": 100,
+    "parse_feedback": 150,
+    "narrate_plan": 600,
+    "plan_skeleton": 300,
+    "generate_day": 1200,
+    "generate_plan": 4000,
+    "modify_section": 1200,
+    "modify_plan": 4000,
+}
+
+
+def task_priority(task: str) -> int:
+    """Queue priority of an LLM task."""
+    return INTERACTIVE if task in INTERACTIVE_TASKS else BULK
+
+
+def estimate_tokens(task: str, prompt_tokens: int) -> int:
+    """Prompt tokens plus the task's expected completion tokens."""
+    return prompt_tokens + OUTPUT_TOKENS.get(task, DEFAULT_OUTPUT_TOKENS)
+
+
+@dataclass
+class AdmissionStats:
+    """Queue and wait-time metrics."""
+
+    admitted: int = 0
+    queued: int = 0
+    max_queue_depth: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    wait_seconds_by_priority: dict[int, float] = field(default_factory=dict)
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    sequence: int
+    tokens: int = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+class AdmissionController:
+    """Rolling-window RPM/TPM limiter with a priority wait queue."""
+
+    def __init__(self, rpm: int, tpm: int, window_seconds: float = WINDOW_SECONDS):
+        """Initialize the controller.
+
+        Args:
+            rpm: Requests allowed per window
+            tpm: Estimated tokens allowed per window
+            window_seconds: Window length
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self.window_seconds = window_seconds
+        self.stats = AdmissionStats()
+        self._window: deque[tuple[float, int]] = deque()
+        self._window_tokens = 0
+        self._waiters: list[_Waiter] = []
+        self._sequence = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        """Requests currently waiting."""
+        return sum(1 for w in self._waiters if not w.future.done())
+
+    def _expire(self, now: float) -> None:
+        while self._window and self._window[0][0] <= now - self.window_seconds:
+            _, tokens = self._window.popleft()
+            self._window_tokens -= tokens
+
+    def _fits(self, tokens: int) -> bool:
+        self._expire(time.monotonic())
+        if not self._window:
+            # Oversized requests run alone instead of waiting forever
+            return True
+        return len(self._window) < self.rpm and self._window_tokens + tokens <= self.tpm
+
+    def _admit(self, tokens: int) -> None:
+        self._window.append((time.monotonic(), tokens))
+        self._window_tokens += tokens
+        self.stats.admitted += 1
+
+    def _dispatch(self) -> None:
+        """Admit waiters from the head of the queue while capacity allows."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while self._waiters:
+            head = self._waiters[0]
+            if head.future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._fits(head.tokens):
+                # Retry once the oldest window entry expires
+                delay = self._window[0][0] + self.window_seconds - time.monotonic()
+                self._timer = asyncio.get_running_loop().call_later(max(delay, 0.001), self._dispatch)
+                return
+            heapq.heappop(self._waiters)
+            self._admit(head.tokens)
+            head.future.set_result(None)
+
+    def _record_wait(self, priority: int, seconds: float) -> None:
+        self.stats.total_wait_seconds += seconds
+        self.stats.max_wait_seconds = max(self.stats.max_wait_seconds, seconds)
+        by_priority = self.stats.wait_seconds_by_priority
+        by_priority[priority] = by_priority.get(priority, 0.0) + seconds
+
+    async def acquire(self, tokens: int, priority: int = BULK) -> float:
+        """Wait until a request of ``tokens`` estimated tokens may be sent.
+
+        Args:
+            tokens: Estimated prompt + completion tokens
+            priority: INTERACTIVE or BULK
+
+        Returns:
+            Seconds spent waiting
+        """
+        if not self._waiters and self._fits(tokens):
+            self._admit(tokens)
+            return 0.0
+
+        start = time.monotonic()
+        waiter = _Waiter(priority, next(self._sequence), tokens, asyncio.get_running_loop().create_future())
+        heapq.heappush(self._waiters, waiter)
+        self.stats.queued += 1
+        self.stats.max_queue_depth = max(self.stats.max_queue_depth, self.queue_depth)
+        logger.info(f"🚦 [admission] Queued request ({tokens:,} tokens, priority {priority}, depth {self.queue_depth})")
+
+        try:
+            self._dispatch()
+            await waiter.future
+        except asyncio.CancelledError:
+            # Deadline or hedge loser: give the slot to the next waiter
+            waiter.future.cancel()
+            self._dispatch()
+            raise
+
+        waited = time.monotonic() - start
+        self._record_wait(priority, waited)
+        return waited
+
+    def snapshot(self) -> dict:
+        """Current window usage, queue depth and wait metrics."""
+        self._expire(time.monotonic())
+        return {
+            "window_requests": len(self._window),
+            "window_tokens": self._window_tokens,
+            "queue_depth": self.queue_depth,
+            "admitted": self.stats.admitted,
+            "queued": self.stats.queued,
+            "max_queue_depth": self.stats.max_queue_depth,
+            "total_wait_seconds": round(self.stats.total_wait_seconds, 3),
+            "max_wait_seconds": round(self.stats.max_wait_seconds, 3),
+            "wait_seconds_by_priority": {
+                p: round(s, 3) for p, s in self.stats.wait_seconds_by_priority.items()
+            },
+        }
+
+
+_controller: AdmissionController | None = None
+
+
+def get_admission_controller() -> AdmissionController | None:
+    """Process-wide controller (None if LLM_ADMISSION_ENABLED is off)."""
+    global _controller
+
+    if not settings.LLM_ADMISSION_ENABLED:
+        return None
+    if _controller is None:
+        _controller = AdmissionController(settings.LLM_RATE_LIMIT_RPM, settings.LLM_RATE_LIMIT_TPM)
+    return _controller
+
+
+async def admit(task: str, prompt_tokens: int) -> float:
+    """Acquire capacity for one request of ``task`` (no-op when disabled).
+
+    Returns:
+        Seconds spent waiting
+    """
+    controller = get_admission_controller()
+    if controller is None:
+        return 0.0
+    return await controller.acquire(estimate_tokens(task, prompt_tokens), task_priority(task))
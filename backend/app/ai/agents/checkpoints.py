@@ -0,0 +1,101 @@
+"""Persistent LangGraph checkpoints.
+
+Graphs compiled with this checkpointer keep their state per ``thread_id`` in
+SQLite (CHECKPOINT_DB_PATH), so a conversation with an agent (e.g. a review
+session) continues from its last state instead of being rebuilt from the
+request. With an empty CHECKPOINT_DB_PATH, checkpoints are kept in memory.
+
+Threads do not grow forever: a job's thread is deleted when the job finishes
+(delete_thread), and threads idle for longer than REVIEW_SESSION_TTL_SECONDS
+(abandoned review sessions) are deleted when the database is opened.
+"""
+
+import asyncio
+import logging
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import aiosqlite
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parents[3]
+
+_checkpointer: BaseCheckpointSaver | None = None
+_connection: aiosqlite.Connection | None = None
+_lock = asyncio.Lock()
+
+
+def checkpoint_path() -> Path | None:
+    """Resolved CHECKPOINT_DB_PATH (None: in-memory checkpoints)."""
+    if not settings.CHECKPOINT_DB_PATH:
+        return None
+    path = Path(settings.CHECKPOINT_DB_PATH)
+    return path if path.is_absolute() else BACKEND_DIR / path
+
+
+async def expire_idle_threads(checkpointer: BaseCheckpointSaver, ttl_seconds: float) -> int:
+    """Delete threads whose latest checkpoint is older than ``ttl_seconds``.
+
+    Args:
+        checkpointer: Saver to clean up
+        ttl_seconds: Idle time after which a thread is deleted
+
+    Returns:
+        Number of threads deleted
+    """
+    latest: dict[str, datetime] = {}
+    async for item in checkpointer.alist(None):
+        thread_id = item.config["configurable"]["thread_id"]
+        updated_at = datetime.fromisoformat(item.checkpoint["ts"])
+        latest[thread_id] = max(updated_at, latest.get(thread_id, updated_at))
+
+    cutoff = datetime.now(UTC) - timedelta(seconds=ttl_seconds)
+    idle = [thread_id for thread_id, updated_at in latest.items() if updated_at < cutoff]
+    for thread_id in idle:
+        await checkpointer.adelete_thread(thread_id)
+    return len(idle)
+
+
+async def get_checkpointer() -> BaseCheckpointSaver:
+    """Process-wide checkpointer, opened on first use."""
+    global _checkpointer, _connection
+
+    async with _lock:
+        if _checkpointer is None:
+            path = checkpoint_path()
+            if path is None:
+                _checkpointer = InMemorySaver()
+            else:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                _connection = await aiosqlite.connect(path)
+                saver = AsyncSqliteSaver(_connection)
+                await saver.setup()
+                expired = await expire_idle_threads(saver, settings.REVIEW_SESSION_TTL_SECONDS)
+                if expired:
+                    logger.info(f"🧹 [checkpoints] Deleted {expired} idle thread(s)")
+                _checkpointer = saver
+            logger.info(f"💾 [checkpoints] Using {path or 'in-memory'} checkpoints")
+    return _checkpointer
+
+
+async def delete_thread(thread_id: str) -> None:
+    """Delete every checkpoint of a thread (e.g. once its job has finished)."""
+    checkpointer = await get_checkpointer()
+    await checkpointer.adelete_thread(thread_id)
+
+
+async def close_checkpointer() -> None:
+    """Close the checkpoint database (application shutdown)."""
+    global _checkpointer, _connection
+
+    async with _lock:
+        if _connection is not None:
+            await _connection.close()
+        _checkpointer = None
+        _connection = None
@@ -0,0 +1,110 @@
+"""Hedged LLM requests.
+
+A call that has not finished after the hedge delay (the task's observed p95
+latency) gets an identical backup request. The first valid result wins and
+the other request is cancelled. Because only calls slower than p95 are
+hedged, the extra load is about 5% of calls, while tail latency drops to
+roughly p95 + typical latency instead of the slowest completion.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class HedgeStats:
+    """Per-task hedging counters.
+
+    ``latency_saved_seconds`` is an estimate. When the backup wins, the
+    primary was still running, so the saving is measured against the task's
+    p99 latency before the call (clipped at zero).
+    """
+
+    def __init__(self) -> None:
+        self.calls: dict[str, int] = defaultdict(int)
+        self.hedged: dict[str, int] = defaultdict(int)
+        self.backup_wins: dict[str, int] = defaultdict(int)
+        self.latency_saved_seconds: dict[str, float] = defaultdict(float)
+
+    def snapshot(self) -> dict[str, dict]:
+        """Per-task hedge rate, backup wins and estimated latency saved."""
+        return {
+            task: {
+                "calls": calls,
+                "hedged": self.hedged[task],
+                "hedge_rate": round(self.hedged[task] / calls, 3) if calls else 0.0,
+                "backup_wins": self.backup_wins[task],
+                "latency_saved_seconds": round(self.latency_saved_seconds[task], 3),
+            }
+            for task, calls in self.calls.items()
+        }
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        self.calls.clear()
+        self.hedged.clear()
+        self.backup_wins.clear()
+        self.latency_saved_seconds.clear()
+
+
+hedge_stats = HedgeStats()
+
+
+async def hedged_call[T](
+    call: Callable[[], Awaitable[T]],
+    delay: float | None,
+    task: str = "default",
+    tail_estimate: float | None = None,
+) -> T:
+    """Run ``call``, starting one backup copy if it is still running after ``delay``.
+
+    Args:
+        call: Factory for the request coroutine (called once or twice)
+        delay: Seconds before the backup starts (None: no hedging)
+        task: Name used for metrics
+        tail_estimate: Expected latency of a slow call, for the saved-latency estimate
+
+    Returns:
+        The first successful result
+
+    Raises:
+        Exception: The last error if every request failed
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    hedge_stats.calls[task] += 1
+
+    primary = asyncio.ensure_future(call())
+    if delay is None:
+        return await primary
+
+    pending: set[asyncio.Future] = {primary}
+    try:
+        done, pending = await asyncio.wait(pending, timeout=delay)
+        if done:
+            return primary.result()
+
+        hedge_stats.hedged[task] += 1
+        logger.info(f"🪁 [{task}] No response after {delay:.2f}s, sending backup request")
+        backup = asyncio.ensure_future(call())
+        pending = {primary, backup}
+
+        error: BaseException | None = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is backup:
+                        hedge_stats.backup_wins[task] += 1
+                        if tail_estimate is not None:
+                            elapsed = loop.time() - started
+                            hedge_stats.latency_saved_seconds[task] += max(tail_estimate - elapsed, 0.0)
+                    return future.result()
+                error = future.exception()
+        raise error
+    finally:
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,193 @@
+"""Exact-match cache for deterministic structured LLM calls.
+
+``temperature=0`` structured calls (collect_info, parse_feedback) are often
+repeated verbatim: retries, the same phrasing from different users, tests.
+Responses are cached under a hash of (model, temperature, output schema,
+messages) in an in-memory LRU backed by a SQLite table, both with a TTL, so a
+repeated call is answered locally instead of with a network round trip.
+
+Calls with a non-zero temperature are never cached.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from langchain_core.messages import BaseMessage
+from pydantic import BaseModel
+
+from app.ai.agents.llm_router import invoke_structured, model_for
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parents[3]
+
+
+def cache_key(model: str, temperature: float, schema: type[BaseModel], messages: list[BaseMessage]) -> str:
+    """Hash everything that determines a structured response."""
+    payload = json.dumps(
+        {
+            "model": model,
+            "temperature": temperature,
+            "schema": schema.model_json_schema(),
+            "messages": [[m.type, m.content] for m in messages],
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class LLMResponseCache:
+    """In-memory LRU in front of an optional SQLite table, with per-entry TTL."""
+
+    def __init__(self, path: Path | None = None, max_size: int = 1024, ttl_seconds: float = 86400):
+        """Initialize the cache.
+
+        Args:
+            path: SQLite database file (memory only if None)
+            max_size: Maximum in-memory entries before LRU eviction
+            ttl_seconds: Entry lifetime in both tiers
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_responses "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._db.execute("DELETE FROM llm_responses WHERE expires_at < ?", (time.time(),))
+            self._db.commit()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remember(self, key: str, expires_at: float, value: str) -> None:
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def get(self, key: str) -> str | None:
+        """Return the cached JSON response, or None on a miss or expired entry."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at >= now:
+                    self._entries.move_to_end(key)
+                    self.stats["memory_hits"] += 1
+                    return value
+                del self._entries[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value, expires_at FROM llm_responses WHERE key = ? AND expires_at >= ?",
+                    (key, now),
+                ).fetchone()
+                if row is not None:
+                    self._remember(key, row[1], row[0])
+                    self.stats["disk_hits"] += 1
+                    return row[0]
+
+            self.stats["misses"] += 1
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        """Store a JSON response in both tiers."""
+        expires_at = time.time() + self.ttl_seconds
+        with self._lock:
+            self._remember(key, expires_at, value)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO llm_responses (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, value, expires_at),
+                )
+                self._db.commit()
+
+    def clear(self) -> None:
+        """Remove all entries from both tiers."""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM llm_responses")
+                self._db.commit()
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+_llm_cache: LLMResponseCache | None = None
+
+
+def get_llm_cache() -> LLMResponseCache | None:
+    """Process-wide response cache (None if LLM_CACHE_ENABLED is off)."""
+    global _llm_cache
+
+    if not settings.LLM_CACHE_ENABLED:
+        return None
+    if _llm_cache is None:
+        path = Path(settings.LLM_CACHE_PATH) if settings.LLM_CACHE_PATH else None
+        if path is not None and not path.is_absolute():
+            path = BACKEND_DIR / path
+        _llm_cache = LLMResponseCache(path, settings.LLM_CACHE_SIZE, settings.LLM_CACHE_TTL_SECONDS)
+    return _llm_cache
+
+
+async def cached_structured_call[ModelT: BaseModel](
+    task: str,
+    schema: type[ModelT],
+    messages: list[BaseMessage],
+    temperature: float = 0,
+    cache: LLMResponseCache | None = None,
+    deadline: float | None = None,
+) -> ModelT:
+    """Run ``invoke_structured(task, ...)``, with caching.
+
+    Args:
+        task: Call name (selects the model, see llm_router)
+        schema: Pydantic output model
+        messages: Chat messages
+        temperature: Sampling temperature (only 0 is cached)
+        cache: Cache to use (default: get_llm_cache())
+        deadline: Request deadline in epoch seconds (see llm_router)
+
+    Returns:
+        Parsed ``schema`` instance
+
+    Raises:
+        Exception: Whatever the LLM call raises on a miss (failures are not cached)
+    """
+    if cache is None:
+        cache = get_llm_cache()
+    if cache is None or temperature != 0:
+        return await invoke_structured(task, schema, messages, temperature, deadline)
+
+    key = cache_key(model_for(task), temperature, schema, messages)
+    cached = cache.get(key)
+    if cached is not None:
+        logger.info(f"⚡ [llm_cache] Hit for {schema.__name__}")
+        return schema.model_validate_json(cached)
+
+    result = await invoke_structured(task, schema, messages, temperature, deadline)
+    cache.set(key, result.model_dump_json())
+    return result
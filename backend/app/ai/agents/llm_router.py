@@ -0,0 +1,206 @@
+"""Per-task model routing with latency budgets, hedging and deadlines.
+
+Every structured LLM call names its task (collect_info, generate_plan, ...).
+LLM_TASK_MODELS maps tasks to models: small, fast models handle extraction
+and classification, and the default model is kept for plan generation and
+modification. If a call exceeds its task's budget in
+LLM_TASK_LATENCY_BUDGETS_SECONDS, it is cancelled and retried once on
+OPENAI_FAST_MODEL. Calls are also hedged (see hedging), pass admission
+control (see admission) and never outlive the request deadline carried in
+the graph state.
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from collections import defaultdict, deque
+
+from langchain_core.messages import BaseMessage
+from pydantic import BaseModel
+
+from app.ai.agents.admission import admit
+from app.ai.agents.hedging import hedged_call
+from app.ai.agents.prompt_budget import count_message_tokens
+from app.ai.agents.utils import get_structured_llm
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Latency samples kept per task for percentile estimates
+LATENCY_WINDOW = 200
+
+
+class DeadlineExceeded(TimeoutError):
+    """The request deadline passed before the LLM call finished."""
+
+
+class LatencyStats:
+    """Rolling per-task latency samples and fallback counters."""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._samples: dict[str, deque[float]] = defaultdict(lambda: deque(maxlen=window))
+        self.calls: dict[str, int] = defaultdict(int)
+        self.fallbacks: dict[str, int] = defaultdict(int)
+
+    def record(self, task: str, seconds: float) -> None:
+        """Add a completed call's latency."""
+        self._samples[task].append(seconds)
+        self.calls[task] += 1
+
+    def samples(self, task: str) -> tuple[float, ...]:
+        """Recorded latencies for ``task``, oldest first."""
+        return tuple(self._samples.get(task) or ())
+
+    def percentile(self, task: str, q: float) -> float | None:
+        """Latency percentile (0-100) for ``task`` (None without samples)."""
+        samples = sorted(self._samples.get(task) or ())
+        if not samples:
+            return None
+        index = min(int(len(samples) * q / 100), len(samples) - 1)
+        return samples[index]
+
+    def snapshot(self) -> dict[str, dict]:
+        """Per-task call counts, fallbacks and p50/p95 latency."""
+        return {
+            task: {
+                "calls": self.calls[task],
+                "fallbacks": self.fallbacks[task],
+                "p50_seconds": self.percentile(task, 50),
+                "p95_seconds": self.percentile(task, 95),
+            }
+            for task in self.calls
+        }
+
+    def reset(self) -> None:
+        """Clear all samples and counters."""
+        self._samples.clear()
+        self.calls.clear()
+        self.fallbacks.clear()
+
+
+latency_stats = LatencyStats()
+
+
+def model_for(task: str) -> str:
+    """Model configured for ``task`` (default: OPENAI_MODEL)."""
+    return settings.LLM_TASK_MODELS.get(task) or settings.OPENAI_MODEL
+
+
+def latency_budget(task: str) -> float | None:
+    """Latency budget in seconds for ``task`` (None: unbounded)."""
+    return settings.LLM_TASK_LATENCY_BUDGETS_SECONDS.get(task)
+
+
+def hedge_delay(task: str) -> float | None:
+    """Backup-request delay for ``task``: its observed p95 (None: don't hedge yet)."""
+    if not settings.LLM_HEDGE_ENABLED or len(latency_stats.samples(task)) < settings.LLM_HEDGE_MIN_SAMPLES:
+        return None
+    p95 = latency_stats.percentile(task, settings.LLM_HEDGE_PERCENTILE)
+    return max(p95, settings.LLM_HEDGE_MIN_DELAY_SECONDS)
+
+
+def remaining_seconds(deadline: float | None) -> float | None:
+    """Seconds left until ``deadline`` (epoch seconds; None: no deadline).
+
+    Raises:
+        DeadlineExceeded: If the deadline has passed
+    """
+    if deadline is None:
+        return None
+    remaining = deadline - time.time()
+    if remaining <= 0:
+        raise DeadlineExceeded("Request deadline exceeded")
+    return remaining
+
+
+async def _call_model[ModelT: BaseModel](
+    task: str,
+    schema: type[ModelT],
+    messages: list[BaseMessage],
+    temperature: float,
+    model: str,
+    admitted: bool = False,
+) -> ModelT:
+    runnable = get_structured_llm(schema, temperature, model)
+    prompt_tokens = count_message_tokens(messages)
+    sent = itertools.count()
+
+    async def request() -> ModelT:
+        # The primary is admitted before the hedge timer starts; backups queue on their own
+        if next(sent):
+            await admit(task, prompt_tokens)
+        return await runnable.ainvoke(messages)
+
+    if not admitted:
+        await admit(task, prompt_tokens)
+    return await hedged_call(
+        request,
+        hedge_delay(task),
+        task=task,
+        tail_estimate=latency_stats.percentile(task, 99),
+    )
+
+
+async def invoke_structured[ModelT: BaseModel](
+    task: str,
+    schema: type[ModelT],
+    messages: list[BaseMessage],
+    temperature: float = 0.7,
+    deadline: float | None = None,
+) -> ModelT:
+    """Run a structured LLM call on the task's model within its latency budget.
+
+    Slow calls are hedged (see hedging); a call over its budget falls back to
+    OPENAI_FAST_MODEL if the request deadline leaves time for it. The budget
+    only times the model call: admission queueing is bounded by the deadline
+    alone.
+
+    Args:
+        task: Call name used for routing, budgets and metrics
+        schema: Pydantic output model
+        messages: Chat messages
+        temperature: Sampling temperature
+        deadline: Request deadline in epoch seconds (from the graph state)
+
+    Returns:
+        Parsed ``schema`` instance
+
+    Raises:
+        DeadlineExceeded: If the deadline passes before a result arrives
+        Exception: Whatever the (fallback) LLM call raises
+    """
+    model = model_for(task)
+    budget = latency_budget(task)
+    fallback_model = settings.OPENAI_FAST_MODEL
+    can_fall_back = budget is not None and bool(fallback_model) and fallback_model != model
+
+    try:
+        await asyncio.wait_for(admit(task, count_message_tokens(messages)), timeout=remaining_seconds(deadline))
+    except TimeoutError:
+        raise DeadlineExceeded(f"{task} was not admitted before the request deadline") from None
+
+    remaining = remaining_seconds(deadline)
+    start = time.perf_counter()
+
+    timeouts = [t for t in (budget if can_fall_back else None, remaining) if t is not None]
+    try:
+        result = await asyncio.wait_for(
+            _call_model(task, schema, messages, temperature, model, admitted=True),
+            timeout=min(timeouts) if timeouts else None,
+        )
+    except TimeoutError:
+        if not can_fall_back or (remaining is not None and remaining <= budget):
+            raise DeadlineExceeded(f"{task} did not finish before the request deadline") from None
+        latency_stats.fallbacks[task] += 1
+        logger.warning(f"⏱️ [{task}] {model} exceeded {budget}s budget, falling back to {fallback_model}")
+        try:
+            result = await asyncio.wait_for(
+                _call_model(task, schema, messages, temperature, fallback_model),
+                timeout=remaining_seconds(deadline),
+            )
+        except TimeoutError:
+            raise DeadlineExceeded(f"{task} did not finish before the request deadline") from None
+
+    latency_stats.record(task, time.perf_counter() - start)
+    return result
@@ -0,0 +1,97 @@
+"""Geographic day clustering of retrieved attractions.
+
+Retrieval returns attractions in similarity order, which scatters each day
+across the city. This stage groups candidates into ``num_days`` compact groups
+with balanced k-medoids on a haversine distance matrix, then attaches the
+restaurants found near each group's attractions, producing one venue bucket
+per day for the LLM.
+"""
+
+import logging
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from app.geo.distance import haversine_matrix
+from app.geo.kmedoids import k_medoids
+
+logger = logging.getLogger(__name__)
+
+
+def _day_dates(start_date: str, num_days: int) -> list[str]:
+    """Return YYYY-MM-DD strings for each trip day (empty strings if unknown)."""
+    try:
+        start = datetime.strptime(start_date, "%Y-%m-%d")
+    except (TypeError, ValueError):
+        return [""] * num_days
+    return [(start + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(num_days)]
+
+
+def cluster_attractions_by_day(attractions: list[dict], num_days: int) -> list[list[dict]]:
+    """Split attractions into ``num_days`` geographically compact groups.
+
+    Groups are balanced in size, ordered west to east by their medoid so
+    consecutive days move across the city in one direction, and each group
+    keeps retrieval (similarity) order internally.
+
+    Args:
+        attractions: Attraction dicts with latitude/longitude
+        num_days: Number of trip days
+
+    Returns:
+        List of ``num_days`` attraction lists (some may be empty)
+    """
+    groups: list[list[dict]] = [[] for _ in range(num_days)]
+    located = [a for a in attractions if a.get("latitude") is not None and a.get("longitude") is not None]
+    if not located or num_days <= 0:
+        return groups
+
+    distances = haversine_matrix(
+        [a["latitude"] for a in located],
+        [a["longitude"] for a in located],
+    )
+    labels, medoids = k_medoids(distances, k=num_days, balanced=True)
+
+    # Order clusters west → east for a consistent day-to-day direction
+    order = np.argsort([located[m]["longitude"] for m in medoids], kind="stable")
+    for day_index, cluster in enumerate(order):
+        groups[day_index] = [located[i] for i in np.flatnonzero(labels == cluster)]
+
+    return groups
+
+
+def build_day_buckets(
+    attractions: list[dict],
+    restaurants: list[dict],
+    num_days: int,
+    start_date: str,
+) -> list[dict]:
+    """Build per-day venue buckets for plan generation.
+
+    Args:
+        attractions: Retrieved attractions
+        restaurants: Restaurants with a ``near_attraction`` name
+        num_days: Number of trip days
+        start_date: First day in YYYY-MM-DD format
+
+    Returns:
+        List of {"day", "date", "attractions", "restaurants"} dicts
+    """
+    groups = cluster_attractions_by_day(attractions, num_days)
+    dates = _day_dates(start_date, num_days)
+
+    buckets = []
+    for index, group in enumerate(groups):
+        names = {a["name"] for a in group}
+        buckets.append({
+            "day": index + 1,
+            "date": dates[index],
+            "attractions": group,
+            "restaurants": [r for r in restaurants if r.get("near_attraction") in names],
+        })
+
+    logger.info(
+        "🗺️ Day buckets: "
+        + ", ".join(f"day {b['day']}={[a['name'] for a in b['attractions']]}" for b in buckets)
+    )
+    return buckets
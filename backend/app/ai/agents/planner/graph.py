@@ -2,12 +2,17 @@
 
 import logging
 
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import START, StateGraph
+from langgraph.graph.state import CompiledStateGraph
 
 from app.ai.agents.planner.nodes import (
+    cluster_days,
     collect_info,
     fetch_venues,
     generate_plan,
+    optimize_routes,
+    validate_plan,
 )
 from app.ai.agents.planner.state import PlanningState
 
@@ -18,16 +23,19 @@ def create_planner_graph() -> StateGraph:
     """Create and configure the planner agent graph.
 
     Flow (using Command-based routing):
-    START → collect_info → fetch_venues → generate_plan → END
+    START → collect_info → fetch_venues → cluster_days → generate_plan → [optimize_routes] → validate_plan → END
 
-    Note: Validation step temporarily disabled, but validate_plan node
-    has been updated to use Command-based routing for future use.
+    Validation is rule-based (no LLM call): fixable issues are repaired in
+    place, and only unfixable ones loop back to generate_plan.
 
     All routing is handled by Command objects returned from nodes:
     - collect_info routes to: fetch_venues
-    - fetch_venues routes to: generate_plan
-    - generate_plan routes to: END
-    - validate_plan (disabled) routes to: generate_plan (retry) or END (valid/max attempts)
+    - fetch_venues routes to: cluster_days
+    - cluster_days routes to: generate_plan
+    - generate_plan routes to: optimize_routes ("llm" mode), validate_plan
+      ("scheduled" mode output is already route-ordered) or END (failure)
+    - optimize_routes routes to: validate_plan
+    - validate_plan routes to: generate_plan (unfixable issues) or END (valid/max attempts)
     """
     logger.info("🏗️ Creating planner graph with Command-based routing")
 
@@ -37,9 +45,11 @@ def create_planner_graph() -> StateGraph:
     # Add nodes
     graph.add_node("collect_info", collect_info)
     graph.add_node("fetch_venues", fetch_venues)
+    graph.add_node("cluster_days", cluster_days)
     graph.add_node("generate_plan", generate_plan)
-    # graph.add_node("validate", validate_plan)  # Temporarily disabled
-    logger.debug("📦 Added 3 nodes: collect_info, fetch_venues, generate_plan")
+    graph.add_node("optimize_routes", optimize_routes)
+    graph.add_node("validate_plan", validate_plan)
+    logger.debug("📦 Added 6 nodes: collect_info, fetch_venues, cluster_days, generate_plan, optimize_routes, validate_plan")
 
     # Define entry edge
     graph.add_edge(START, "collect_info")
@@ -48,9 +58,21 @@ def create_planner_graph() -> StateGraph:
     # Note: All other routing is handled by Command objects returned from nodes
     # No need for explicit edges between nodes - Command handles routing
 
-    logger.info("✅ Planner graph created successfully with Command-based routing (validation disabled)")
+    logger.info("✅ Planner graph created successfully with Command-based routing")
     return graph
 
 
+def compile_planner_graph(checkpointer: BaseCheckpointSaver | None = None) -> CompiledStateGraph:
+    """Compile the planner graph, optionally persisting state per thread_id.
+
+    Args:
+        checkpointer: Saver for resumable runs (None: in-request runs)
+
+    Returns:
+        Compiled planner graph
+    """
+    return create_planner_graph().compile(checkpointer=checkpointer)
+
+
 # Compile the graph
-planner_graph = create_planner_graph().compile()
+planner_graph = compile_planner_graph()
@@ -0,0 +1,261 @@
+"""Map-reduce plan generation for long trips.
+
+Instead of one structured TravelPlan call whose output grows with the trip:
+1. Skeleton: one small call for title, summary, day themes and the
+   accommodation; the budget split is computed locally.
+2. Map: one DayItinerary call per day, run concurrently under a semaphore.
+3. Reduce: a deterministic merge that fixes day numbers and dates, sorts
+   activities and recomputes every cost total.
+
+Retries after unfixable validation issues reuse the previous plan's outline
+and regenerate only the days with issues, each told what was wrong.
+
+Wall-clock time is roughly skeleton + one day call, independent of trip length
+(up to the concurrency cap).
+"""
+
+import asyncio
+import logging
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from app.ai.agents.llm_router import invoke_structured
+from app.ai.agents.planner.models import DayItinerary, TripSkeleton
+from app.ai.agents.planner.prompts import (
+    GENERATE_DAY_PROMPT,
+    GENERATE_DAY_SYSTEM_PROMPT,
+    PLAN_SKELETON_PROMPT,
+    PLAN_SKELETON_SYSTEM_PROMPT,
+    RETRY_FEEDBACK_PROMPT,
+)
+from app.ai.agents.planner.scheduler import default_narrative, nightly_rate
+from app.ai.agents.planner.streaming import emit
+from app.ai.agents.prompt_budget import build_venue_context, log_prompt_tokens
+
+logger = logging.getLogger(__name__)
+
+
+def split_budget(budget: int, num_days: int, lodging_total: int) -> list[int]:
+    """Split the non-lodging budget evenly across days (remainder on day 1)."""
+    spending = max(budget - lodging_total, 0)
+    per_day, remainder = divmod(spending, max(num_days, 1))
+    return [per_day + (remainder if i == 0 else 0) for i in range(num_days)]
+
+
+def default_skeleton(num_days: int, day_buckets: list[dict], accommodations: list[dict]) -> dict:
+    """Deterministic skeleton used when the skeleton call fails."""
+    stub = {"total_days": num_days, "itinerary": [{"day": i + 1, "activities": []} for i in range(num_days)]}
+    narrative = default_narrative(stub, day_buckets)
+    return {
+        "title": narrative["title"],
+        "summary": narrative["summary"],
+        "accommodation_name": accommodations[0]["name"] if accommodations else "",
+        "days": [{"day": d["day"], "theme": d["theme"]} for d in narrative["days"]],
+    }
+
+
+def skeleton_from_plan(plan: dict) -> dict:
+    """Skeleton of an already generated plan (reused on retries)."""
+    return {
+        "title": plan.get("title", ""),
+        "summary": plan.get("summary", ""),
+        "accommodation_name": (plan.get("accommodation") or {}).get("name", ""),
+        "days": [{"day": d["day"], "theme": d.get("theme", "")} for d in plan.get("itinerary") or []],
+    }
+
+
+async def generate_skeleton(
+    request: dict,
+    day_buckets: list[dict],
+    accommodations: list[dict],
+    deadline: float | None = None,
+) -> dict:
+    """Generate the trip skeleton (title, summary, themes, accommodation).
+
+    Args:
+        request: {"user_request", "start_date", "end_date", "num_days", "interests"}
+        day_buckets: Per-day venue buckets
+        accommodations: Accommodation candidates
+        deadline: Request deadline in epoch seconds
+
+    Returns:
+        TripSkeleton dict (deterministic fallback on LLM failure)
+    """
+    day_areas = "\n".join(
+        f"Day {b['day']}: {', '.join(a['name'] for a in b.get('attractions', [])) or '자유 일정'}"
+        for b in day_buckets
+    )
+    prompt = PLAN_SKELETON_PROMPT.format(
+        **request,
+        day_areas=day_areas,
+        accommodations=", ".join(a["name"] for a in accommodations) or "none",
+    )
+
+    messages = [SystemMessage(content=PLAN_SKELETON_SYSTEM_PROMPT), HumanMessage(content=prompt)]
+    log_prompt_tokens("generate_plan/skeleton", messages)
+
+    try:
+        skeleton = await invoke_structured(
+            "plan_skeleton", TripSkeleton, messages, temperature=0.5, deadline=deadline
+        )
+        return skeleton.model_dump()
+    except Exception as e:
+        logger.warning(f"⚠️ [map_reduce] Skeleton generation failed, using default outline: {e}")
+        return default_skeleton(request["num_days"], day_buckets, accommodations)
+
+
+async def generate_day(
+    semaphore: asyncio.Semaphore,
+    request: dict,
+    skeleton: dict,
+    bucket: dict,
+    day_budget: int,
+    accommodation: str,
+    deadline: float | None = None,
+    issues: list[str] | None = None,
+) -> dict | None:
+    """Generate one DayItinerary (None on failure).
+
+    ``issues`` are the previous attempt's validation problems for this day.
+    """
+    themes = {d["day"]: d["theme"] for d in skeleton.get("days", [])}
+    prompt = GENERATE_DAY_PROMPT.format(
+        title=skeleton["title"],
+        day=bucket["day"],
+        num_days=request["num_days"],
+        date=bucket["date"],
+        theme=themes.get(bucket["day"], ""),
+        day_budget=day_budget,
+        interests=request["interests"],
+        accommodation=accommodation or "미정",
+        bucket=build_venue_context([bucket], []).day_buckets,
+    )
+    if issues:
+        prompt += RETRY_FEEDBACK_PROMPT.format(issues="\n".join(f"- {i}" for i in issues))
+    messages = [SystemMessage(content=GENERATE_DAY_SYSTEM_PROMPT), HumanMessage(content=prompt)]
+    log_prompt_tokens(f"generate_plan/day {bucket['day']}", messages)
+
+    async with semaphore:
+        try:
+            day = await invoke_structured(
+                "generate_day", DayItinerary, messages, temperature=0.5, deadline=deadline
+            )
+            result = day.model_dump()
+            emit("day", {**result, "day": bucket["day"], "date": bucket["date"]})
+            return result
+        except Exception as e:
+            logger.error(f"❌ [map_reduce] Day {bucket['day']} generation failed: {e}")
+            return None
+
+
+def merge_days(
+    skeleton: dict,
+    days: list[dict | None],
+    day_buckets: list[dict],
+    accommodation: dict,
+) -> dict:
+    """Deterministically merge per-day results into a TravelPlan dict.
+
+    Day numbers, dates and themes come from the buckets/skeleton rather than
+    the per-day outputs; activities are sorted by time and every cost total is
+    recomputed. Failed days are kept as empty days for validate_plan to flag.
+
+    Args:
+        skeleton: TripSkeleton dict
+        days: DayItinerary dicts (or None) in bucket order
+        day_buckets: Per-day venue buckets
+        accommodation: AccommodationInfo dict
+
+    Returns:
+        TravelPlan dict
+    """
+    themes = {d["day"]: d["theme"] for d in skeleton.get("days", [])}
+    itinerary = []
+    for bucket, day in zip(day_buckets, days, strict=True):
+        activities = sorted((day or {}).get("activities", []), key=lambda a: a.get("time", ""))
+        itinerary.append({
+            "day": bucket["day"],
+            "date": bucket["date"],
+            "theme": themes.get(bucket["day"]) or (day or {}).get("theme", ""),
+            "activities": activities,
+            "daily_cost": sum(int(a.get("estimated_cost", 0)) for a in activities),
+        })
+
+    lodging = accommodation["cost_per_night"] * accommodation["total_nights"]
+    return {
+        "title": skeleton["title"],
+        "total_days": len(itinerary),
+        "total_cost": sum(d["daily_cost"] for d in itinerary) + lodging,
+        "itinerary": itinerary,
+        "accommodation": accommodation,
+        "summary": skeleton["summary"],
+    }
+
+
+async def generate_plan_map_reduce(
+    request: dict,
+    day_buckets: list[dict],
+    accommodations: list[dict],
+    budget: int,
+    max_concurrency: int,
+    deadline: float | None = None,
+    previous_plan: dict | None = None,
+    day_issues: dict[int, list[str]] | None = None,
+) -> dict:
+    """Generate a full plan with a skeleton call and concurrent per-day calls.
+
+    Args:
+        request: {"user_request", "start_date", "end_date", "num_days", "interests"}
+        day_buckets: Per-day venue buckets (one per day)
+        accommodations: Accommodation candidates
+        budget: Total budget in KRW
+        max_concurrency: Maximum concurrent per-day calls
+        deadline: Request deadline in epoch seconds
+        previous_plan: Plan of the failed attempt (retries only)
+        day_issues: Unfixable issues per day number of ``previous_plan``;
+            only these days are regenerated, the others are kept
+
+    Returns:
+        TravelPlan dict
+    """
+    num_days = request["num_days"]
+    retry = previous_plan is not None and bool(day_issues)
+    if retry:
+        skeleton = skeleton_from_plan(previous_plan)
+    else:
+        skeleton = await generate_skeleton(request, day_buckets, accommodations, deadline)
+
+    by_name = {a["name"]: a for a in accommodations}
+    chosen = by_name.get(skeleton.get("accommodation_name")) or (accommodations[0] if accommodations else None)
+
+    nights = max(num_days - 1, 0)
+    accommodation = {
+        "name": chosen["name"] if chosen else "숙소 미정",
+        "cost_per_night": nightly_rate(chosen, nights),
+        "total_nights": nights,
+    }
+    day_budgets = split_budget(budget, num_days, accommodation["cost_per_night"] * nights)
+
+    kept = {d["day"]: d for d in previous_plan["itinerary"]} if retry else {}
+    kept = {number: day for number, day in kept.items() if number not in day_issues}
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def day_result(bucket: dict, day_budget: int) -> dict | None:
+        if bucket["day"] in kept:
+            return kept[bucket["day"]]
+        issues = (day_issues or {}).get(bucket["day"])
+        return await generate_day(semaphore, request, skeleton, bucket, day_budget, chosen, deadline, issues=issues)
+
+    days = await asyncio.gather(*(
+        day_result(bucket, day_budget)
+        for bucket, day_budget in zip(day_buckets, day_budgets, strict=True)
+    ))
+
+    generated = num_days - len(kept)
+    failed = sum(day is None for day in days)
+    logger.info(
+        f"✅ [map_reduce] Generated {generated - failed}/{generated} days, kept {len(kept)} "
+        f"(concurrency {max_concurrency})"
+    )
+    return merge_days(skeleton, days, day_buckets, accommodation)
@@ -102,20 +102,60 @@ class TravelPlan(BaseModel):
     summary: str = Field(description="Brief summary of the plan")
 
 
-class ValidationResult(BaseModel):
-    """Result of travel plan validation.
+class DayNarrative(BaseModel):
+    """Prose for one scheduled day.
 
-    Example (valid):
-        is_valid: True
-        errors: []
-
-    Example (invalid):
-        is_valid: False
-        errors: ['Budget exceeded by 30%', 'Day 2 has time conflicts']
+    Example:
+        day: 1
+        theme: '궁궐과 한옥마을'
+        notes: ['한복을 입으면 입장료 무료', '북촌 골목 산책 추천']
     """
 
-    is_valid: bool = Field(description="Whether the plan is valid")
-    errors: list[str] = Field(
+    day: int = Field(description="Day number (1-indexed)", gt=0)
+    theme: str = Field(description="Short theme for the day")
+    notes: list[str] = Field(
         default_factory=list,
-        description="List of critical error messages if plan is invalid"
+        description="One short tip per activity, in the same order as the schedule"
     )
+
+
+class PlanNarrative(BaseModel):
+    """Prose layer written by the LLM on top of a deterministic schedule.
+
+    Example:
+        title: '서울 역사 탐방 3일 여행'
+        summary: '궁궐과 박물관을 중심으로 서울의 역사를 체험하는 여행'
+        days: [DayNarrative(...), DayNarrative(...)]
+    """
+
+    title: str = Field(description="Title of the travel plan")
+    summary: str = Field(description="Brief summary of the plan")
+    days: list[DayNarrative] = Field(description="Theme and notes for each day")
+
+
+class DaySkeleton(BaseModel):
+    """Outline entry for one day of a map-reduce generated trip.
+
+    Example:
+        day: 2
+        theme: '남산과 용산'
+    """
+
+    day: int = Field(description="Day number (1-indexed)", gt=0)
+    theme: str = Field(description="Short theme for the day")
+
+
+class TripSkeleton(BaseModel):
+    """Trip outline generated before per-day itineraries.
+
+    Example:
+        title: '서울 역사 탐방 5일 여행'
+        summary: '궁궐, 박물관, 한강을 아우르는 여행'
+        accommodation_name: '서울 호텔'
+        days: [DaySkeleton(...), DaySkeleton(...)]
+    """
+
+    title: str = Field(description="Title of the travel plan")
+    summary: str = Field(description="Brief summary of the plan")
+    accommodation_name: str = Field(default="", description="Chosen accommodation name")
+    days: list[DaySkeleton] = Field(description="Theme for each day")
@@ -1,38 +1,78 @@
 """Planner agent node functions."""
 
-import json
 import logging
+from datetime import datetime
 from pathlib import Path
 from typing import Literal
 
 from langchain_core.messages import HumanMessage, SystemMessage
 from langgraph.types import Command
 
+from app.ai.agents.llm_cache import cached_structured_call
+from app.ai.agents.llm_router import invoke_structured
+from app.ai.agents.planner.day_clustering import build_day_buckets
+from app.ai.agents.planner.map_reduce import generate_plan_map_reduce
 from app.ai.agents.planner.models import (
+    PlanNarrative,
     TravelInfoExtraction,
     TravelPlan,
-    ValidationResult,
 )
 from app.ai.agents.planner.prompts import (
     COLLECT_INFO_PROMPT,
+    COLLECT_INFO_SYSTEM_PROMPT,
     GENERATE_PLAN_PROMPT,
-    VALIDATE_PLAN_PROMPT,
+    GENERATE_PLAN_SYSTEM_PROMPT,
+    NARRATE_PLAN_PROMPT,
+    NARRATE_PLAN_SYSTEM_PROMPT,
+    RETRY_FEEDBACK_PROMPT,
 )
+from app.ai.agents.planner.request_parser import parse_travel_request, seoul_today
+from app.ai.agents.planner.route_optimizer import VenueLocator, optimize_itinerary
+from app.ai.agents.planner.scheduler import apply_narrative, schedule_outline, schedule_trip
 from app.ai.agents.planner.state import PlanningState
-from app.ai.agents.utils import get_llm
+from app.ai.agents.planner.streaming import attraction_summary, emit
+from app.ai.agents.planner.validator import PlanIssue, validate_and_repair
+from app.ai.agents.prompt_budget import build_venue_context, log_prompt_tokens
+from app.config import settings
+from app.transit import travel_minutes
 
 logger = logging.getLogger(__name__)
 
 # Get absolute path to chroma_db directory
 CHROMA_DB_PATH = str(Path(__file__).parent.parent.parent.parent.parent / "chroma_db")
 
+# Total generate_plan attempts before unfixable validation issues fail the request
+MAX_PLAN_ATTEMPTS = 3
+
+# Issues a scheduled plan inherits from its venue data (real prices, the size
+# of the restaurant pool); an LLM rewrite could only hide them by inventing
+# prices or venues, so the scheduled plan is kept instead of retried
+SCHEDULER_DATA_ISSUES = frozenset({"budget_exceeded", "missing_meal"})
+
+# Candidate attractions retrieved per trip day before geographic clustering
+# (the scheduler drops candidates that do not fit the day)
+ATTRACTIONS_PER_DAY = 4
+
+
+def _count_trip_days(dates: tuple[str, str] | None) -> int:
+    """Count trip days from (start_date, end_date), defaulting to 1."""
+    if not dates or len(dates) != 2:
+        return 1
+    try:
+        start = datetime.strptime(dates[0], "%Y-%m-%d")
+        end = datetime.strptime(dates[1], "%Y-%m-%d")
+        return max((end - start).days + 1, 1)
+    except Exception:
+        return 1
+
 
 async def collect_info(state: PlanningState) -> Command[Literal["fetch_venues"]]:
     """Parse user request and extract structured information.
 
     Priority:
     1. Use structured data already in state (dates, budget, interests)
-    2. Only use LLM parsing if data is missing from state
+    2. Parse missing fields from user_request with rules (request_parser)
+    3. Only use LLM parsing if fields are still missing
     """
     logger.info("🔵 [collect_info] Node started")
     logger.debug(f"📥 Input state: dates={state.get('dates')}, budget={state.get('budget')}, interests={state.get('interests')}")
@@ -52,7 +92,16 @@ async def collect_info(state: PlanningState) -> Command[Literal["fetch_venues"]]
         result["interests"] = state["interests"]
         logger.info(f"✅ [collect_info] Using provided interests: {result['interests']}")
 
-    # Priority 2: Only parse from user_request if data is still missing
+    # Priority 2: Rule-based parsing of user_request (no LLM round trip)
+    if settings.COLLECT_INFO_FAST_PATH_ENABLED and len(result) < 3:
+        parsed = parse_travel_request(state["user_request"])
+        for field in ("dates", "budget", "interests"):
+            value = getattr(parsed, field)
+            if field not in result and value:
+                result[field] = value
+                logger.info(f"⚡ [collect_info] Parsed {field} without LLM: {value}")
+
+    # Priority 3: Only use the LLM if data is still missing
     missing_fields = []
     if "dates" not in result:
         missing_fields.append("dates")
@@ -64,17 +113,23 @@ async def collect_info(state: PlanningState) -> Command[Literal["fetch_venues"]]
     if missing_fields:
         logger.info(f"🔍 [collect_info] Parsing missing fields from user_request: {missing_fields}")
 
-        llm = get_llm(temperature=0)
-        structured_llm = llm.with_structured_output(TravelInfoExtraction)
-        prompt = COLLECT_INFO_PROMPT.format(user_request=state["user_request"])
+        today = seoul_today()
+        prompt = COLLECT_INFO_PROMPT.format(
+            today=today.isoformat(), weekday=today.strftime("%A"), user_request=state["user_request"]
+        )
 
         messages = [
-            SystemMessage(content="You are a travel planning assistant."),
+            SystemMessage(content=COLLECT_INFO_SYSTEM_PROMPT),
             HumanMessage(content=prompt),
         ]
 
+        log_prompt_tokens("collect_info", messages)
+
         try:
-            parsed_data: TravelInfoExtraction = await structured_llm.ainvoke(messages)
+            # Deterministic call: repeated requests are answered from the response cache
+            parsed_data = await cached_structured_call(
+                "collect_info", TravelInfoExtraction, messages, deadline=state.get("deadline")
+            )
             logger.debug(f"🤖 LLM parsed: {parsed_data.model_dump()}")
 
             # Fill in missing fields only
@@ -102,14 +157,13 @@ async def collect_info(state: PlanningState) -> Command[Literal["fetch_venues"]]
     )
 
 
-async def fetch_venues(state: PlanningState) -> Command[Literal["generate_plan"]]:
+async def fetch_venues(state: PlanningState) -> Command[Literal["cluster_days"]]:
     """Fetch tourist attractions using ChromaDB and search nearby venues via Naver API."""
     logger.info("🔵 [fetch_venues] Node started")
     logger.debug(f"📥 Input state: interests={state.get('interests')}, budget={state.get('budget')}, dates={state.get('dates')}")
 
-    from datetime import datetime
-
     from app.database import SessionLocal
+    from app.geo.districts import resolve_district
     from app.naver.client import NaverLocalClient
     from app.tourist_attraction.models import TouristAttraction
     from app.tourist_attraction.vector_store import TouristAttractionVectorStore
@@ -118,15 +172,7 @@ async def fetch_venues(state: PlanningState) -> Command[Literal["generate_plan"]
 
     try:
         # Step 1: Calculate number of days
-        dates = state.get("dates", ("", ""))
-        num_days = 1
-        if dates and len(dates) == 2:
-            try:
-                start_date = datetime.strptime(dates[0], "%Y-%m-%d")
-                end_date = datetime.strptime(dates[1], "%Y-%m-%d")
-                num_days = (end_date - start_date).days + 1
-            except Exception:
-                pass
+        num_days = _count_trip_days(state.get("dates"))
 
         logger.info(f"📅 [fetch_venues] Trip duration: {num_days} days")
 
@@ -137,10 +183,10 @@ async def fetch_venues(state: PlanningState) -> Command[Literal["generate_plan"]
         logger.info(f"🔍 [fetch_venues] Searching attractions with ChromaDB: '{query}'")
         vector_store = TouristAttractionVectorStore(persist_directory=CHROMA_DB_PATH)
 
-        # Search for attractions (1 per day)
+        # Search for candidate attractions; cluster_days groups them by day
         attraction_results = vector_store.search_attractions(
             query=query,
-            n_results=num_days,  # 하루당 관광지 1개
+            n_results=num_days * ATTRACTIONS_PER_DAY,
         )
 
         # Get full attraction data from DB
@@ -152,12 +198,16 @@ async def fetch_venues(state: PlanningState) -> Command[Literal["generate_plan"]
             ).first()
 
             if attraction:
+                address = attraction.road_address or attraction.jibun_address or ""
                 selected_attractions.append({
                     "id": attraction.id,
                     "name": attraction.name,
                     "category": attraction.category,
                     "description": attraction.introduction or "정보 없음",
-                    "address": attraction.road_address or attraction.jibun_address or "",
+                    "address": address,
+                    "district": attraction.district or resolve_district(
+                        attraction.latitude, attraction.longitude, address
+                    ),
                     "phone": attraction.phone or "",
                     "latitude": attraction.latitude,
                     "longitude": attraction.longitude,
@@ -167,6 +217,7 @@ async def fetch_venues(state: PlanningState) -> Command[Literal["generate_plan"]
         logger.info(f"✅ [fetch_venues] Selected {len(selected_attractions)} attractions via ChromaDB")
         for idx, attr in enumerate(selected_attractions, 1):
             logger.info(f"   {idx}. {attr['name']} (similarity: {attr['similarity_score']})")
+        emit("attractions", attraction_summary(selected_attractions))
 
         # Step 3: Search nearby restaurants and accommodations for each attraction
         all_restaurants = []
@@ -177,16 +228,18 @@ async def fetch_venues(state: PlanningState) -> Command[Literal["generate_plan"]
 
             for attraction in selected_attractions:
                 attr_name = attraction["name"]
-                # Extract location keyword from address
-                address = attraction.get("address", "")
-                location_keyword = address.split()[1] if len(address.split()) > 1 else "서울"
+                # District is precomputed offline (see app.geo.districts)
+                location_keyword = attraction.get("district") or "서울"
 
                 # Search nearby restaurants
                 logger.info(f"🔍 [fetch_venues] Searching restaurants near {attr_name} ({location_keyword})")
-                restaurant_results = await naver_client.search_local(
-                    query=f"{location_keyword} 맛집",
-                    display=2,  # 관광지당 2개
-                    sort="random",
+                restaurant_results = await naver_client.search_nearby_restaurants(
+                    latitude=attraction["latitude"],
+                    longitude=attraction["longitude"],
+                    query="맛집",
+                    location_keyword=location_keyword,
+                    radius_km=1.0,  # 도보 거리
+                    limit=2,  # 관광지당 2개
                 )
 
                 for item in restaurant_results:
@@ -199,6 +252,7 @@ async def fetch_venues(state: PlanningState) -> Command[Literal["generate_plan"]
                         "longitude": item.get("longitude"),
                         "description": f"카테고리: {item.get('category', '정보없음')}",
                         "near_attraction": attr_name,
+                        "distance_km": item.get("distance_km"),
                     })
 
             logger.info(f"✅ [fetch_venues] Found {len(all_restaurants)} restaurants via Naver API")
@@ -206,14 +260,16 @@ async def fetch_venues(state: PlanningState) -> Command[Literal["generate_plan"]
             # Search accommodations once (not per attraction)
             if selected_attractions:
                 first_attr = selected_attractions[0]
-                address = first_attr.get("address", "")
-                location_keyword = address.split()[1] if len(address.split()) > 1 else "서울"
+                location_keyword = first_attr.get("district") or "서울"
 
                 logger.info(f"🔍 [fetch_venues] Searching accommodations in {location_keyword}")
-                accommodation_results = await naver_client.search_local(
-                    query=f"{location_keyword} 호텔 숙박",
-                    display=5,
-                    sort="random",
+                accommodation_results = await naver_client.search_nearby_accommodations(
+                    latitude=first_attr["latitude"],
+                    longitude=first_attr["longitude"],
+                    query="호텔 숙박",
+                    location_keyword=location_keyword,
+                    radius_km=2.0,
+                    limit=5,
                 )
 
                 for item in accommodation_results:
@@ -225,6 +281,7 @@ async def fetch_venues(state: PlanningState) -> Command[Literal["generate_plan"]
                         "latitude": item.get("latitude"),
                         "longitude": item.get("longitude"),
                         "description": f"카테고리: {item.get('category', '정보없음')}",
+                        "distance_km": item.get("distance_km"),
                     })
 
                 logger.info(f"✅ [fetch_venues] Found {len(all_accommodations)} accommodations via Naver API")
@@ -232,66 +289,187 @@ async def fetch_venues(state: PlanningState) -> Command[Literal["generate_plan"]
         except Exception as e:
             logger.warning(f"⚠️ [fetch_venues] Naver API error (continuing with attractions only): {e}")
 
-        # Route to generate_plan with fetched venue data
+        # Route to cluster_days with fetched venue data
         return Command(
             update={
                 "attractions": selected_attractions,
                 "restaurants": all_restaurants,
                 "accommodations": all_accommodations,
             },
-            goto="generate_plan"
+            goto="cluster_days"
         )
 
     except Exception as e:
         logger.error(f"❌ [fetch_venues] Error during venue search: {e}", exc_info=True)
-        # On error, still proceed to generate_plan with empty data
+        # On error, still proceed to cluster_days with empty data
         return Command(
             update={
                 "attractions": [],
                 "restaurants": [],
                 "accommodations": [],
             },
-            goto="generate_plan"
+            goto="cluster_days"
         )
     finally:
         db.close()
 
 
-async def generate_plan(state: PlanningState) -> Command[Literal["__end__"]]:
-    """Generate travel plan using LLM."""
+async def cluster_days(state: PlanningState) -> Command[Literal["generate_plan"]]:
+    """Group retrieved attractions into geographically compact per-day buckets."""
+    logger.info("🔵 [cluster_days] Node started")
+
+    dates = state.get("dates") or ("", "")
+    num_days = _count_trip_days(dates)
+
+    day_buckets = build_day_buckets(
+        attractions=state.get("attractions") or [],
+        restaurants=state.get("restaurants") or [],
+        num_days=num_days,
+        start_date=dates[0] if dates else "",
+    )
+
+    logger.info(f"✅ [cluster_days] Built {len(day_buckets)} day buckets")
+    return Command(
+        update={"day_buckets": day_buckets},
+        goto="generate_plan"
+    )
+
+
+async def _narrate_plan(state: PlanningState, plan: dict, interests: list[str]) -> dict:
+    """Ask the LLM for title/summary/themes/notes only; fall back to defaults on error."""
+    prompt = NARRATE_PLAN_PROMPT.format(
+        user_request=state.get("user_request") or "서울 여행",
+        interests=", ".join(interests) if interests else "general sightseeing",
+        schedule=schedule_outline(plan),
+    )
+    messages = [
+        SystemMessage(content=NARRATE_PLAN_SYSTEM_PROMPT),
+        HumanMessage(content=prompt),
+    ]
+    log_prompt_tokens("generate_plan", messages)
+
+    try:
+        narrative = await invoke_structured(
+            "narrate_plan", PlanNarrative, messages, temperature=0.5, deadline=state.get("deadline")
+        )
+        return apply_narrative(plan, narrative.model_dump())
+    except Exception as e:
+        logger.warning(f"⚠️ [generate_plan] Narrative generation failed, keeping default prose: {e}")
+        return plan
+
+
+async def generate_plan(state: PlanningState) -> Command[Literal["optimize_routes", "validate_plan", "__end__"]]:
+    """Generate travel plan.
+
+    In "scheduled" mode (default) the itinerary is built deterministically by
+    the scheduler and the LLM only writes prose; in "llm" mode the LLM writes
+    the whole plan and optimize_routes reorders it afterwards. In "llm" mode,
+    trips of PLANNER_MAP_REDUCE_MIN_DAYS or more are generated per day in
+    parallel (see map_reduce).
+
+    Retries after unfixable validation issues use the LLM path (rescheduling
+    the same venues would give the same result) and receive the issues as
+    feedback; map-reduce retries regenerate only the days with issues.
+    validate_plan does not retry scheduled plans for SCHEDULER_DATA_ISSUES.
+    """
     from langgraph.graph import END
 
     attempt = state.get("attempts", 0) + 1
-    logger.info(f"🔵 [generate_plan] Node started (attempt {attempt})")
+    validation_issues = state.get("validation_issues") or []
+    mode = "llm" if validation_issues else settings.PLANNER_GENERATION_MODE
+    logger.info(f"🔵 [generate_plan] Node started (attempt {attempt}, mode={mode})")
     logger.debug(f"📥 Input state: dates={state.get('dates')}, budget={state.get('budget')}, interests={state.get('interests')}")
     logger.debug(f"📥 Venue counts: attractions={len(state.get('attractions', []))}, restaurants={len(state.get('restaurants', []))}, accommodations={len(state.get('accommodations', []))}")
 
-    llm = get_llm(temperature=0.5)
-    structured_llm = llm.with_structured_output(TravelPlan)
-
     # Safely get state values with defaults to prevent format errors
     # Use 'or' to handle both missing keys and None values
     dates = state.get("dates") or ("", "")
     budget = state.get("budget") or 0
     interests = state.get("interests") or []
-    attractions = state.get("attractions") or []
-    restaurants = state.get("restaurants") or []
     accommodations = state.get("accommodations") or []
 
     # Calculate trip details
-    from datetime import datetime
     start_date = dates[0] if dates and len(dates) > 0 else ""
     end_date = dates[1] if dates and len(dates) > 1 else ""
+    num_days = _count_trip_days(dates)
 
-    num_days = 1
-    if start_date and end_date:
+    # Per-day venue buckets from cluster_days (rebuilt if the node was skipped)
+    day_buckets = state.get("day_buckets") or build_day_buckets(
+        attractions=state.get("attractions") or [],
+        restaurants=state.get("restaurants") or [],
+        num_days=num_days,
+        start_date=start_date,
+    )
+
+    if mode == "scheduled":
         try:
-            start = datetime.strptime(start_date, "%Y-%m-%d")
-            end = datetime.strptime(end_date, "%Y-%m-%d")
-            num_days = (end - start).days + 1
-        except Exception:
-            pass
+            plan = schedule_trip(day_buckets, accommodations, budget, num_days, start_date)
+            for day in plan["itinerary"]:
+                emit("day", day)
+            plan = await _narrate_plan(state, plan, interests)
+            travel_plan = TravelPlan.model_validate(plan)
+            logger.info(f"✅ [generate_plan] Scheduled plan with {len(travel_plan.itinerary)} days")
+
+            # Scheduler output is already route-ordered and respects opening hours
+            return Command(
+                update={
+                    "travel_plan": travel_plan.model_dump(),
+                    "plan_mode": mode,
+                    "attempts": attempt,
+                },
+                goto="validate_plan"
+            )
+        except Exception as e:
+            logger.error(f"❌ [generate_plan] Failed to schedule plan: {e}", exc_info=True)
+            return Command(
+                update={
+                    "errors": ["Failed to generate valid plan structure."],
+                    "attempts": attempt,
+                },
+                goto=END
+            )
 
+    if num_days >= settings.PLANNER_MAP_REDUCE_MIN_DAYS:
+        # Long trips: skeleton + concurrent per-day calls keep latency flat
+        try:
+            plan = await generate_plan_map_reduce(
+                request={
+                    "user_request": state.get("user_request") or "서울 여행",
+                    "start_date": start_date,
+                    "end_date": end_date,
+                    "num_days": num_days,
+                    "interests": ", ".join(interests) if interests else "general sightseeing",
+                },
+                day_buckets=day_buckets,
+                accommodations=accommodations,
+                budget=budget,
+                max_concurrency=settings.PLANNER_MAP_REDUCE_CONCURRENCY,
+                deadline=state.get("deadline"),
+                previous_plan=state.get("travel_plan") if validation_issues else None,
+                day_issues=state.get("day_issues") if validation_issues else None,
+            )
+            travel_plan = TravelPlan.model_validate(plan)
+            logger.info(f"✅ [generate_plan] Map-reduce generated plan with {len(travel_plan.itinerary)} days")
+            return Command(
+                update={
+                    "travel_plan": travel_plan.model_dump(),
+                    "plan_mode": mode,
+                    "attempts": attempt,
+                },
+                goto="optimize_routes"
+            )
+        except Exception as e:
+            logger.error(f"❌ [generate_plan] Map-reduce generation failed: {e}", exc_info=True)
+            return Command(
+                update={
+                    "errors": ["Failed to generate valid plan structure."],
+                    "attempts": attempt,
+                },
+                goto=END
+            )
+
+    # Compact, token-budgeted venue lists instead of the raw retrieval dicts
+    venue_context = build_venue_context(day_buckets, accommodations)
     prompt = GENERATE_PLAN_PROMPT.format(
         user_request=state.get("user_request") or "서울 여행",
         start_date=start_date,
@@ -299,27 +477,32 @@ async def generate_plan(state: PlanningState) -> Command[Literal["__end__"]]:
         num_days=num_days,
         budget=budget,
         interests=", ".join(interests) if interests else "general sightseeing",
-        attractions=json.dumps(attractions, ensure_ascii=False),
-        restaurants=json.dumps(restaurants, ensure_ascii=False),
-        accommodations=json.dumps(accommodations, ensure_ascii=False),
+        day_buckets=venue_context.day_buckets,
+        accommodations=venue_context.accommodations,
     )
+    if validation_issues:
+        prompt += RETRY_FEEDBACK_PROMPT.format(issues="\n".join(f"- {i}" for i in validation_issues))
 
     messages = [
-        SystemMessage(content="You are an expert Seoul travel planner."),
+        SystemMessage(content=GENERATE_PLAN_SYSTEM_PROMPT),
         HumanMessage(content=prompt),
     ]
+    log_prompt_tokens("generate_plan", messages)
 
     try:
-        travel_plan: TravelPlan = await structured_llm.ainvoke(messages)
+        travel_plan = await invoke_structured(
+            "generate_plan", TravelPlan, messages, temperature=0.5, deadline=state.get("deadline")
+        )
         logger.info(f"✅ [generate_plan] Successfully generated plan with {len(travel_plan.itinerary)} days")
 
-        # Route to END with completed plan (convert to dict for state)
+        # Route to route optimization with completed plan (convert to dict for state)
         return Command(
             update={
                 "travel_plan": travel_plan.model_dump(),
+                "plan_mode": mode,
                 "attempts": attempt,
             },
-            goto=END
+            goto="optimize_routes"
         )
     except Exception as e:
         logger.error(f"❌ [generate_plan] Failed to generate plan: {e}")
@@ -333,10 +516,110 @@ async def generate_plan(state: PlanningState) -> Command[Literal["__end__"]]:
         )
 
 
-async def validate_plan(state: PlanningState) -> Command[Literal["generate_plan", "__end__"]]:
-    """Validate generated plan for logical consistency.
+async def optimize_routes(state: PlanningState) -> Command[Literal["validate_plan"]]:
+    """Reorder each day's activities to shorten travel, keeping meal anchors fixed."""
+    logger.info("🔵 [optimize_routes] Node started")
+
+    venues = [
+        *(state.get("attractions") or []),
+        *(state.get("restaurants") or []),
+        *(state.get("accommodations") or []),
+    ]
+    travel_plan, route_stats = optimize_itinerary(state["travel_plan"], venues)
+
+    logger.info(
+        f"✅ [optimize_routes] Route distance {route_stats['distance_before_km']}km → "
+        f"{route_stats['distance_after_km']}km (saved {route_stats['saved_km']}km)"
+    )
+    return Command(
+        update={"travel_plan": travel_plan, "route_stats": route_stats},
+        goto="validate_plan"
+    )
+
+
+def _plan_travel_minutes(plan: dict, locator: VenueLocator) -> dict[tuple[int, int], int]:
+    """Travel minutes between consecutive activities, keyed by (day position, activity index).
+
+    Venues are resolved like the route optimizer does and timed from the
+    precomputed travel time matrix (distance estimate for venues outside it),
+    so this makes no API calls.
+    """
+    minutes = {}
+    for number, day in enumerate(plan.get("itinerary", []), start=1):
+        venues = [locator.find(activity.get("venue_name", "")) for activity in day.get("activities") or []]
+        for index in range(1, len(venues)):
+            if venues[index - 1] is None or venues[index] is None:
+                continue
+            leg = travel_minutes(venues[index - 1], venues[index])
+            if leg is not None:
+                minutes[(number, index)] = leg
+    return minutes
+
+
+async def _live_travel_minutes(plan: dict, locator: VenueLocator) -> dict[tuple[int, int], int] | None:
+    """Live travel minutes between consecutive activities, in one routing batch.
+
+    Returns None when the routing provider is not configured or fails.
+    """
+    from app.routing import get_routing_client, itinerary_legs
+
+    try:
+        client = get_routing_client()
+    except ValueError as e:
+        logger.debug(f"[validate_plan] Live travel times unavailable: {e}")
+        return None
+
+    legs = itinerary_legs(plan, locator.locate)
+    if not legs:
+        return None
+
+    try:
+        minutes = await client.batch(list(legs.values()))
+    except Exception as e:
+        logger.warning(f"⚠️ [validate_plan] Live travel times failed, using the travel time matrix: {e}")
+        return None
+
+    logger.info(f"🚇 [validate_plan] Resolved {len(legs)} legs via {client.backend.name}")
+    return {position: m for position, m in zip(legs, minutes, strict=True) if m is not None}
+
+
+async def _activity_travel_minutes(plan: dict, state: PlanningState) -> dict[tuple[int, int], int]:
+    """Travel minutes validate_plan checks activity gaps against.
+
+    Matrix lookups by default; live routing (one batched call per plan) only
+    when PLANNER_LIVE_TRAVEL_TIMES is enabled.
+    """
+    locator = VenueLocator([
+        *(state.get("attractions") or []),
+        *(state.get("restaurants") or []),
+        *(state.get("accommodations") or []),
+    ])
+    minutes = _plan_travel_minutes(plan, locator)
+    if settings.PLANNER_LIVE_TRAVEL_TIMES:
+        minutes.update(await _live_travel_minutes(plan, locator) or {})
+    return minutes
+
+
+def _issues_by_day(issues: list[PlanIssue], num_days: int) -> dict[int, list[str]]:
+    """Issue messages per day number; plan-wide issues apply to every day."""
+    by_day: dict[int, list[str]] = {}
+    for issue in issues:
+        days = [issue.day] if issue.day is not None else range(1, num_days + 1)
+        for day in days:
+            by_day.setdefault(day, []).append(issue.message)
+    return by_day
+
 
-    Note: Currently disabled in graph, but kept for future use.
+async def validate_plan(state: PlanningState) -> Command[Literal["generate_plan", "__end__"]]:
+    """Validate the plan with local rules and repair what can be fixed.
+
+    Gaps between consecutive activities are checked against the precomputed
+    travel time matrix, or against live travel times (one batched, cached
+    routing call per plan, see app.routing) when PLANNER_LIVE_TRAVEL_TIMES is
+    enabled. Only issues that cannot be repaired
+    deterministically (missing or empty days, unparsable times, budget still
+    exceeded) trigger an LLM retry, except SCHEDULER_DATA_ISSUES on a
+    scheduled plan, which is kept with the issues recorded.
     """
     from langgraph.graph import END
 
@@ -350,63 +633,53 @@ async def validate_plan(state: PlanningState) -> Command[Literal["generate_plan"
             goto=END
         )
 
-    logger.debug(f"📥 Validating plan with {len(state['travel_plan'].get('itinerary', []))} days")
-
-    llm = get_llm(temperature=0)
-    structured_llm = llm.with_structured_output(ValidationResult)
-
-    # Safely get budget with default to prevent format errors
-    budget = state.get("budget", 0)
-
-    prompt = VALIDATE_PLAN_PROMPT.format(
-        plan=json.dumps(state["travel_plan"], ensure_ascii=False),
-        budget=budget,
+    dates = state.get("dates") or ("", "")
+    num_days = _count_trip_days(dates) if dates[0] and dates[1] else None
+    plan, issues, remaining = validate_and_repair(
+        state["travel_plan"],
+        budget=state.get("budget") or 0,
+        num_days=num_days,
+        start_date=dates[0],
+        travel_minutes=await _activity_travel_minutes(state["travel_plan"], state),
     )
 
-    messages = [
-        SystemMessage(content="You are a travel plan validator."),
-        HumanMessage(content=prompt),
-    ]
-
-    try:
-        validation_result: ValidationResult = await structured_llm.ainvoke(messages)
-        logger.debug(f"🤖 Validation result: {validation_result.model_dump()}")
-
-        if not validation_result.is_valid:
-            logger.warning(f"⚠️ [validate_plan] Plan validation failed: {validation_result.errors}")
-
-            max_attempts = 3
-            attempts = state.get("attempts", 0)
-
-            # Retry if under max attempts
-            if attempts < max_attempts:
-                logger.info(f"🔄 [validate_plan] Retrying (attempt {attempts + 1}/{max_attempts})")
-                return Command(
-                    update={
-                        "errors": validation_result.errors,
-                        "travel_plan": None,  # Clear invalid plan
-                    },
-                    goto="generate_plan"  # Retry
-                )
-            else:
-                logger.warning(f"⚠️ [validate_plan] Max attempts reached ({max_attempts})")
-                # End with errors
-                return Command(
-                    update={"errors": validation_result.errors},
-                    goto=END
-                )
+    if issues:
+        logger.info(
+            f"🔧 [validate_plan] Found {len(issues)} issues, {len(issues) - len(remaining)} repaired: "
+            f"{[i.code for i in issues]}"
+        )
 
+    if not remaining:
         logger.info("✅ [validate_plan] Plan is valid")
-        # Valid plan, route to END
         return Command(
-            update={},
+            update={"travel_plan": plan, "validation_issues": None, "day_issues": None},
             goto=END
         )
 
-    except Exception as e:
-        logger.error(f"❌ [validate_plan] Validation failed: {e}")
-        # Route to END with error
+    messages = [issue.message for issue in remaining]
+    logger.warning(f"⚠️ [validate_plan] Unfixable issues: {messages}")
+
+    if state.get("plan_mode") == "scheduled" and all(i.code in SCHEDULER_DATA_ISSUES for i in remaining):
+        logger.info("✅ [validate_plan] Keeping scheduled plan; its issues come from the venue data")
         return Command(
-            update={"errors": ["Validation check failed"]},
+            update={"travel_plan": plan, "validation_issues": messages, "day_issues": None},
             goto=END
         )
+
+    attempts = state.get("attempts", 0)
+    if attempts < MAX_PLAN_ATTEMPTS:
+        logger.info(f"🔄 [validate_plan] Retrying with LLM (attempt {attempts + 1}/{MAX_PLAN_ATTEMPTS})")
+        return Command(
+            update={
+                "travel_plan": plan,
+                "validation_issues": messages,
+                "day_issues": _issues_by_day(remaining, num_days or len(plan.get("itinerary") or [])),
+            },
+            goto="generate_plan"
+        )
+
+    logger.warning(f"⚠️ [validate_plan] Max attempts reached ({MAX_PLAN_ATTEMPTS})")
+    return Command(
+        update={"travel_plan": plan, "errors": messages},
+        goto=END
+    )
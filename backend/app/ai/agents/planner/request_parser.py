@@ -0,0 +1,362 @@
+"""Deterministic Korean/English travel request parser.
+
+Fast path for collect_info: most requests state their dates, trip length,
+budget and interests in a handful of fixed forms ("3일 서울 여행 50만원 궁궐
+맛집", "2박3일", "7월 1일~3일", "July 1-3", "₩500,000"), so regular
+expressions resolve them without an LLM round trip. Fields that cannot be
+resolved are left as None for the LLM to fill. Per-day amounts ("하루
+10만원") are multiplied by the trip length; per-person amounts ("1인당")
+are left to the LLM.
+
+Matching runs in stages over a working copy of the text: dates, then
+budgets, then trip lengths. Each stage blanks out what it consumed, so
+"7월 3일" is never read as a three-day trip and "2025" is never a budget.
+"""
+
+import re
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from app.ai.agents.planner.models import TravelInfoExtraction
+
+SEOUL_TZ = ZoneInfo("Asia/Seoul")
+
+# Trips longer than this are treated as misparses
+MAX_TRIP_DAYS = 30
+
+# A trip length without a start date starts the next day
+DEFAULT_START_OFFSET_DAYS = 1
+
+# Interest taxonomy (the app's interest chips) and the keywords that map to it.
+# Korean keywords match as substrings, English ones as whole words. English
+# keywords must be unambiguous on their own: everyday words such as "show",
+# "art", "class" or "river" would match requests like "show me a 3 day trip".
+INTEREST_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "역사": ("역사", "궁궐", "고궁", "경복궁", "창덕궁", "덕수궁", "창경궁", "경희궁", "종묘", "유적", "한옥",
+            "history", "historic", "historical", "palace", "palaces", "heritage"),
+    "문화": ("문화", "박물관", "미술관", "전시", "갤러리",
+            "culture", "cultural", "museum", "museums", "gallery", "exhibition"),
+    "맛집": ("맛집", "먹방", "먹거리", "미식", "식도락", "음식", "로컬 식당", "길거리 음식",
+            "food", "foodie", "restaurant", "restaurants", "cuisine"),
+    "카페": ("카페", "커피", "디저트", "베이커리", "cafe", "cafes", "café", "coffee", "dessert", "bakery"),
+    "쇼핑": ("쇼핑", "시장", "백화점", "면세점", "아울렛", "shopping", "market", "markets", "mall"),
+    "자연": ("자연", "공원", "한강", "등산", "산책", "숲", "nature", "park", "parks", "hiking", "han river"),
+    "야경": ("야경", "야간", "밤거리", "night view", "night views", "nightlife", "nightscape"),
+    "사진": ("사진", "인생샷", "포토", "photo", "photos", "photography", "instagram"),
+    "공연": ("공연", "뮤지컬", "콘서트", "연극", "난타", "musical", "concert", "theater", "theatre"),
+    "체험": ("체험", "한복", "공방", "클래스", "템플스테이",
+            "workshop", "workshops", "hanbok", "cooking class", "temple stay"),
+}
+
+_MONTHS = {
+    name: number
+    for number, names in enumerate(
+        (
+            ("jan", "january"), ("feb", "february"), ("mar", "march"), ("apr", "april"),
+            ("may",), ("jun", "june"), ("jul", "july"), ("aug", "august"),
+            ("sep", "sept", "september"), ("oct", "october"), ("nov", "november"), ("dec", "december"),
+        ),
+        start=1,
+    )
+    for name in names
+}
+_MONTH_NAMES = "|".join(sorted(_MONTHS, key=len, reverse=True))
+_ORDINAL = r"(?:st|nd|rd|th)?"
+
+# Absolute dates; each pattern names its groups year/month/day
+_DATE_PATTERNS = (
+    re.compile(r"(?P<year>\d{4})\s*[-./]\s*(?P<month>\d{1,2})\s*[-./]\s*(?P<day>\d{1,2})"),
+    re.compile(r"(?:(?P<year>\d{4})\s*년\s*)?(?P<month>\d{1,2})\s*월\s*(?P<day>\d{1,2})\s*일"),
+    re.compile(rf"\b(?P<month>{_MONTH_NAMES})\.?\s+(?P<day>\d{{1,2}}){_ORDINAL}\b(?:,?\s*(?P<year>\d{{4}})(?!\d))?", re.I),
+    re.compile(rf"\b(?P<day>\d{{1,2}}){_ORDINAL}\s+(?:of\s+)?(?P<month>{_MONTH_NAMES})\b(?:,?\s*(?P<year>\d{{4}})(?!\d))?", re.I),
+    re.compile(r"(?<![\d/])(?P<month>\d{1,2})/(?P<day>\d{1,2})(?![\d/])"),
+)
+
+# "7월 1일~3일", "July 1-3", "7월 1일부터 3일까지": a range ending on a bare day
+_DAY_RANGE_END = (
+    re.compile(r"\s*(?:~|-|–|to\b|until\b|through\b)\s*(?P<day>\d{1,2})(?:\s*일|" + _ORDINAL + r")(?!\s*(?:[간월박일/.]|동안|\d))", re.I),
+    re.compile(r"\s*부터\s*(?P<day>\d{1,2})\s*일\s*까지"),
+)
+
+# Checked in order, so "day after tomorrow" is not read as "tomorrow"
+_RELATIVE_DAYS = (
+    (re.compile(r"모레|day after tomorrow", re.I), 2),
+    (re.compile(r"내일|tomorrow", re.I), 1),
+    (re.compile(r"오늘|today", re.I), 0),
+)
+_WEEKDAYS = {
+    "월": 0, "화": 1, "수": 2, "목": 3, "금": 4, "토": 5, "일": 6,
+    "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3, "friday": 4, "saturday": 5, "sunday": 6,
+}
+_WEEKDAY = re.compile(
+    r"(?P<next>다음\s*주|담주|next\s+week(?:'s)?|next)?\s*"
+    r"(?:(?P<ko>[월화수목금토일])요일|\b(?P<en>monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b)",
+    re.I,
+)
+_WEEKEND = re.compile(r"(?P<next>다음(?:\s*주(?=\s*주말))?|담주|next)?\s*(?:이번\s*)?(?:주말|\bweekend\b)", re.I)
+_NEXT_WEEK = re.compile(r"다음\s*주|담주|\bnext\s+week\b", re.I)
+
+# Budgets: "50만원", "1.5만 원", "2백만원", "1,500,000원", "₩500,000", "500,000 KRW", "500k won"
+_BUDGET_MAN = re.compile(r"(?P<amount>\d+(?:\.\d+)?)\s*(?P<unit>천|백)?\s*만\s*(?:원|won\b|krw\b)?", re.I)
+_BUDGET_WON = re.compile(r"(?P<amount>\d{1,3}(?:,\d{3})+|\d+)\s*(?P<k>k\b)?\s*(?:원|won\b|krw\b)", re.I)
+_BUDGET_PREFIX = re.compile(r"(?:₩|\bkrw\s*)(?P<amount>\d{1,3}(?:,\d{3})+|\d+)\s*(?P<k>k\b)?", re.I)
+# Amount qualifiers before ("하루 10만원", "1인당 5만원") or after ("10만원/일",
+# "100k won per person") the amount
+_PER_DAY_BEFORE = re.compile(r"(?:하루|일당|(?<!\d)1\s*일|매일|\bdaily)\s*(?:에|당)?\s*(?:예산\s*)?$", re.I)
+_PER_DAY_AFTER = re.compile(r"\s*(?:/\s*(?:일|day)\b|per\s+day\b|a\s+day\b|daily\b)", re.I)
+_PER_PERSON_BEFORE = re.compile(r"(?:1?\s*인\s*당|한\s*사람\s*당|\bper\s+person|\beach)\s*(?:에)?\s*$", re.I)
+_PER_PERSON_AFTER = re.compile(r"\s*(?:/\s*(?:인|person)\b|per\s+(?:person|head)\b|each\b)", re.I)
+
+# Trip lengths
+_NIGHTS_DAYS_KO = re.compile(r"(?P<nights>\d+)\s*박\s*(?P<days>\d+)\s*일")
+_NIGHTS_KO = re.compile(r"(?P<nights>\d+)\s*박")
+_DAYS_KO = re.compile(r"(?P<days>\d+)\s*일")
+_NIGHTS_EN = re.compile(r"(?P<nights>\d+)[\s-]*nights?\b", re.I)
+_DAYS_EN = re.compile(r"(?P<days>\d+)[\s-]*days?\b", re.I)
+_WORD_DAYS = (
+    (re.compile(r"당일\s*치기|\bday\s*trip\b", re.I), 1),
+    (re.compile(r"일주일|1\s*주일|\b(?:a|one)\s+week\b", re.I), 7),
+    (re.compile(r"나흘"), 4),
+    (re.compile(r"사흘"), 3),
+    (re.compile(r"이틀"), 2),
+    (re.compile(r"하루"), 1),
+)
+
+
+def seoul_today() -> date:
+    """Today's date in Seoul, the reference for relative dates."""
+    return datetime.now(SEOUL_TZ).date()
+
+
+def _mask(text: str, start: int, end: int) -> str:
+    """Replace text[start:end] with spaces so later stages skip it."""
+    return text[:start] + " " * (end - start) + text[end:]
+
+
+def _make_date(year: int | None, month: int, day: int, today: date) -> date | None:
+    """Build a date, rolling year-less dates that already passed into next year."""
+    try:
+        if year is not None:
+            return date(year, month, day)
+        candidate = date(today.year, month, day)
+        return candidate if candidate >= today else date(today.year + 1, month, day)
+    except ValueError:
+        return None
+
+
+def _month_number(value: str) -> int:
+    return int(value) if value.isdigit() else _MONTHS[value.lower().rstrip(".")]
+
+
+def _extract_absolute_dates(text: str, today: date) -> tuple[list[date], str]:
+    """Find absolute dates (and bare-day range ends) in order of appearance."""
+    found: list[tuple[int, date]] = []
+    for pattern in _DATE_PATTERNS:
+        for match in pattern.finditer(text):
+            year = int(match["year"]) if match.groupdict().get("year") else None
+            month = _month_number(match["month"])
+            parsed = _make_date(year, month, int(match["day"]), today)
+            if parsed is None:
+                continue
+            end = match.end()
+            found.append((match.start(), parsed))
+
+            range_end = next((m for m in (p.match(text, end) for p in _DAY_RANGE_END) if m), None)
+            if range_end:
+                end_day = _make_date(parsed.year, parsed.month, int(range_end["day"]), parsed)
+                if end_day is not None:
+                    found.append((range_end.start(), end_day))
+                    end = range_end.end()
+            text = _mask(text, match.start(), end)
+
+    found.sort()
+    return [d for _, d in found], text
+
+
+def _extract_relative_start(text: str, today: date) -> tuple[date | None, int | None, str]:
+    """Resolve relative start dates (내일, 다음 주 금요일, this weekend, ...).
+
+    Returns:
+        (start date, implied trip length or None, masked text)
+    """
+    match = _WEEKEND.search(text)
+    if match:
+        saturday = today + timedelta(days=(5 - today.weekday()) % 7)
+        if match["next"]:
+            saturday += timedelta(days=7)
+        return saturday, 2, _mask(text, match.start(), match.end())
+
+    match = _WEEKDAY.search(text)
+    if match:
+        weekday = _WEEKDAYS[(match["ko"] or match["en"]).lower()]
+        if match["next"]:
+            # Weekday of next calendar week
+            start = today - timedelta(days=today.weekday()) + timedelta(days=7 + weekday)
+        else:
+            start = today + timedelta(days=(weekday - today.weekday()) % 7)
+        return start, None, _mask(text, match.start(), match.end())
+
+    for pattern, offset in _RELATIVE_DAYS:
+        match = pattern.search(text)
+        if match:
+            return today + timedelta(days=offset), None, _mask(text, match.start(), match.end())
+
+    match = _NEXT_WEEK.search(text)
+    if match:
+        monday = today - timedelta(days=today.weekday()) + timedelta(days=7)
+        return monday, None, _mask(text, match.start(), match.end())
+
+    return None, None, text
+
+
+def _amount_scope(text: str, start: int, end: int) -> tuple[str, int, int]:
+    """Whether an amount is "total", "per_day" or "per_person", with its qualifier's span."""
+    for scope, before, after in (
+        ("per_day", _PER_DAY_BEFORE, _PER_DAY_AFTER),
+        ("per_person", _PER_PERSON_BEFORE, _PER_PERSON_AFTER),
+    ):
+        match = before.search(text, 0, start)
+        if match:
+            return scope, match.start(), end
+        match = after.match(text, end)
+        if match:
+            return scope, start, match.end()
+    return "total", start, end
+
+
+def _extract_budget(text: str) -> tuple[int | None, int | None, str]:
+    """Largest total and per-day KRW amounts mentioned (not per-item prices).
+
+    A per-person amount leaves both None: the party size is unknown, so the
+    LLM resolves the budget.
+
+    Returns:
+        (total budget, per-day budget, masked text)
+    """
+    amounts: dict[str, list[int]] = {"total": [], "per_day": [], "per_person": []}
+    matches: list[tuple[int, int, int]] = []
+
+    for match in _BUDGET_MAN.finditer(text):
+        multiplier = {"천": 1000, "백": 100}.get(match["unit"], 1)
+        matches.append((match.start(), match.end(), round(float(match["amount"]) * multiplier * 10000)))
+        text = _mask(text, match.start(), match.end())
+
+    for pattern in (_BUDGET_PREFIX, _BUDGET_WON):
+        for match in pattern.finditer(text):
+            amount = int(match["amount"].replace(",", ""))
+            matches.append((match.start(), match.end(), amount * 1000 if match["k"] else amount))
+            text = _mask(text, match.start(), match.end())
+
+    for start, end, amount in matches:
+        scope, start, end = _amount_scope(text, start, end)
+        # Mask the qualifier too, so "하루" / "1일" are not read as the trip length
+        text = _mask(text, start, end)
+        if amount > 0:
+            amounts[scope].append(amount)
+
+    if amounts["per_person"]:
+        return None, None, text
+    return max(amounts["total"], default=None), max(amounts["per_day"], default=None), text
+
+
+def _total_budget(total: int | None, per_day: int | None, dates: tuple[str, str] | None) -> int | None:
+    """A stated total wins; a per-day amount is multiplied by the trip length."""
+    if total or not per_day or dates is None:
+        return total
+    start, end = (date.fromisoformat(d) for d in dates)
+    return per_day * ((end - start).days + 1)
+
+
+def _extract_trip_days(text: str) -> int | None:
+    """Trip length in days from N박M일, N박, N일, "2 nights", "3 days", 이틀, ..."""
+    match = _NIGHTS_DAYS_KO.search(text)
+    if match:
+        return int(match["days"])
+
+    days = _DAYS_KO.search(text) or _DAYS_EN.search(text)
+    if days:
+        return int(days["days"])
+
+    nights = _NIGHTS_KO.search(text) or _NIGHTS_EN.search(text)
+    if nights:
+        return int(nights["nights"]) + 1
+
+    for pattern, num_days in _WORD_DAYS:
+        if pattern.search(text):
+            return num_days
+    return None
+
+
+def _resolve_dates(
+    absolute: list[date], start: date | None, num_days: int | None, today: date
+) -> tuple[str, str] | None:
+    """Combine the date mentions into (start_date, end_date), or None if unresolved."""
+    if len(absolute) >= 2:
+        start, end = absolute[0], absolute[-1]
+    elif num_days:
+        if start is None:
+            start = today + timedelta(days=DEFAULT_START_OFFSET_DAYS)
+        end = start + timedelta(days=num_days - 1)
+    else:
+        # A start date alone does not say how long the trip is
+        return None
+
+    if end < start or (end - start).days + 1 > MAX_TRIP_DAYS:
+        return None
+    return start.isoformat(), end.isoformat()
+
+
+def _has_keyword(text: str, keyword: str) -> int | None:
+    """Position of ``keyword`` in ``text`` (English keywords must be whole words)."""
+    if keyword.isascii():
+        match = re.search(rf"\b{re.escape(keyword)}\b", text)
+        return match.start() if match else None
+    position = text.find(keyword)
+    return position if position >= 0 else None
+
+
+def extract_interests(text: str) -> list[str]:
+    """Map interest keywords to taxonomy labels, in order of first mention.
+
+    Args:
+        text: User request
+
+    Returns:
+        Taxonomy labels (e.g. ["역사", "맛집"]); empty if none matched
+    """
+    lowered = text.lower()
+    positions = {}
+    for label, keywords in INTEREST_KEYWORDS.items():
+        hits = [p for p in (_has_keyword(lowered, k) for k in keywords) if p is not None]
+        if hits:
+            positions[label] = min(hits)
+    return sorted(positions, key=positions.get)
+
+
+def parse_travel_request(user_request: str, today: date | None = None) -> TravelInfoExtraction:
+    """Extract dates, budget and interests from a request without an LLM.
+
+    Args:
+        user_request: Free-text request in Korean and/or English
+        today: Reference date for relative dates (default: today in Seoul)
+
+    Returns:
+        TravelInfoExtraction with unresolved fields set to None
+    """
+    today = today or seoul_today()
+
+    absolute, text = _extract_absolute_dates(user_request, today)
+    implied_days = None
+    if absolute:
+        start = absolute[0]
+    else:
+        start, implied_days, text = _extract_relative_start(text, today)
+    total, per_day, text = _extract_budget(text)
+    num_days = _extract_trip_days(text) or implied_days
+    dates = _resolve_dates(absolute, start, num_days, today)
+
+    return TravelInfoExtraction(
+        dates=dates,
+        budget=_total_budget(total, per_day, dates),
+        interests=extract_interests(user_request) or None,
+    )
@@ -0,0 +1,313 @@
+"""Deterministic route optimization for generated itineraries.
+
+The LLM often returns a visit order that backtracks across the city. This
+post-processing stage reorders the movable activities of each day with a
+nearest-neighbour tour improved by 2-opt, keeping meals (restaurants) and
+accommodation stops as fixed anchors, then re-stamps start times.
+
+Everything runs on small per-day NumPy distance matrices, so optimizing a day
+takes well under a millisecond.
+"""
+
+import math
+from typing import Any
+
+import numpy as np
+
+from app.geo.distance import haversine_km, haversine_matrix
+from app.transit import travel_minutes
+
+# Activities that keep their position in the day (meal-time and lodging anchors)
+ANCHOR_VENUE_TYPES = frozenset({"restaurant", "accommodation"})
+
+TIME_ROUNDING_MINUTES = 5
+LATEST_START_MINUTES = 23 * 60 + 55
+
+
+# ============================================================================
+# Venue lookup
+# ============================================================================
+
+
+def _normalize(name: str) -> str:
+    """Normalize a venue name for fuzzy matching."""
+    return "".join(name.split()).lower()
+
+
+class VenueLocator:
+    """Resolve LLM-written venue names to fetched venues with coordinates."""
+
+    def __init__(self, venues: list[dict]):
+        """Index venues by normalized name.
+
+        Args:
+            venues: Venue dicts with name/latitude/longitude (and id for attractions)
+        """
+        self._venues: dict[str, dict] = {}
+        for venue in venues:
+            name = venue.get("name")
+            if name and venue.get("latitude") is not None and venue.get("longitude") is not None:
+                self._venues.setdefault(_normalize(name), venue)
+
+    def find(self, venue_name: str) -> dict | None:
+        """Find a venue by name (exact, then substring match)."""
+        key = _normalize(venue_name or "")
+        if not key:
+            return None
+        if key in self._venues:
+            return self._venues[key]
+        for name, venue in self._venues.items():
+            if name in key or key in name:
+                return venue
+        return None
+
+    def locate(self, venue_name: str) -> tuple[float, float] | None:
+        """Find (latitude, longitude) for a venue name."""
+        venue = self.find(venue_name)
+        if venue is None:
+            return None
+        return float(venue["latitude"]), float(venue["longitude"])
+
+
+# ============================================================================
+# Tour construction
+# ============================================================================
+
+
+def _nearest_neighbour(distances: np.ndarray, start: int, stops: list[int]) -> list[int]:
+    """Greedy path from ``start`` through every index in ``stops``."""
+    order = [start]
+    remaining = list(stops)
+    while remaining:
+        row = distances[order[-1], remaining]
+        order.append(remaining.pop(int(np.argmin(row))))
+    return order
+
+
+def _two_opt(order: list[int], distances: np.ndarray, fixed_end: bool) -> list[int]:
+    """Improve an open path with 2-opt; the first node (and optionally last) stays put."""
+    order = list(order)
+    last = len(order) - 1 if fixed_end else len(order)
+    improved = True
+    while improved:
+        improved = False
+        for i in range(1, last - 1):
+            for j in range(i + 1, last):
+                a, b = order[i - 1], order[i]
+                c = order[j]
+                d = order[j + 1] if j + 1 < len(order) else None
+                before = distances[a, b] + (distances[c, d] if d is not None else 0.0)
+                after = distances[a, c] + (distances[b, d] if d is not None else 0.0)
+                if after + 1e-9 < before:
+                    order[i:j + 1] = reversed(order[i:j + 1])
+                    improved = True
+    return order
+
+
+def order_stops(
+    movable: list[tuple[float, float]],
+    start: tuple[float, float] | None,
+    end: tuple[float, float] | None,
+) -> list[int]:
+    """Best visiting order for movable stops between two anchors.
+
+    Args:
+        movable: Coordinates of the movable stops
+        start: Coordinates of the preceding anchor (None at day start)
+        end: Coordinates of the following anchor (None at day end)
+
+    Returns:
+        Permutation of range(len(movable))
+    """
+    if len(movable) < 2:
+        return list(range(len(movable)))
+
+    points = list(movable)
+    offset = 0
+    if start is not None:
+        points.insert(0, start)
+        offset = 1
+    if end is not None:
+        points.append(end)
+
+    coords = np.asarray(points)
+    distances = haversine_matrix(coords[:, 0], coords[:, 1])
+    stops = list(range(offset, offset + len(movable)))
+
+    if start is not None:
+        order = _nearest_neighbour(distances, 0, stops)
+    else:
+        # Free start: begin at the stop farthest from the segment's centroid
+        # (an extreme point), which gives NN a sweep instead of a zig-zag
+        centroid = coords[stops].mean(axis=0)
+        spread = ((coords[stops] - centroid) ** 2).sum(axis=1)
+        first = stops[int(np.argmax(spread))]
+        order = _nearest_neighbour(distances, first, [s for s in stops if s != first])
+
+    if end is not None:
+        order.append(len(points) - 1)
+
+    order = _two_opt(order, distances, fixed_end=end is not None)
+    return [i - offset for i in order if offset <= i < offset + len(movable)]
+
+
+# ============================================================================
+# Time stamping
+# ============================================================================
+
+
+def _parse_minutes(value: str) -> int | None:
+    """Parse "HH:MM" into minutes after midnight."""
+    try:
+        hours, minutes = value.split(":")
+        return int(hours) * 60 + int(minutes)
+    except (AttributeError, ValueError):
+        return None
+
+
+def _format_minutes(minutes: int) -> str:
+    """Format minutes after midnight as "HH:MM"."""
+    minutes = max(0, min(minutes, LATEST_START_MINUTES))
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def _restamp_times(activities: list[dict], venues: list[dict | None]) -> None:
+    """Recompute start times sequentially from the first activity.
+
+    Travel time between consecutive venues comes from the precomputed transit
+    matrix (see app.transit). Anchors never move earlier than their original
+    time, so meals stay in their meal window.
+    """
+    clock = _parse_minutes(activities[0].get("time", "")) if activities else None
+    if clock is None:
+        return
+
+    for index, activity in enumerate(activities):
+        if index > 0:
+            previous = activities[index - 1]
+            clock += int(previous.get("duration_minutes") or 0)
+            if venues[index - 1] is not None and venues[index] is not None:
+                clock += travel_minutes(venues[index - 1], venues[index]) or 0
+            clock = math.ceil(clock / TIME_ROUNDING_MINUTES) * TIME_ROUNDING_MINUTES
+
+            if activity.get("venue_type") in ANCHOR_VENUE_TYPES:
+                original = _parse_minutes(activity.get("time", ""))
+                if original is not None:
+                    clock = max(clock, original)
+
+        activity["time"] = _format_minutes(clock)
+
+
+# ============================================================================
+# Public API
+# ============================================================================
+
+
+def _route_length(coords: list[tuple[float, float] | None]) -> float:
+    """Total haversine length between consecutive located activities."""
+    located = [c for c in coords if c is not None]
+    if len(located) < 2:
+        return 0.0
+    points = np.asarray(located)
+    legs = haversine_km(points[:-1, 0], points[:-1, 1], points[1:, 0], points[1:, 1])
+    return float(legs.sum())
+
+
+def optimize_day(activities: list[dict], locator: VenueLocator) -> tuple[list[dict], float, float]:
+    """Reorder one day's movable activities and re-stamp times.
+
+    Args:
+        activities: Activity dicts in the LLM's order (sorted by time)
+        locator: Venue name → coordinate resolver
+
+    Returns:
+        Tuple of (reordered activities, distance_before_km, distance_after_km)
+    """
+    activities = sorted(
+        (dict(a) for a in activities),
+        key=lambda a: _parse_minutes(a.get("time", "")) or 0,
+    )
+    venues = [locator.find(a.get("venue_name", "")) for a in activities]
+    coords = [
+        (float(v["latitude"]), float(v["longitude"])) if v is not None else None
+        for v in venues
+    ]
+    before = _route_length(coords)
+
+    # Anchors: meals, lodging and anything we cannot place on the map
+    is_anchor = [
+        a.get("venue_type") in ANCHOR_VENUE_TYPES or c is None
+        for a, c in zip(activities, coords, strict=True)
+    ]
+
+    result: list[dict] = []
+    result_venues: list[dict | None] = []
+    result_coords: list[tuple[float, float] | None] = []
+    index = 0
+    while index < len(activities):
+        if is_anchor[index]:
+            result.append(activities[index])
+            result_venues.append(venues[index])
+            result_coords.append(coords[index])
+            index += 1
+            continue
+
+        segment_end = index
+        while segment_end < len(activities) and not is_anchor[segment_end]:
+            segment_end += 1
+
+        start = result_coords[-1] if result_coords else None
+        end = coords[segment_end] if segment_end < len(activities) else None
+        segment = list(range(index, segment_end))
+        order = order_stops([coords[i] for i in segment], start, end)
+
+        for position in order:
+            result.append(activities[segment[position]])
+            result_venues.append(venues[segment[position]])
+            result_coords.append(coords[segment[position]])
+        index = segment_end
+
+    after = _route_length(result_coords)
+    if after > before:
+        # Never make a day worse than the LLM's order
+        result, result_venues, after = activities, venues, before
+
+    _restamp_times(result, result_venues)
+    return result, before, after
+
+
+def optimize_itinerary(travel_plan: dict, venues: list[dict]) -> tuple[dict, dict[str, Any]]:
+    """Optimize every day of a TravelPlan dict.
+
+    Args:
+        travel_plan: TravelPlan.model_dump() output
+        venues: Attractions, restaurants and accommodations with coordinates
+
+    Returns:
+        Tuple of (optimized plan, route statistics)
+    """
+    locator = VenueLocator(venues)
+    plan = dict(travel_plan)
+    itinerary = []
+    per_day = []
+
+    for day in plan.get("itinerary", []):
+        activities, before, after = optimize_day(day.get("activities", []), locator)
+        itinerary.append({**day, "activities": activities})
+        per_day.append({
+            "day": day.get("day"),
+            "distance_before_km": round(before, 2),
+            "distance_after_km": round(after, 2),
+        })
+
+    plan["itinerary"] = itinerary
+    total_before = sum(d["distance_before_km"] for d in per_day)
+    total_after = sum(d["distance_after_km"] for d in per_day)
+
+    stats = {
+        "distance_before_km": round(total_before, 2),
+        "distance_after_km": round(total_after, 2),
+        "saved_km": round(total_before - total_after, 2),
+        "per_day": per_day,
+    }
+    return plan, stats
@@ -0,0 +1,380 @@
+"""Deterministic constraint-based day scheduler.
+
+Fills each day's slots from the clustered venue buckets without an LLM:
+- Attractions are visited in a short route order (see route_optimizer) and
+  only placed when they fit their category's opening hours.
+- Lunch and dinner are placed inside their meal windows at the nearest
+  unused restaurant; breakfast is taken at the accommodation from day 2.
+- Durations and costs come from per-category profiles, travel times from the
+  transit matrix (app.transit). The accommodation's price is only taken from
+  the candidate itself; an unknown price stays 0 and out of the total.
+
+The output is a TravelPlan-shaped dict with placeholder prose; the LLM only
+writes the title, summary, day themes and activity notes on top of it.
+"""
+
+import logging
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from app.ai.agents.planner.route_optimizer import order_stops
+from app.transit import travel_minutes
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class VenueProfile:
+    """Scheduling assumptions for a kind of attraction."""
+
+    kind: str
+    duration_minutes: int
+    opens: int  # Minutes after midnight
+    closes: int
+    cost: int  # Typical admission in KRW
+
+
+# Attraction profiles matched on name keywords (checked in order) or suffixes.
+# The Seoul attraction dataset has a single category ("관광지"), so the name is
+# the only signal available.
+ATTRACTION_PROFILES: tuple[tuple[tuple[str, ...], tuple[str, ...], VenueProfile], ...] = (
+    (("타워", "전망대"), (), VenueProfile("observatory", 90, 10 * 60, 23 * 60, 21000)),
+    (("예술의전당", "국악원", "극장", "공연"), (), VenueProfile("performance", 120, 10 * 60, 22 * 60, 30000)),
+    (("박물관", "미술관", "기념관", "전시관", "역사관", "울림관"), (), VenueProfile("museum", 90, 10 * 60, 18 * 60, 0)),
+    (("궁", "종묘"), ("릉",), VenueProfile("palace", 90, 9 * 60, 18 * 60, 3000)),
+    (("시장", "몰", "아케이드", "거리"), (), VenueProfile("shopping", 90, 10 * 60, 22 * 60, 0)),
+    (("공원", "숲", "섬", "한강", "폭포", "성곽"), (), VenueProfile("outdoor", 90, 6 * 60, 22 * 60, 0)),
+    (("성당", "교회", "성원", "성지", "사당", "향교"), ("사", "당"), VenueProfile("religious", 45, 9 * 60, 18 * 60, 0)),
+)
+DEFAULT_PROFILE = VenueProfile("landmark", 45, 9 * 60, 19 * 60, 0)
+
+
+@dataclass(frozen=True)
+class MealSlot:
+    """A meal that must start inside its window."""
+
+    label: str
+    earliest: int
+    latest: int
+    duration_minutes: int
+    cost: int
+
+
+MEALS = (
+    MealSlot("점심", 11 * 60 + 30, 13 * 60 + 30, 60, 15000),
+    MealSlot("저녁", 17 * 60 + 30, 19 * 60 + 30, 90, 25000),
+)
+
+FIRST_DAY_START = 10 * 60
+DAY_START = 9 * 60 + 30
+DAY_END = 22 * 60
+BREAKFAST_TIME = 8 * 60 + 30
+BREAKFAST_MINUTES = 45
+CHECK_IN_MINUTES = 30
+TIME_ROUNDING_MINUTES = 5
+
+# Meal price multipliers by daily spending budget (KRW per day after lodging)
+BUDGET_TIERS = ((60000, 0.7), (150000, 1.0), (math.inf, 1.5))
+
+
+def attraction_profile(name: str) -> VenueProfile:
+    """Pick the scheduling profile for an attraction name."""
+    compact = "".join((name or "").split())
+    for keywords, suffixes, profile in ATTRACTION_PROFILES:
+        if any(k in compact for k in keywords) or compact.endswith(suffixes or ("\0",)):
+            return profile
+    return DEFAULT_PROFILE
+
+
+def _round_up(minutes: int) -> int:
+    return math.ceil(minutes / TIME_ROUNDING_MINUTES) * TIME_ROUNDING_MINUTES
+
+
+def _hhmm(minutes: int) -> str:
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def _travel(origin: dict | None, destination: dict) -> int:
+    """Travel minutes between venues (0 when the origin is unknown)."""
+    if origin is None:
+        return 0
+    return travel_minutes(origin, destination) or 0
+
+
+def _activity(start: int, venue: dict, venue_type: str, duration: int, cost: int, notes: str = "") -> dict:
+    return {
+        "time": _hhmm(start),
+        "venue_name": venue.get("name", ""),
+        "venue_type": venue_type,
+        "duration_minutes": duration,
+        "estimated_cost": cost,
+        "notes": notes,
+    }
+
+
+def _coords(venue: dict | None) -> tuple[float, float] | None:
+    if venue is None or venue.get("latitude") is None or venue.get("longitude") is None:
+        return None
+    return float(venue["latitude"]), float(venue["longitude"])
+
+
+def _nearest(position: dict | None, candidates: list[dict]) -> dict | None:
+    """Closest candidate by travel time (first candidate if position is unknown)."""
+    if not candidates:
+        return None
+    if _coords(position) is None:
+        return candidates[0]
+    return min(candidates, key=lambda venue: _travel(position, venue))
+
+
+def _unused(restaurants: list[dict], used: set[str]) -> list[dict]:
+    return [r for r in restaurants if r.get("name") not in used]
+
+
+class _DayScheduler:
+    """Greedy slot filler for a single day."""
+
+    def __init__(self, start: int, position: dict | None, meal_factor: float):
+        self.clock = start
+        self.position = position
+        self.meal_factor = meal_factor
+        self.activities: list[dict] = []
+
+    def place(self, venue: dict, venue_type: str, start: int, duration: int, cost: int, notes: str = "") -> None:
+        self.activities.append(_activity(start, venue, venue_type, duration, cost, notes))
+        self.clock = start + duration
+        if _coords(venue) is not None:
+            self.position = venue
+
+    def arrival(self, venue: dict) -> int:
+        return _round_up(self.clock + _travel(self.position, venue))
+
+    def try_meal(self, meal: MealSlot, restaurants: list[dict], used: set[str]) -> bool:
+        """Place a meal at the nearest unused restaurant if its window allows."""
+        restaurant = _nearest(self.position, _unused(restaurants, used))
+        if restaurant is None:
+            return False
+        start = max(self.arrival(restaurant), meal.earliest)
+        if start > meal.latest:
+            return False
+        cost = round(meal.cost * self.meal_factor, -3)
+        self.place(restaurant, "restaurant", start, meal.duration_minutes, int(cost), f"{meal.label} 식사")
+        used.add(restaurant.get("name"))
+        return True
+
+    def fill(self, attractions: list[dict], restaurants: list[dict], used: set[str]) -> None:
+        """Interleave attractions and meals until both run out."""
+        queue = list(attractions)
+        meals = list(MEALS)
+
+        while queue or meals:
+            meal = meals[0] if meals else None
+
+            if queue:
+                attraction = queue[0]
+                profile = attraction_profile(attraction.get("name", ""))
+                start = max(self.arrival(attraction), profile.opens)
+                end = start + profile.duration_minutes
+
+                # Leave time to reach a restaurant before the meal window closes
+                restaurant = _nearest(attraction, _unused(restaurants, used)) if meal else None
+                meal_by = end + (_travel(attraction, restaurant) if restaurant else 0)
+
+                if meal is None or _round_up(meal_by) <= meal.latest:
+                    queue.pop(0)
+                    if end <= min(profile.closes, DAY_END):
+                        self.place(attraction, "attraction", start, profile.duration_minutes, profile.cost)
+                    continue
+
+            # A meal is due (or only meals remain)
+            meals.pop(0)
+            self.try_meal(meal, restaurants, used)
+
+
+def _meal_factor(budget: int, num_days: int, lodging_total: int) -> float:
+    """Meal price multiplier for the traveller's daily spending budget."""
+    if not budget:
+        return 1.0
+    per_day = max(budget - lodging_total, 0) / max(num_days, 1)
+    return next(factor for limit, factor in BUDGET_TIERS if per_day < limit)
+
+
+def nightly_rate(accommodation: dict | None, nights: int) -> int:
+    """Nightly price of an accommodation candidate (KRW).
+
+    Returns 0 for day trips and when the candidate has no price (search
+    results usually do not), so an unknown price never counts against the
+    budget.
+    """
+    if nights <= 0 or not accommodation:
+        return 0
+    try:
+        return max(int(accommodation.get("cost_per_night") or 0), 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _dates(start_date: str, num_days: int) -> list[str]:
+    try:
+        start = datetime.strptime(start_date, "%Y-%m-%d")
+    except (TypeError, ValueError):
+        return [""] * num_days
+    return [(start + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(num_days)]
+
+
+def schedule_trip(
+    day_buckets: list[dict],
+    accommodations: list[dict],
+    budget: int,
+    num_days: int,
+    start_date: str = "",
+) -> dict:
+    """Build a complete TravelPlan-shaped itinerary deterministically.
+
+    Args:
+        day_buckets: Output of build_day_buckets (attractions/restaurants per day)
+        accommodations: Accommodation candidates, closest first (cost_per_night
+            is used when a candidate has one)
+        budget: Total budget in KRW (0 if unknown)
+        num_days: Number of trip days
+        start_date: First day in YYYY-MM-DD (used when buckets lack dates)
+
+    Returns:
+        TravelPlan dict with placeholder title/summary/themes
+    """
+    nights = max(num_days - 1, 0)
+    hotel = accommodations[0] if accommodations else None
+    rate = nightly_rate(hotel, nights)
+    meal_factor = _meal_factor(budget, num_days, rate * nights)
+
+    all_restaurants = [r for bucket in day_buckets for r in bucket.get("restaurants", [])]
+    dates = _dates(start_date, num_days)
+    used_restaurants: set[str] = set()
+    itinerary = []
+
+    for index in range(num_days):
+        bucket = day_buckets[index] if index < len(day_buckets) else {}
+        day = index + 1
+        wakes_at_hotel = hotel is not None and day > 1
+
+        scheduler = _DayScheduler(
+            start=DAY_START if wakes_at_hotel else FIRST_DAY_START,
+            position=hotel if wakes_at_hotel else None,
+            meal_factor=meal_factor,
+        )
+        if wakes_at_hotel:
+            scheduler.place(hotel, "accommodation", BREAKFAST_TIME, BREAKFAST_MINUTES, 0, "숙소 조식")
+            scheduler.clock = max(scheduler.clock, DAY_START)
+
+        # Short route through the day's attractions, starting from the hotel when known
+        attractions = [a for a in bucket.get("attractions", []) if _coords(a) is not None]
+        order = order_stops([_coords(a) for a in attractions], _coords(scheduler.position), None)
+        attractions = [attractions[i] for i in order]
+
+        # Restaurants near today's attractions first, then the rest of the trip's pool
+        restaurants = bucket.get("restaurants", []) + [
+            r for r in all_restaurants if r not in bucket.get("restaurants", [])
+        ]
+        scheduler.fill(attractions, [r for r in restaurants if _coords(r) is not None], used_restaurants)
+
+        if hotel is not None and day == 1 and nights > 0:
+            check_in = "숙소 체크인" if rate else "숙소 체크인 (숙박비 별도)"
+            scheduler.place(hotel, "accommodation", scheduler.arrival(hotel), CHECK_IN_MINUTES, 0, check_in)
+
+        activities = scheduler.activities
+        itinerary.append({
+            "day": day,
+            "date": bucket.get("date") or dates[index],
+            "theme": "",
+            "activities": activities,
+            "daily_cost": sum(a["estimated_cost"] for a in activities),
+        })
+
+    total_cost = sum(day["daily_cost"] for day in itinerary) + rate * nights
+    plan = {
+        "title": "",
+        "total_days": num_days,
+        "total_cost": total_cost,
+        "itinerary": itinerary,
+        "accommodation": {
+            "name": hotel.get("name", "") if hotel else "숙소 미정",
+            "cost_per_night": rate,
+            "total_nights": nights,
+        },
+        "summary": "",
+    }
+    logger.info(
+        f"🗓️ Scheduled {num_days} days, "
+        f"{sum(len(d['activities']) for d in itinerary)} activities, total {total_cost:,} KRW"
+    )
+    return apply_narrative(plan, default_narrative(plan, day_buckets))
+
+
+# ============================================================================
+# Narrative (prose) layer
+# ============================================================================
+
+
+def default_narrative(plan: dict, day_buckets: list[dict]) -> dict:
+    """Deterministic prose used when the LLM narrative is unavailable."""
+    days = []
+    for index, day in enumerate(plan["itinerary"]):
+        bucket = day_buckets[index] if index < len(day_buckets) else {}
+        districts = list(dict.fromkeys(a.get("district") for a in bucket.get("attractions", []) if a.get("district")))
+        theme = f"{'·'.join(districts[:2])} 탐방" if districts else "서울 탐방"
+        days.append({"day": day["day"], "theme": theme, "notes": [a["notes"] for a in day["activities"]]})
+
+    highlights = [
+        a["venue_name"] for day in plan["itinerary"] for a in day["activities"] if a["venue_type"] == "attraction"
+    ]
+    return {
+        "title": f"서울 {plan['total_days']}일 여행",
+        "summary": ", ".join(highlights[:5]) + " 등을 둘러보는 여행" if highlights else "서울 여행",
+        "days": days,
+    }
+
+
+def apply_narrative(plan: dict, narrative: dict) -> dict:
+    """Merge LLM-written prose into a scheduled plan.
+
+    Only title, summary, day themes and activity notes are taken from the
+    narrative; times, venues and costs are never touched. Missing or extra
+    entries are ignored.
+
+    Args:
+        plan: Scheduled TravelPlan dict
+        narrative: {"title", "summary", "days": [{"day", "theme", "notes"}]}
+
+    Returns:
+        New plan dict with prose applied
+    """
+    days_by_number = {d.get("day"): d for d in narrative.get("days", [])}
+    itinerary = []
+    for day in plan["itinerary"]:
+        prose = days_by_number.get(day["day"], {})
+        notes = prose.get("notes") or []
+        activities = [
+            {**activity, "notes": notes[i] if i < len(notes) and notes[i] else activity["notes"]}
+            for i, activity in enumerate(day["activities"])
+        ]
+        itinerary.append({**day, "theme": prose.get("theme") or day["theme"], "activities": activities})
+
+    return {
+        **plan,
+        "title": narrative.get("title") or plan["title"],
+        "summary": narrative.get("summary") or plan["summary"],
+        "itinerary": itinerary,
+    }
+
+
+def schedule_outline(plan: dict) -> str:
+    """Compact one-line-per-activity outline of a plan for the narrative prompt."""
+    lines = []
+    for day in plan["itinerary"]:
+        lines.append(f"Day {day['day']} ({day['date']}):")
+        lines.extend(
+            f"  {i + 1}. {a['time']} {a['venue_name']} [{a['venue_type']}, {a['duration_minutes']}m]"
+            for i, a in enumerate(day["activities"])
+        )
+    return "\n".join(lines)
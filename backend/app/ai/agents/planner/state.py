@@ -22,9 +22,23 @@ class PlanningState(TypedDict, total=False):
     restaurants: list[dict] | None
     accommodations: list[dict] | None
 
-    # Generated plan
+    # Geographic day buckets: [{"day", "date", "attractions", "restaurants"}]
+    day_buckets: list[dict] | None
+
+    # Generated plan and the generate_plan mode that produced it ("scheduled" or "llm")
     travel_plan: dict | None
+    plan_mode: str | None
+
+    # Unfixable rule violations from validate_plan, fed back to generate_plan on retry
+    validation_issues: list[str] | None
+    # The same issues per day number (plan-wide issues under every day), so
+    # map-reduce retries regenerate only the affected days
+    day_issues: dict[int, list[str]] | None
+
+    # Route optimization report: distance before/after and per-day breakdown
+    route_stats: dict | None
 
     # Metadata
+    deadline: float | None  # Epoch seconds; LLM calls fail fast once it passes
     attempts: int
     errors: Annotated[list[str], add]  # Reducer pattern for accumulating errors
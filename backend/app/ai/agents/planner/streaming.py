@@ -0,0 +1,167 @@
+"""Streaming progress for plan generation.
+
+The planner graph is run with ``astream`` and its stream modes are turned
+into a small set of client events:
+
+- progress: a node started, completed or failed
+- attractions: attractions selected by fetch_venues (before the Naver search)
+- day: a finished itinerary day, from the scheduler, a map-reduce day call or
+  the generate_plan LLM output parsed while it streams
+- plan: the final plan (sent by the caller once the graph has finished)
+
+Day events are previews: the final plan is still validated, repaired and
+possibly regenerated, so clients replace them with the plan event.
+"""
+
+import logging
+
+from langchain_core.messages import BaseMessage
+from langchain_core.utils.json import parse_partial_json
+from langgraph.config import get_stream_writer
+
+logger = logging.getLogger(__name__)
+
+# Stream modes consumed by PlanEventStream
+STREAM_MODES = ["tasks", "custom", "messages", "values"]
+
+PLANNER_NODES = frozenset({
+    "collect_info",
+    "fetch_venues",
+    "cluster_days",
+    "generate_plan",
+    "optimize_routes",
+    "validate_plan",
+})
+
+# Attraction fields sent to clients (embeddings/descriptions stay server-side)
+ATTRACTION_FIELDS = ("id", "name", "category", "district", "address", "latitude", "longitude")
+
+
+def emit(event: str, data: dict) -> None:
+    """Publish an event to streaming consumers of the running graph.
+
+    No-op outside a graph run and when the graph is not streamed
+    (``ainvoke``), so nodes can call it unconditionally.
+    """
+    try:
+        writer = get_stream_writer()
+    except RuntimeError:
+        return
+    writer({"event": event, "data": data})
+
+
+def attraction_summary(attractions: list[dict]) -> dict:
+    """Payload of the attractions event."""
+    return {"attractions": [{key: a.get(key) for key in ATTRACTION_FIELDS} for a in attractions]}
+
+
+class ItineraryStreamParser:
+    """Extract finished itinerary days from TravelPlan JSON as it streams.
+
+    The JSON is only parsed when an object or array closes at day level or
+    above (depth <= 2), so the cost is one partial parse per day instead of
+    one per token.
+
+    Example:
+        parser = ItineraryStreamParser()
+        parser.feed('{"title": "서울", "itinerary": [{"day": 1')  # []
+        parser.feed(', "activities": []}, {')                     # [{"day": 1, ...}]
+    """
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._emitted = 0
+
+    def feed(self, text: str) -> list[dict]:
+        """Add streamed text and return days completed by it."""
+        days = []
+        for char in text:
+            self._buffer += char
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth <= 2:
+                    days.extend(self._completed_days())
+        return days
+
+    def _completed_days(self) -> list[dict]:
+        parsed = parse_partial_json(self._buffer)
+        if not isinstance(parsed, dict) or not isinstance(parsed.get("itinerary"), list):
+            return []
+        days = [d for d in parsed["itinerary"][self._emitted:] if isinstance(d, dict)]
+        self._emitted = len(parsed["itinerary"])
+        return days
+
+
+def _message_text(message: BaseMessage) -> str:
+    """Streamed JSON text of a chunk (json_schema content or tool call arguments)."""
+    text = message.content if isinstance(message.content, str) else ""
+    for chunk in getattr(message, "tool_call_chunks", None) or []:
+        text += chunk.get("args") or ""
+    return text
+
+
+class PlanEventStream:
+    """Translate planner ``astream`` output into (event, data) pairs.
+
+    Args passed to ``translate`` are the (mode, chunk) tuples produced by
+    ``graph.astream(state, stream_mode=STREAM_MODES)``. The last "values"
+    chunk is kept as ``final_state``.
+    """
+
+    def __init__(self) -> None:
+        self.final_state: dict = {}
+        self._parsers: dict[str, ItineraryStreamParser] = {}
+        self._sent_days: set[int] = set()
+
+    def translate(self, mode: str, chunk) -> list[tuple[str, dict]]:
+        """Events for one stream chunk (possibly none)."""
+        if mode == "values":
+            self.final_state = chunk
+            return []
+
+        if mode == "tasks":
+            if chunk["name"] not in PLANNER_NODES:
+                return []
+            if "input" in chunk:
+                status = "started"
+            else:
+                status = "failed" if chunk.get("error") else "completed"
+            return [("progress", {"node": chunk["name"], "status": status})]
+
+        if mode == "custom":
+            if chunk["event"] == "day":
+                return self._day(chunk["data"])
+            return [(chunk["event"], chunk["data"])]
+
+        if mode == "messages":
+            message, metadata = chunk
+            if metadata.get("langgraph_node") != "generate_plan":
+                return []
+            # Hedged/retried calls stream concurrently; keep one parser per message
+            parser = self._parsers.setdefault(message.id or "", ItineraryStreamParser())
+            return [event for day in parser.feed(_message_text(message)) for event in self._day(day)]
+
+        return []
+
+    def _day(self, day: dict) -> list[tuple[str, dict]]:
+        """Day event, sent once per day number."""
+        number = day.get("day")
+        if not isinstance(number, int) or number in self._sent_days:
+            return []
+        self._sent_days.add(number)
+        logger.debug(f"📤 [stream] Day {number} ready")
+        return [("day", day)]
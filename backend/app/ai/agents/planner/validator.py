@@ -0,0 +1,351 @@
+"""Rule-based travel plan validation and targeted repair.
+
+Checks the same rules the LLM validator used to (see the former
+VALIDATE_PLAN_PROMPT) in pure Python:
+- Time conflicts between activities on the same day (10 minutes tolerated),
+  including the travel time between them when live routing times are given
+- Total cost more than 20% over budget
+- Missing or placeholder dates
+- Empty days / empty itinerary
+- Full days (morning to evening) without lunch or dinner
+- daily_cost, total_cost and total_days consistency
+
+Most failures are repaired in place (shift times, recompute sums, restore
+dates, drop paid attractions to fit the budget). Venue prices are never
+rewritten: a plan still over budget (e.g. because of the hotel) is reported
+back for an LLM retry, like everything else that cannot be fixed
+deterministically.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+OVERLAP_TOLERANCE_MINUTES = 10
+BUDGET_TOLERANCE = 0.2
+LATEST_START_MINUTES = 23 * 60 + 55
+TIME_ROUNDING_MINUTES = 5
+
+# Meal windows a restaurant visit must start in; a day running from before
+# lunch until dinner time needs both meals
+MEAL_WINDOWS = (
+    ("lunch", 11 * 60, 14 * 60),
+    ("dinner", 17 * 60, 20 * 60 + 30),
+)
+
+
+@dataclass(frozen=True)
+class PlanIssue:
+    """A single rule violation.
+
+    Example:
+        PlanIssue("time_overlap", "Day 2: 경복궁 overlaps 창덕궁", day=2)
+    """
+
+    code: str
+    message: str
+    day: int | None = None
+    fixable: bool = True
+
+
+def _parse_time(value: str | None) -> int | None:
+    try:
+        hours, minutes = (value or "").split(":")
+        hours, minutes = int(hours), int(minutes)
+    except ValueError:
+        return None
+    if not (0 <= hours < 24 and 0 <= minutes < 60):
+        return None
+    return hours * 60 + minutes
+
+
+def _format_time(minutes: int) -> str:
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def _parse_date(value: str | None) -> datetime | None:
+    try:
+        return datetime.strptime(value or "", "%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+def _expected_dates(start_date: str | None, count: int) -> list[str] | None:
+    start = _parse_date(start_date)
+    if start is None:
+        return None
+    return [(start + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(count)]
+
+
+def _accommodation_cost(plan: dict) -> int:
+    accommodation = plan.get("accommodation") or {}
+    return int(accommodation.get("cost_per_night", 0)) * int(accommodation.get("total_nights", 0))
+
+
+def _expected_total(plan: dict) -> int:
+    return sum(int(day.get("daily_cost", 0)) for day in plan.get("itinerary", [])) + _accommodation_cost(plan)
+
+
+# ============================================================================
+# Checks
+# ============================================================================
+
+
+def _missing_meals(number: int, activities: list[dict], times: list[int]) -> list[PlanIssue]:
+    """Flag a full day that skips lunch or dinner."""
+    day_start = min(times)
+    day_end = max(t + int(a.get("duration_minutes", 0)) for a, t in zip(activities, times, strict=True))
+    if day_start > MEAL_WINDOWS[0][1] or day_end < MEAL_WINDOWS[-1][1]:
+        return []
+
+    meal_times = [t for a, t in zip(activities, times, strict=True) if a.get("venue_type") == "restaurant"]
+    return [
+        PlanIssue(
+            "missing_meal",
+            f"Day {number} has no {meal} between {_format_time(earliest)} and {_format_time(latest)}",
+            number,
+            fixable=False,
+        )
+        for meal, earliest, latest in MEAL_WINDOWS
+        if not any(earliest <= t <= latest for t in meal_times)
+    ]
+
+
+def check_plan(
+    plan: dict,
+    budget: int | None = None,
+    num_days: int | None = None,
+    start_date: str | None = None,
+    travel_minutes: dict[tuple[int, int], int] | None = None,
+) -> list[PlanIssue]:
+    """Run every rule against a plan.
+
+    Args:
+        plan: TravelPlan dict
+        budget: Total budget in KRW (budget rule skipped if falsy)
+        num_days: Expected number of days (skipped if None)
+        start_date: First trip day in YYYY-MM-DD (enables date repair)
+        travel_minutes: Travel minutes into an activity from the previous one,
+            keyed by (day position, activity index) (see routing.itinerary_legs)
+
+    Returns:
+        Issues found (empty if the plan is valid)
+    """
+    issues: list[PlanIssue] = []
+    itinerary = plan.get("itinerary") or []
+
+    if not itinerary:
+        return [PlanIssue("empty_itinerary", "Itinerary has no days", fixable=False)]
+
+    if num_days is not None and len(itinerary) != num_days:
+        issues.append(PlanIssue(
+            "missing_days",
+            f"Itinerary has {len(itinerary)} days, expected {num_days}",
+            fixable=False,
+        ))
+
+    expected_dates = _expected_dates(start_date, len(itinerary))
+
+    for index, day in enumerate(itinerary):
+        number = index + 1
+        activities = day.get("activities") or []
+
+        if day.get("day") != number:
+            issues.append(PlanIssue("day_number", f"Day {number} is numbered {day.get('day')}", number))
+
+        date = day.get("date")
+        if _parse_date(date) is None or (expected_dates and date != expected_dates[index]):
+            issues.append(PlanIssue(
+                "placeholder_date",
+                f"Day {number} has invalid date {date!r}",
+                number,
+                fixable=expected_dates is not None,
+            ))
+
+        if not activities:
+            issues.append(PlanIssue("empty_day", f"Day {number} has no activities", number, fixable=False))
+            continue
+
+        times = [_parse_time(a.get("time")) for a in activities]
+        if any(t is None for t in times):
+            issues.append(PlanIssue("invalid_time", f"Day {number} has unparsable times", number, fixable=False))
+        else:
+            for index in range(1, len(activities)):
+                previous, current = activities[index - 1], activities[index]
+                travel = (travel_minutes or {}).get((number, index), 0)
+                previous_end = times[index - 1] + int(previous.get("duration_minutes", 0)) + travel
+                if times[index] < previous_end - OVERLAP_TOLERANCE_MINUTES:
+                    travel_note = f" (incl. {travel} min travel)" if travel else ""
+                    issues.append(PlanIssue(
+                        "time_overlap",
+                        f"Day {number}: {current.get('venue_name')} at {current.get('time')} "
+                        f"overlaps {previous.get('venue_name')}{travel_note}",
+                        number,
+                    ))
+
+            issues.extend(_missing_meals(number, activities, times))
+
+        activity_total = sum(int(a.get("estimated_cost", 0)) for a in activities)
+        if int(day.get("daily_cost", 0)) != activity_total:
+            issues.append(PlanIssue(
+                "daily_cost_mismatch",
+                f"Day {number} daily_cost {day.get('daily_cost')} != activities {activity_total}",
+                number,
+            ))
+
+    if plan.get("total_days") != len(itinerary):
+        issues.append(PlanIssue(
+            "total_days_mismatch",
+            f"total_days {plan.get('total_days')} != {len(itinerary)} itinerary days",
+        ))
+
+    expected_total = _expected_total(plan)
+    if int(plan.get("total_cost", 0)) != expected_total:
+        issues.append(PlanIssue(
+            "total_cost_mismatch",
+            f"total_cost {plan.get('total_cost')} != days + accommodation {expected_total}",
+        ))
+
+    if budget and int(plan.get("total_cost", 0)) > budget * (1 + BUDGET_TOLERANCE):
+        issues.append(PlanIssue(
+            "budget_exceeded",
+            f"Total cost {plan.get('total_cost'):,} exceeds budget {budget:,} by more than 20%; "
+            "choose cheaper venues or accommodation",
+        ))
+
+    return issues
+
+
+# ============================================================================
+# Repairs
+# ============================================================================
+
+
+def _fix_days(plan: dict, start_date: str | None) -> None:
+    """Renumber days and restore dates from the trip start."""
+    expected_dates = _expected_dates(start_date, len(plan["itinerary"]))
+    for index, day in enumerate(plan["itinerary"]):
+        day["day"] = index + 1
+        if expected_dates is not None:
+            day["date"] = expected_dates[index]
+
+
+def _fix_overlaps(day: dict, travel: dict[int, int]) -> None:
+    """Push conflicting activities later so each starts after the previous ends (plus travel)."""
+    activities = day.get("activities") or []
+    times = [_parse_time(a.get("time")) for a in activities]
+    if any(t is None for t in times):
+        return
+
+    clock = None
+    for index, (activity, start) in enumerate(zip(activities, times, strict=True)):
+        if clock is not None:
+            clock += travel.get(index, 0)
+            if start < clock - OVERLAP_TOLERANCE_MINUTES:
+                start = -(-clock // TIME_ROUNDING_MINUTES) * TIME_ROUNDING_MINUTES
+                activity["time"] = _format_time(min(start, LATEST_START_MINUTES))
+        clock = start + int(activity.get("duration_minutes", 0))
+
+
+def _recompute_costs(plan: dict) -> None:
+    for day in plan["itinerary"]:
+        day["daily_cost"] = sum(int(a.get("estimated_cost", 0)) for a in day.get("activities") or [])
+    plan["total_cost"] = _expected_total(plan)
+    plan["total_days"] = len(plan["itinerary"])
+
+
+def _fit_budget(plan: dict, budget: int) -> None:
+    """Drop the most expensive attractions until within budget (prices are kept)."""
+    limit = int(budget * (1 + BUDGET_TOLERANCE))
+    _recompute_costs(plan)
+    if plan["total_cost"] <= limit:
+        return
+
+    paid = sorted(
+        (
+            (int(a.get("estimated_cost", 0)), day_index, a)
+            for day_index, day in enumerate(plan["itinerary"])
+            for a in day.get("activities") or []
+            if a.get("venue_type") == "attraction" and int(a.get("estimated_cost", 0)) > 0
+        ),
+        key=lambda item: -item[0],
+    )
+    for _, day_index, activity in paid:
+        if plan["total_cost"] <= limit:
+            break
+        activities = plan["itinerary"][day_index]["activities"]
+        if len(activities) > 1:
+            activities.remove(activity)
+            _recompute_costs(plan)
+
+
+def repair_plan(
+    plan: dict,
+    budget: int | None = None,
+    start_date: str | None = None,
+    travel_minutes: dict[tuple[int, int], int] | None = None,
+) -> dict:
+    """Apply every deterministic repair (idempotent).
+
+    Args:
+        plan: TravelPlan dict (not modified)
+        budget: Total budget in KRW
+        start_date: First trip day in YYYY-MM-DD
+        travel_minutes: Travel minutes keyed by (day position, activity index)
+
+    Returns:
+        Repaired copy of the plan
+    """
+    plan = {
+        **plan,
+        "accommodation": dict(plan.get("accommodation") or {}),
+        "itinerary": [
+            {**day, "activities": [dict(a) for a in day.get("activities") or []]}
+            for day in plan.get("itinerary") or []
+        ],
+    }
+
+    _fix_days(plan, start_date)
+    travel_by_day: dict[int, dict[int, int]] = {}
+    for (number, index), minutes in (travel_minutes or {}).items():
+        travel_by_day.setdefault(number, {})[index] = minutes
+    for number, day in enumerate(plan["itinerary"], start=1):
+        _fix_overlaps(day, travel_by_day.get(number, {}))
+    if budget:
+        _fit_budget(plan, budget)
+    _recompute_costs(plan)
+    return plan
+
+
+def validate_and_repair(
+    plan: dict,
+    budget: int | None = None,
+    num_days: int | None = None,
+    start_date: str | None = None,
+    travel_minutes: dict[tuple[int, int], int] | None = None,
+) -> tuple[dict, list[PlanIssue], list[PlanIssue]]:
+    """Check a plan, repair what can be repaired and re-check.
+
+    Args:
+        plan: TravelPlan dict
+        budget: Total budget in KRW
+        num_days: Expected number of days
+        start_date: First trip day in YYYY-MM-DD
+        travel_minutes: Live travel minutes keyed by (day position, activity index)
+
+    Returns:
+        Tuple of (plan, issues found initially, issues remaining after repair)
+    """
+    issues = check_plan(plan, budget, num_days, start_date, travel_minutes)
+    if not issues:
+        return plan, [], []
+
+    if any(issue.fixable for issue in issues):
+        plan = repair_plan(plan, budget, start_date, travel_minutes)
+        remaining = check_plan(plan, budget, num_days, start_date, travel_minutes)
+    else:
+        remaining = issues
+
+    return plan, issues, remaining
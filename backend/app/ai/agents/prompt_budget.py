@@ -0,0 +1,256 @@
+"""Token-budgeted prompt construction.
+
+Venue lists used to be serialized with ``json.dumps`` of the full retrieval
+dicts (long introductions, addresses, phone numbers, coordinates, similarity
+scores). This module builds a compact venue context instead:
+- Short keys (legend in planner prompts' VENUE_KEYS_NOTE) and minified JSON
+- Descriptions truncated to PROMPT_DESCRIPTION_MAX_CHARS
+- Empty and placeholder fields dropped
+- Restaurants reference their attraction by id ("near": "A3") instead of name
+- Lowest-relevance venues pruned until the context fits PROMPT_VENUE_TOKEN_BUDGET
+
+Tokens are counted locally with tiktoken. If the encoding cannot be loaded
+(no network to fetch the BPE file and no TIKTOKEN_CACHE_DIR), a
+character-based estimate is used instead.
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+
+from langchain_core.messages import BaseMessage
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Per-message overhead of the chat format (role and separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+_EMPTY_VALUES = (None, "", "정보 없음", "정보없음", [], {})
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    """Load the tokenizer for the configured model (None if unavailable)."""
+    import tiktoken
+
+    try:
+        try:
+            return tiktoken.encoding_for_model(settings.OPENAI_MODEL)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.warning(f"⚠️ [prompt_budget] Tokenizer unavailable, estimating token counts: {e}")
+        return None
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough count: ~4 ASCII characters per token, one token per other character."""
+    ascii_chars = sum(1 for ch in text if ch.isascii())
+    return -(-ascii_chars // 4) + (len(text) - ascii_chars)
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens in ``text`` with the configured model's tokenizer."""
+    encoding = _encoding()
+    if encoding is None:
+        return _estimate_tokens(text)
+    return len(encoding.encode(text))
+
+
+def count_message_tokens(messages: list[BaseMessage]) -> int:
+    """Count prompt tokens for a list of chat messages."""
+    return sum(count_tokens(str(m.content)) + MESSAGE_OVERHEAD_TOKENS for m in messages)
+
+
+def log_prompt_tokens(node: str, messages: list[BaseMessage]) -> int:
+    """Log and return the prompt token count of an LLM call made by ``node``."""
+    tokens = count_message_tokens(messages)
+    logger.info(f"📏 [{node}] Prompt tokens: {tokens:,}")
+    return tokens
+
+
+def truncate(text: str, max_chars: int) -> str:
+    """Cut ``text`` to ``max_chars`` characters, ending with an ellipsis if cut."""
+    text = " ".join((text or "").split())
+    if len(text) <= max_chars:
+        return text
+    return text[: max(max_chars - 1, 0)].rstrip() + "…"
+
+
+def _drop_empty(item: dict) -> dict:
+    return {key: value for key, value in item.items() if value not in _EMPTY_VALUES}
+
+
+def _km(value) -> float | None:
+    return round(float(value), 1) if value is not None else None
+
+
+def compact_attraction(attraction: dict, ref: str, max_description_chars: int) -> dict:
+    """Compact form of an attraction dict."""
+    return _drop_empty({
+        "id": ref,
+        "n": attraction.get("name"),
+        "c": attraction.get("category"),
+        "d": truncate(attraction.get("description") or "", max_description_chars),
+        "g": attraction.get("district"),
+    })
+
+
+def compact_restaurant(restaurant: dict, ref: str, attraction_refs: dict[str, str]) -> dict:
+    """Compact form of a restaurant dict (its description only repeats the category)."""
+    return _drop_empty({
+        "id": ref,
+        "n": restaurant.get("name"),
+        "c": restaurant.get("category"),
+        "near": attraction_refs.get(restaurant.get("near_attraction") or ""),
+        "km": _km(restaurant.get("distance_km")),
+    })
+
+
+def compact_accommodation(accommodation: dict, ref: str) -> dict:
+    """Compact form of an accommodation dict."""
+    return _drop_empty({
+        "id": ref,
+        "n": accommodation.get("name"),
+        "c": accommodation.get("category"),
+        "km": _km(accommodation.get("distance_km")),
+    })
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+@dataclass
+class VenueContext:
+    """Serialized venue context for a prompt.
+
+    Attributes:
+        day_buckets: Compact JSON of the per-day buckets
+        accommodations: Compact JSON of the accommodation candidates
+        tokens: Token count of both strings together
+        pruned: Number of venues removed to fit the budget
+    """
+
+    day_buckets: str
+    accommodations: str
+    tokens: int
+    pruned: int
+
+
+def _serialize(day_buckets: list[dict], accommodations: list[dict], max_description_chars: int) -> tuple[str, str]:
+    attraction_refs: dict[str, str] = {}
+    buckets = []
+    restaurant_index = 0
+    for bucket in day_buckets:
+        attractions = []
+        for attraction in bucket.get("attractions", []):
+            ref = attraction_refs.setdefault(attraction.get("name") or "", f"A{len(attraction_refs) + 1}")
+            attractions.append(compact_attraction(attraction, ref, max_description_chars))
+        restaurants = []
+        for restaurant in bucket.get("restaurants", []):
+            restaurant_index += 1
+            restaurants.append(compact_restaurant(restaurant, f"R{restaurant_index}", attraction_refs))
+        buckets.append(_drop_empty({
+            "day": bucket.get("day"),
+            "date": bucket.get("date"),
+            "attractions": attractions,
+            "restaurants": restaurants,
+        }))
+
+    lodging = [compact_accommodation(a, f"H{i}") for i, a in enumerate(accommodations, 1)]
+    return _dumps(buckets), _dumps(lodging)
+
+
+def _prune_once(day_buckets: list[dict], accommodations: list[dict]) -> bool:
+    """Remove the least relevant venue in place; False when nothing can go.
+
+    Order: extra accommodations (farthest first), then the lowest-similarity
+    attraction together with its restaurants (keeping one per day), then the
+    farthest restaurant (keeping one per day).
+    """
+    if len(accommodations) > 1:
+        farthest = max(accommodations, key=lambda a: a.get("distance_km") or 0)
+        accommodations.remove(farthest)
+        return True
+
+    candidates = [
+        (attraction.get("similarity_score") or 0, bucket, attraction)
+        for bucket in day_buckets
+        if len(bucket.get("attractions", [])) > 1
+        for attraction in bucket["attractions"]
+    ]
+    if candidates:
+        _, bucket, attraction = min(candidates, key=lambda item: item[0])
+        bucket["attractions"] = [a for a in bucket["attractions"] if a is not attraction]
+        remaining = [
+            r for r in bucket.get("restaurants", []) if r.get("near_attraction") != attraction.get("name")
+        ]
+        bucket["restaurants"] = remaining or bucket.get("restaurants", [])[:1]
+        return True
+
+    candidates = [
+        (restaurant.get("distance_km") or 0, bucket, restaurant)
+        for bucket in day_buckets
+        if len(bucket.get("restaurants", [])) > 1
+        for restaurant in bucket["restaurants"]
+    ]
+    if candidates:
+        _, bucket, restaurant = max(candidates, key=lambda item: item[0])
+        bucket["restaurants"] = [r for r in bucket["restaurants"] if r is not restaurant]
+        return True
+
+    return False
+
+
+def _venue_count(day_buckets: list[dict], accommodations: list[dict]) -> int:
+    return len(accommodations) + sum(
+        len(b.get("attractions", [])) + len(b.get("restaurants", [])) for b in day_buckets
+    )
+
+
+def build_venue_context(
+    day_buckets: list[dict],
+    accommodations: list[dict],
+    token_budget: int | None = None,
+    max_description_chars: int | None = None,
+) -> VenueContext:
+    """Serialize day buckets and accommodations within a token budget.
+
+    Args:
+        day_buckets: Per-day buckets from cluster_days (not modified)
+        accommodations: Accommodation candidates (not modified)
+        token_budget: Maximum tokens for the venue context
+            (default: PROMPT_VENUE_TOKEN_BUDGET)
+        max_description_chars: Description truncation length
+            (default: PROMPT_DESCRIPTION_MAX_CHARS)
+
+    Returns:
+        VenueContext (may exceed the budget if every day is down to one
+        attraction and one restaurant)
+    """
+    if token_budget is None:
+        token_budget = settings.PROMPT_VENUE_TOKEN_BUDGET
+    if max_description_chars is None:
+        max_description_chars = settings.PROMPT_DESCRIPTION_MAX_CHARS
+
+    buckets = [
+        {**b, "attractions": list(b.get("attractions", [])), "restaurants": list(b.get("restaurants", []))}
+        for b in day_buckets
+    ]
+    lodging = list(accommodations)
+    original_count = _venue_count(buckets, lodging)
+
+    while True:
+        buckets_text, lodging_text = _serialize(buckets, lodging, max_description_chars)
+        tokens = count_tokens(buckets_text) + count_tokens(lodging_text)
+        if tokens <= token_budget or not _prune_once(buckets, lodging):
+            break
+
+    pruned = original_count - _venue_count(buckets, lodging)
+    if pruned:
+        logger.info(f"✂️ [prompt_budget] Pruned {pruned} venues to fit {token_budget:,} tokens ({tokens:,} used)")
+    return VenueContext(buckets_text, lodging_text, tokens, pruned)
@@ -0,0 +1,318 @@
+"""Rule-based feedback classification for the reviewer fast path.
+
+Most review feedback is short and formulaic ("좋아요", "이대로 확정", "2일차
+점심 식당 바꿔줘"), so parse_feedback does not need an LLM to tell approve,
+reject and modify apart. Two local classifiers run before the LLM:
+- Keyword/regex rules over approve/reject/modify signals, modification
+  categories and target days, with a confidence score.
+- Optionally, a small character n-gram nearest-centroid model trained on the
+  built-in examples below at import time. It settles feedback the rules are
+  unsure about (e.g. no known keyword).
+
+parse_feedback uses the result when its confidence reaches
+REVIEW_FEEDBACK_MIN_CONFIDENCE and calls the LLM otherwise.
+"""
+
+import re
+import zlib
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from app.ai.agents.reviewer.models import FeedbackParsing
+
+# Rule confidences
+CLEAR_CONFIDENCE = 0.95  # A single unambiguous signal
+CATEGORY_CONFIDENCE = 0.9  # Modify with exactly one category
+WEAK_CONFIDENCE = 0.6  # Modify without (or with several) categories
+CONFLICT_CONFIDENCE = 0.4  # Contradicting signals, e.g. "좋은데 점심은 별로"
+NEGATED_CONFIDENCE = 0.3  # Approval word under a negation cue, e.g. "확정하지 마세요"
+
+_APPROVE = (
+    "좋아요", "좋아", "좋네요", "좋습니다", "좋군요", "확정", "이대로", "그대로 진행", "완벽", "마음에 들어",
+    "마음에 듭니다", "만족", "괜찮아", "괜찮은", "괜찮네요", "괜찮습니다", "오케이", "최고", "진행해", "👍",
+    "ok", "okay", "good", "yes", "looks good", "sounds good", "perfect", "great", "approve", "confirm", "love it",
+)
+_REJECT = (
+    "싫어", "싫습니다", "별로", "마음에 안 들", "마음에 들지 않", "다시 짜", "다시 만들", "처음부터",
+    "전부 다시", "전체 다시", "취소", "필요 없",
+    "reject", "start over", "don't like", "do not like", "hate", "cancel", "not good", "redo",
+)
+_NEGATION = re.compile(r"(?:안\s*|못\s*)(?:좋|괜찮|마음에)|(?:좋|괜찮)지\s*(?:않|못)|\bnot\s+(?:good|great|ok)")
+# Negation cues around approval words; the LLM decides what such feedback means.
+# Korean negates after the word ("확정하지 마세요", "만족스럽지 않아요", "이대로는
+# 안 돼요"), English before it ("don't confirm yet", "not perfect").
+_KO_NEGATED_APPROVAL = re.compile(
+    "(?:" + "|".join(re.escape(k) for k in _APPROVE if not k.isascii()) + ")"
+    r".{0,6}?(?:않|안|못|아니|말(?:고|아|라)|지\s*마)"
+)
+_EN_NEGATION = re.compile(r"\b(?:not|no|never|don't|dont|doesn't|isn't|aren't|won't|can't)\b")
+_CONTRAST = ("근데", "그런데", "하지만", "다만", "그래도", "but", "however", "except")
+# Approval keywords that only count as whole words ("좋아" but not "좋아해요")
+_WHOLE_WORD_APPROVE = ("좋아",)
+# Requests and questions next to an approval word ask for something else
+# ("괜찮은 식당으로 해주세요", "okay, what about ...?"); asking to confirm does not
+_APPROVAL_REQUEST = re.compile(r"(?:확정|진행|이대로|그대로)\s*해\s*(?:주세요|줘)")
+_REQUEST_ENDING = re.compile(r"해\s*주세요|해\s*줘|로\s*해")
+_QUESTION = re.compile(
+    r"\?|궁금|어때|어떨까|어떻게|인가요|\b(?:what|how|why|when|where|which|could|can|would)\b"
+)
+_MODIFY = (
+    "바꿔", "바꾸", "바꿨", "변경", "대신", "빼", "추가", "넣어", "교체", "다른", "줄여", "늘려", "수정",
+    "옮겨", "조정", "싸게", "저렴", "일찍", "늦게", "여유", "말고",
+    "change", "replace", "swap", "instead", "add", "remove", "drop", "move", "cheaper", "another",
+    "different", "shorter", "longer", "earlier", "later", "less", "fewer",
+)
+
+# modification_type categories and their keywords
+_CATEGORIES: dict[str, tuple[str, ...]] = {
+    "restaurant": ("식당", "맛집", "점심", "저녁", "아침 식사", "식사", "음식", "밥", "메뉴", "카페",
+                   "restaurant", "lunch", "dinner", "breakfast", "meal", "food", "cafe"),
+    "accommodation": ("숙소", "호텔", "숙박", "게스트하우스", "에어비앤비", "모텔", "한옥스테이",
+                      "hotel", "accommodation", "hostel", "airbnb"),
+    "attraction": ("관광지", "명소", "장소", "코스", "박물관", "미술관", "궁궐", "고궁", "공원", "시장", "구경",
+                   "attraction", "sight", "museum", "palace", "spot", "place", "tour"),
+    "budget": ("예산", "비용", "비싸", "저렴", "싸게", "가격", "경비", "돈",
+               "budget", "cost", "cheaper", "expensive", "price"),
+    "time": ("시간", "일찍", "늦게", "빡빡", "여유", "느긋", "출발", "오전", "오후",
+             "time", "earlier", "later", "schedule", "rushed", "relaxed"),
+}
+
+_DAY_NUMBER = re.compile(r"(\d+)\s*(?:일\s*차|일째|번째\s*날)|\bday\s*(\d+)\b|\b(\d+)(?:st|nd|rd|th)\s+day\b")
+_DAY_ORDINALS = {
+    "첫째 날": 1, "첫날": 1, "첫 날": 1, "둘째 날": 2, "둘째날": 2, "셋째 날": 3, "셋째날": 3,
+    "넷째 날": 4, "넷째날": 4, "다섯째 날": 5, "다섯째날": 5,
+    "first day": 1, "second day": 2, "third day": 3, "fourth day": 4, "fifth day": 5,
+}
+_LAST_DAY = re.compile(r"마지막\s*날|\blast\s+day\b")
+
+
+@dataclass(frozen=True)
+class FeedbackClassification:
+    """Local classification of review feedback."""
+
+    parsing: FeedbackParsing
+    confidence: float  # 0.0-1.0
+    source: str  # "rules" or "model"
+
+
+def _contains(text: str, keyword: str) -> bool:
+    """Substring match for Korean, whole-word match for English keywords."""
+    if keyword.isascii() and keyword[0].isalnum():
+        return re.search(rf"\b{re.escape(keyword)}\b", text) is not None
+    if keyword in _WHOLE_WORD_APPROVE:
+        return re.search(rf"{re.escape(keyword)}(?![가-힣])", text) is not None
+    return keyword in text
+
+
+def _any(text: str, keywords: tuple[str, ...]) -> bool:
+    return any(_contains(text, k) for k in keywords)
+
+
+def _categories(text: str) -> list[str]:
+    return [category for category, keywords in _CATEGORIES.items() if _any(text, keywords)]
+
+
+def _approval_negated(text: str) -> bool:
+    """Whether an approval word appears together with a negation cue."""
+    if _KO_NEGATED_APPROVAL.search(text):
+        return True
+    return _EN_NEGATION.search(text) is not None and _any(text, tuple(k for k in _APPROVE if k.isascii()))
+
+
+def _approval_hedged(text: str, categories: list[str]) -> bool:
+    """Whether an approval word comes with a plan topic, a request or a question."""
+    if categories or _QUESTION.search(text) or _any(text, _CONTRAST):
+        return True
+    return _REQUEST_ENDING.search(_APPROVAL_REQUEST.sub("", text)) is not None
+
+
+def _target_day(text: str, total_days: int | None) -> int | None:
+    match = _DAY_NUMBER.search(text)
+    if match:
+        return int(next(g for g in match.groups() if g))
+    for phrase, day in _DAY_ORDINALS.items():
+        if phrase in text:
+            return day
+    if total_days and _LAST_DAY.search(text):
+        return total_days
+    return None
+
+
+def _target_section(text: str, category: str | None, total_days: int | None) -> str | None:
+    day = _target_day(text, total_days)
+    if day is not None:
+        return f"day_{day}"
+    if category in ("accommodation", "budget"):
+        return category
+    return None
+
+
+def _parsing(
+    feedback_type: str, reasoning: str, category: str | None = None, target: str | None = None
+) -> FeedbackParsing:
+    return FeedbackParsing(
+        feedback_type=feedback_type,
+        modification_type=category if feedback_type == "modify" else None,
+        target_section=target if feedback_type == "modify" else None,
+        reasoning=reasoning,
+    )
+
+
+def classify_by_rules(feedback: str, total_days: int | None = None) -> FeedbackClassification:
+    """Classify feedback with keyword/regex rules.
+
+    Args:
+        feedback: User feedback text
+        total_days: Trip length, to resolve "마지막 날" / "last day"
+
+    Returns:
+        Classification with its confidence (0.0 if no rule matched)
+    """
+    text = " ".join(feedback.lower().split())
+    negated = _NEGATION.search(text) is not None
+    uncertain = not negated and _approval_negated(text)
+    approve = _any(text, _APPROVE) and not negated and not uncertain
+    reject = _any(text, _REJECT) or negated
+    modify = _any(text, _MODIFY)
+    categories = _categories(text)
+    category = categories[0] if len(categories) == 1 else None
+    target = _target_section(text, category, total_days)
+
+    def result(feedback_type: str, confidence: float, reasoning: str, modification_type: str | None = None):
+        parsing = _parsing(feedback_type, reasoning, modification_type, target)
+        return FeedbackClassification(parsing, confidence, "rules")
+
+    if modify or (reject and categories) or (target and categories):
+        # A specific part of the plan should change
+        if category:
+            confidence = CATEGORY_CONFIDENCE if modify else WEAK_CONFIDENCE
+            return result("modify", confidence, f"규칙: {category} 변경 요청", category)
+        return result("modify", WEAK_CONFIDENCE, "규칙: 일반 변경 요청", "general")
+    if reject:
+        confidence = CONFLICT_CONFIDENCE if approve else CLEAR_CONFIDENCE
+        return result("reject", confidence, "규칙: 계획 거절")
+    if uncertain:
+        return result("reject", NEGATED_CONFIDENCE, "규칙: 부정된 승인 표현")
+    if approve:
+        confidence = CONFLICT_CONFIDENCE if _approval_hedged(text, categories) else CLEAR_CONFIDENCE
+        return result("approve", confidence, "규칙: 계획 승인")
+    return result("modify", 0.0, "규칙: 해당 없음", "general")
+
+
+# Labelled examples for the local model ("modify:<modification_type>" for modify)
+TRAINING_EXAMPLES: dict[str, tuple[str, ...]] = {
+    "approve": (
+        "좋아요", "이대로 확정해 주세요", "완벽해요 감사합니다", "마음에 들어요", "이 일정으로 갈게요",
+        "네 이걸로 할게요", "딱 좋네요", "looks good to me", "perfect, let's go with this", "yes this works",
+    ),
+    "reject": (
+        "전부 마음에 안 들어요", "처음부터 다시 짜주세요", "별로예요 다른 계획으로", "이 계획은 싫어요",
+        "완전히 새로 만들어 주세요", "i don't like this plan at all", "start over please", "this is not what i wanted",
+    ),
+    "modify:restaurant": (
+        "점심 식당 바꿔주세요", "저녁은 한식으로 해주세요", "맛집 다른 곳으로", "둘째 날 저녁 메뉴 변경",
+        "채식 식당으로 해줘", "can you change the lunch place", "different restaurant for dinner",
+    ),
+    "modify:attraction": (
+        "박물관 말고 다른 관광지로", "궁궐 하나 빼주세요", "공원 대신 시장 구경", "관광지 하나 더 넣어줘",
+        "명소를 다른 곳으로", "replace the museum with a palace", "add another sight on day 2",
+    ),
+    "modify:accommodation": (
+        "숙소 바꿔주세요", "호텔을 강남으로", "게스트하우스로 변경", "숙박 다른 곳",
+        "change the hotel", "a cheaper hotel please",
+    ),
+    "modify:budget": (
+        "예산을 줄여주세요", "너무 비싸요 더 저렴하게", "비용 좀 낮춰줘", "돈을 덜 쓰고 싶어요",
+        "reduce the budget", "it's too expensive",
+    ),
+    "modify:time": (
+        "일정이 너무 빡빡해요", "아침 출발을 늦게", "좀 더 여유 있게", "시간을 조정해 주세요",
+        "too rushed, make it relaxed", "start later in the morning",
+    ),
+}
+
+_NGRAM_SIZES = (2, 3)
+_FEATURES = 2**12
+_SOFTMAX_TEMPERATURE = 0.05
+
+
+def _vectorize(text: str) -> np.ndarray:
+    """L2-normalized hashed character n-gram counts."""
+    text = f" {' '.join(text.lower().split())} "
+    vector = np.zeros(_FEATURES)
+    for n in _NGRAM_SIZES:
+        for i in range(len(text) - n + 1):
+            vector[zlib.crc32(text[i:i + n].encode()) % _FEATURES] += 1
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class NgramFeedbackModel:
+    """Nearest-centroid classifier over character n-grams."""
+
+    def __init__(self, examples: dict[str, tuple[str, ...]]):
+        """Fit one centroid per label.
+
+        Args:
+            examples: Texts per label
+        """
+        self.labels = list(examples)
+        centroids = np.stack([np.mean([_vectorize(t) for t in texts], axis=0) for texts in examples.values()])
+        self._centroids = centroids / np.linalg.norm(centroids, axis=1, keepdims=True)
+
+    def predict(self, text: str) -> tuple[str, float]:
+        """Most likely label and its probability (softmax over cosine similarities)."""
+        similarities = self._centroids @ _vectorize(text)
+        scores = np.exp((similarities - similarities.max()) / _SOFTMAX_TEMPERATURE)
+        best = int(np.argmax(scores))
+        return self.labels[best], float(scores[best] / scores.sum())
+
+
+@lru_cache(maxsize=1)
+def get_feedback_model() -> NgramFeedbackModel:
+    """Model trained on TRAINING_EXAMPLES (built once per process)."""
+    return NgramFeedbackModel(TRAINING_EXAMPLES)
+
+
+def classify_feedback(
+    feedback: str,
+    total_days: int | None = None,
+    use_model: bool = True,
+) -> FeedbackClassification:
+    """Classify feedback locally, with rules first and the n-gram model second.
+
+    The model is consulted only when the rules are not confident. It can
+    raise the confidence of a rule result it agrees with, or classify
+    feedback no rule matched. Negated approvals are never settled by the
+    model: its n-grams cannot tell "확정" from "확정하지 마세요".
+
+    Args:
+        feedback: User feedback text
+        total_days: Trip length, to resolve "마지막 날" / "last day"
+        use_model: Whether to consult the local model
+
+    Returns:
+        The more confident local classification
+    """
+    rules = classify_by_rules(feedback, total_days)
+    if not use_model or rules.confidence >= CLEAR_CONFIDENCE:
+        return rules
+    if _approval_negated(" ".join(feedback.lower().split())):
+        return rules
+
+    label, probability = get_feedback_model().predict(feedback)
+    feedback_type, _, category = label.partition(":")
+    agrees = feedback_type == rules.parsing.feedback_type and (
+        feedback_type != "modify" or category == rules.parsing.modification_type
+    )
+
+    if agrees and probability > rules.confidence:
+        return FeedbackClassification(rules.parsing, probability, "model")
+    if rules.confidence == 0.0:
+        text = " ".join(feedback.lower().split())
+        target = _target_section(text, category or None, total_days)
+        parsing = _parsing(feedback_type, f"모델: {label}", category or None, target)
+        return FeedbackClassification(parsing, probability, "model")
+    return rules
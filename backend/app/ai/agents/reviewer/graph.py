@@ -2,7 +2,9 @@
 
 import logging
 
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import START, StateGraph
+from langgraph.graph.state import CompiledStateGraph
 
 from app.ai.agents.reviewer.nodes import (
     fetch_context,
@@ -56,5 +58,17 @@ def create_reviewer_graph() -> StateGraph:
     return graph
 
 
+def compile_reviewer_graph(checkpointer: BaseCheckpointSaver | None = None) -> CompiledStateGraph:
+    """Compile the reviewer graph, optionally persisting state per thread_id.
+
+    Args:
+        checkpointer: Saver for review sessions (None: stateless runs)
+
+    Returns:
+        Compiled reviewer graph
+    """
+    return create_reviewer_graph().compile(checkpointer=checkpointer)
+
+
 # Compile the graph
-reviewer_graph = create_reviewer_graph().compile()
+reviewer_graph = compile_reviewer_graph()
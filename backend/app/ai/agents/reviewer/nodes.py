@@ -7,89 +7,155 @@ from typing import Literal
 from langchain_core.messages import HumanMessage, SystemMessage
 from langgraph.types import Command
 
+from app.ai.agents.llm_cache import cached_structured_call
+from app.ai.agents.llm_router import invoke_structured
 from app.ai.agents.planner.models import TravelPlan
+from app.ai.agents.prompt_budget import log_prompt_tokens
+from app.ai.agents.reviewer.feedback_classifier import classify_feedback
 from app.ai.agents.reviewer.models import FeedbackParsing
-from app.ai.agents.reviewer.prompts import MODIFY_PLAN_PROMPT, PARSE_FEEDBACK_PROMPT
+from app.ai.agents.reviewer.prompts import (
+    MODIFY_PLAN_PROMPT,
+    MODIFY_PLAN_SYSTEM_PROMPT,
+    MODIFY_SECTION_PROMPT,
+    MODIFY_SECTION_SYSTEM_PROMPT,
+    PARSE_FEEDBACK_PROMPT,
+    PARSE_FEEDBACK_SYSTEM_PROMPT,
+)
+from app.ai.agents.reviewer.sections import (
+    PlanSection,
+    extract_section,
+    merge_section,
+    plan_outline,
+    resolve_section,
+    serialize_section,
+)
 from app.ai.agents.reviewer.state import ReviewState
-from app.ai.agents.utils import get_llm
+from app.config import settings
 
 logger = logging.getLogger(__name__)
 
 
 async def parse_feedback(state: ReviewState) -> Command[Literal["__end__", "fetch_context"]]:
-    """Parse user feedback to determine action type and modification needs."""
-    from langgraph.graph import END
+    """Parse user feedback to determine action type and modification needs.
 
-    llm = get_llm(temperature=0)
-    structured_llm = llm.with_structured_output(FeedbackParsing)
+    Feedback is classified locally first (see feedback_classifier); the LLM
+    is only called when the local result is below
+    REVIEW_FEEDBACK_MIN_CONFIDENCE.
+    """
+    from langgraph.graph import END
 
-    prompt = PARSE_FEEDBACK_PROMPT.format(
-        original_plan=json.dumps(state["original_plan"], ensure_ascii=False),
-        user_feedback=state["user_feedback"],
-    )
+    parsed = None
+    if settings.REVIEW_FEEDBACK_FAST_PATH_ENABLED:
+        classification = classify_feedback(
+            state["user_feedback"],
+            total_days=state["original_plan"].get("total_days"),
+            use_model=settings.REVIEW_FEEDBACK_LOCAL_MODEL_ENABLED,
+        )
+        if classification.confidence >= settings.REVIEW_FEEDBACK_MIN_CONFIDENCE:
+            parsed = classification.parsing
+            logger.info(
+                f"⚡ [parse_feedback] Classified by {classification.source} "
+                f"(confidence {classification.confidence:.2f}), skipping LLM"
+            )
 
-    messages = [
-        SystemMessage(content="You are a feedback analysis assistant."),
-        HumanMessage(content=prompt),
-    ]
+    if parsed is None:
+        prompt = PARSE_FEEDBACK_PROMPT.format(
+            original_plan=json.dumps(state["original_plan"], ensure_ascii=False),
+            user_feedback=state["user_feedback"],
+        )
 
-    try:
-        parsed: FeedbackParsing = await structured_llm.ainvoke(messages)
-        logger.debug(f"🤖 Parsed feedback: {parsed.model_dump()}")
+        messages = [
+            SystemMessage(content=PARSE_FEEDBACK_SYSTEM_PROMPT),
+            HumanMessage(content=prompt),
+        ]
+        log_prompt_tokens("parse_feedback", messages)
 
-        # Route based on feedback type
-        if parsed.feedback_type == "approve":
-            logger.info("✅ [parse_feedback] User approved plan")
-            return Command(
-                update={
-                    "feedback_type": "approve",
-                    "iteration": state.get("iteration", 0) + 1,
-                },
-                goto=END
+        try:
+            parsed = await cached_structured_call(
+                "parse_feedback", FeedbackParsing, messages, deadline=state.get("deadline")
             )
-        elif parsed.feedback_type == "reject":
-            logger.info("❌ [parse_feedback] User rejected plan")
+        except Exception as e:
+            logger.error(f"❌ [parse_feedback] Failed to parse feedback: {e}")
+            # Default to reject on parse error
             return Command(
                 update={
                     "feedback_type": "reject",
+                    "target_section": None,
+                    "modification_type": None,
                     "iteration": state.get("iteration", 0) + 1,
                 },
                 goto=END
             )
-        else:  # modify
-            logger.info(f"🔧 [parse_feedback] User requested modifications: {parsed.modification_type}")
-            return Command(
-                update={
-                    "feedback_type": "modify",
-                    "target_section": parsed.target_section,
-                    "modification_type": parsed.modification_type or "general",
-                    "iteration": state.get("iteration", 0) + 1,
-                    "attractions": [],
-                    "restaurants": [],
-                    "accommodations": [],
-                },
-                goto="fetch_context"
-            )
-    except Exception as e:
-        logger.error(f"❌ [parse_feedback] Failed to parse feedback: {e}")
-        # Default to reject on parse error
+
+    logger.debug(f"🤖 Parsed feedback: {parsed.model_dump()}")
+
+    # Route based on feedback type
+    if parsed.feedback_type == "approve":
+        logger.info("✅ [parse_feedback] User approved plan")
+        return Command(
+            update={
+                "feedback_type": "approve",
+                "iteration": state.get("iteration", 0) + 1,
+            },
+            goto=END
+        )
+    elif parsed.feedback_type == "reject":
+        logger.info("❌ [parse_feedback] User rejected plan")
         return Command(
             update={
                 "feedback_type": "reject",
-                "target_section": None,
-                "modification_type": None,
                 "iteration": state.get("iteration", 0) + 1,
             },
             goto=END
         )
+    else:  # modify
+        logger.info(f"🔧 [parse_feedback] User requested modifications: {parsed.modification_type}")
+        return Command(
+            update={
+                "feedback_type": "modify",
+                "target_section": parsed.target_section,
+                "modification_type": parsed.modification_type or "general",
+                "iteration": state.get("iteration", 0) + 1,
+                "attractions": [],
+                "restaurants": [],
+                "accommodations": [],
+            },
+            goto="fetch_context"
+        )
+
+
+async def _modify_section(state: ReviewState, section: PlanSection, context_data: dict) -> dict:
+    """Regenerate one section with the LLM and merge it into the plan."""
+    plan = state["original_plan"]
+    prompt = MODIFY_SECTION_PROMPT.format(
+        title=plan.get("title", ""),
+        plan_outline=plan_outline(plan, section),
+        section_name=section.name,
+        section=serialize_section(extract_section(plan, section)),
+        context_data=json.dumps(context_data, ensure_ascii=False),
+        modification_type=state.get("modification_type", "general"),
+        user_feedback=state["user_feedback"],
+    )
+
+    messages = [
+        SystemMessage(content=MODIFY_SECTION_SYSTEM_PROMPT),
+        HumanMessage(content=prompt),
+    ]
+    log_prompt_tokens("modify_section", messages)
+
+    fragment = await invoke_structured(
+        "modify_section", section.schema, messages, temperature=0.3, deadline=state.get("deadline")
+    )
+    return merge_section(plan, section, fragment.model_dump())
 
 
 async def modify_plan(state: ReviewState) -> Command[Literal["validate"]]:
-    """Modify specific section of the plan based on feedback and fetched context."""
-    logger.info("Modifying plan with fetched context")
+    """Modify specific section of the plan based on feedback and fetched context.
 
-    llm = get_llm(temperature=0.3)
-    structured_llm = llm.with_structured_output(TravelPlan)
+    Edits that target one day or the accommodation regenerate only that
+    section (see sections); other edits regenerate the whole plan.
+    """
+    logger.info("Modifying plan with fetched context")
 
     # Prepare context data for LLM
     context_data = {
@@ -98,29 +164,47 @@ async def modify_plan(state: ReviewState) -> Command[Literal["validate"]]:
         "accommodations": state.get("accommodations", []),
     }
 
-    # Count available options
-    total_options = sum(len(v) for v in context_data.values())
     logger.info(f"Available context: {len(context_data['attractions'])} attractions, "
                 f"{len(context_data['restaurants'])} restaurants, "
                 f"{len(context_data['accommodations'])} accommodations")
 
+    section = resolve_section(
+        state.get("target_section"), state.get("modification_type"), state["original_plan"]
+    )
+    if section is not None:
+        logger.info(f"✂️ [modify_plan] Regenerating section {section.name} only")
+        try:
+            modified_plan = await _modify_section(state, section, context_data)
+            logger.info(f"✅ [modify_plan] Section {section.name} modified")
+            return Command(
+                update={"modified_plan": modified_plan},
+                goto="validate"
+            )
+        except Exception as e:
+            logger.error(f"❌ [modify_plan] Failed to modify section {section.name}: {e}")
+            return Command(
+                update={"modified_plan": state["original_plan"]},
+                goto="validate"
+            )
+
     prompt = MODIFY_PLAN_PROMPT.format(
-        original_plan=json.dumps(state["original_plan"], ensure_ascii=False, indent=2),
+        original_plan=json.dumps(state["original_plan"], ensure_ascii=False),
         user_feedback=state["user_feedback"],
         modification_type=state.get("modification_type", "general"),
         target_section=state.get("target_section", ""),
-        context_data=json.dumps(context_data, ensure_ascii=False, indent=2),
+        context_data=json.dumps(context_data, ensure_ascii=False),
     )
 
     messages = [
-        SystemMessage(content="You are a travel plan modification expert. "
-                              "Use the provided context data (attractions, restaurants, accommodations) "
-                              "to make informed modifications to the plan."),
+        SystemMessage(content=MODIFY_PLAN_SYSTEM_PROMPT),
         HumanMessage(content=prompt),
     ]
+    log_prompt_tokens("modify_plan", messages)
 
     try:
-        modified_plan: TravelPlan = await structured_llm.ainvoke(messages)
+        modified_plan = await invoke_structured(
+            "modify_plan", TravelPlan, messages, temperature=0.3, deadline=state.get("deadline")
+        )
         logger.info("✅ [modify_plan] Plan modification successful")
 
         # Convert to dict for state
@@ -151,7 +235,7 @@ async def validate_modification(state: ReviewState) -> Command[Literal["__end__"
             goto=END
         )
 
-    required_keys = ["title", "total_days", "days", "total_cost"]
+    required_keys = ["title", "total_days", "itinerary", "total_cost"]
     missing_keys = [key for key in required_keys if key not in modified]
 
     if missing_keys:
@@ -175,11 +259,16 @@ async def fetch_context(state: ReviewState) -> Command[Literal["modify_plan"]]:
     Fetches data from:
     - Vector store: For attraction searches
     - Naver API: For restaurant and accommodation searches
+
+    Results are kept in ``context_cache`` (attractions per query, restaurants
+    and accommodations per area and query), so later rounds of a review
+    session reuse them instead of searching again.
     """
     logger.info(f"Fetching context for modification_type: {state.get('modification_type')}")
 
     modification_type = state.get("modification_type")
     original_plan = state.get("original_plan", {})
+    context_cache = dict(state.get("context_cache") or {})
 
     result = {
         "attractions": [],
@@ -196,75 +285,90 @@ async def fetch_context(state: ReviewState) -> Command[Literal["modify_plan"]]:
         )
 
     try:
-        from app.database import SessionLocal
+        from app.geo.districts import resolve_district
         from app.naver.client import NaverLocalClient
         from app.tourist_attraction.vector_store import TouristAttractionVectorStore
 
         # Extract location info from original plan
-        plan_interests = original_plan.get("interests", [])
-        first_day = original_plan.get("days", [{}])[0] if original_plan.get("days") else {}
-        activities = first_day.get("activities", [])
+        itinerary = original_plan.get("itinerary") or [{}]
+        activities = itinerary[0].get("activities", [])
 
         # Get base location from first activity (fallback to Gangnam)
         base_lat, base_lon = 37.4979, 127.0276  # Default: Gangnam
+        address = None
         if activities and len(activities) > 0:
             first_activity = activities[0]
-            if "location" in first_activity:
-                base_lat = first_activity["location"].get("latitude", base_lat)
-                base_lon = first_activity["location"].get("longitude", base_lon)
+            location = first_activity.get("location") or {}
+            base_lat = location.get("latitude", base_lat)
+            base_lon = location.get("longitude", base_lon)
+            address = first_activity.get("address") or location.get("address")
+
+        # Resolve the search area offline (address first, then coordinates)
+        # instead of relying on free-text feedback
+        location_keyword = resolve_district(base_lat, base_lon, address)
 
         # Fetch attractions if needed
         if modification_type in ["attraction", "activity"]:
-            logger.info("Fetching attractions from vector store")
-            vector_store = TouristAttractionVectorStore()
-
             query = state.get("user_feedback", "")
-            search_results = await vector_store.search_attractions(query=query, top_k=5)
-
-            result["attractions"] = [
-                {
-                    "name": doc.get("name"),
-                    "category": doc.get("category"),
-                    "introduction": doc.get("introduction"),
-                    "latitude": doc.get("latitude"),
-                    "longitude": doc.get("longitude"),
-                    "facilities": doc.get("public_facilities"),
-                }
-                for doc in search_results
-            ]
+            cache_key = f"attractions:{query}"
+            if cache_key not in context_cache:
+                logger.info("Fetching attractions from vector store")
+                vector_store = TouristAttractionVectorStore()
+                search_results = vector_store.search_attractions(query=query, n_results=5)
+                context_cache[cache_key] = [
+                    {
+                        "name": metadata.get("name"),
+                        "category": metadata.get("category"),
+                        "address": metadata.get("address"),
+                        "latitude": metadata.get("latitude"),
+                        "longitude": metadata.get("longitude"),
+                        "similarity": round(similarity, 3),
+                    }
+                    for metadata, similarity in search_results
+                ]
+
+            result["attractions"] = context_cache[cache_key]
             logger.info(f"Found {len(result['attractions'])} attractions")
 
         # Fetch restaurants if needed
         if modification_type in ["restaurant", "food", "meal"]:
-            logger.info("Fetching restaurants from Naver API")
-            naver_client = NaverLocalClient()
-
             # Extract keywords from user feedback
-            query = state.get("user_feedback", "맛집")
-            restaurants = await naver_client.search_nearby_restaurants(
-                latitude=base_lat,
-                longitude=base_lon,
-                radius=2000,
-                query=query[:20]  # Limit query length
-            )
-
-            result["restaurants"] = restaurants[:10]
+            query = state.get("user_feedback", "맛집")[:20]  # Limit query length
+            cache_key = f"restaurants:{location_keyword}:{query}"
+            if cache_key not in context_cache:
+                logger.info("Fetching restaurants from Naver API")
+                naver_client = NaverLocalClient()
+
+                restaurants = await naver_client.search_nearby_restaurants(
+                    latitude=base_lat,
+                    longitude=base_lon,
+                    radius_km=1.0,
+                    query=query,
+                    location_keyword=location_keyword,
+                )
+                context_cache[cache_key] = restaurants[:10]
+
+            result["restaurants"] = context_cache[cache_key]
             logger.info(f"Found {len(result['restaurants'])} restaurants")
 
         # Fetch accommodations if needed
         if modification_type in ["accommodation", "hotel"]:
-            logger.info("Fetching accommodations from Naver API")
-            naver_client = NaverLocalClient()
-
-            query = state.get("user_feedback", "호텔")
-            accommodations = await naver_client.search_nearby_accommodations(
-                latitude=base_lat,
-                longitude=base_lon,
-                radius=3000,
-                query=query[:20]
-            )
-
-            result["accommodations"] = accommodations[:10]
+            query = state.get("user_feedback", "호텔")[:20]
+            cache_key = f"accommodations:{location_keyword}:{query}"
+            if cache_key not in context_cache:
+                logger.info("Fetching accommodations from Naver API")
+                naver_client = NaverLocalClient()
+
+                accommodations = await naver_client.search_nearby_accommodations(
+                    latitude=base_lat,
+                    longitude=base_lon,
+                    radius_km=2.0,
+                    query=query,
+                    location_keyword=location_keyword,
+                )
+                context_cache[cache_key] = accommodations[:10]
+
+            result["accommodations"] = context_cache[cache_key]
             logger.info(f"Found {len(result['accommodations'])} accommodations")
 
     except Exception as e:
@@ -273,7 +377,7 @@ async def fetch_context(state: ReviewState) -> Command[Literal["modify_plan"]]:
 
     # Route to modify_plan with fetched context
     return Command(
-        update=result,
+        update={**result, "context_cache": context_cache},
         goto="modify_plan"
     )
 
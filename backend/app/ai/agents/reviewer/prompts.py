@@ -1,9 +1,14 @@
-"""Reviewer agent prompts."""
+"""Reviewer agent prompts.
 
-PARSE_FEEDBACK_PROMPT = """Analyze user feedback on a travel plan and determine what needs to be modified.
+Static instructions live in the ``*_SYSTEM_PROMPT`` constants and request data
+in the ``*_PROMPT`` suffixes, so the provider can cache the shared prefix. The
+plan comes before the feedback because it stays the same across review rounds.
+Section-scoped edits (MODIFY_SECTION_*) send one day or the accommodation
+instead of the whole plan.
+"""
 
-Original Plan: {original_plan}
-User Feedback: {user_feedback}
+PARSE_FEEDBACK_SYSTEM_PROMPT = """You are a feedback analysis assistant.
+Analyze user feedback on a travel plan and determine what needs to be modified.
 
 Analyze and determine:
 1. **Feedback type**:
@@ -31,19 +36,14 @@ Examples:
 - "예산을 50만원으로 줄여줘" → modification_type: "budget"
 """
 
-MODIFY_PLAN_PROMPT = """Modify the travel plan based on user feedback using the provided context data.
-
-**Original Plan:**
-{original_plan}
-
-**User Feedback:** {user_feedback}
+PARSE_FEEDBACK_PROMPT = """Original Plan: {original_plan}
 
-**Modification Type:** {modification_type}
+User Feedback: {user_feedback}
+"""
 
-**Target Section:** {target_section}
-
-**Available Context Data (use this for modifications):**
-{context_data}
+MODIFY_PLAN_SYSTEM_PROMPT = """You are a travel plan modification expert.
+Modify the travel plan based on user feedback, using the provided context data
+(attractions, restaurants, accommodations) to make informed modifications.
 
 **Guidelines:**
 1. **Use context data**: If restaurants/attractions/accommodations are provided, SELECT appropriate options from this data
@@ -57,3 +57,46 @@ MODIFY_PLAN_PROMPT = """Modify the travel plan based on user feedback using the
 
 Return the complete modified travel plan maintaining all the structure and fields from the original.
 """
+
+MODIFY_PLAN_PROMPT = """**Original Plan:**
+{original_plan}
+
+**Available Context Data (use this for modifications):**
+{context_data}
+
+**Modification Type:** {modification_type}
+
+**Target Section:** {target_section}
+
+**User Feedback:** {user_feedback}
+"""
+
+MODIFY_SECTION_SYSTEM_PROMPT = """You are a travel plan modification expert.
+You are given ONE section of a travel plan (a single day's itinerary or the
+accommodation) and the user's feedback about it. Regenerate only that section.
+
+**Guidelines:**
+1. **Use context data**: If restaurants/attractions/accommodations are provided, SELECT appropriate options from this data
+   - IMPORTANT: Choose from the provided options rather than inventing new venues
+2. **Change only what the feedback asks for**: Keep every other activity in the section exactly as it is
+3. **Stay consistent with the rest of the trip**: Do not repeat venues listed in the plan outline
+4. **Keep the shape**: For a day, keep times in HH:MM order and include every meal the day already has;
+   for accommodation, return name and cost_per_night (the number of nights is fixed)
+5. **Costs**: Estimate each activity's cost; totals for the plan are recomputed for you
+
+Return only the regenerated section.
+"""
+
+MODIFY_SECTION_PROMPT = """**Plan:** {title}
+{plan_outline}
+
+**Section to modify ({section_name}):**
+{section}
+
+**Available Context Data (use this for modifications):**
+{context_data}
+
+**Modification Type:** {modification_type}
+
+**User Feedback:** {user_feedback}
+"""
@@ -0,0 +1,132 @@
+"""Section-scoped plan edits.
+
+Most feedback targets one part of the plan ("day_2" lunch, the hotel). For
+those, modify_plan sends only that fragment to the LLM and regenerates it
+alone. The fragment is then merged back deterministically: the day number,
+date and number of nights are pinned to the original, and daily/total costs
+are recomputed. Output tokens and latency scale with the edit instead of the
+plan.
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Literal
+
+from pydantic import BaseModel
+
+from app.ai.agents.planner.models import AccommodationInfo, DayItinerary
+from app.ai.agents.planner.validator import repair_plan
+
+_DAY_SECTION = re.compile(r"^day_(\d+)$")
+
+
+@dataclass(frozen=True)
+class PlanSection:
+    """A part of the plan that can be regenerated on its own.
+
+    Example:
+        PlanSection("day", day=2)
+        PlanSection("accommodation")
+    """
+
+    kind: Literal["day", "accommodation"]
+    day: int | None = None
+
+    @property
+    def name(self) -> str:
+        """Section name as used in target_section ("day_2", "accommodation")."""
+        return f"day_{self.day}" if self.kind == "day" else self.kind
+
+    @property
+    def schema(self) -> type[BaseModel]:
+        """Structured output model for the regenerated fragment."""
+        return DayItinerary if self.kind == "day" else AccommodationInfo
+
+
+def resolve_section(
+    target_section: str | None,
+    modification_type: str | None,
+    plan: dict,
+) -> PlanSection | None:
+    """Section to regenerate, or None if the edit needs the whole plan.
+
+    Args:
+        target_section: Parsed target ("day_2", "accommodation", "budget", ...)
+        modification_type: Parsed modification category
+        plan: Original TravelPlan dict
+
+    Returns:
+        PlanSection for an existing day or the accommodation, else None
+    """
+    match = _DAY_SECTION.match(target_section or "")
+    if match:
+        day = int(match.group(1))
+        if any(d.get("day") == day for d in plan.get("itinerary") or []):
+            return PlanSection("day", day=day)
+        return None
+
+    wants_lodging = target_section == "accommodation" or modification_type in ("accommodation", "hotel")
+    if wants_lodging and plan.get("accommodation"):
+        return PlanSection("accommodation")
+    return None
+
+
+def extract_section(plan: dict, section: PlanSection) -> dict:
+    """The fragment of ``plan`` covered by ``section``."""
+    if section.kind == "accommodation":
+        return plan["accommodation"]
+    return next(d for d in plan["itinerary"] if d.get("day") == section.day)
+
+
+def plan_outline(plan: dict, section: PlanSection) -> str:
+    """One line per other day and the accommodation, so the edit stays consistent.
+
+    Example:
+        Day 1 (2025-07-01, 역사 탐방): 경복궁, 삼청동 식당, 북촌 한옥마을 | 45,000 KRW
+        Accommodation: 명동 호텔, 2 nights x 90,000 KRW
+    """
+    lines = []
+    for day in plan.get("itinerary") or []:
+        if section.kind == "day" and day.get("day") == section.day:
+            continue
+        venues = ", ".join(a.get("venue_name", "") for a in day.get("activities") or [])
+        lines.append(
+            f"Day {day.get('day')} ({day.get('date')}, {day.get('theme', '')}): {venues} "
+            f"| {int(day.get('daily_cost', 0)):,} KRW"
+        )
+    accommodation = plan.get("accommodation") or {}
+    if section.kind != "accommodation" and accommodation:
+        lines.append(
+            f"Accommodation: {accommodation.get('name')}, {accommodation.get('total_nights', 0)} nights "
+            f"x {int(accommodation.get('cost_per_night', 0)):,} KRW"
+        )
+    return "\n".join(lines)
+
+
+def serialize_section(fragment: dict) -> str:
+    """Compact JSON for the prompt."""
+    return json.dumps(fragment, ensure_ascii=False, separators=(",", ":"))
+
+
+def merge_section(plan: dict, section: PlanSection, fragment: dict) -> dict:
+    """Put a regenerated fragment back into the plan and recompute totals.
+
+    Args:
+        plan: Original TravelPlan dict (not modified)
+        section: Section that was regenerated
+        fragment: DayItinerary or AccommodationInfo dict from the LLM
+
+    Returns:
+        New plan with the fragment merged, overlaps fixed and costs recomputed
+    """
+    original = extract_section(plan, section)
+    if section.kind == "accommodation":
+        merged = {**plan, "accommodation": {**fragment, "total_nights": original.get("total_nights", 0)}}
+    else:
+        day = {**fragment, "day": section.day, "date": original.get("date", fragment.get("date"))}
+        merged = {
+            **plan,
+            "itinerary": [day if d.get("day") == section.day else d for d in plan["itinerary"]],
+        }
+    return repair_plan(merged)
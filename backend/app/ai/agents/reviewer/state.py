@@ -19,10 +19,13 @@ class ReviewState(TypedDict):
     attractions: list[dict]  # New attraction options from vector search
     restaurants: list[dict]  # New restaurant options from Naver API
     accommodations: list[dict]  # New accommodation options from Naver API
+    context_cache: dict[str, list[dict]]  # Fetched options kept across a session's rounds
 
     # Output
     modified_plan: dict | None
 
     # Metadata
+    owner_id: int | None  # User who started the session (None: anonymous)
+    deadline: float | None  # Epoch seconds; LLM calls fail fast once it passes
     iteration: int
     max_iterations: int  # Maximum 3 iterations
@@ -0,0 +1,130 @@
+"""LLM token usage recording.
+
+Records prompt, cached-prompt and completion tokens reported by the provider
+for every chat model call, grouped by LangGraph node. OpenAI caches prompt
+prefixes of 1024+ tokens automatically; ``cached_tokens`` shows how much of
+each prompt was served from that cache (see the static/dynamic split in the
+agent prompts).
+"""
+
+import logging
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TokenUsage:
+    """Accumulated token usage for one node."""
+
+    calls: int = 0
+    prompt_tokens: int = 0
+    cached_tokens: int = 0
+    completion_tokens: int = 0
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        """Share of prompt tokens served from the provider prompt cache."""
+        return self.cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+
+def _usage_from_result(response: LLMResult) -> tuple[int, int, int] | None:
+    """Extract (prompt, cached, completion) tokens from a chat model result."""
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                details = usage.get("input_token_details") or {}
+                return (
+                    int(usage.get("input_tokens", 0)),
+                    int(details.get("cache_read", 0)),
+                    int(usage.get("output_tokens", 0)),
+                )
+
+    token_usage = (response.llm_output or {}).get("token_usage") or {}
+    if not token_usage:
+        return None
+    details = token_usage.get("prompt_tokens_details") or {}
+    return (
+        int(token_usage.get("prompt_tokens", 0)),
+        int(details.get("cached_tokens") or 0),
+        int(token_usage.get("completion_tokens", 0)),
+    )
+
+
+class TokenUsageRecorder(BaseCallbackHandler):
+    """Callback handler that aggregates provider-reported token usage per node.
+
+    The node name comes from the ``langgraph_node`` run metadata (calls made
+    outside a graph are recorded under "default").
+    """
+
+    run_inline = True
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._nodes: dict[UUID, str] = {}
+        self._usage: dict[str, TokenUsage] = {}
+
+    def on_chat_model_start(
+        self,
+        serialized: dict[str, Any],
+        messages: list[list[Any]],
+        *,
+        run_id: UUID,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        with self._lock:
+            self._nodes[run_id] = (metadata or {}).get("langgraph_node") or "default"
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            node = self._nodes.pop(run_id, "default")
+        self.record(node, response)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            self._nodes.pop(run_id, None)
+
+    def record(self, node: str, response: LLMResult) -> None:
+        """Add the usage reported in ``response`` to ``node``'s totals."""
+        usage = _usage_from_result(response)
+        if usage is None:
+            return
+
+        prompt_tokens, cached_tokens, completion_tokens = usage
+        with self._lock:
+            totals = self._usage.setdefault(node, TokenUsage())
+            totals.calls += 1
+            totals.prompt_tokens += prompt_tokens
+            totals.cached_tokens += cached_tokens
+            totals.completion_tokens += completion_tokens
+
+        logger.info(
+            f"💾 [{node}] Prompt tokens {prompt_tokens:,} (cached {cached_tokens:,}), "
+            f"completion tokens {completion_tokens:,}"
+        )
+
+    def snapshot(self) -> dict[str, dict]:
+        """Per-node totals, including the cache hit ratio."""
+        with self._lock:
+            return {
+                node: {**asdict(usage), "cache_hit_ratio": round(usage.cache_hit_ratio, 3)}
+                for node, usage in self._usage.items()
+            }
+
+    def reset(self) -> None:
+        """Clear all totals."""
+        with self._lock:
+            self._nodes.clear()
+            self._usage.clear()
+
+
+usage_recorder = TokenUsageRecorder()
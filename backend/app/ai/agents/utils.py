@@ -2,24 +2,109 @@
 
 Only contains minimal shared utilities that are truly common.
 Each agent maintains its own independence and responsibility.
+
+LLM clients are pooled: one ChatOpenAI per (model, temperature) and one
+structured-output runnable per (model, temperature, schema), created on first
+use and reused by every node so calls share the client's connection pool.
 """
 
+import logging
+import threading
+
+from langchain_core.runnables import Runnable
 from langchain_openai import ChatOpenAI
+from pydantic import BaseModel
 
+from app.ai.agents.usage import usage_recorder
 from app.config import settings
 
+logger = logging.getLogger(__name__)
 
-def get_llm(temperature: float = 0.7) -> ChatOpenAI:
-    """Get configured LLM instance.
+# Temperatures used by the agent nodes, pre-created at startup
+WARM_UP_TEMPERATURES = (0.0, 0.3, 0.5)
 
-    Args:
-        temperature: Sampling temperature (0.0-1.0)
+_lock = threading.Lock()
+_clients: dict[tuple[str, float], ChatOpenAI] = {}
+_structured: dict[tuple[str, float, type[BaseModel]], Runnable] = {}
 
-    Returns:
-        Configured ChatOpenAI instance
-    """
+
+def _create_llm(model: str, temperature: float) -> ChatOpenAI:
     return ChatOpenAI(
         api_key=settings.OPENAI_API_KEY,
-        model=settings.OPENAI_MODEL,
+        model=model,
         temperature=temperature,
+        callbacks=[usage_recorder],
     )
+
+
+def get_llm(temperature: float = 0.7, model: str | None = None) -> ChatOpenAI:
+    """Get the pooled LLM instance for (model, temperature).
+
+    Args:
+        temperature: Sampling temperature (0.0-1.0)
+        model: Model name (default: settings.OPENAI_MODEL)
+
+    Returns:
+        Configured ChatOpenAI instance (token usage, including cached prompt
+        tokens, is recorded by ``usage_recorder``)
+    """
+    key = (model or settings.OPENAI_MODEL, float(temperature))
+    llm = _clients.get(key)
+    if llm is None:
+        with _lock:
+            llm = _clients.get(key)
+            if llm is None:
+                llm = _clients[key] = _create_llm(*key)
+    return llm
+
+
+def get_structured_llm(
+    schema: type[BaseModel],
+    temperature: float = 0.7,
+    model: str | None = None,
+) -> Runnable:
+    """Get the pooled ``with_structured_output(schema)`` runnable.
+
+    Args:
+        schema: Pydantic output model
+        temperature: Sampling temperature (0.0-1.0)
+        model: Model name (default: settings.OPENAI_MODEL)
+
+    Returns:
+        Runnable that returns ``schema`` instances
+    """
+    key = (model or settings.OPENAI_MODEL, float(temperature), schema)
+    runnable = _structured.get(key)
+    if runnable is None:
+        llm = get_llm(temperature, model)
+        with _lock:
+            runnable = _structured.get(key)
+            if runnable is None:
+                runnable = _structured[key] = llm.with_structured_output(schema)
+    return runnable
+
+
+def clear_llm_clients() -> None:
+    """Drop all pooled clients (e.g. after changing the API key or model)."""
+    with _lock:
+        _clients.clear()
+        _structured.clear()
+
+
+async def warm_up_llm_clients() -> None:
+    """Create the pooled clients and open a connection to the provider.
+
+    Called at application startup so the first user request does not pay
+    for client construction or the TLS handshake. Failures are logged only.
+    """
+    if not settings.OPENAI_API_KEY:
+        logger.info("⏭️ [llm] No OpenAI API key configured, skipping warm-up")
+        return
+
+    clients = [get_llm(temperature) for temperature in WARM_UP_TEMPERATURES]
+    try:
+        # Cheap authenticated request over the shared connection pool
+        await clients[0].root_async_client.with_options(timeout=5).models.retrieve(settings.OPENAI_MODEL)
+        logger.info(f"✅ [llm] Warmed up {len(clients)} clients for {settings.OPENAI_MODEL}")
+    except Exception as e:
+        logger.warning(f"⚠️ [llm] Warm-up request failed: {e}")
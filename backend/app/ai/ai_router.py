@@ -1,17 +1,23 @@
 """AI domain router - LangGraph agent endpoints."""
 
+import json
 import logging
+import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
+from app.ai.agents.checkpoints import delete_thread
 from app.ai.ai_schemas import (
     GenerateTravelPlanRequest,
+    JobResponse,
     ReviewTravelPlanRequest,
     TravelPlanResponse,
 )
 from app.ai.ai_service import ai_service
-from app.database import get_db
+from app.ai.jobs import Job, get_job_pool, job_handler
+from app.database import SessionLocal, get_db
 from app.plan import plan_service
 
 logger = logging.getLogger(__name__)
@@ -80,19 +86,7 @@ async def generate_travel_plan(
         logger.info("✅ [API] Plan generation completed successfully")
 
         # Optionally save to database
-        plan_id = None
-        if save_to_db:
-            try:
-                saved_plan = plan_service.create_plan(
-                    db=db,
-                    user_id=user_id,
-                    planner_data=plan
-                )
-                plan_id = saved_plan.id
-                logger.info(f"💾 [API] Plan saved to database with ID: {plan_id}")
-            except Exception as save_error:
-                logger.error(f"⚠️ [API] Failed to save plan to database: {save_error}")
-                # Continue even if save fails - plan generation was successful
+        plan_id = _save_generated_plan(db, user_id, plan) if save_to_db else None
 
         return TravelPlanResponse(plan=plan, plan_id=plan_id)
 
@@ -104,10 +98,195 @@ async def generate_travel_plan(
         raise HTTPException(status_code=500, detail=f"Plan generation failed: {str(e)}")
 
 
+@router.post("/plans/generate/stream")
+async def stream_travel_plan(
+    request: GenerateTravelPlanRequest,
+    user_id: int = Query(..., description="User ID (임시: 나중에 인증으로 대체)"),
+    save_to_db: bool = Query(True, description="Whether to save the generated plan to database"),
+    db: Session = Depends(get_db),
+):
+    """Generate an initial travel plan as a Server-Sent Events stream.
+
+    Same input and final plan as POST /plans/generate, but progress is pushed
+    while the Planner Agent runs:
+    - progress: {"node", "status"} when a graph node starts/completes/fails
+    - attractions: {"attractions": [...]} selected attractions
+    - day: one DayItinerary preview as soon as it is ready
+    - plan: {"plan", "plan_id"} the final plan (same as the non-streaming response)
+    - error: {"detail", "status_code"} if generation fails
+
+    Frontend usage:
+    ```javascript
+    const response = await fetch('/api/ai/plans/generate/stream?user_id=1', {
+      method: 'POST',
+      body: JSON.stringify({ user_request: "3일 서울 여행", ... })
+    });
+    const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+    // Parse "event: <type>\ndata: <json>\n\n" frames
+    ```
+
+    Args:
+        request: Travel plan generation request
+        user_id: User ID (temporary: will be replaced with authentication)
+        save_to_db: Whether to save the generated plan to database (default: True)
+        db: Database session
+
+    Returns:
+        text/event-stream response
+    """
+    logger.info("🚀 [API] POST /plans/generate/stream - Request received")
+
+    async def events():
+        try:
+            async for event, data in ai_service.stream_initial_plan(
+                user_request=request.user_request,
+                dates=(request.start_date, request.end_date),
+                budget=request.budget,
+                interests=request.interests,
+            ):
+                if event == "plan":
+                    plan_id = _save_generated_plan(db, user_id, data["plan"]) if save_to_db else None
+                    data = {**data, "plan_id": plan_id}
+                    logger.info("✅ [API] Streamed plan generation completed successfully")
+                yield _sse(event, data)
+        except ValueError as e:
+            logger.error(f"Validation error: {e}")
+            yield _sse("error", {"detail": str(e), "status_code": 400})
+        except Exception as e:
+            logger.error(f"Plan generation failed: {e}", exc_info=True)
+            yield _sse("error", {"detail": f"Plan generation failed: {str(e)}", "status_code": 500})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # Disable proxy buffering so events reach the client as they are produced
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _sse(event: str, data: dict) -> str:
+    """Format one Server-Sent Event frame."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _save_generated_plan(db: Session, user_id: int, plan: dict) -> int | None:
+    """Save a generated plan; failures are logged since generation itself succeeded."""
+    try:
+        saved_plan = plan_service.create_plan(
+            db=db,
+            user_id=user_id,
+            planner_data=plan
+        )
+        logger.info(f"💾 [API] Plan saved to database with ID: {saved_plan.id}")
+        return saved_plan.id
+    except Exception as save_error:
+        logger.error(f"⚠️ [API] Failed to save plan to database: {save_error}")
+        return None
+
+
+def _review_thread_id(session_id: str | None, plan_id: int | None) -> str:
+    """Review session key: the client's session, the plan, or a new session.
+
+    Plan sessions ("plan-<id>") are guessable, so a client session_id in that
+    namespace is only accepted together with the matching plan_id (whose owner
+    is then checked); new sessions get an opaque id.
+
+    Raises:
+        HTTPException: 400 for a plan session_id without its plan_id
+    """
+    plan_thread = f"plan-{plan_id}" if plan_id is not None else None
+    if session_id:
+        if session_id.startswith("plan-") and session_id != plan_thread:
+            raise HTTPException(status_code=400, detail="Plan review sessions require their plan_id")
+        return session_id
+    if plan_thread:
+        return plan_thread
+    return f"review-{uuid.uuid4().hex}"
+
+
+def _check_review_owner_params(plan_id: int | None, user_id: int | None) -> None:
+    """Reject a plan_id without the user it must belong to."""
+    if plan_id is not None and user_id is None:
+        raise HTTPException(
+            status_code=400,
+            detail="user_id is required when plan_id is provided"
+        )
+
+
+async def _review_start_plan(
+    db: Session,
+    thread_id: str,
+    original_plan: dict | None,
+    plan_id: int | None,
+    user_id: int | None,
+) -> dict | None:
+    """Plan to start the review session from (None: continue the stored session).
+
+    Checks on every round that the session and the plan belong to
+    ``user_id``, and loads the saved plan when neither a plan nor an existing
+    session is given.
+
+    Raises:
+        HTTPException: 404 if there is nothing to review, 403 if the session
+            or the plan belongs to another user
+    """
+    session = await ai_service.get_review_session(thread_id)
+    if session is not None and session.get("owner_id") != user_id:
+        raise HTTPException(status_code=403, detail="Not authorized to review this session")
+
+    existing_plan = None
+    if plan_id is not None:
+        existing_plan = plan_service.get_plan(db=db, plan_id=plan_id)
+        if not existing_plan:
+            raise HTTPException(status_code=404, detail="Plan not found")
+        if existing_plan.user_id != user_id:
+            raise HTTPException(status_code=403, detail="Not authorized to update this plan")
+
+    if original_plan is not None or session is not None:
+        return original_plan
+    if existing_plan is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Review session not found; send original_plan or plan_id to start one"
+        )
+    return plan_service.to_planner_plan(existing_plan)
+
+
+def _save_reviewed_plan(db: Session, plan_id: int, modified_plan: dict) -> None:
+    """Write a reviewed plan back to its database row."""
+    # Convert modified_plan (full plan structure) to DB format
+    # modified_plan has: {title, total_days, total_cost, itinerary, accommodation, ...}
+    # DB expects: {title, itinerary: {total_days, days}, recommendations: {accommodation}, ...}
+    update_data = {
+        "itinerary": {
+            "total_days": modified_plan.get("total_days"),
+            "days": modified_plan.get("itinerary", [])
+        }
+    }
+
+    # Update title if present
+    if "title" in modified_plan:
+        update_data["title"] = modified_plan.get("title")
+
+    # Update recommendations (accommodation) if present
+    if "accommodation" in modified_plan and modified_plan.get("accommodation"):
+        update_data["recommendations"] = {
+            "accommodation": modified_plan.get("accommodation")
+        }
+
+    # Update plan in database
+    plan_service.update_plan(
+        db=db,
+        plan_id=plan_id,
+        update_data=update_data
+    )
+    logger.info(f"💾 [API] Plan {plan_id} updated in database")
+
+
 @router.post("/plans/review", response_model=TravelPlanResponse)
 async def review_travel_plan(
     request: ReviewTravelPlanRequest,
-    original_plan: dict,
+    original_plan: dict | None = Body(None, description="Plan to review (only needed to start a session)"),
     plan_id: int | None = Query(None, description="Plan ID to update in database (optional)"),
     user_id: int | None = Query(None, description="User ID (optional, required if plan_id provided)"),
     db: Session = Depends(get_db),
@@ -120,38 +299,58 @@ async def review_travel_plan(
     3. Validate modified plan consistency
     4. Optionally save modifications to database if plan_id provided
 
-    Request body should include the original plan in the request.
+    Reviews run in server-side sessions: the plan, iteration count and
+    fetched context are kept in the LangGraph checkpointer. The first round
+    sends ``original_plan`` (or a ``plan_id``, loaded from the database);
+    later rounds send only ``user_feedback`` and the returned ``session_id``
+    (plan_id sessions are keyed by the plan, so plan_id alone also works).
+    Sessions belong to the user_id that started them; every round is checked.
+
+    Frontend usage:
+    ```javascript
+    // First round
+    const first = await fetch('/api/ai/plans/review', {
+      method: 'POST',
+      body: JSON.stringify({ request: { user_feedback: "2일차 점심 바꿔줘" }, original_plan: plan })
+    }).then(r => r.json());
+
+    // Later rounds: feedback only
+    await fetch('/api/ai/plans/review', {
+      method: 'POST',
+      body: JSON.stringify({ request: { user_feedback: "좋아요", session_id: first.session_id } })
+    });
+    ```
 
     Args:
-        request: Review request with user feedback and iteration
-        original_plan: Original plan to be modified
+        request: Review request with user feedback, iteration and optional session_id
+        original_plan: Plan to be modified (starts or resets the session)
         plan_id: Optional plan ID to update in database
         user_id: Optional user ID (required if plan_id provided)
         db: Database session
 
     Returns:
-        TravelPlanResponse with modified plan and optional plan_id if saved
+        TravelPlanResponse with modified plan, session_id and optional plan_id if saved
     """
     logger.info("🔄 [API] POST /plans/review - Request received")
     logger.debug(f"📥 Feedback: {request.user_feedback}, iteration={request.iteration}, plan_id={plan_id}")
 
+    _check_review_owner_params(plan_id, user_id)
+    thread_id = _review_thread_id(request.session_id, plan_id)
+
     try:
-        modified_plan = await ai_service.review_and_modify_plan(
-            original_plan=original_plan,
+        original_plan = await _review_start_plan(db, thread_id, original_plan, plan_id, user_id)
+
+        modified_plan = await ai_service.review_in_session(
+            thread_id=thread_id,
             user_feedback=request.user_feedback,
-            iteration=request.iteration,
+            original_plan=original_plan,
+            owner_id=user_id,
         )
 
         logger.info("✅ [API] Plan review completed successfully")
 
         # Optionally save to database if plan_id provided
         if plan_id is not None:
-            if user_id is None:
-                raise HTTPException(
-                    status_code=400,
-                    detail="user_id is required when plan_id is provided"
-                )
-
             try:
                 # Verify plan exists and belongs to user
                 existing_plan = plan_service.get_plan(db=db, plan_id=plan_id)
@@ -160,36 +359,12 @@ async def review_travel_plan(
                 if existing_plan.user_id != user_id:
                     raise HTTPException(status_code=403, detail="Not authorized to update this plan")
 
-                # Convert modified_plan (full plan structure) to DB format
-                # modified_plan has: {title, total_days, total_cost, days, accommodation, ...}
-                # DB expects: {title, itinerary: {total_days, days}, recommendations: {accommodation}, ...}
-                update_data = {
-                    "itinerary": {
-                        "total_days": modified_plan.get("total_days"),
-                        "days": modified_plan.get("days", [])
-                    }
-                }
-
-                # Update title if present
-                if "title" in modified_plan:
-                    update_data["title"] = modified_plan.get("title")
-
-                # Update recommendations (accommodation) if present
-                if "accommodation" in modified_plan and modified_plan.get("accommodation"):
-                    update_data["recommendations"] = {
-                        "accommodation": modified_plan.get("accommodation")
-                    }
-
-                # Update plan in database
-                updated_plan = plan_service.update_plan(
-                    db=db,
-                    plan_id=plan_id,
-                    update_data=update_data
-                )
-                logger.info(f"💾 [API] Plan {plan_id} updated in database")
+                _save_reviewed_plan(db, plan_id, modified_plan)
 
-                return TravelPlanResponse(plan=modified_plan, plan_id=plan_id)
+                return TravelPlanResponse(plan=modified_plan, plan_id=plan_id, session_id=thread_id)
 
+            except HTTPException:
+                raise
             except Exception as save_error:
                 logger.error(f"⚠️ [API] Failed to save plan to database: {save_error}")
                 raise HTTPException(
@@ -197,14 +372,221 @@ async def review_travel_plan(
                     detail=f"Failed to save plan to database: {str(save_error)}"
                 )
 
-        return TravelPlanResponse(plan=modified_plan)
+        return TravelPlanResponse(plan=modified_plan, session_id=thread_id)
 
     except ValueError as e:
         # Rejection or need to regenerate
         logger.error(f"Validation error: {e}")
         raise HTTPException(status_code=400, detail=str(e))
+    except PermissionError as e:
+        raise HTTPException(status_code=403, detail=str(e))
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Plan review failed: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Plan review failed: {str(e)}")
+
+
+# Background job endpoints
+@router.post("/jobs/generate", response_model=JobResponse, status_code=202)
+async def enqueue_generate_job(
+    request: GenerateTravelPlanRequest,
+    user_id: int = Query(..., description="User ID (임시: 나중에 인증으로 대체)"),
+    save_to_db: bool = Query(True, description="Whether to save the generated plan to database"),
+):
+    """Queue plan generation and return a job id immediately.
+
+    Same input as POST /plans/generate. The result (TravelPlanResponse
+    fields) is fetched with GET /jobs/{job_id} or streamed with
+    GET /jobs/{job_id}/events, so no HTTP request stays open for the whole
+    run.
+
+    Frontend usage:
+    ```javascript
+    const job = await fetch('/api/ai/jobs/generate?user_id=1', {
+      method: 'POST',
+      body: JSON.stringify({ user_request: "3일 서울 여행", ... })
+    }).then(r => r.json());
+
+    // Long-poll until the job finishes (or subscribe to /events)
+    const done = await fetch(`/api/ai/jobs/${job.job_id}?wait=30`).then(r => r.json());
+    ```
+
+    Args:
+        request: Travel plan generation request
+        user_id: User ID (temporary: will be replaced with authentication)
+        save_to_db: Whether to save the generated plan to database (default: True)
+
+    Returns:
+        JobResponse with status "queued"
+    """
+    logger.info("🚀 [API] POST /jobs/generate - Request received")
+    job = get_job_pool().submit(
+        "generate",
+        {"request": request.model_dump(), "user_id": user_id, "save_to_db": save_to_db},
+    )
+    return _job_response(job)
+
+
+@router.post("/jobs/review", response_model=JobResponse, status_code=202)
+async def enqueue_review_job(
+    request: ReviewTravelPlanRequest,
+    original_plan: dict | None = Body(None, description="Plan to review (only needed to start a session)"),
+    plan_id: int | None = Query(None, description="Plan ID to update in database (optional)"),
+    user_id: int | None = Query(None, description="User ID (optional, required if plan_id provided)"),
+    db: Session = Depends(get_db),
+):
+    """Queue one review round and return a job id immediately.
+
+    Same input and session semantics as POST /plans/review; the session and
+    plan are checked before queueing, so missing sessions and foreign plans
+    fail here instead of in the job.
+
+    Args:
+        request: Review request with user feedback and optional session_id
+        original_plan: Plan to be modified (starts or resets the session)
+        plan_id: Optional plan ID to update in database
+        user_id: Optional user ID (required if plan_id provided)
+        db: Database session
+
+    Returns:
+        JobResponse with status "queued"
+    """
+    logger.info("🔄 [API] POST /jobs/review - Request received")
+    _check_review_owner_params(plan_id, user_id)
+    thread_id = _review_thread_id(request.session_id, plan_id)
+    original_plan = await _review_start_plan(db, thread_id, original_plan, plan_id, user_id)
+
+    job = get_job_pool().submit(
+        "review",
+        {
+            "session_id": thread_id,
+            "user_feedback": request.user_feedback,
+            "original_plan": original_plan,
+            "plan_id": plan_id,
+            "user_id": user_id,
+        },
+    )
+    return _job_response(job)
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: str,
+    wait: float = Query(0, ge=0, le=60, description="Seconds to wait for the job to finish (long polling)"),
+):
+    """Get a background job's status and, once finished, its result or error.
+
+    Args:
+        job_id: Job ID returned when the job was queued
+        wait: Seconds to wait for the job to finish before answering
+
+    Returns:
+        JobResponse
+
+    Raises:
+        HTTPException: 404 if the job does not exist (or has expired)
+    """
+    pool = get_job_pool()
+    job = await pool.wait(job_id, wait) if wait else pool.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return _job_response(job)
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_job_events(job_id: str):
+    """Subscribe to a background job as a Server-Sent Events stream.
+
+    Sends one event per status change, named after the status (queued,
+    running, succeeded, failed) with the JobResponse as data; the stream
+    ends once the job has finished.
+
+    Args:
+        job_id: Job ID returned when the job was queued
+
+    Returns:
+        text/event-stream response
+
+    Raises:
+        HTTPException: 404 if the job does not exist (or has expired)
+    """
+    pool = get_job_pool()
+    if pool.get(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def events():
+        async for job in pool.watch(job_id):
+            yield _sse(job.status, _job_response(job).model_dump())
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _job_response(job: Job) -> JobResponse:
+    return JobResponse(
+        job_id=job.id,
+        kind=job.kind,
+        status=job.status,
+        result=job.result,
+        error=job.error,
+        attempts=job.attempts,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+    )
+
+
+@job_handler("generate")
+async def _run_generate_job(job: Job) -> dict:
+    """Generate a plan on a checkpointed thread (resumed after a restart)."""
+    request = GenerateTravelPlanRequest(**job.payload["request"])
+    thread_id = f"job-{job.id}"
+    try:
+        plan = await ai_service.generate_initial_plan(
+            user_request=request.user_request,
+            dates=(request.start_date, request.end_date),
+            budget=request.budget,
+            interests=request.interests,
+            thread_id=thread_id,
+        )
+    except Exception:
+        # The job fails for good; only a cancelled (interrupted) run keeps its checkpoints
+        await delete_thread(thread_id)
+        raise
+    await delete_thread(thread_id)
+
+    plan_id = None
+    if job.payload["save_to_db"]:
+        db = SessionLocal()
+        try:
+            plan_id = _save_generated_plan(db, job.payload["user_id"], plan)
+        finally:
+            db.close()
+    return TravelPlanResponse(plan=plan, plan_id=plan_id).model_dump()
+
+
+@job_handler("review")
+async def _run_review_job(job: Job) -> dict:
+    """Run a review round in its session (resumed after a restart)."""
+    payload = job.payload
+    modified_plan = await ai_service.review_in_session(
+        thread_id=payload["session_id"],
+        user_feedback=payload["user_feedback"],
+        original_plan=payload["original_plan"],
+        background=True,
+        owner_id=payload.get("user_id"),
+    )
+
+    if payload["plan_id"] is not None:
+        db = SessionLocal()
+        try:
+            _save_reviewed_plan(db, payload["plan_id"], modified_plan)
+        finally:
+            db.close()
+    return TravelPlanResponse(
+        plan=modified_plan, plan_id=payload["plan_id"], session_id=payload["session_id"]
+    ).model_dump()
+
@@ -19,6 +19,7 @@ class TravelPlanResponse(BaseModel):
 
     plan_id: int | None = None  # Optional, for DB-backed plans
     plan: dict  # The actual travel plan JSON
+    session_id: str | None = None  # Review session to continue with feedback only
 
 
 class ReviewTravelPlanRequest(BaseModel):
@@ -26,3 +27,18 @@ class ReviewTravelPlanRequest(BaseModel):
 
     user_feedback: str
     iteration: int = 0
+    session_id: str | None = None  # Continue a review session (plan kept server-side)
+
+
+# Background job schemas
+class JobResponse(BaseModel):
+    """Response schema for a background generate/review job."""
+
+    job_id: str
+    kind: str  # generate or review
+    status: str  # queued, running, succeeded or failed
+    result: dict | None = None  # TravelPlanResponse fields once succeeded
+    error: str | None = None  # Failure reason once failed
+    attempts: int = 0  # Runs started (a restart resumes the job)
+    created_at: float
+    updated_at: float
@@ -1,6 +1,10 @@
 """AI service - LangGraph agent orchestration for travel planning."""
 
 import logging
+import time
+from collections.abc import AsyncIterator
+
+from app.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -11,8 +15,15 @@ class AIService:
     This service orchestrates two specialized agents:
     - Planner Agent: Generates initial travel plans
     - Reviewer Agent: Reviews and modifies plans based on user feedback
+
+    Review sessions keep the reviewer state server-side in the LangGraph
+    checkpointer, keyed by thread_id, so later rounds only send feedback.
     """
 
+    def __init__(self) -> None:
+        self._review_session_graph = None
+        self._planner_job_graph = None
+
     def _create_initial_planning_state(
         self,
         user_request: str,
@@ -29,7 +40,12 @@ class AIService:
             "attractions": [],
             "restaurants": [],
             "accommodations": [],
+            "day_buckets": None,
+            "route_stats": None,
+            "validation_issues": None,
             "travel_plan": None,
+            "plan_mode": None,
+            "deadline": time.time() + settings.PLAN_REQUEST_DEADLINE_SECONDS,
             "attempts": 0,
             "errors": [],
         }
@@ -40,6 +56,7 @@ class AIService:
         dates: tuple[str, str],
         budget: int,
         interests: list[str],
+        thread_id: str | None = None,
     ) -> dict:
         """Generate initial travel plan using Planner Agent.
 
@@ -48,6 +65,9 @@ class AIService:
             dates: Tuple of (start_date, end_date) in YYYY-MM-DD format
             budget: Budget amount in KRW
             interests: List of user interests
+            thread_id: Checkpoint the run under this thread (background
+                jobs): no request deadline, and a run interrupted by a
+                restart resumes from its last finished node
 
         Returns:
             Generated travel plan as dict
@@ -58,13 +78,90 @@ class AIService:
         logger.info("Starting plan generation")
 
         from app.ai.agents.planner import planner_graph
+        from app.ai.plan_cache import get_plan_cache
+
+        plan_cache = get_plan_cache()
+        if plan_cache is not None:
+            cached_plan = await plan_cache.lookup(user_request, dates, budget, interests)
+            if cached_plan is not None:
+                logger.info("Plan served from template cache")
+                return cached_plan
 
         initial_state = self._create_initial_planning_state(
             user_request, dates, budget, interests
         )
 
-        final_state = await planner_graph.ainvoke(initial_state)
+        if thread_id is None:
+            final_state = await planner_graph.ainvoke(initial_state)
+        else:
+            initial_state["deadline"] = None
+            final_state = await self._resume_or_invoke(
+                await self._get_planner_job_graph(), initial_state, thread_id
+            )
+        plan = self._planning_result(final_state)
+
+        if plan_cache is not None:
+            await plan_cache.store(plan, user_request, dates, budget, interests)
+        return plan
+
+    async def stream_initial_plan(
+        self,
+        user_request: str,
+        dates: tuple[str, str],
+        budget: int,
+        interests: list[str],
+    ) -> AsyncIterator[tuple[str, dict]]:
+        """Generate an initial travel plan, yielding progress as it is produced.
+
+        Runs the same graph and cache as generate_initial_plan, so the final
+        plan is identical; see planner.streaming for the event types.
 
+        Args:
+            user_request: User's travel request description
+            dates: Tuple of (start_date, end_date) in YYYY-MM-DD format
+            budget: Budget amount in KRW
+            interests: List of user interests
+
+        Yields:
+            (event, data) pairs, ending with ("plan", {"plan": plan})
+
+        Raises:
+            ValueError: If plan generation fails after max attempts
+        """
+        logger.info("Starting streamed plan generation")
+
+        from app.ai.agents.planner import planner_graph
+        from app.ai.agents.planner.streaming import STREAM_MODES, PlanEventStream
+        from app.ai.plan_cache import get_plan_cache
+
+        plan_cache = get_plan_cache()
+        if plan_cache is not None:
+            cached_plan = await plan_cache.lookup(user_request, dates, budget, interests)
+            if cached_plan is not None:
+                logger.info("Plan served from template cache")
+                yield "plan", {"plan": cached_plan}
+                return
+
+        initial_state = self._create_initial_planning_state(
+            user_request, dates, budget, interests
+        )
+
+        stream = PlanEventStream()
+        async for mode, chunk in planner_graph.astream(initial_state, stream_mode=STREAM_MODES):
+            for event in stream.translate(mode, chunk):
+                yield event
+
+        plan = self._planning_result(stream.final_state)
+        if plan_cache is not None:
+            await plan_cache.store(plan, user_request, dates, budget, interests)
+        yield "plan", {"plan": plan}
+
+    def _planning_result(self, final_state: dict) -> dict:
+        """Plan from a finished planner run.
+
+        Raises:
+            ValueError: If the run recorded errors or produced no plan
+        """
         if final_state.get("errors"):
             error_msg = f"Plan generation failed: {'; '.join(final_state['errors'])}"
             logger.error(error_msg)
@@ -77,39 +174,51 @@ class AIService:
         logger.info("Plan generation successful")
         return final_state["travel_plan"]
 
-    async def review_and_modify_plan(
-        self,
-        original_plan: dict,
-        user_feedback: str,
-        iteration: int = 0,
-    ) -> dict:
-        """Review and modify travel plan using Reviewer Agent.
+    async def _get_planner_job_graph(self):
+        """Planner graph compiled with the persistent checkpointer."""
+        if self._planner_job_graph is None:
+            from app.ai.agents.checkpoints import get_checkpointer
+            from app.ai.agents.planner.graph import compile_planner_graph
 
-        Args:
-            original_plan: Original travel plan from Planner
-            user_feedback: User's feedback on the plan
-            iteration: Current iteration number (default: 0)
+            self._planner_job_graph = compile_planner_graph(await get_checkpointer())
+        return self._planner_job_graph
 
-        Returns:
-            Modified plan or original plan based on feedback type
+    async def _resume_or_invoke(self, graph, state: dict, thread_id: str) -> dict:
+        """Run ``graph`` on a checkpointed thread, continuing an interrupted run.
 
-        Raises:
-            ValueError: If rejection requires new plan generation
+        Returns:
+            Final state (the stored one if the run had already finished)
         """
-        from app.ai.agents.reviewer import ReviewState, reviewer_graph
+        config = {"configurable": {"thread_id": thread_id}}
+        snapshot = await graph.aget_state(config)
+        if snapshot.next:
+            logger.info(f"Resuming {thread_id} at {', '.join(snapshot.next)}")
+            return await graph.ainvoke(None, config)
+        if snapshot.values:
+            logger.info(f"{thread_id} already finished, using its stored state")
+            return snapshot.values
+        return await graph.ainvoke(state, config)
 
-        review_state: ReviewState = {
+    def _create_review_state(self, original_plan: dict, user_feedback: str, iteration: int) -> dict:
+        """Create the reviewer input for one round of feedback."""
+        return {
             "original_plan": original_plan,
             "user_feedback": user_feedback,
             "feedback_type": None,
             "target_section": None,
+            "modification_type": None,
             "modified_plan": None,
             "iteration": iteration,
             "max_iterations": 3,
+            "deadline": time.time() + settings.REVIEW_REQUEST_DEADLINE_SECONDS,
         }
 
-        final_state = await reviewer_graph.ainvoke(review_state)
+    def _review_result(self, final_state: dict, original_plan: dict) -> dict:
+        """Plan to return for a finished review round.
 
+        Raises:
+            ValueError: If the user rejected the plan
+        """
         feedback_type = final_state.get("feedback_type")
 
         if feedback_type == "reject":
@@ -119,7 +228,109 @@ class AIService:
         elif feedback_type == "approve":
             return original_plan
         else:  # modify
-            return final_state.get("modified_plan", original_plan)
+            return final_state.get("modified_plan") or original_plan
+
+    async def review_and_modify_plan(
+        self,
+        original_plan: dict,
+        user_feedback: str,
+        iteration: int = 0,
+    ) -> dict:
+        """Review and modify travel plan using Reviewer Agent.
+
+        Args:
+            original_plan: Original travel plan from Planner
+            user_feedback: User's feedback on the plan
+            iteration: Current iteration number (default: 0)
+
+        Returns:
+            Modified plan or original plan based on feedback type
+
+        Raises:
+            ValueError: If rejection requires new plan generation
+        """
+        from app.ai.agents.reviewer import reviewer_graph
+
+        review_state = self._create_review_state(original_plan, user_feedback, iteration)
+        final_state = await reviewer_graph.ainvoke(review_state)
+        return self._review_result(final_state, original_plan)
+
+    async def _get_review_session_graph(self):
+        """Reviewer graph compiled with the persistent checkpointer."""
+        if self._review_session_graph is None:
+            from app.ai.agents.checkpoints import get_checkpointer
+            from app.ai.agents.reviewer.graph import compile_reviewer_graph
+
+            self._review_session_graph = compile_reviewer_graph(await get_checkpointer())
+        return self._review_session_graph
+
+    async def get_review_session(self, thread_id: str) -> dict | None:
+        """Stored state of a review session (None if it does not exist)."""
+        graph = await self._get_review_session_graph()
+        snapshot = await graph.aget_state({"configurable": {"thread_id": thread_id}})
+        return snapshot.values or None
+
+    async def review_in_session(
+        self,
+        thread_id: str,
+        user_feedback: str,
+        original_plan: dict | None = None,
+        background: bool = False,
+        owner_id: int | None = None,
+    ) -> dict:
+        """Run one review round in a persistent session.
+
+        The session stores the current plan, the iteration count, fetched
+        context and the user who started it, so after the first round the
+        client only sends feedback. Every round must come from that user.
+
+        Args:
+            thread_id: Session key (e.g. "plan-42" or "review-<uuid>")
+            user_feedback: User's feedback on the current plan
+            original_plan: Plan to start from (required for a new session;
+                replaces the session's current plan if given)
+            background: Run as a background job: no request deadline, and a
+                round with the same feedback interrupted by a restart resumes
+                from its last checkpoint
+            owner_id: User sending the feedback (None: anonymous session)
+
+        Returns:
+            Modified plan or current plan based on feedback type
+
+        Raises:
+            LookupError: If the session does not exist and no plan is given
+            PermissionError: If the session belongs to another user
+            ValueError: If rejection requires new plan generation
+        """
+        graph = await self._get_review_session_graph()
+        config = {"configurable": {"thread_id": thread_id}}
+        snapshot = await graph.aget_state(config)
+        session = snapshot.values
+        if session and session.get("owner_id") != owner_id:
+            raise PermissionError(f"Review session {thread_id} belongs to another user")
+
+        if background and snapshot.next and session.get("user_feedback") == user_feedback:
+            logger.info(f"Review session {thread_id}: resuming at {', '.join(snapshot.next)}")
+            final_state = await graph.ainvoke(None, config)
+            return self._review_result(final_state, session["original_plan"])
+
+        if original_plan is None:
+            if not session.get("original_plan"):
+                raise LookupError(f"Review session {thread_id} not found")
+            # The previous round's result is the plan under review now
+            modified = session.get("feedback_type") == "modify" and session.get("modified_plan")
+            original_plan = modified or session["original_plan"]
+
+        review_state = self._create_review_state(original_plan, user_feedback, session.get("iteration", 0))
+        review_state["owner_id"] = owner_id
+        if not session:
+            review_state["context_cache"] = {}
+        if background:
+            review_state["deadline"] = None
+
+        logger.info(f"Review session {thread_id}: round {review_state['iteration'] + 1}")
+        final_state = await graph.ainvoke(review_state, config)
+        return self._review_result(final_state, original_plan)
 
 
 ai_service = AIService()
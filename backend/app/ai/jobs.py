@@ -0,0 +1,414 @@
+"""Background jobs for long agent runs.
+
+Plan generation and review can run longer than proxies keep an HTTP request
+open. In job mode a request is only enqueued: the client gets a job id back
+and polls or subscribes for the result, while a bounded pool of in-process
+workers (JOB_WORKERS) runs the jobs.
+
+The queue backend is pluggable (JOB_QUEUE_BACKEND): SQLite by default, so
+jobs survive a restart, or in memory. Jobs still running when the process
+stopped are queued again at startup; their graphs run on checkpointed
+threads (see agents.checkpoints) and continue from the last finished node
+instead of starting over. A job is given up after JOB_MAX_ATTEMPTS runs.
+
+The queue file is owned by one process: with several server processes, give
+each its own JOB_QUEUE_PATH.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import suppress
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Protocol
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+FINISHED_STATUSES = ("succeeded", "failed")
+
+
+@dataclass
+class Job:
+    """A queued agent run.
+
+    Status goes queued → running → succeeded/failed; a running job whose
+    worker stopped goes back to queued.
+    """
+
+    id: str
+    kind: str  # Handler name ("generate", "review")
+    payload: dict
+    status: str = "queued"
+    result: dict | None = None
+    error: str | None = None
+    attempts: int = 0  # Runs started (restarts included)
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has a final result or error."""
+        return self.status in FINISHED_STATUSES
+
+
+JobHandler = Callable[[Job], Awaitable[dict]]
+
+_handlers: dict[str, JobHandler] = {}
+
+
+def job_handler(kind: str) -> Callable[[JobHandler], JobHandler]:
+    """Register the coroutine that runs jobs of ``kind``.
+
+    Example:
+        @job_handler("generate")
+        async def run_generate_job(job: Job) -> dict:
+            ...
+    """
+    def register(handler: JobHandler) -> JobHandler:
+        _handlers[kind] = handler
+        return handler
+
+    return register
+
+
+class JobQueue(Protocol):
+    """Storage for jobs, shared by the API and the workers."""
+
+    name: str
+
+    def put(self, job: Job) -> None:
+        """Add a new job."""
+        ...
+
+    def claim(self) -> Job | None:
+        """Mark the oldest queued job running (attempts + 1) and return it."""
+        ...
+
+    def get(self, job_id: str) -> Job | None:
+        """Return a job, or None if it does not exist (or expired)."""
+        ...
+
+    def update(self, job: Job) -> None:
+        """Save a job's status, result and error."""
+        ...
+
+    def requeue_running(self) -> int:
+        """Queue jobs left running by a stopped worker again; return how many."""
+        ...
+
+    def close(self) -> None:
+        """Release the storage."""
+        ...
+
+
+class MemoryJobQueue:
+    """In-process queue (jobs are lost on restart)."""
+
+    name = "memory"
+
+    def __init__(self) -> None:
+        self._jobs: dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def put(self, job: Job) -> None:
+        with self._lock:
+            self._jobs[job.id] = replace(job)
+
+    def claim(self) -> Job | None:
+        with self._lock:
+            queued = [job for job in self._jobs.values() if job.status == "queued"]
+            if not queued:
+                return None
+            job = min(queued, key=lambda j: j.created_at)
+            job.status = "running"
+            job.attempts += 1
+            job.updated_at = time.time()
+            return replace(job)
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return replace(job) if job else None
+
+    def update(self, job: Job) -> None:
+        job.updated_at = time.time()
+        with self._lock:
+            self._jobs[job.id] = replace(job)
+
+    def requeue_running(self) -> int:
+        with self._lock:
+            running = [job for job in self._jobs.values() if job.status == "running"]
+            for job in running:
+                job.status = "queued"
+            return len(running)
+
+    def close(self) -> None:
+        pass
+
+
+class SqliteJobQueue:
+    """Queue in a SQLite table; finished jobs are kept for ``ttl_seconds``."""
+
+    name = "sqlite"
+
+    COLUMNS = "id, kind, payload, status, result, error, attempts, created_at, updated_at"
+
+    def __init__(self, path: Path, ttl_seconds: float = 86400):
+        """Open (and create) the queue database.
+
+        Args:
+            path: SQLite database file
+            ttl_seconds: How long finished jobs can still be fetched
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "id TEXT PRIMARY KEY, kind TEXT NOT NULL, payload TEXT NOT NULL, status TEXT NOT NULL, "
+            "result TEXT, error TEXT, attempts INTEGER NOT NULL, created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)")
+        self._db.execute(
+            "DELETE FROM jobs WHERE status IN ('succeeded', 'failed') AND updated_at < ?",
+            (time.time() - ttl_seconds,),
+        )
+        self._db.commit()
+
+    @staticmethod
+    def _job(row: tuple) -> Job:
+        job_id, kind, payload, status, result, error, attempts, created_at, updated_at = row
+        return Job(
+            id=job_id,
+            kind=kind,
+            payload=json.loads(payload),
+            status=status,
+            result=json.loads(result) if result is not None else None,
+            error=error,
+            attempts=attempts,
+            created_at=created_at,
+            updated_at=updated_at,
+        )
+
+    def put(self, job: Job) -> None:
+        with self._lock:
+            self._db.execute(
+                f"INSERT INTO jobs ({self.COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job.id, job.kind, json.dumps(job.payload, ensure_ascii=False), job.status,
+                    None, None, job.attempts, job.created_at, job.updated_at,
+                ),
+            )
+            self._db.commit()
+
+    def claim(self) -> Job | None:
+        with self._lock:
+            row = self._db.execute(
+                "UPDATE jobs SET status = 'running', attempts = attempts + 1, updated_at = ? "
+                "WHERE id = (SELECT id FROM jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1) "
+                f"RETURNING {self.COLUMNS}",
+                (time.time(),),
+            ).fetchone()
+            self._db.commit()
+        return self._job(row) if row else None
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            row = self._db.execute(f"SELECT {self.COLUMNS} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._job(row) if row else None
+
+    def update(self, job: Job) -> None:
+        job.updated_at = time.time()
+        result = json.dumps(job.result, ensure_ascii=False) if job.result is not None else None
+        with self._lock:
+            self._db.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, updated_at = ? WHERE id = ?",
+                (job.status, result, job.error, job.updated_at, job.id),
+            )
+            self._db.commit()
+
+    def requeue_running(self) -> int:
+        with self._lock:
+            count = self._db.execute("UPDATE jobs SET status = 'queued' WHERE status = 'running'").rowcount
+            self._db.commit()
+        return count
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+def create_job_queue() -> JobQueue:
+    """Queue backend selected by JOB_QUEUE_BACKEND.
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    if settings.JOB_QUEUE_BACKEND == "memory":
+        return MemoryJobQueue()
+    if settings.JOB_QUEUE_BACKEND == "sqlite":
+        path = Path(settings.JOB_QUEUE_PATH)
+        return SqliteJobQueue(
+            path if path.is_absolute() else BACKEND_DIR / path,
+            ttl_seconds=settings.JOB_RESULT_TTL_SECONDS,
+        )
+    raise ValueError(f"Unknown JOB_QUEUE_BACKEND: {settings.JOB_QUEUE_BACKEND}")
+
+
+class JobWorkerPool:
+    """Bounded set of asyncio workers running jobs from a queue."""
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        handlers: dict[str, JobHandler],
+        concurrency: int,
+        max_attempts: int = 3,
+        poll_interval: float = 1.0,
+    ):
+        """Initialize the pool (call ``start`` to run it).
+
+        Args:
+            queue: Job storage
+            handlers: Coroutine per job kind
+            concurrency: Number of workers (jobs running at once)
+            max_attempts: Runs before an interrupted job is failed
+            poll_interval: Seconds between queue checks when idle
+        """
+        self.queue = queue
+        self.handlers = handlers
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self._workers: list[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+        self._changed = asyncio.Condition()
+
+    def start(self) -> None:
+        """Requeue interrupted jobs and start the workers."""
+        requeued = self.queue.requeue_running()
+        if requeued:
+            logger.info(f"🔁 [jobs] Requeued {requeued} interrupted job(s)")
+        self._workers = [asyncio.create_task(self._work()) for _ in range(self.concurrency)]
+        logger.info(f"✅ [jobs] Started {self.concurrency} worker(s) on the {self.queue.name} queue")
+
+    async def stop(self) -> None:
+        """Cancel the workers; running jobs are resumed at the next start."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def submit(self, kind: str, payload: dict) -> Job:
+        """Enqueue a job.
+
+        Raises:
+            ValueError: If no handler is registered for ``kind``
+        """
+        if kind not in self.handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+        job = Job(id=uuid.uuid4().hex, kind=kind, payload=payload)
+        self.queue.put(job)
+        self._wakeup.set()
+        logger.info(f"📥 [jobs] Queued {kind} job {job.id}")
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        """Current state of a job."""
+        return self.queue.get(job_id)
+
+    async def watch(self, job_id: str) -> AsyncIterator[Job]:
+        """Yield the job whenever its status changes, until it finishes."""
+        last_status = None
+        while True:
+            job = self.queue.get(job_id)
+            if job is None:
+                return
+            if job.status != last_status:
+                last_status = job.status
+                yield job
+            if job.finished:
+                return
+            async with self._changed:
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(self._changed.wait(), self.poll_interval)
+
+    async def wait(self, job_id: str, timeout: float) -> Job | None:
+        """The job once finished, or its current state after ``timeout`` seconds."""
+        with suppress(TimeoutError):
+            async with asyncio.timeout(timeout):
+                async for _ in self.watch(job_id):
+                    pass
+        return self.queue.get(job_id)
+
+    async def _save(self, job: Job) -> None:
+        self.queue.update(job)
+        async with self._changed:
+            self._changed.notify_all()
+
+    async def _work(self) -> None:
+        while True:
+            self._wakeup.clear()
+            job = self.queue.claim()
+            if job is None:
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                continue
+            await self._run(job)
+
+    async def _run(self, job: Job) -> None:
+        if job.attempts > self.max_attempts:
+            job.status, job.error = "failed", f"Job was interrupted {job.attempts - 1} times"
+            await self._save(job)
+            return
+
+        logger.info(f"🔵 [jobs] {job.kind} job {job.id} started (attempt {job.attempts})")
+        await self._save(job)
+        try:
+            job.result = await self.handlers[job.kind](job)
+            job.status = "succeeded"
+            logger.info(f"✅ [jobs] {job.kind} job {job.id} succeeded")
+        except Exception as e:
+            # CancelledError (shutdown) is not caught: the job stays running and is requeued
+            job.status, job.error = "failed", str(e)
+            logger.error(f"❌ [jobs] {job.kind} job {job.id} failed: {e}", exc_info=True)
+        await self._save(job)
+
+
+_job_pool: JobWorkerPool | None = None
+
+
+def get_job_pool() -> JobWorkerPool:
+    """Process-wide worker pool, started on first use (needs a running event loop)."""
+    global _job_pool
+
+    if _job_pool is None:
+        _job_pool = JobWorkerPool(
+            create_job_queue(),
+            _handlers,
+            concurrency=settings.JOB_WORKERS,
+            max_attempts=settings.JOB_MAX_ATTEMPTS,
+        )
+        _job_pool.start()
+    return _job_pool
+
+
+async def close_job_pool() -> None:
+    """Stop the workers and close the queue (application shutdown)."""
+    global _job_pool
+
+    if _job_pool is not None:
+        pool, _job_pool = _job_pool, None
+        await pool.stop()
+        pool.queue.close()
@@ -0,0 +1,249 @@
+"""Plan template cache for near-identical generate requests.
+
+Many generate requests differ only in their dates ("3일 고궁 + 맛집, 50만원").
+A finished plan is stored as a template under (trip length, budget bucket,
+interest set); a later request with the same key reuses it. Requests whose
+key misses fall back to cosine similarity of the ``user_request`` embedding
+against templates with the same trip length and budget bucket, and, when the
+request names interests, the same interest set. A template whose total cost
+is over the request's budget is never returned, even from the same bucket.
+
+On a hit the itinerary is rebased onto the requested dates deterministically
+(day N gets start_date + N - 1); venues, times and costs are unchanged.
+"""
+
+import copy
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+Embedder = Callable[[str], Awaitable[list[float]]]
+
+
+def trip_days(start_date: str, end_date: str) -> int | None:
+    """Inclusive number of trip days (None if the dates are invalid)."""
+    try:
+        start = datetime.strptime(start_date, "%Y-%m-%d")
+        end = datetime.strptime(end_date, "%Y-%m-%d")
+    except (TypeError, ValueError):
+        return None
+    days = (end - start).days + 1
+    return days if days >= 1 else None
+
+
+def budget_bucket(budget: int, step: int) -> int:
+    """Round a budget to the nearest ``step`` KRW bucket."""
+    return round(budget / step)
+
+
+def normalize_interests(interests: list[str]) -> tuple[str, ...]:
+    """Lowercase, strip and de-duplicate interests into a sorted tuple."""
+    return tuple(sorted({i.strip().lower() for i in interests if i and i.strip()}))
+
+
+def rebase_plan(plan: dict, start_date: str) -> dict:
+    """Copy ``plan`` with day N moved to ``start_date`` + N - 1.
+
+    Args:
+        plan: TravelPlan dict (not modified)
+        start_date: New first day in YYYY-MM-DD
+
+    Returns:
+        Rebased copy of the plan
+    """
+    start = datetime.strptime(start_date, "%Y-%m-%d")
+    rebased = copy.deepcopy(plan)
+    for index, day in enumerate(rebased.get("itinerary", [])):
+        day["day"] = index + 1
+        day["date"] = (start + timedelta(days=index)).strftime("%Y-%m-%d")
+    return rebased
+
+
+@dataclass
+class PlanTemplate:
+    """A cached plan and what it was generated for."""
+
+    plan: dict
+    user_request: str
+    num_days: int
+    budget_bucket: int
+    interests: tuple[str, ...]
+    embedding: np.ndarray | None
+    expires_at: float
+
+
+class PlanTemplateCache:
+    """In-memory LRU of plan templates with exact and semantic lookup."""
+
+    def __init__(
+        self,
+        max_size: int = 256,
+        ttl_seconds: float = 86400,
+        budget_step: int = 100_000,
+        similarity_threshold: float = 0.9,
+        embed: Embedder | None = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum templates before LRU eviction
+            ttl_seconds: Template lifetime
+            budget_step: Budget bucket width in KRW
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            embed: Async text embedder (semantic fallback disabled if None)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.budget_step = budget_step
+        self.similarity_threshold = similarity_threshold
+        self.embed = embed
+        self.stats = {"exact_hits": 0, "semantic_hits": 0, "misses": 0}
+        self._templates: OrderedDict[tuple, PlanTemplate] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def _key(self, num_days: int, budget: int, interests: list[str], user_request: str) -> tuple:
+        normalized = normalize_interests(interests)
+        # Without interests the request text is the only signal, so key on it
+        discriminator = normalized if normalized else ("", " ".join(user_request.split()))
+        return (num_days, budget_bucket(budget, self.budget_step), discriminator)
+
+    async def _embedding(self, text: str) -> np.ndarray | None:
+        if self.embed is None:
+            return None
+        try:
+            vector = np.asarray(await self.embed(text), dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"⚠️ [plan_cache] Embedding failed, semantic lookup skipped: {e}")
+            return None
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+    @staticmethod
+    def _reusable(template: PlanTemplate, budget: int, interests: tuple[str, ...]) -> bool:
+        """Whether a template fits the request's budget and explicit interests."""
+        if int(template.plan.get("total_cost", 0)) > budget:
+            return False
+        return not interests or template.interests == interests
+
+    def _evict_expired(self) -> None:
+        now = time.time()
+        for key in [k for k, t in self._templates.items() if t.expires_at < now]:
+            del self._templates[key]
+
+    async def lookup(
+        self,
+        user_request: str,
+        dates: tuple[str, str],
+        budget: int | None,
+        interests: list[str],
+    ) -> dict | None:
+        """Find a template for the request and rebase it onto its dates.
+
+        Returns:
+            Rebased TravelPlan dict, or None on a miss (or uncacheable request)
+        """
+        num_days = trip_days(*dates)
+        if num_days is None or not budget:
+            return None
+
+        self._evict_expired()
+        key = self._key(num_days, budget, interests, user_request)
+        normalized = normalize_interests(interests)
+        template = self._templates.get(key)
+        if template is not None and self._reusable(template, budget, normalized):
+            self._templates.move_to_end(key)
+            self.stats["exact_hits"] += 1
+            logger.info(f"⚡ [plan_cache] Exact template hit for {num_days} days")
+            return rebase_plan(template.plan, dates[0])
+
+        candidates = [
+            (k, t) for k, t in self._templates.items()
+            if t.embedding is not None and k[:2] == key[:2] and self._reusable(t, budget, normalized)
+        ]
+        if candidates:
+            query = await self._embedding(user_request)
+            if query is not None:
+                similarities = np.stack([t.embedding for _, t in candidates]) @ query
+                best = int(np.argmax(similarities))
+                if similarities[best] >= self.similarity_threshold:
+                    best_key, template = candidates[best]
+                    self._templates.move_to_end(best_key)
+                    self.stats["semantic_hits"] += 1
+                    logger.info(f"⚡ [plan_cache] Semantic template hit (similarity {similarities[best]:.3f})")
+                    return rebase_plan(template.plan, dates[0])
+
+        self.stats["misses"] += 1
+        return None
+
+    async def store(
+        self,
+        plan: dict,
+        user_request: str,
+        dates: tuple[str, str],
+        budget: int | None,
+        interests: list[str],
+    ) -> None:
+        """Store a freshly generated plan as a template (no-op if uncacheable)."""
+        num_days = trip_days(*dates)
+        if num_days is None or not budget or len(plan.get("itinerary", [])) != num_days:
+            return
+
+        key = self._key(num_days, budget, interests, user_request)
+        self._templates[key] = PlanTemplate(
+            plan=copy.deepcopy(plan),
+            user_request=user_request,
+            num_days=num_days,
+            budget_bucket=key[1],
+            interests=normalize_interests(interests),
+            embedding=await self._embedding(user_request),
+            expires_at=time.time() + self.ttl_seconds,
+        )
+        self._templates.move_to_end(key)
+        while len(self._templates) > self.max_size:
+            self._templates.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all templates."""
+        self._templates.clear()
+
+
+def _openai_embedder() -> Embedder:
+    """Query embedder using the same model as the attraction vector store.
+
+    The client is created once and shared by every lookup and store.
+    """
+    from langchain_openai import OpenAIEmbeddings
+
+    embeddings = OpenAIEmbeddings(model="text-embedding-3-small", openai_api_key=settings.OPENAI_API_KEY)
+    return embeddings.aembed_query
+
+
+_plan_cache: PlanTemplateCache | None = None
+
+
+def get_plan_cache() -> PlanTemplateCache | None:
+    """Process-wide plan template cache (None if PLAN_CACHE_ENABLED is off)."""
+    global _plan_cache
+
+    if not settings.PLAN_CACHE_ENABLED:
+        return None
+    if _plan_cache is None:
+        _plan_cache = PlanTemplateCache(
+            max_size=settings.PLAN_CACHE_SIZE,
+            ttl_seconds=settings.PLAN_CACHE_TTL_SECONDS,
+            budget_step=settings.PLAN_CACHE_BUDGET_STEP_KRW,
+            similarity_threshold=settings.PLAN_CACHE_SIMILARITY_THRESHOLD,
+            embed=_openai_embedder() if settings.OPENAI_API_KEY else None,
+        )
+    return _plan_cache
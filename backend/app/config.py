@@ -20,10 +20,68 @@ class Settings(BaseSettings):
     # Docker/Production: PostgreSQL
     DATABASE_URL: str = "sqlite:///./seoul_travel.db"
 
+    # Tourist attraction read API
+    ATTRACTION_SNAPSHOT_TTL_SECONDS: int = 3600  # Rebuild in-memory snapshot hourly
+    ATTRACTION_CACHE_MAX_AGE_SECONDS: int = 300  # Cache-Control max-age for clients
+
     # AI/LLM
     OPENAI_API_KEY: str = ""
-    OPENAI_MODEL: str = "gpt-4o-mini"  # Default model for all LLM calls
+    OPENAI_MODEL: str = "gpt-4o-mini"  # Default model (plan generation and modification)
+    OPENAI_FAST_MODEL: str = "gpt-4.1-nano"  # Fallback when a call exceeds its latency budget
+    LLM_TASK_MODELS: dict[str, str] = {  # Per-task model overrides (others use OPENAI_MODEL)
+        "collect_info": "gpt-4.1-nano",
+        "parse_feedback": "gpt-4.1-nano",
+    }
+    LLM_TASK_LATENCY_BUDGETS_SECONDS: dict[str, float] = {  # Exceeding falls back to OPENAI_FAST_MODEL
+        "collect_info": 5,
+        "parse_feedback": 5,
+        "narrate_plan": 10,
+        "plan_skeleton": 10,
+        "generate_day": 25,
+        "generate_plan": 60,
+        "modify_section": 20,
+        "modify_plan": 45,
+    }
+    LLM_HEDGE_ENABLED: bool = True  # Send a backup request for calls slower than the task's p95
+    LLM_HEDGE_PERCENTILE: float = 95
+    LLM_HEDGE_MIN_SAMPLES: int = 20  # Latency samples needed before hedging a task
+    LLM_HEDGE_MIN_DELAY_SECONDS: float = 1.0
+    LLM_ADMISSION_ENABLED: bool = True  # Queue LLM requests to stay under provider rate limits
+    LLM_RATE_LIMIT_RPM: int = 500  # Requests per minute across the process
+    LLM_RATE_LIMIT_TPM: int = 200000  # Estimated tokens (prompt + completion) per minute
+    PLAN_REQUEST_DEADLINE_SECONDS: float = 120  # End-to-end deadline for plan generation
+    REVIEW_REQUEST_DEADLINE_SECONDS: float = 60  # End-to-end deadline for plan review
     ANTHROPIC_API_KEY: str = ""
+    PLANNER_GENERATION_MODE: str = "scheduled"  # scheduled (deterministic + LLM prose) or llm (full LLM plan)
+    PLANNER_MAP_REDUCE_MIN_DAYS: int = 3  # llm mode: generate days in parallel from this trip length
+    PLANNER_MAP_REDUCE_CONCURRENCY: int = 5  # Max concurrent per-day LLM calls
+    PROMPT_VENUE_TOKEN_BUDGET: int = 3000  # Max tokens for venue lists in a prompt (lowest relevance pruned)
+    PROMPT_DESCRIPTION_MAX_CHARS: int = 120  # Venue descriptions truncated to this length
+    COLLECT_INFO_FAST_PATH_ENABLED: bool = True  # Regex request parsing before the collect_info LLM call
+    REVIEW_FEEDBACK_FAST_PATH_ENABLED: bool = True  # Classify review feedback locally before the LLM
+    REVIEW_FEEDBACK_LOCAL_MODEL_ENABLED: bool = True  # n-gram model for feedback the rules are unsure about
+    REVIEW_FEEDBACK_MIN_CONFIDENCE: float = 0.8  # Below this the LLM parses the feedback
+    LLM_CACHE_ENABLED: bool = True  # Exact-match cache for temperature=0 structured calls
+    LLM_CACHE_PATH: str = "data/llm_cache.sqlite3"  # Relative to backend/ (empty: memory only)
+    LLM_CACHE_SIZE: int = 1024  # In-memory LRU entries
+    LLM_CACHE_TTL_SECONDS: int = 60 * 60 * 24 * 7
+    CHECKPOINT_DB_PATH: str = "data/checkpoints.sqlite3"  # LangGraph checkpoints (empty: memory only)
+    REVIEW_SESSION_TTL_SECONDS: int = 60 * 60 * 24 * 7  # Idle checkpoint threads (review sessions) deleted at startup
+    JOB_QUEUE_BACKEND: str = "sqlite"  # Background job queue: sqlite or memory
+    JOB_QUEUE_PATH: str = "data/jobs.sqlite3"  # Relative to backend/ (sqlite backend)
+    JOB_WORKERS: int = 2  # Jobs run concurrently by the in-process worker pool
+    JOB_MAX_ATTEMPTS: int = 3  # Runs (restarts included) before an interrupted job is failed
+    JOB_RESULT_TTL_SECONDS: int = 60 * 60 * 24  # How long finished jobs can be fetched
+    PLAN_CACHE_ENABLED: bool = True  # Reuse plans for requests that differ only in dates
+    PLAN_CACHE_SIZE: int = 256
+    PLAN_CACHE_TTL_SECONDS: int = 60 * 60 * 24
+    PLAN_CACHE_BUDGET_STEP_KRW: int = 100000  # Budget bucket width for the template key
+    PLAN_CACHE_SIMILARITY_THRESHOLD: float = 0.9  # Min cosine similarity of user_request embeddings
+
+    # Shared outbound HTTP client
+    HTTP_TIMEOUT_SECONDS: float = 10.0
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
 
     # Naver API (Local Search)
     NAVER_CLIENT_ID: str = ""
@@ -35,6 +93,21 @@ class Settings(BaseSettings):
     # ODsay API (Public Transit)
     ODSAY_API_KEY: str = ""
 
+    # Routing client (live transit/driving times)
+    ROUTING_PROVIDER: str = "odsay"  # odsay (transit) or kakao (driving)
+    ODSAY_BASE_URL: str = "https://api.odsay.com"
+    KAKAO_MOBILITY_BASE_URL: str = "https://apis-navi.kakaomobility.com"
+    ROUTING_CELL_SIZE_METERS: int = 200  # Cache key grid resolution
+    ROUTING_TIME_BUCKET_MINUTES: int = 60  # Cache key departure-time resolution
+    ROUTING_CACHE_SIZE: int = 10000
+    ROUTING_CACHE_TTL_SECONDS: int = 60 * 60 * 24
+    ROUTING_MAX_CONCURRENCY: int = 8
+    PLANNER_LIVE_TRAVEL_TIMES: bool = False  # Opt in: validate_plan checks activity gaps against live routing instead of the travel time matrix (needs the provider's API key)
+
+    # Transit travel-time matrix
+    TRAVEL_TIME_MATRIX_DIR: str = "data/travel_times"  # Relative to backend/
+    TRAVEL_TIME_PROVIDER: str = "estimate"  # estimate (offline), odsay or kakao
+
     # Auth
     SECRET_KEY: str = "dev-secret-key-change-in-production"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
@@ -0,0 +1 @@
+"""Geospatial utilities shared across domains."""
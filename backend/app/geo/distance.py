@@ -0,0 +1,54 @@
+"""Great-circle distance helpers (vectorized with NumPy)."""
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+# Mean Earth radius (IUGG)
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(
+    lat1: ArrayLike,
+    lon1: ArrayLike,
+    lat2: ArrayLike,
+    lon2: ArrayLike,
+) -> np.ndarray:
+    """Compute haversine distances in kilometers.
+
+    Arguments broadcast like NumPy arrays, so a single origin can be compared
+    against many destinations in one call.
+
+    Example:
+        haversine_km(37.5796, 126.9770, [37.5512, 37.5240], [126.9882, 126.9803])
+        # -> array([3.3, 6.2])
+
+    Args:
+        lat1: Origin latitude(s) in degrees
+        lon1: Origin longitude(s) in degrees
+        lat2: Destination latitude(s) in degrees
+        lon2: Destination longitude(s) in degrees
+
+    Returns:
+        Distances in kilometers (broadcast shape of the inputs)
+    """
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lon1, lat2, lon2))
+
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def haversine_matrix(latitudes: ArrayLike, longitudes: ArrayLike) -> np.ndarray:
+    """Compute the pairwise haversine distance matrix for a set of points.
+
+    Args:
+        latitudes: Point latitudes in degrees (length N)
+        longitudes: Point longitudes in degrees (length N)
+
+    Returns:
+        Symmetric (N, N) matrix of distances in kilometers
+    """
+    lats = np.asarray(latitudes, dtype=np.float64)
+    lons = np.asarray(longitudes, dtype=np.float64)
+    return haversine_km(lats[:, None], lons[:, None], lats[None, :], lons[None, :])
@@ -0,0 +1,360 @@
+"""Offline reverse geocoding of coordinates to Seoul districts (구).
+
+Uses bundled boundary data instead of an external geocoding API:
+- A coarse Seoul boundary polygon decides whether a point is in Seoul at all.
+- Simplified boundary polygons of the 25 districts (built from shared border
+  vertices, with the Han river as a common edge, so neighbours never overlap)
+  decide the district with a ray-casting point-in-polygon test.
+- Points in the slack between the simplified district outlines and the
+  generous city boundary fall back to the nearest district anchor point.
+
+This is precise enough to build Naver search keywords such as "용산구 맛집".
+"""
+
+import numpy as np
+
+from app.geo.distance import haversine_km
+
+# (district, latitude, longitude) anchors for points outside every district polygon:
+# one centroid per district plus a few extra anchors for districts whose shape a
+# single centroid represents poorly.
+SEOUL_DISTRICTS: tuple[tuple[str, float, float], ...] = (
+    ("종로구", 37.5949, 126.9773),
+    ("중구", 37.5601, 126.9960),
+    ("용산구", 37.5311, 126.9810),
+    ("성동구", 37.5506, 127.0409),
+    ("광진구", 37.5467, 127.0857),
+    ("동대문구", 37.5838, 127.0507),
+    ("중랑구", 37.5978, 127.0928),
+    ("성북구", 37.6058, 127.0175),
+    ("강북구", 37.6436, 127.0112),
+    ("도봉구", 37.6691, 127.0324),
+    ("노원구", 37.6525, 127.0750),
+    ("은평구", 37.6191, 126.9270),
+    ("서대문구", 37.5778, 126.9391),
+    ("마포구", 37.5593, 126.9083),
+    ("양천구", 37.5247, 126.8554),
+    ("강서구", 37.5613, 126.8228),
+    ("구로구", 37.4944, 126.8562),
+    ("금천구", 37.4605, 126.9008),
+    ("영등포구", 37.5223, 126.9101),
+    ("동작구", 37.4988, 126.9517),
+    ("관악구", 37.4673, 126.9453),
+    ("서초구", 37.4733, 127.0312),
+    ("강남구", 37.4966, 127.0630),
+    ("송파구", 37.5056, 127.1153),
+    ("강동구", 37.5504, 127.1470),
+    # Extra anchors
+    ("종로구", 37.5740, 126.9850),  # 종로·인사동
+    ("중구", 37.5625, 126.9830),  # 명동·을지로
+    ("성북구", 37.5920, 126.9960),  # 성북동
+    ("용산구", 37.5480, 126.9880),  # 후암동·남산 남측
+    ("용산구", 37.5180, 126.9600),  # 이촌동·노들섬
+    ("서초구", 37.5060, 127.0000),  # 반포동
+    ("서초구", 37.4650, 127.0800),  # 내곡동
+    ("강남구", 37.5172, 127.0473),  # 삼성동·청담동
+    ("송파구", 37.4850, 127.1400),  # 문정동·장지동
+    ("은평구", 37.6400, 126.9180),  # 진관동
+)
+
+# Coarse Seoul city boundary as (latitude, longitude) vertices, clockwise from the north.
+# Slightly generous so border attractions are not rejected.
+SEOUL_BOUNDARY: tuple[tuple[float, float], ...] = (
+    (37.7200, 127.0100),
+    (37.7000, 127.0950),
+    (37.6400, 127.1200),
+    (37.5850, 127.1200),
+    (37.5700, 127.1900),
+    (37.5250, 127.1900),
+    (37.4800, 127.1650),
+    (37.4600, 127.1300),
+    (37.4400, 127.1050),
+    (37.4200, 127.0500),
+    (37.4200, 127.0000),
+    (37.4350, 126.9550),
+    (37.4200, 126.9000),
+    (37.4650, 126.8650),
+    (37.4750, 126.8150),
+    (37.5000, 126.8100),
+    (37.5250, 126.8150),
+    (37.5450, 126.7850),
+    (37.5700, 126.7600),
+    (37.5950, 126.7950),
+    (37.5950, 126.8600),
+    (37.6400, 126.8950),
+    (37.6700, 126.9350),
+    (37.6950, 126.9900),
+)
+
+# District boundaries as (latitude, longitude) rings (last edge implicit), simplified
+# to the vertices needed to place landmarks and neighbourhoods correctly.
+SEOUL_DISTRICT_BOUNDARIES: dict[str, tuple[tuple[float, float], ...]] = {
+    "종로구": (
+        (37.6320, 126.9720), (37.6150, 126.9550), (37.6020, 126.9480), (37.5850, 126.9580),
+        (37.5750, 126.9620), (37.5660, 126.9650), (37.5688, 126.9700), (37.5695, 126.9780),
+        (37.5693, 126.9950), (37.5698, 127.0150), (37.5715, 127.0240), (37.5770, 127.0200),
+        (37.5780, 127.0180), (37.5840, 127.0120), (37.5880, 127.0030), (37.5930, 126.9900),
+        (37.6120, 126.9850),
+    ),
+    "중구": (
+        (37.5715, 127.0240), (37.5698, 127.0150), (37.5693, 126.9950), (37.5695, 126.9780),
+        (37.5688, 126.9700), (37.5660, 126.9650), (37.5610, 126.9640), (37.5580, 126.9620),
+        (37.5520, 126.9610), (37.5540, 126.9700), (37.5525, 126.9790), (37.5530, 126.9880),
+        (37.5490, 126.9970), (37.5470, 127.0080), (37.5530, 127.0150), (37.5620, 127.0250),
+        (37.5700, 127.0270),
+    ),
+    "용산구": (
+        (37.5520, 126.9610), (37.5410, 126.9550), (37.5310, 126.9460), (37.5210, 126.9500),
+        (37.5140, 126.9680), (37.5100, 126.9850), (37.5140, 127.0000), (37.5260, 127.0120),
+        (37.5400, 127.0100), (37.5470, 127.0080), (37.5490, 126.9970), (37.5530, 126.9880),
+        (37.5525, 126.9790), (37.5540, 126.9700),
+    ),
+    "성동구": (
+        (37.5260, 127.0120), (37.5350, 127.0300), (37.5340, 127.0500), (37.5320, 127.0580),
+        (37.5400, 127.0620), (37.5500, 127.0660), (37.5630, 127.0680), (37.5660, 127.0500),
+        (37.5710, 127.0400), (37.5700, 127.0270), (37.5620, 127.0250), (37.5530, 127.0150),
+        (37.5470, 127.0080), (37.5400, 127.0100),
+    ),
+    "광진구": (
+        (37.5320, 127.0580), (37.5240, 127.0700), (37.5220, 127.0900), (37.5320, 127.1050),
+        (37.5420, 127.1170), (37.5550, 127.1130), (37.5720, 127.1050), (37.5750, 127.0950),
+        (37.5720, 127.0760), (37.5630, 127.0680), (37.5500, 127.0660), (37.5400, 127.0620),
+    ),
+    "동대문구": (
+        (37.5770, 127.0200), (37.5715, 127.0240), (37.5700, 127.0270), (37.5710, 127.0400),
+        (37.5660, 127.0500), (37.5630, 127.0680), (37.5720, 127.0760), (37.5900, 127.0720),
+        (37.6060, 127.0680), (37.6030, 127.0550), (37.5950, 127.0450), (37.5850, 127.0330),
+        (37.5800, 127.0220),
+    ),
+    "중랑구": (
+        (37.6060, 127.0680), (37.5900, 127.0720), (37.5720, 127.0760), (37.5750, 127.0950),
+        (37.5720, 127.1050), (37.5980, 127.1150), (37.6250, 127.1080), (37.6220, 127.0950),
+        (37.6180, 127.0800), (37.6140, 127.0670),
+    ),
+    "성북구": (
+        (37.6320, 126.9720), (37.6120, 126.9850), (37.5930, 126.9900), (37.5880, 127.0030),
+        (37.5840, 127.0120), (37.5780, 127.0180), (37.5770, 127.0200), (37.5800, 127.0220),
+        (37.5850, 127.0330), (37.5950, 127.0450), (37.6030, 127.0550), (37.6060, 127.0680),
+        (37.6140, 127.0670), (37.6280, 127.0480), (37.6110, 127.0280), (37.6170, 127.0150),
+        (37.6250, 126.9950),
+    ),
+    "강북구": (
+        (37.6320, 126.9720), (37.6590, 126.9780), (37.6750, 126.9980), (37.6550, 127.0150),
+        (37.6450, 127.0300), (37.6400, 127.0470), (37.6280, 127.0480), (37.6110, 127.0280),
+        (37.6170, 127.0150), (37.6250, 126.9950),
+    ),
+    "도봉구": (
+        (37.6750, 126.9980), (37.7000, 127.0100), (37.7000, 127.0400), (37.6930, 127.0520),
+        (37.6750, 127.0500), (37.6550, 127.0510), (37.6400, 127.0470), (37.6450, 127.0300),
+        (37.6550, 127.0150),
+    ),
+    "노원구": (
+        (37.6400, 127.0470), (37.6550, 127.0510), (37.6750, 127.0500), (37.6930, 127.0520),
+        (37.7000, 127.0900), (37.6650, 127.1150), (37.6400, 127.1120), (37.6250, 127.1080),
+        (37.6220, 127.0950), (37.6180, 127.0800), (37.6140, 127.0670), (37.6280, 127.0480),
+    ),
+    "은평구": (
+        (37.5900, 126.8680), (37.5830, 126.8820), (37.5790, 126.8950), (37.5770, 126.9050),
+        (37.5850, 126.9150), (37.5920, 126.9300), (37.6020, 126.9480), (37.6150, 126.9550),
+        (37.6320, 126.9720), (37.6600, 126.9550), (37.6720, 126.9250), (37.6500, 126.9000),
+        (37.6100, 126.8800),
+    ),
+    "서대문구": (
+        (37.5770, 126.9050), (37.5660, 126.9200), (37.5610, 126.9300), (37.5580, 126.9400),
+        (37.5560, 126.9500), (37.5580, 126.9620), (37.5610, 126.9640), (37.5660, 126.9650),
+        (37.5750, 126.9620), (37.5850, 126.9580), (37.6020, 126.9480), (37.5920, 126.9300),
+        (37.5850, 126.9150),
+    ),
+    "마포구": (
+        (37.5760, 126.8500), (37.5700, 126.8660), (37.5530, 126.8880), (37.5430, 126.9050),
+        (37.5350, 126.9280), (37.5310, 126.9460), (37.5410, 126.9550), (37.5520, 126.9610),
+        (37.5580, 126.9620), (37.5560, 126.9500), (37.5580, 126.9400), (37.5610, 126.9300),
+        (37.5660, 126.9200), (37.5770, 126.9050), (37.5790, 126.8950), (37.5830, 126.8820),
+        (37.5900, 126.8680),
+    ),
+    "양천구": (
+        (37.5300, 126.8220), (37.5290, 126.8450), (37.5360, 126.8620), (37.5460, 126.8760),
+        (37.5300, 126.8830), (37.5120, 126.8840), (37.5080, 126.8600), (37.5050, 126.8350),
+        (37.5150, 126.8180),
+    ),
+    "강서구": (
+        (37.5300, 126.8220), (37.5400, 126.8000), (37.5550, 126.7700), (37.5750, 126.7650),
+        (37.5980, 126.7950), (37.5850, 126.8150), (37.5760, 126.8500), (37.5700, 126.8660),
+        (37.5530, 126.8880), (37.5460, 126.8760), (37.5360, 126.8620), (37.5290, 126.8450),
+    ),
+    "구로구": (
+        (37.5050, 126.8350), (37.5080, 126.8600), (37.5120, 126.8840), (37.5110, 126.8950),
+        (37.5030, 126.9000), (37.4950, 126.9020), (37.4900, 126.9050), (37.4820, 126.9050),
+        (37.4835, 126.8950), (37.4840, 126.8850), (37.4840, 126.8730), (37.4780, 126.8400),
+        (37.4850, 126.8150), (37.5000, 126.8120),
+    ),
+    "금천구": (
+        (37.4840, 126.8730), (37.4840, 126.8850), (37.4835, 126.8950), (37.4820, 126.9050),
+        (37.4700, 126.9120), (37.4550, 126.9150), (37.4350, 126.9220), (37.4350, 126.8950),
+        (37.4600, 126.8720),
+    ),
+    "영등포구": (
+        (37.5460, 126.8760), (37.5530, 126.8880), (37.5430, 126.9050), (37.5350, 126.9280),
+        (37.5310, 126.9460), (37.5210, 126.9500), (37.5160, 126.9350), (37.5100, 126.9220),
+        (37.5000, 126.9140), (37.4900, 126.9050), (37.4950, 126.9020), (37.5030, 126.9000),
+        (37.5110, 126.8950), (37.5120, 126.8840), (37.5300, 126.8830),
+    ),
+    "동작구": (
+        (37.4900, 126.9050), (37.5000, 126.9140), (37.5100, 126.9220), (37.5160, 126.9350),
+        (37.5210, 126.9500), (37.5140, 126.9680), (37.5100, 126.9850), (37.5000, 126.9830),
+        (37.4870, 126.9850), (37.4770, 126.9820), (37.4820, 126.9700), (37.4880, 126.9500),
+        (37.4870, 126.9350), (37.4840, 126.9180),
+    ),
+    "관악구": (
+        (37.4820, 126.9050), (37.4900, 126.9050), (37.4840, 126.9180), (37.4870, 126.9350),
+        (37.4880, 126.9500), (37.4820, 126.9700), (37.4770, 126.9820), (37.4650, 126.9880),
+        (37.4520, 126.9850), (37.4400, 126.9600), (37.4350, 126.9220), (37.4550, 126.9150),
+        (37.4700, 126.9120),
+    ),
+    "서초구": (
+        (37.5100, 126.9850), (37.5140, 127.0000), (37.5260, 127.0120), (37.5170, 127.0200),
+        (37.5040, 127.0240), (37.4980, 127.0276), (37.4850, 127.0380), (37.4750, 127.0450),
+        (37.4680, 127.0680), (37.4550, 127.0950), (37.4400, 127.0700), (37.4300, 127.0450),
+        (37.4450, 127.0100), (37.4520, 126.9850), (37.4650, 126.9880), (37.4770, 126.9820),
+        (37.4870, 126.9850), (37.5000, 126.9830),
+    ),
+    "강남구": (
+        (37.5260, 127.0120), (37.5350, 127.0300), (37.5340, 127.0500), (37.5320, 127.0580),
+        (37.5240, 127.0700), (37.5100, 127.0680), (37.5000, 127.0760), (37.4930, 127.0880),
+        (37.4880, 127.1040), (37.4800, 127.1080), (37.4700, 127.1120), (37.4600, 127.1150),
+        (37.4550, 127.0950), (37.4680, 127.0680), (37.4750, 127.0450), (37.4850, 127.0380),
+        (37.4980, 127.0276), (37.5040, 127.0240), (37.5170, 127.0200),
+    ),
+    "송파구": (
+        (37.5240, 127.0700), (37.5220, 127.0900), (37.5320, 127.1050), (37.5420, 127.1170),
+        (37.5270, 127.1220), (37.5230, 127.1350), (37.5150, 127.1500), (37.5120, 127.1580),
+        (37.4900, 127.1600), (37.4700, 127.1400), (37.4600, 127.1150), (37.4700, 127.1120),
+        (37.4800, 127.1080), (37.4880, 127.1040), (37.4930, 127.0880), (37.5000, 127.0760),
+        (37.5100, 127.0680),
+    ),
+    "강동구": (
+        (37.5420, 127.1170), (37.5650, 127.1280), (37.5780, 127.1550), (37.5820, 127.1800),
+        (37.5550, 127.1850), (37.5300, 127.1800), (37.5120, 127.1580), (37.5150, 127.1500),
+        (37.5230, 127.1350), (37.5270, 127.1220),
+    ),
+}
+
+_ANCHOR_NAMES = tuple(name for name, _, _ in SEOUL_DISTRICTS)
+_DISTRICT_NAMES = frozenset(_ANCHOR_NAMES)
+_DISTRICT_LATS = np.array([lat for _, lat, _ in SEOUL_DISTRICTS])
+_DISTRICT_LONS = np.array([lon for _, _, lon in SEOUL_DISTRICTS])
+
+# (district, polygon, (min_lat, min_lon, max_lat, max_lon)) with bounding boxes to skip most tests
+_DISTRICT_POLYGONS = tuple(
+    (
+        name,
+        polygon,
+        (
+            min(lat for lat, _ in polygon),
+            min(lon for _, lon in polygon),
+            max(lat for lat, _ in polygon),
+            max(lon for _, lon in polygon),
+        ),
+    )
+    for name, polygon in SEOUL_DISTRICT_BOUNDARIES.items()
+)
+
+
+def point_in_polygon(
+    latitude: float,
+    longitude: float,
+    polygon: tuple[tuple[float, float], ...],
+) -> bool:
+    """Ray-casting point-in-polygon test.
+
+    Args:
+        latitude: Point latitude
+        longitude: Point longitude
+        polygon: Closed ring of (latitude, longitude) vertices (last edge implicit)
+
+    Returns:
+        True if the point lies inside the polygon
+    """
+    inside = False
+    j = len(polygon) - 1
+    for i in range(len(polygon)):
+        lat_i, lon_i = polygon[i]
+        lat_j, lon_j = polygon[j]
+        if (lat_i > latitude) != (lat_j > latitude):
+            crossing = lon_i + (latitude - lat_i) * (lon_j - lon_i) / (lat_j - lat_i)
+            if longitude < crossing:
+                inside = not inside
+        j = i
+    return inside
+
+
+def is_in_seoul(latitude: float, longitude: float) -> bool:
+    """Check whether a coordinate falls inside the Seoul boundary."""
+    return point_in_polygon(latitude, longitude, SEOUL_BOUNDARY)
+
+
+def lookup_district(latitude: float | None, longitude: float | None) -> str | None:
+    """Reverse-geocode a coordinate to a Seoul district.
+
+    Example:
+        lookup_district(37.5796, 126.9770)  # -> "종로구"
+
+    Args:
+        latitude: WGS84 latitude
+        longitude: WGS84 longitude
+
+    Returns:
+        District name, or None if the coordinate is missing or outside Seoul
+    """
+    if latitude is None or longitude is None:
+        return None
+    if not is_in_seoul(latitude, longitude):
+        return None
+
+    for name, polygon, (min_lat, min_lon, max_lat, max_lon) in _DISTRICT_POLYGONS:
+        if (
+            min_lat <= latitude <= max_lat
+            and min_lon <= longitude <= max_lon
+            and point_in_polygon(latitude, longitude, polygon)
+        ):
+            return name
+
+    # Border slack outside the simplified district outlines
+    distances = haversine_km(latitude, longitude, _DISTRICT_LATS, _DISTRICT_LONS)
+    return _ANCHOR_NAMES[int(np.argmin(distances))]
+
+
+def extract_district(address: str | None) -> str | None:
+    """Extract the district (구) token from a Korean address.
+
+    Args:
+        address: Road or jibun address (e.g., "서울특별시 용산구 한강대로40길 46")
+
+    Returns:
+        District name (e.g., "용산구") or None if not found
+    """
+    if not address:
+        return None
+
+    for token in address.split()[1:3]:
+        if token in _DISTRICT_NAMES:
+            return token
+    return None
+
+
+def resolve_district(
+    latitude: float | None,
+    longitude: float | None,
+    address: str | None = None,
+) -> str | None:
+    """Resolve a district, preferring an explicit address over coordinates.
+
+    Args:
+        latitude: WGS84 latitude
+        longitude: WGS84 longitude
+        address: Optional Korean address
+
+    Returns:
+        District name or None if neither source resolves
+    """
+    return extract_district(address) or lookup_district(latitude, longitude)
@@ -0,0 +1,107 @@
+"""Static 2D KD-tree over projected points (port of mourner/kdbush).
+
+The tree is stored as flat arrays sorted in-place by alternating axes, so a
+range query is a short iterative descent with no per-node objects.
+"""
+
+import numpy as np
+
+
+class KDBush:
+    """Immutable KD-tree supporting box and radius queries.
+
+    Example:
+        index = KDBush(xs, ys)
+        index.range(0.1, 0.1, 0.2, 0.2)  # -> positions into xs/ys
+        index.within(0.15, 0.15, 0.01)
+    """
+
+    def __init__(self, xs: np.ndarray, ys: np.ndarray, node_size: int = 64):
+        """Build the tree.
+
+        Args:
+            xs: X coordinates
+            ys: Y coordinates
+            node_size: Leaf size below which points are scanned linearly
+        """
+        self.node_size = node_size
+        self.ids = np.arange(len(xs), dtype=np.int64)
+        self.coords = np.column_stack([xs, ys]).astype(np.float64) if len(xs) else np.empty((0, 2))
+        self._sort(0, len(xs) - 1, 0)
+
+    def __len__(self) -> int:
+        """Number of indexed points."""
+        return len(self.ids)
+
+    def _sort(self, left: int, right: int, axis: int) -> None:
+        """Recursively partition [left, right] around the median on ``axis``."""
+        stack = [(left, right, axis)]
+        while stack:
+            left, right, axis = stack.pop()
+            if right - left <= self.node_size:
+                continue
+
+            mid = (left + right) >> 1
+            # Partition the slice so the median lands at ``mid``
+            segment = self.coords[left:right + 1, axis]
+            order = np.argpartition(segment, mid - left)
+            self.coords[left:right + 1] = self.coords[left:right + 1][order]
+            self.ids[left:right + 1] = self.ids[left:right + 1][order]
+
+            stack.append((left, mid - 1, 1 - axis))
+            stack.append((mid + 1, right, 1 - axis))
+
+    def range(self, min_x: float, min_y: float, max_x: float, max_y: float) -> list[int]:
+        """Return positions of points inside the axis-aligned box."""
+        result: list[int] = []
+        if not len(self.ids):
+            return result
+
+        stack = [(0, len(self.ids) - 1, 0)]
+        coords = self.coords
+        while stack:
+            left, right, axis = stack.pop()
+
+            if right - left <= self.node_size:
+                block = coords[left:right + 1]
+                inside = (
+                    (block[:, 0] >= min_x) & (block[:, 0] <= max_x)
+                    & (block[:, 1] >= min_y) & (block[:, 1] <= max_y)
+                )
+                result.extend(self.ids[left:right + 1][inside].tolist())
+                continue
+
+            mid = (left + right) >> 1
+            x, y = coords[mid]
+            if min_x <= x <= max_x and min_y <= y <= max_y:
+                result.append(int(self.ids[mid]))
+
+            value = x if axis == 0 else y
+            low = min_x if axis == 0 else min_y
+            high = max_x if axis == 0 else max_y
+            if low <= value:
+                stack.append((left, mid - 1, 1 - axis))
+            if high >= value:
+                stack.append((mid + 1, right, 1 - axis))
+
+        return result
+
+    def within(self, qx: float, qy: float, radius: float) -> list[int]:
+        """Return positions of points within ``radius`` of (qx, qy)."""
+        candidates = self.range(qx - radius, qy - radius, qx + radius, qy + radius)
+        if not candidates:
+            return candidates
+
+        # ``range`` returns original positions, so look coordinates up by id
+        pts = self._points_by_id()[candidates]
+        d2 = (pts[:, 0] - qx) ** 2 + (pts[:, 1] - qy) ** 2
+        return [c for c, inside in zip(candidates, d2 <= radius * radius, strict=True) if inside]
+
+    def _points_by_id(self) -> np.ndarray:
+        """Coordinates in original insertion order (cached)."""
+        cached = getattr(self, "_by_id", None)
+        if cached is None:
+            cached = np.empty_like(self.coords)
+            cached[self.ids] = self.coords
+            self._by_id = cached
+        return cached
@@ -0,0 +1,102 @@
+"""Vectorized k-medoids clustering over a precomputed distance matrix."""
+
+import math
+
+import numpy as np
+
+
+def _init_medoids(distances: np.ndarray, k: int) -> np.ndarray:
+    """Deterministic farthest-first initialization.
+
+    The first medoid is the most central point; each next medoid is the point
+    farthest from all medoids chosen so far.
+    """
+    medoids = [int(np.argmin(distances.sum(axis=1)))]
+    nearest = distances[medoids[0]].copy()
+
+    for _ in range(1, k):
+        candidate = int(np.argmax(nearest))
+        if nearest[candidate] == 0:
+            # Remaining points coincide with medoids; take any unused point
+            candidate = next(i for i in range(len(distances)) if i not in medoids)
+        medoids.append(candidate)
+        nearest = np.minimum(nearest, distances[candidate])
+
+    return np.array(medoids, dtype=np.int64)
+
+
+def _assign(distances: np.ndarray, medoids: np.ndarray, capacity: int | None) -> np.ndarray:
+    """Assign each point to a medoid, optionally with a per-cluster capacity.
+
+    With a capacity, (point, medoid) pairs are visited in order of increasing
+    distance and a point takes the closest medoid that still has room.
+    """
+    to_medoids = distances[:, medoids]
+    if capacity is None:
+        return np.argmin(to_medoids, axis=1)
+
+    n, k = to_medoids.shape
+    labels = np.full(n, -1, dtype=np.int64)
+    sizes = np.zeros(k, dtype=np.int64)
+
+    # Medoids always belong to their own cluster
+    labels[medoids] = np.arange(k)
+    sizes += 1
+
+    for flat in np.argsort(to_medoids, axis=None, kind="stable"):
+        point, cluster = divmod(int(flat), k)
+        if labels[point] != -1 or sizes[cluster] >= capacity:
+            continue
+        labels[point] = cluster
+        sizes[cluster] += 1
+
+    return labels
+
+
+def k_medoids(
+    distances: np.ndarray,
+    k: int,
+    balanced: bool = False,
+    max_iter: int = 50,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Cluster points into ``k`` groups around medoids (alternating algorithm).
+
+    Example:
+        labels, medoids = k_medoids(haversine_matrix(lats, lons), k=3, balanced=True)
+
+    Args:
+        distances: Symmetric (N, N) distance matrix
+        k: Number of clusters (clamped to N)
+        balanced: Cap cluster sizes at ceil(N / k) so groups are even
+        max_iter: Maximum assignment/update rounds
+
+    Returns:
+        Tuple of (labels, medoid_indices); labels[i] indexes into medoid_indices
+    """
+    n = len(distances)
+    if n == 0 or k <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    k = min(k, n)
+    capacity = math.ceil(n / k) if balanced else None
+
+    medoids = _init_medoids(distances, k)
+    labels = _assign(distances, medoids, capacity)
+
+    for _ in range(max_iter):
+        new_medoids = medoids.copy()
+        for cluster in range(k):
+            members = np.flatnonzero(labels == cluster)
+            if len(members) == 0:
+                continue
+            # Member with the smallest total distance to the rest of its cluster
+            costs = distances[np.ix_(members, members)].sum(axis=1)
+            new_medoids[cluster] = members[int(np.argmin(costs))]
+
+        if np.array_equal(new_medoids, medoids):
+            break
+
+        medoids = new_medoids
+        labels = _assign(distances, medoids, capacity)
+
+    return labels, medoids
@@ -0,0 +1,210 @@
+"""Hierarchical map marker clustering (port of mapbox/supercluster).
+
+Points are projected to Web Mercator unit space, then greedily merged from the
+maximum zoom down to the minimum zoom. Each zoom level keeps its own KD-tree,
+so a viewport query is a single range search on the tree for that zoom.
+"""
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.geo.kdbush import KDBush
+
+
+def lng_x(lng: float) -> float:
+    """Project longitude to Mercator X in [0, 1]."""
+    return lng / 360 + 0.5
+
+
+def lat_y(lat: float) -> float:
+    """Project latitude to Mercator Y in [0, 1] (0 = north)."""
+    sin = math.sin(lat * math.pi / 180)
+    y = 0.5 - 0.25 * math.log((1 + sin) / (1 - sin)) / math.pi
+    return min(max(y, 0.0), 1.0)
+
+
+def x_lng(x: float) -> float:
+    """Unproject Mercator X to longitude."""
+    return (x - 0.5) * 360
+
+
+def y_lat(y: float) -> float:
+    """Unproject Mercator Y to latitude."""
+    y2 = (180 - y * 360) * math.pi / 180
+    return 360 * math.atan(math.exp(y2)) / math.pi - 90
+
+
+@dataclass
+class ClusterFeature:
+    """A point or cluster returned from a viewport query.
+
+    For single points ``point_id`` is the caller-supplied ID and ``count`` is 1.
+    For clusters ``point_id`` is None and ``expansion_zoom`` is the zoom level
+    at which the cluster splits into its children.
+    """
+
+    cluster_id: int
+    latitude: float
+    longitude: float
+    count: int
+    point_id: int | None = None
+    expansion_zoom: int | None = None
+
+    @property
+    def is_cluster(self) -> bool:
+        """Whether this feature aggregates more than one point."""
+        return self.point_id is None
+
+
+class _Level:
+    """Nodes and KD-tree for one zoom level."""
+
+    def __init__(self, xs: list[float], ys: list[float], counts: list[int], node_ids: list[int]):
+        self.xs = np.asarray(xs, dtype=np.float64)
+        self.ys = np.asarray(ys, dtype=np.float64)
+        self.counts = np.asarray(counts, dtype=np.int64)
+        self.node_ids = np.asarray(node_ids, dtype=np.int64)
+        self.tree = KDBush(self.xs, self.ys)
+
+
+class Supercluster:
+    """Precomputed cluster hierarchy over (latitude, longitude) points.
+
+    Example:
+        index = Supercluster([(37.57, 126.97, 1), (37.58, 126.98, 2)])
+        index.get_clusters((37.5, 126.9, 37.6, 127.1), zoom=11)
+    """
+
+    def __init__(
+        self,
+        points: list[tuple[float, float, int]],
+        radius: int = 60,
+        extent: int = 512,
+        min_zoom: int = 0,
+        max_zoom: int = 16,
+        min_points: int = 2,
+    ):
+        """Build the cluster index.
+
+        Args:
+            points: (latitude, longitude, point_id) tuples
+            radius: Cluster radius in pixels
+            extent: Tile extent in pixels (radius is relative to this)
+            min_zoom: Lowest zoom level with clusters
+            max_zoom: Highest zoom level with clusters (above it, raw points)
+            min_points: Minimum points to form a cluster
+        """
+        self.radius = radius
+        self.extent = extent
+        self.min_zoom = min_zoom
+        self.max_zoom = max_zoom
+        self.min_points = min_points
+
+        self.point_ids = [pid for _, _, pid in points]
+        # Zoom level at which each cluster node was created (points never split)
+        self._origin_zoom: dict[int, int] = {}
+        self._levels: dict[int, _Level] = {}
+
+        xs = [lng_x(lon) for _, lon, _ in points]
+        ys = [lat_y(lat) for lat, _, _ in points]
+        level = _Level(xs, ys, [1] * len(points), list(range(len(points))))
+        self._levels[max_zoom + 1] = level
+
+        self._next_id = len(points)
+        for zoom in range(max_zoom, min_zoom - 1, -1):
+            level = self._cluster(level, zoom)
+            self._levels[zoom] = level
+
+    def _cluster(self, level: _Level, zoom: int) -> _Level:
+        """Merge nodes of the level above into clusters for ``zoom``."""
+        r = self.radius / (self.extent * 2 ** zoom)
+        visited = np.zeros(len(level.node_ids), dtype=bool)
+
+        xs: list[float] = []
+        ys: list[float] = []
+        counts: list[int] = []
+        node_ids: list[int] = []
+
+        for i in range(len(level.node_ids)):
+            if visited[i]:
+                continue
+            visited[i] = True
+
+            neighbors = [j for j in level.tree.within(level.xs[i], level.ys[i], r) if not visited[j]]
+            total = int(level.counts[i]) + int(level.counts[neighbors].sum()) if neighbors else int(level.counts[i])
+
+            if neighbors and total >= self.min_points:
+                members = [i, *neighbors]
+                visited[neighbors] = True
+                weights = level.counts[members]
+                xs.append(float(np.dot(level.xs[members], weights) / total))
+                ys.append(float(np.dot(level.ys[members], weights) / total))
+                counts.append(total)
+
+                cluster_id = self._next_id
+                self._next_id += 1
+                self._origin_zoom[cluster_id] = zoom
+                node_ids.append(cluster_id)
+            else:
+                xs.append(float(level.xs[i]))
+                ys.append(float(level.ys[i]))
+                counts.append(int(level.counts[i]))
+                node_ids.append(int(level.node_ids[i]))
+
+        return _Level(xs, ys, counts, node_ids)
+
+    def _limit_zoom(self, zoom: int) -> int:
+        """Clamp a requested zoom to the indexed range."""
+        return max(self.min_zoom, min(int(zoom), self.max_zoom + 1))
+
+    def get_clusters(
+        self, bbox: tuple[float, float, float, float], zoom: int
+    ) -> list[ClusterFeature]:
+        """Return clusters and points inside a viewport.
+
+        Args:
+            bbox: (min_lat, min_lon, max_lat, max_lon)
+            zoom: Map zoom level
+
+        Returns:
+            Features visible in the viewport at that zoom
+        """
+        min_lat, min_lon, max_lat, max_lon = bbox
+        level = self._levels[self._limit_zoom(zoom)]
+
+        positions = level.tree.range(lng_x(min_lon), lat_y(max_lat), lng_x(max_lon), lat_y(min_lat))
+
+        features = []
+        for pos in positions:
+            node_id = int(level.node_ids[pos])
+            count = int(level.counts[pos])
+            latitude = y_lat(float(level.ys[pos]))
+            longitude = x_lng(float(level.xs[pos]))
+
+            if node_id < len(self.point_ids):
+                features.append(ClusterFeature(
+                    cluster_id=node_id,
+                    latitude=latitude,
+                    longitude=longitude,
+                    count=1,
+                    point_id=self.point_ids[node_id],
+                ))
+            else:
+                features.append(ClusterFeature(
+                    cluster_id=node_id,
+                    latitude=latitude,
+                    longitude=longitude,
+                    count=count,
+                    expansion_zoom=self.get_expansion_zoom(node_id),
+                ))
+
+        return features
+
+    def get_expansion_zoom(self, cluster_id: int) -> int:
+        """Zoom level at which a cluster breaks apart into its children."""
+        origin = self._origin_zoom.get(cluster_id)
+        if origin is None:
+            return self.max_zoom + 1
+        return min(origin + 1, self.max_zoom + 1)
@@ -0,0 +1,49 @@
+"""Process-wide pooled HTTP client for outbound API calls.
+
+Naver, ODsay and Kakao clients share one ``httpx.AsyncClient`` so TCP/TLS
+connections are reused across requests instead of being opened per call.
+"""
+
+import asyncio
+import logging
+
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use.
+
+    A pooled connection is bound to the event loop that opened it, so a new
+    client is created if the running loop changed (e.g. between test cases).
+    """
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(settings.HTTP_TIMEOUT_SECONDS),
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+        _client_loop = loop
+        logger.debug("Created shared HTTP client")
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client (called on application shutdown)."""
+    global _client, _client_loop
+
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
@@ -7,10 +7,16 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.ai import router as ai_router
+from app.ai.agents.checkpoints import close_checkpointer, get_checkpointer
+from app.ai.agents.utils import warm_up_llm_clients
+from app.ai.jobs import close_job_pool, get_job_pool
 from app.auth import router as auth_router
 from app.config import settings
-from app.database import create_tables
+from app.database import SessionLocal, create_tables
+from app.http_client import close_http_client
 from app.plan import router as plan_router
+from app.tourist_attraction import router as attraction_router
+from app.tourist_attraction.snapshot import refresh_snapshot
 
 # Configure logging
 logging.basicConfig(
@@ -27,8 +33,21 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Seoul Travel Agent API")
     create_tables()
     logger.info("Database tables created/verified")
+    db = SessionLocal()
+    try:
+        refresh_snapshot(db)
+    finally:
+        db.close()
+    await warm_up_llm_clients()
+    # Open checkpoints now so idle review sessions expire at startup
+    await get_checkpointer()
+    # Start job workers now so jobs interrupted by the last shutdown resume
+    get_job_pool()
     yield
     logger.info("Shutting down Seoul Travel Agent API")
+    await close_job_pool()
+    await close_http_client()
+    await close_checkpointer()
 
 
 def create_application() -> FastAPI:
@@ -56,6 +75,7 @@ def create_application() -> FastAPI:
     app.include_router(ai_router, prefix="/api/ai", tags=["AI"])
     app.include_router(auth_router, prefix="/api/auth", tags=["Authentication"])
     app.include_router(plan_router, prefix="/api/plans", tags=["Travel Plans"])
+    app.include_router(attraction_router, prefix="/api/attractions", tags=["Tourist Attractions"])
 
     @app.get("/api/health")
     async def health_check():
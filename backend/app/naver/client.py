@@ -1,10 +1,14 @@
 """Naver Local Search API client."""
 
+import asyncio
 import logging
 
 import httpx
+import numpy as np
 
 from app.config import settings
+from app.geo.distance import haversine_km
+from app.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -79,40 +83,129 @@ class NaverLocalClient:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    self.BASE_URL,
-                    headers=self._get_headers(),
-                    params=params,
-                    timeout=10.0,
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                items = data.get("items", [])
-                logger.info(f"Found {len(items)} results for query: {query}")
-
-                # Convert coordinates to standard WGS84 format
-                for item in items:
-                    if item.get("mapx") and item.get("mapy"):
-                        item["longitude"] = int(item["mapx"]) / 10000000
-                        item["latitude"] = int(item["mapy"]) / 10000000
-
-                    # Remove HTML tags from title
-                    if item.get("title"):
-                        item["title"] = (
-                            item["title"]
-                            .replace("<b>", "")
-                            .replace("</b>", "")
-                            .replace("&amp;", "&")
-                        )
-
-                return items
+            client = get_http_client()
+            response = await client.get(
+                self.BASE_URL,
+                headers=self._get_headers(),
+                params=params,
+                timeout=10.0,
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            items = data.get("items", [])
+            logger.info(f"Found {len(items)} results for query: {query}")
+
+            # Convert coordinates to standard WGS84 format
+            for item in items:
+                if item.get("mapx") and item.get("mapy"):
+                    item["longitude"] = int(item["mapx"]) / 10000000
+                    item["latitude"] = int(item["mapy"]) / 10000000
+
+                # Remove HTML tags from title
+                if item.get("title"):
+                    item["title"] = (
+                        item["title"]
+                        .replace("<b>", "")
+                        .replace("</b>", "")
+                        .replace("&amp;", "&")
+                    )
+
+            return items
 
         except httpx.HTTPError as e:
             logger.error(f"Naver Local API error: {e}")
             raise
 
+    async def _fetch_candidates(
+        self,
+        query: str,
+        sorts: tuple[str, ...] = ("random", "comment"),
+    ) -> list[dict]:
+        """Over-fetch search results across sort orders.
+
+        Each Naver Local request returns at most 5 items and only ``start=1``
+        is accepted, so one request per sort order is issued concurrently and
+        the results are merged before distance filtering. Failed requests are
+        skipped.
+
+        Args:
+            query: Search query
+            sorts: Sort orders to combine
+
+        Returns:
+            Deduplicated list of place dictionaries
+        """
+        requests = [self.search_local(query=query, display=5, start=1, sort=sort) for sort in sorts]
+        responses = await asyncio.gather(*requests, return_exceptions=True)
+
+        seen: set[tuple[str, str]] = set()
+        candidates = []
+        for response in responses:
+            if isinstance(response, BaseException):
+                logger.debug(f"Skipping failed Naver request for '{query}': {response}")
+                continue
+            for item in response:
+                key = (item.get("title", ""), item.get("roadAddress") or item.get("address", ""))
+                if key in seen:
+                    continue
+                seen.add(key)
+                candidates.append(item)
+
+        return candidates
+
+    async def search_within_radius(
+        self,
+        query: str,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        limit: int = 5,
+    ) -> list[dict]:
+        """Search places and keep only those within a radius, nearest first.
+
+        Distances are computed in one vectorized haversine call over all
+        candidates using the WGS84 coordinates converted from ``mapx``/``mapy``.
+        Each returned item gets a ``distance_km`` field.
+
+        Args:
+            query: Search query (include an area name for relevant results)
+            latitude: Center point latitude
+            longitude: Center point longitude
+            radius_km: Maximum distance from the center in kilometers
+            limit: Maximum number of results
+
+        Returns:
+            Places within ``radius_km`` sorted by distance
+        """
+        candidates = [
+            item for item in await self._fetch_candidates(query)
+            if item.get("latitude") is not None and item.get("longitude") is not None
+        ]
+        if not candidates:
+            return []
+
+        distances = haversine_km(
+            latitude,
+            longitude,
+            [item["latitude"] for item in candidates],
+            [item["longitude"] for item in candidates],
+        )
+
+        nearby = np.flatnonzero(distances <= radius_km)
+        nearest = nearby[np.argsort(distances[nearby], kind="stable")][:limit]
+
+        results = []
+        for index in nearest:
+            item = candidates[index]
+            item["distance_km"] = round(float(distances[index]), 3)
+            results.append(item)
+
+        logger.info(
+            f"Kept {len(results)}/{len(candidates)} results within {radius_km} km for query: {query}"
+        )
+        return results
+
     async def search_nearby_restaurants(
         self,
         latitude: float,
@@ -120,6 +213,7 @@ class NaverLocalClient:
         query: str = "맛집",
         radius_km: float = 1.0,
         limit: int = 5,
+        location_keyword: str | None = None,
     ) -> list[dict]:
         """Search for restaurants near a specific location.
 
@@ -129,24 +223,21 @@ class NaverLocalClient:
             query: Additional search keyword (default: "맛집")
             radius_km: Search radius in kilometers (default: 1.0)
             limit: Maximum number of results (default: 5)
+            location_keyword: Area name prepended to the query (e.g., "용산구")
 
         Returns:
-            List of restaurant dictionaries
+            List of restaurant dictionaries sorted by distance
         """
-        # Convert coordinates to area name for better search results
-        # In production, you might want to use reverse geocoding
-        search_query = f"{query}"
+        search_query = f"{location_keyword} {query}" if location_keyword else query
 
-        results = await self.search_local(
+        return await self.search_within_radius(
             query=search_query,
-            display=min(limit, 5),
-            sort="random",
+            latitude=latitude,
+            longitude=longitude,
+            radius_km=radius_km,
+            limit=limit,
         )
 
-        # Filter by distance if needed (simple approximation)
-        # For production, implement proper haversine distance calculation
-        return results[:limit]
-
     async def search_nearby_accommodations(
         self,
         latitude: float,
@@ -154,6 +245,7 @@ class NaverLocalClient:
         query: str = "숙박",
         radius_km: float = 2.0,
         limit: int = 5,
+        location_keyword: str | None = None,
     ) -> list[dict]:
         """Search for accommodations near a specific location.
 
@@ -163,16 +255,17 @@ class NaverLocalClient:
             query: Additional search keyword (default: "숙박")
             radius_km: Search radius in kilometers (default: 2.0)
             limit: Maximum number of results (default: 5)
+            location_keyword: Area name prepended to the query (e.g., "용산구")
 
         Returns:
-            List of accommodation dictionaries
+            List of accommodation dictionaries sorted by distance
         """
-        search_query = f"{query}"
+        search_query = f"{location_keyword} {query}" if location_keyword else query
 
-        results = await self.search_local(
+        return await self.search_within_radius(
             query=search_query,
-            display=min(limit, 5),
-            sort="random",
+            latitude=latitude,
+            longitude=longitude,
+            radius_km=radius_km,
+            limit=limit,
         )
-
-        return results[:limit]
@@ -35,7 +35,7 @@ class PlannerAccommodation(BaseModel):
     """Accommodation information."""
 
     name: str = Field(..., min_length=1, max_length=200, description="Accommodation name")
-    cost_per_night: int = Field(..., gt=0, description="Cost per night in KRW")
+    cost_per_night: int = Field(..., ge=0, description="Cost per night in KRW (0 if unknown)")
     total_nights: int = Field(..., gt=0, description="Total number of nights")
 
 
@@ -62,6 +62,37 @@ def _convert_planner_to_travel_plan_data(planner_plan: PlannerPlanCreate) -> dic
     }
 
 
+def to_planner_plan(travel_plan: TravelPlan) -> dict:
+    """Convert a stored TravelPlan back to the planner's plan structure.
+
+    Inverse of ``_convert_planner_to_travel_plan_data``. total_cost is not
+    stored, so it is recomputed from the daily costs and the accommodation.
+
+    Args:
+        travel_plan: TravelPlan model instance
+
+    Returns:
+        Plan dict with title, total_days, total_cost, itinerary, accommodation, summary
+    """
+    itinerary = travel_plan.itinerary or {}
+    days = itinerary.get("days", [])
+    accommodation = (travel_plan.recommendations or {}).get("accommodation") or {
+        "name": "",
+        "cost_per_night": 0,
+        "total_nights": 0,
+    }
+    lodging = int(accommodation.get("cost_per_night", 0)) * int(accommodation.get("total_nights", 0))
+
+    return {
+        "title": travel_plan.title,
+        "total_days": itinerary.get("total_days", len(days)),
+        "total_cost": sum(int(day.get("daily_cost", 0)) for day in days) + lodging,
+        "itinerary": days,
+        "accommodation": accommodation,
+        "summary": travel_plan.description or "",
+    }
+
+
 # ============================================================================
 # Database Query Helpers
 # ============================================================================
@@ -0,0 +1,16 @@
+"""Async routing client for live transit/driving times (ODsay, Kakao Mobility)."""
+
+from app.routing.backends import KakaoMobilityBackend, ODsayBackend, RoutingBackend
+from app.routing.cache import RouteCache
+from app.routing.client import Leg, RoutingClient, get_routing_client, itinerary_legs
+
+__all__ = [
+    "KakaoMobilityBackend",
+    "Leg",
+    "ODsayBackend",
+    "RouteCache",
+    "RoutingBackend",
+    "RoutingClient",
+    "get_routing_client",
+    "itinerary_legs",
+]
@@ -0,0 +1,133 @@
+"""Upstream routing APIs.
+
+Each backend turns one origin/destination pair into whole travel minutes.
+Base URLs are configurable so the in-repo fake server (app.routing.fake_server)
+can stand in for the real APIs.
+"""
+
+from datetime import datetime
+from typing import Protocol
+
+import httpx
+
+from app.config import settings
+
+
+class RoutingBackend(Protocol):
+    """A single-leg routing API."""
+
+    name: str
+
+    async def fetch_minutes(
+        self,
+        client: httpx.AsyncClient,
+        origin: tuple[float, float],
+        destination: tuple[float, float],
+        departure: datetime | None,
+    ) -> int | None:
+        """Return travel minutes, or None if the API has no route."""
+        ...
+
+
+class ODsayBackend:
+    """ODsay public transit path search (fastest of the returned paths)."""
+
+    name = "odsay"
+    PATH = "/v1/api/searchPubTransPathT"
+
+    def __init__(self, api_key: str | None = None, base_url: str | None = None):
+        """Initialize ODsay backend.
+
+        Args:
+            api_key: ODsay API key (defaults to settings)
+            base_url: API base URL (defaults to settings)
+
+        Raises:
+            ValueError: If no API key is configured
+        """
+        self.api_key = api_key or settings.ODSAY_API_KEY
+        self.base_url = (base_url or settings.ODSAY_BASE_URL).rstrip("/")
+
+        if not self.api_key:
+            raise ValueError(
+                "ODsay API key not configured. "
+                "Please set ODSAY_API_KEY in .env file."
+            )
+
+    async def fetch_minutes(
+        self,
+        client: httpx.AsyncClient,
+        origin: tuple[float, float],
+        destination: tuple[float, float],
+        departure: datetime | None,
+    ) -> int | None:
+        """Query the fastest transit path.
+
+        ODsay has no departure-time parameter; ``departure`` only affects caching.
+        Trips under ~700m come back as an error payload without paths (→ None).
+        """
+        params = {
+            "SX": origin[1],
+            "SY": origin[0],
+            "EX": destination[1],
+            "EY": destination[0],
+            "apiKey": self.api_key,
+        }
+        response = await client.get(f"{self.base_url}{self.PATH}", params=params)
+        response.raise_for_status()
+        paths = response.json().get("result", {}).get("path") or []
+        if not paths:
+            return None
+        return min(int(path["info"]["totalTime"]) for path in paths)
+
+
+class KakaoMobilityBackend:
+    """Kakao Mobility car directions (duration of the recommended route)."""
+
+    name = "kakao"
+    PATH = "/v1/directions"
+
+    def __init__(self, api_key: str | None = None, base_url: str | None = None):
+        """Initialize Kakao Mobility backend.
+
+        Args:
+            api_key: Kakao REST API key (defaults to settings)
+            base_url: API base URL (defaults to settings)
+
+        Raises:
+            ValueError: If no API key is configured
+        """
+        self.api_key = api_key or settings.KAKAO_REST_API_KEY
+        self.base_url = (base_url or settings.KAKAO_MOBILITY_BASE_URL).rstrip("/")
+
+        if not self.api_key:
+            raise ValueError(
+                "Kakao API key not configured. "
+                "Please set KAKAO_REST_API_KEY in .env file."
+            )
+
+    async def fetch_minutes(
+        self,
+        client: httpx.AsyncClient,
+        origin: tuple[float, float],
+        destination: tuple[float, float],
+        departure: datetime | None,
+    ) -> int | None:
+        """Query driving duration (seconds in the response, rounded up to minutes)."""
+        params = {
+            "origin": f"{origin[1]},{origin[0]}",
+            "destination": f"{destination[1]},{destination[0]}",
+        }
+        if departure is not None:
+            params["departure_time"] = departure.strftime("%Y%m%d%H%M")
+
+        response = await client.get(
+            f"{self.base_url}{self.PATH}",
+            params=params,
+            headers={"Authorization": f"KakaoAK {self.api_key}"},
+        )
+        response.raise_for_status()
+        routes = response.json().get("routes") or []
+        if not routes or routes[0].get("result_code", 0) != 0:
+            return None
+        return -(-int(routes[0]["summary"]["duration"]) // 60)
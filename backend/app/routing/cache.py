@@ -0,0 +1,79 @@
+"""Route cache keyed by (origin cell, destination cell, time bucket)."""
+
+import math
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+# Meters per degree of latitude
+METERS_PER_DEGREE = 111_320.0
+
+# Latitude used to size longitude cells (Seoul)
+REFERENCE_LATITUDE = 37.55
+
+RouteKey = tuple[tuple[int, int], tuple[int, int], int | None]
+
+
+def grid_cell(latitude: float, longitude: float, cell_size_m: float) -> tuple[int, int]:
+    """Snap a coordinate to a square grid cell of roughly ``cell_size_m`` meters."""
+    lat_step = cell_size_m / METERS_PER_DEGREE
+    lon_step = cell_size_m / (METERS_PER_DEGREE * math.cos(math.radians(REFERENCE_LATITUDE)))
+    return math.floor(latitude / lat_step), math.floor(longitude / lon_step)
+
+
+def time_bucket(departure: datetime | None, bucket_minutes: int) -> int | None:
+    """Bucket a departure time by weekday/weekend and time of day (None if unknown).
+
+    Transit schedules differ between weekdays and weekends but are nearly the
+    same from one weekday to the next, so weekdays share buckets.
+    """
+    if departure is None:
+        return None
+    buckets_per_day = -(-24 * 60 // bucket_minutes)
+    day_type = 1 if departure.weekday() >= 5 else 0
+    return day_type * buckets_per_day + (departure.hour * 60 + departure.minute) // bucket_minutes
+
+
+class RouteCache:
+    """In-memory LRU cache with per-entry TTL."""
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 86400):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries before LRU eviction
+            ttl_seconds: Entry lifetime
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[RouteKey, tuple[float, int | None]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: RouteKey) -> tuple[bool, int | None]:
+        """Look up a key.
+
+        Returns:
+            Tuple of (hit, minutes); a cached None means "no route"
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, minutes = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, minutes
+
+    def set(self, key: RouteKey, minutes: int | None) -> None:
+        """Store a result, evicting the least recently used entry if full."""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, minutes)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
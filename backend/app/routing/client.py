@@ -0,0 +1,239 @@
+"""Batched, deduplicated and cached routing client.
+
+A plan's legs are resolved in one ``batch`` call:
+1. Legs are keyed by (origin cell, destination cell, time bucket); duplicate
+   keys within the batch, and keys already being fetched by a concurrent
+   batch, are requested upstream only once.
+2. Cached keys are answered from memory.
+3. Walkable legs never leave the process (distance-based estimate).
+4. Remaining legs go upstream concurrently over the shared pooled HTTP client,
+   capped by a semaphore.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+import httpx
+
+from app.config import settings
+from app.geo.distance import haversine_km
+from app.http_client import get_http_client
+from app.routing.backends import KakaoMobilityBackend, ODsayBackend, RoutingBackend
+from app.routing.cache import RouteCache, RouteKey, grid_cell, time_bucket
+from app.transit.estimator import WALKING_MAX_KM, estimate_travel_minutes
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Leg:
+    """One trip between two coordinates."""
+
+    origin: tuple[float, float]
+    destination: tuple[float, float]
+    departure: datetime | None = None
+
+    @property
+    def distance_km(self) -> float:
+        """Straight-line distance of the leg."""
+        return float(haversine_km(*self.origin, *self.destination))
+
+
+@dataclass
+class RoutingStats:
+    """Counters for cache efficiency and upstream load."""
+
+    legs: int = 0
+    cache_hits: int = 0
+    deduplicated: int = 0
+    walking: int = 0
+    upstream_requests: int = 0
+    upstream_failures: int = 0
+
+
+class RoutingClient:
+    """Async routing client shared by planner stages."""
+
+    def __init__(
+        self,
+        backend: RoutingBackend,
+        http_client: httpx.AsyncClient | None = None,
+        cache: RouteCache | None = None,
+        cell_size_m: float | None = None,
+        time_bucket_minutes: int | None = None,
+        max_concurrency: int | None = None,
+        fallback_to_estimate: bool = True,
+    ):
+        """Initialize routing client.
+
+        Args:
+            backend: Upstream routing API
+            http_client: HTTP client (defaults to the shared pooled client)
+            cache: Route cache (defaults to a new cache sized from settings)
+            cell_size_m: Cache grid resolution in meters
+            time_bucket_minutes: Cache departure-time resolution
+            max_concurrency: Maximum in-flight upstream requests
+            fallback_to_estimate: Estimate legs the backend cannot route
+        """
+        self.backend = backend
+        self._http_client = http_client
+        self.cache = cache or RouteCache(
+            max_size=settings.ROUTING_CACHE_SIZE,
+            ttl_seconds=settings.ROUTING_CACHE_TTL_SECONDS,
+        )
+        self.cell_size_m = cell_size_m or settings.ROUTING_CELL_SIZE_METERS
+        self.time_bucket_minutes = time_bucket_minutes or settings.ROUTING_TIME_BUCKET_MINUTES
+        self.max_concurrency = max_concurrency or settings.ROUTING_MAX_CONCURRENCY
+        self.fallback_to_estimate = fallback_to_estimate
+        self.stats = RoutingStats()
+
+        self._semaphore: asyncio.Semaphore | None = None
+        self._inflight: dict[RouteKey, asyncio.Future] = {}
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """HTTP client used for upstream requests."""
+        return self._http_client or get_http_client()
+
+    def key(self, leg: Leg) -> RouteKey:
+        """Cache key for a leg."""
+        return (
+            grid_cell(*leg.origin, self.cell_size_m),
+            grid_cell(*leg.destination, self.cell_size_m),
+            time_bucket(leg.departure, self.time_bucket_minutes),
+        )
+
+    async def route_minutes(self, leg: Leg) -> int | None:
+        """Travel minutes for a single leg."""
+        return (await self.batch([leg]))[0]
+
+    async def batch(self, legs: list[Leg]) -> list[int | None]:
+        """Resolve travel minutes for many legs at once.
+
+        Args:
+            legs: Legs to resolve (duplicates welcome)
+
+        Returns:
+            Minutes per leg in input order; None only when the backend has no
+            route and estimation fallback is disabled
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        keys = [self.key(leg) for leg in legs]
+        results: dict[RouteKey, int | None] = {}
+        waiting: dict[RouteKey, asyncio.Future] = {}
+        fetches = []
+
+        for key, leg in zip(keys, legs, strict=True):
+            self.stats.legs += 1
+            if key in results or key in waiting:
+                self.stats.deduplicated += 1
+                continue
+
+            hit, minutes = self.cache.get(key)
+            if hit:
+                self.stats.cache_hits += 1
+                results[key] = minutes
+            elif leg.distance_km <= WALKING_MAX_KM:
+                self.stats.walking += 1
+                results[key] = int(estimate_travel_minutes(leg.distance_km))
+            elif key in self._inflight:
+                self.stats.deduplicated += 1
+                waiting[key] = self._inflight[key]
+            else:
+                future = asyncio.get_running_loop().create_future()
+                self._inflight[key] = future
+                waiting[key] = future
+                fetches.append(self._fetch(key, leg, future))
+
+        await asyncio.gather(*fetches)
+        for key, future in waiting.items():
+            results[key] = await future
+
+        return [self._finalize(leg, results[key]) for key, leg in zip(keys, legs, strict=True)]
+
+    async def _fetch(self, key: RouteKey, leg: Leg, future: asyncio.Future) -> None:
+        """Fetch one leg upstream and publish the result to waiters."""
+        minutes = None
+        try:
+            async with self._semaphore:
+                self.stats.upstream_requests += 1
+                minutes = await self.backend.fetch_minutes(
+                    self.http_client, leg.origin, leg.destination, leg.departure
+                )
+            self.cache.set(key, minutes)
+        except (httpx.HTTPError, KeyError, ValueError) as e:
+            # Failures are not cached so the next plan retries
+            self.stats.upstream_failures += 1
+            logger.warning(f"{self.backend.name} routing failed for {leg}: {e}")
+        finally:
+            self._inflight.pop(key, None)
+            future.set_result(minutes)
+
+    def _finalize(self, leg: Leg, minutes: int | None) -> int | None:
+        """Apply estimation fallback to unresolved legs."""
+        if minutes is None and self.fallback_to_estimate:
+            return int(estimate_travel_minutes(leg.distance_km))
+        return minutes
+
+
+def itinerary_legs(travel_plan: dict, locate) -> dict[tuple[int, int], Leg]:
+    """Collect the legs between consecutive activities of a plan.
+
+    Activities are taken in itinerary order; a leg is only built when both
+    ends can be located, so unknown venues leave a gap instead of linking
+    non-adjacent activities.
+
+    Args:
+        travel_plan: TravelPlan dict with itinerary days
+        locate: Callable mapping a venue name to (latitude, longitude) or None
+
+    Returns:
+        Legs keyed by (day position starting at 1, index of the destination
+        activity); departure is the previous activity's end time
+    """
+    legs = {}
+    for number, day in enumerate(travel_plan.get("itinerary", []), start=1):
+        activities = day.get("activities") or []
+        coords = [locate(activity.get("venue_name", "")) for activity in activities]
+        for index in range(1, len(activities)):
+            if coords[index - 1] is None or coords[index] is None:
+                continue
+            departure = _end_time(day.get("date"), activities[index - 1])
+            legs[(number, index)] = Leg(coords[index - 1], coords[index], departure)
+    return legs
+
+
+def _end_time(date: str | None, activity: dict) -> datetime | None:
+    """Datetime at which an activity ends (None if date/time are unparsable)."""
+    try:
+        start = datetime.strptime(f"{date} {activity.get('time')}", "%Y-%m-%d %H:%M")
+    except (TypeError, ValueError):
+        return None
+    return start + timedelta(minutes=int(activity.get("duration_minutes") or 0))
+
+
+_routing_client: RoutingClient | None = None
+
+
+def get_routing_client() -> RoutingClient:
+    """Process-wide routing client for settings.ROUTING_PROVIDER.
+
+    Raises:
+        ValueError: If the provider is unknown or its API key is missing
+    """
+    global _routing_client
+
+    if _routing_client is None:
+        provider = settings.ROUTING_PROVIDER
+        if provider == "odsay":
+            backend = ODsayBackend()
+        elif provider == "kakao":
+            backend = KakaoMobilityBackend()
+        else:
+            raise ValueError(f"Unknown routing provider: {provider}")
+        _routing_client = RoutingClient(backend)
+    return _routing_client
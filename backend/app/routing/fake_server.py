@@ -0,0 +1,76 @@
+"""In-repo fake ODsay / Kakao Mobility server for offline tests and load tests.
+
+Responses follow the real payload shapes with travel times from the local
+estimator, plus optional artificial latency.
+
+Run standalone:
+    uvicorn app.routing.fake_server:app --port 8099
+
+Or in-process via ``httpx.ASGITransport(app=create_fake_routing_app())``.
+"""
+
+import asyncio
+
+from fastapi import FastAPI, Request
+
+from app.geo.distance import haversine_km
+from app.transit.estimator import WALKING_MAX_KM, estimate_travel_minutes
+
+# ODsay error code for origin/destination closer than ~700m
+ODSAY_TOO_CLOSE = "-98"
+
+
+def create_fake_routing_app(latency_ms: float = 0.0) -> FastAPI:
+    """Create the fake routing API.
+
+    Args:
+        latency_ms: Artificial delay per request
+
+    Returns:
+        FastAPI app; ``app.state.request_count`` counts handled requests
+    """
+    app = FastAPI(title="Fake routing API")
+    app.state.request_count = 0
+
+    async def _handle(request: Request) -> None:
+        request.app.state.request_count += 1
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+
+    @app.get("/v1/api/searchPubTransPathT")
+    async def odsay_path(request: Request, SX: float, SY: float, EX: float, EY: float, apiKey: str = ""):  # noqa: N803
+        await _handle(request)
+        distance = float(haversine_km(SY, SX, EY, EX))
+        if distance <= WALKING_MAX_KM:
+            return {"error": [{"code": ODSAY_TOO_CLOSE, "message": "출, 도착지가 700m이내입니다."}]}
+        minutes = int(estimate_travel_minutes(distance))
+        return {
+            "result": {
+                "path": [
+                    {"pathType": 1, "info": {"totalTime": minutes, "trafficDistance": distance * 1000}},
+                    {"pathType": 2, "info": {"totalTime": minutes + 7, "trafficDistance": distance * 1100}},
+                ]
+            }
+        }
+
+    @app.get("/v1/directions")
+    async def kakao_directions(request: Request, origin: str, destination: str):
+        await _handle(request)
+        origin_lon, origin_lat = (float(v) for v in origin.split(","))
+        dest_lon, dest_lat = (float(v) for v in destination.split(","))
+        distance = float(haversine_km(origin_lat, origin_lon, dest_lat, dest_lon))
+        # Driving in Seoul averages roughly 25 km/h
+        duration_seconds = int(distance * 1.3 / 25 * 3600)
+        return {
+            "routes": [
+                {
+                    "result_code": 0,
+                    "summary": {"distance": int(distance * 1300), "duration": duration_seconds},
+                }
+            ]
+        }
+
+    return app
+
+
+app = create_fake_routing_app()
@@ -1,5 +1,6 @@
 """Tourist attraction module."""
 
+from app.tourist_attraction.attraction_router import router
 from app.tourist_attraction.models import TouristAttraction
 
-__all__ = ["TouristAttraction"]
+__all__ = ["router", "TouristAttraction"]
@@ -0,0 +1,219 @@
+"""Tourist attraction domain router."""
+
+import logging
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+
+from app.config import settings
+from app.database import get_db
+from app.tourist_attraction import attraction_service
+from app.tourist_attraction.attraction_schemas import (
+    AttractionFacets,
+    AttractionPage,
+    MapClusterResponse,
+)
+from app.tourist_attraction.snapshot import AttractionSnapshot, current_snapshot, get_snapshot
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+
+def get_attraction_snapshot(request: Request) -> AttractionSnapshot:
+    """Get the in-memory attraction snapshot dependency.
+
+    A database session is opened only when the snapshot must be (re)built;
+    the session comes from get_db (or its override, e.g. in tests).
+    """
+    snapshot = current_snapshot(settings.ATTRACTION_SNAPSHOT_TTL_SECONDS)
+    if snapshot is not None:
+        return snapshot
+
+    sessions = request.app.dependency_overrides.get(get_db, get_db)()
+    try:
+        return get_snapshot(next(sessions), max_age_seconds=settings.ATTRACTION_SNAPSHOT_TTL_SECONDS)
+    finally:
+        sessions.close()
+
+
+def _cache_headers(etag: str) -> dict[str, str]:
+    """Build caching headers for snapshot-derived responses."""
+    return {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.ATTRACTION_CACHE_MAX_AGE_SECONDS}",
+    }
+
+
+@router.get("/", response_model=AttractionPage)
+async def list_attractions(
+    response: Response,
+    cursor: int | None = Query(None, description="Last attraction ID of the previous page"),
+    limit: int = Query(20, ge=1, le=200, description="Page size"),
+    category: str | None = Query(None, description="Comma-separated categories (e.g. 관광지)"),
+    district: str | None = Query(None, description="Comma-separated districts (e.g. 용산구,서초구)"),
+    bbox: str | None = Query(None, description="Viewport as min_lat,min_lon,max_lat,max_lon"),
+    fields: str | None = Query(None, description="Comma-separated fields to return"),
+    if_none_match: str | None = Header(None),
+    snapshot: AttractionSnapshot = Depends(get_attraction_snapshot),
+):
+    """List tourist attractions with filters and keyset pagination.
+
+    Frontend usage:
+    ```javascript
+    // Markers for the current map viewport
+    const res = await fetch(
+      '/api/attractions?bbox=37.50,126.90,37.60,127.05&fields=id,name,latitude,longitude'
+    );
+    const { items, next_cursor } = await res.json();
+    // Next page: /api/attractions?...&cursor=${next_cursor}
+    ```
+
+    Args:
+        response: Response used to attach cache headers
+        cursor: Keyset cursor (last ID from previous page)
+        limit: Page size (1-200)
+        category: Category filter
+        district: District filter
+        bbox: Bounding-box filter
+        fields: Column projection
+        if_none_match: Conditional request header
+        snapshot: In-memory attraction snapshot
+
+    Returns:
+        One page of attractions
+
+    Raises:
+        HTTPException: 400 if bbox or fields are invalid
+    """
+    etag = attraction_service.compute_etag(
+        snapshot, "list", cursor, limit, category, district, bbox, fields
+    )
+    if attraction_service.etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_cache_headers(etag))
+
+    try:
+        page = attraction_service.list_attractions(
+            snapshot,
+            cursor=cursor,
+            limit=limit,
+            category=category,
+            district=district,
+            bbox=bbox,
+            fields=fields,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    response.headers.update(_cache_headers(etag))
+    return page
+
+
+@router.get("/facets", response_model=AttractionFacets)
+async def get_attraction_facets(
+    response: Response,
+    if_none_match: str | None = Header(None),
+    snapshot: AttractionSnapshot = Depends(get_attraction_snapshot),
+):
+    """Get distinct categories and districts for building filter UIs.
+
+    Args:
+        response: Response used to attach cache headers
+        if_none_match: Conditional request header
+        snapshot: In-memory attraction snapshot
+
+    Returns:
+        Available categories and districts
+    """
+    etag = attraction_service.compute_etag(snapshot, "facets")
+    if attraction_service.etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_cache_headers(etag))
+
+    response.headers.update(_cache_headers(etag))
+    return attraction_service.get_facets(snapshot)
+
+
+@router.get("/clusters", response_model=MapClusterResponse)
+async def get_attraction_clusters(
+    response: Response,
+    bbox: str = Query(..., description="Viewport as min_lat,min_lon,max_lat,max_lon"),
+    zoom: int = Query(..., ge=0, le=22, description="Map zoom level"),
+    if_none_match: str | None = Header(None),
+    snapshot: AttractionSnapshot = Depends(get_attraction_snapshot),
+):
+    """Get clustered attraction markers for a map viewport.
+
+    Clusters are precomputed for every zoom level when the snapshot is built,
+    so the payload size depends on the viewport, not on the dataset size.
+
+    Frontend usage:
+    ```javascript
+    const res = await fetch('/api/attractions/clusters?bbox=37.4,126.8,37.7,127.2&zoom=12');
+    const { clusters } = await res.json();
+    // type === 'cluster' → zoom map to expansion_zoom on tap
+    ```
+
+    Args:
+        response: Response used to attach cache headers
+        bbox: Viewport bounding box
+        zoom: Map zoom level (0-22)
+        if_none_match: Conditional request header
+        snapshot: In-memory attraction snapshot
+
+    Returns:
+        Points and clusters visible in the viewport
+
+    Raises:
+        HTTPException: 400 if bbox is invalid
+    """
+    etag = attraction_service.compute_etag(snapshot, "clusters", bbox, zoom)
+    if attraction_service.etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_cache_headers(etag))
+
+    try:
+        result = attraction_service.get_map_clusters(snapshot, bbox=bbox, zoom=zoom)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    response.headers.update(_cache_headers(etag))
+    return result
+
+
+@router.get("/{attraction_id}")
+async def get_attraction(
+    attraction_id: int,
+    response: Response,
+    fields: str | None = Query(None, description="Comma-separated fields to return"),
+    if_none_match: str | None = Header(None),
+    snapshot: AttractionSnapshot = Depends(get_attraction_snapshot),
+):
+    """Get a specific tourist attraction.
+
+    Args:
+        attraction_id: Attraction ID
+        response: Response used to attach cache headers
+        fields: Column projection
+        if_none_match: Conditional request header
+        snapshot: In-memory attraction snapshot
+
+    Returns:
+        Attraction details
+
+    Raises:
+        HTTPException: 404 if not found, 400 if fields are invalid
+    """
+    etag = attraction_service.compute_etag(snapshot, "detail", attraction_id, fields)
+    if attraction_service.etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_cache_headers(etag))
+
+    try:
+        attraction = attraction_service.get_attraction(snapshot, attraction_id, fields=fields)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    if attraction is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Attraction with ID {attraction_id} not found"
+        )
+
+    response.headers.update(_cache_headers(etag))
+    return attraction
@@ -0,0 +1,49 @@
+"""Tourist attraction domain schemas."""
+
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+
+class AttractionPage(BaseModel):
+    """Keyset-paginated list of tourist attractions.
+
+    Items are plain dictionaries because the client may request a subset of
+    fields via the ``fields`` query parameter.
+    """
+
+    items: list[dict[str, Any]] = Field(..., description="Attractions on this page")
+    next_cursor: int | None = Field(
+        None, description="Pass as `cursor` to fetch the next page (null on the last page)"
+    )
+    total: int = Field(..., ge=0, description="Total attractions matching the filters")
+
+
+class AttractionFacets(BaseModel):
+    """Available filter values for the attraction list."""
+
+    categories: list[str] = Field(default_factory=list, description="Distinct categories")
+    districts: list[str] = Field(default_factory=list, description="Distinct districts (구)")
+    total: int = Field(..., ge=0, description="Total number of attractions")
+
+
+class MapCluster(BaseModel):
+    """A map marker: either a single attraction or a cluster of attractions."""
+
+    type: Literal["point", "cluster"] = Field(..., description="Marker type")
+    id: int = Field(..., description="Attraction ID for points, cluster ID for clusters")
+    latitude: float
+    longitude: float
+    count: int = Field(..., ge=1, description="Number of attractions represented")
+    expansion_zoom: int | None = Field(
+        None, description="Zoom level at which the cluster splits (clusters only)"
+    )
+    name: str | None = Field(None, description="Attraction name (points only)")
+    category: str | None = Field(None, description="Attraction category (points only)")
+
+
+class MapClusterResponse(BaseModel):
+    """Map markers for a viewport at a zoom level."""
+
+    zoom: int
+    clusters: list[MapCluster] = Field(default_factory=list)
@@ -0,0 +1,218 @@
+"""Tourist attraction domain service layer."""
+
+import hashlib
+from typing import Any
+
+from app.tourist_attraction.snapshot import AttractionSnapshot
+
+# ============================================================================
+# Helper Functions
+# ============================================================================
+
+
+def _split_csv(value: str | None) -> list[str]:
+    """Split a comma-separated query value into non-empty trimmed tokens."""
+    if not value:
+        return []
+    return [token.strip() for token in value.split(",") if token.strip()]
+
+
+def parse_fields(snapshot: AttractionSnapshot, fields: str | None) -> list[str] | None:
+    """Parse and validate a column projection.
+
+    Args:
+        snapshot: Current attraction snapshot
+        fields: Comma-separated field names (e.g., "id,name,latitude,longitude")
+
+    Returns:
+        List of field names, or None to return every field
+
+    Raises:
+        ValueError: If an unknown field is requested
+    """
+    requested = _split_csv(fields)
+    if not requested:
+        return None
+
+    unknown = [name for name in requested if snapshot.fields and name not in snapshot.fields]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+
+    # "id" is always included so clients can page and look up details
+    if "id" not in requested:
+        requested.insert(0, "id")
+    return requested
+
+
+def parse_bbox(bbox: str | None) -> tuple[float, float, float, float] | None:
+    """Parse a "min_lat,min_lon,max_lat,max_lon" bounding box.
+
+    Raises:
+        ValueError: If the value is malformed or the box is inverted
+    """
+    if not bbox:
+        return None
+
+    parts = _split_csv(bbox)
+    if len(parts) != 4:
+        raise ValueError("bbox must be 'min_lat,min_lon,max_lat,max_lon'")
+
+    try:
+        min_lat, min_lon, max_lat, max_lon = (float(p) for p in parts)
+    except ValueError:
+        raise ValueError("bbox values must be numbers") from None
+
+    if min_lat > max_lat or min_lon > max_lon:
+        raise ValueError("bbox minimum must not exceed maximum")
+
+    return min_lat, min_lon, max_lat, max_lon
+
+
+def project(record: dict[str, Any], fields: list[str] | None) -> dict[str, Any]:
+    """Return only the requested fields of a record."""
+    if fields is None:
+        return record
+    return {name: record.get(name) for name in fields}
+
+
+def compute_etag(snapshot: AttractionSnapshot, *parts: Any) -> str:
+    """Compute a strong ETag for a response derived from the snapshot.
+
+    Args:
+        snapshot: Snapshot the response was built from
+        parts: Request parameters that shape the response body
+
+    Returns:
+        Quoted ETag value
+    """
+    key = "|".join([snapshot.version, *(str(p) for p in parts)])
+    return f'"{hashlib.sha1(key.encode("utf-8")).hexdigest()[:20]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+# ============================================================================
+# Query Operations
+# ============================================================================
+
+
+def list_attractions(
+    snapshot: AttractionSnapshot,
+    cursor: int | None = None,
+    limit: int = 20,
+    category: str | None = None,
+    district: str | None = None,
+    bbox: str | None = None,
+    fields: str | None = None,
+) -> dict[str, Any]:
+    """List attractions from the snapshot with filters and keyset pagination.
+
+    Args:
+        snapshot: Current attraction snapshot
+        cursor: Last attraction ID of the previous page
+        limit: Page size
+        category: Comma-separated categories
+        district: Comma-separated districts
+        bbox: "min_lat,min_lon,max_lat,max_lon" viewport
+        fields: Comma-separated projection
+
+    Returns:
+        Dictionary matching AttractionPage
+
+    Raises:
+        ValueError: If bbox or fields are invalid
+    """
+    projection = parse_fields(snapshot, fields)
+    mask = snapshot.filter_mask(
+        categories=_split_csv(category),
+        districts=_split_csv(district),
+        bbox=parse_bbox(bbox),
+    )
+
+    records, next_cursor, total = snapshot.page(mask, after_id=cursor, limit=limit)
+
+    return {
+        "items": [project(record, projection) for record in records],
+        "next_cursor": next_cursor,
+        "total": total,
+    }
+
+
+def get_attraction(
+    snapshot: AttractionSnapshot,
+    attraction_id: int,
+    fields: str | None = None,
+) -> dict[str, Any] | None:
+    """Get a single attraction from the snapshot.
+
+    Returns:
+        Projected attraction dictionary or None if not found
+
+    Raises:
+        ValueError: If fields are invalid
+    """
+    record = snapshot.get(attraction_id)
+    if record is None:
+        return None
+    return project(record, parse_fields(snapshot, fields))
+
+
+def get_facets(snapshot: AttractionSnapshot) -> dict[str, Any]:
+    """Get distinct categories and districts for filter UIs."""
+    return {
+        "categories": sorted({c for c in snapshot.categories if c}),
+        "districts": sorted({d for d in snapshot.districts if d}),
+        "total": len(snapshot),
+    }
+
+
+def get_map_clusters(
+    snapshot: AttractionSnapshot,
+    bbox: str,
+    zoom: int,
+) -> dict[str, Any]:
+    """Get precomputed map marker clusters for a viewport.
+
+    Args:
+        snapshot: Current attraction snapshot
+        bbox: "min_lat,min_lon,max_lat,max_lon" viewport
+        zoom: Map zoom level
+
+    Returns:
+        Dictionary matching MapClusterResponse
+
+    Raises:
+        ValueError: If bbox is invalid
+    """
+    features = snapshot.cluster_index.get_clusters(parse_bbox(bbox), zoom)
+
+    clusters = []
+    for feature in features:
+        if feature.is_cluster:
+            clusters.append({
+                "type": "cluster",
+                "id": feature.cluster_id,
+                "latitude": feature.latitude,
+                "longitude": feature.longitude,
+                "count": feature.count,
+                "expansion_zoom": feature.expansion_zoom,
+            })
+        else:
+            record = snapshot.get(feature.point_id) or {}
+            clusters.append({
+                "type": "point",
+                "id": feature.point_id,
+                "latitude": record.get("latitude", feature.latitude),
+                "longitude": record.get("longitude", feature.longitude),
+                "count": 1,
+                "name": record.get("name"),
+                "category": record.get("category"),
+            })
+
+    return {"zoom": zoom, "clusters": clusters}
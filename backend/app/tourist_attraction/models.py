@@ -27,6 +27,7 @@ class TouristAttraction(Base):
     # Address information
     road_address = Column(String)  # 소재지도로명주소
     jibun_address = Column(String)  # 소재지지번주소
+    district = Column(String, index=True)  # 자치구 (precomputed at import time)
 
     # Location coordinates (WGS84)
     latitude = Column(Float, nullable=False, index=True)  # 위도
@@ -101,6 +102,7 @@ class TouristAttraction(Base):
             "category": self.category,
             "road_address": self.road_address,
             "jibun_address": self.jibun_address,
+            "district": self.district,
             "latitude": self.latitude,
             "longitude": self.longitude,
             "area": self.area,
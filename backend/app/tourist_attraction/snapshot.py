@@ -0,0 +1,226 @@
+"""In-memory snapshot of the tourist attraction table.
+
+The attraction dataset is imported once from the Seoul open data file and is
+effectively static, so read endpoints are served from an immutable snapshot
+instead of loading ORM objects on every request.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Any
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.geo.districts import resolve_district
+from app.geo.supercluster import Supercluster
+from app.tourist_attraction.models import TouristAttraction
+
+logger = logging.getLogger(__name__)
+
+
+class AttractionSnapshot:
+    """Immutable, id-ordered view of all tourist attractions.
+
+    Coordinates, categories and districts are kept as NumPy arrays so filters
+    are evaluated as vectorized masks, and keyset pagination is a binary search
+    over the sorted id array. A map marker cluster index is precomputed for
+    every zoom level when the snapshot is built.
+    """
+
+    def __init__(self, records: list[dict[str, Any]]):
+        """Build the snapshot from attraction records.
+
+        Args:
+            records: Attraction dictionaries (see TouristAttraction.to_dict)
+        """
+        self.records: list[dict[str, Any]] = sorted(records, key=lambda r: r["id"])
+        self.by_id: dict[int, dict[str, Any]] = {r["id"]: r for r in self.records}
+
+        self.ids = np.array([r["id"] for r in self.records], dtype=np.int64)
+        self.latitudes = np.array([r["latitude"] for r in self.records], dtype=np.float64)
+        self.longitudes = np.array([r["longitude"] for r in self.records], dtype=np.float64)
+        self.categories = np.array([r["category"] or "" for r in self.records], dtype=object)
+        self.districts = np.array([r["district"] or "" for r in self.records], dtype=object)
+
+        self.cluster_index = Supercluster(
+            [(r["latitude"], r["longitude"], r["id"]) for r in self.records]
+        )
+
+        self.fields: tuple[str, ...] = tuple(self.records[0].keys()) if self.records else ()
+        self.version = self._compute_version(self.records)
+        self.built_at = time.monotonic()
+
+    @staticmethod
+    def _compute_version(records: list[dict[str, Any]]) -> str:
+        """Compute a content hash used as the base of response ETags."""
+        payload = json.dumps(records, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+    @classmethod
+    def from_db(cls, db: Session) -> "AttractionSnapshot":
+        """Load every attraction from the database into a new snapshot.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Snapshot of the tourist_attractions table
+        """
+        records = []
+        for attraction in db.query(TouristAttraction).all():
+            record = attraction.to_dict()
+            # Rows imported before the district column existed are resolved offline
+            record["district"] = record["district"] or resolve_district(
+                attraction.latitude,
+                attraction.longitude,
+                attraction.road_address or attraction.jibun_address,
+            )
+            records.append(record)
+
+        snapshot = cls(records)
+        logger.info(f"📸 Built attraction snapshot: {len(records)} records (version {snapshot.version})")
+        return snapshot
+
+    def __len__(self) -> int:
+        """Number of attractions in the snapshot."""
+        return len(self.records)
+
+    def get(self, attraction_id: int) -> dict[str, Any] | None:
+        """Get a single attraction by ID."""
+        return self.by_id.get(attraction_id)
+
+    def filter_mask(
+        self,
+        categories: list[str] | None = None,
+        districts: list[str] | None = None,
+        bbox: tuple[float, float, float, float] | None = None,
+    ) -> np.ndarray:
+        """Build a boolean mask of attractions matching all filters.
+
+        Args:
+            categories: Allowed categories (any match)
+            districts: Allowed districts (any match)
+            bbox: (min_lat, min_lon, max_lat, max_lon) viewport
+
+        Returns:
+            Boolean array aligned with ``records``
+        """
+        mask = np.ones(len(self.records), dtype=bool)
+
+        if categories:
+            mask &= np.isin(self.categories, categories)
+        if districts:
+            mask &= np.isin(self.districts, districts)
+        if bbox:
+            min_lat, min_lon, max_lat, max_lon = bbox
+            mask &= (
+                (self.latitudes >= min_lat)
+                & (self.latitudes <= max_lat)
+                & (self.longitudes >= min_lon)
+                & (self.longitudes <= max_lon)
+            )
+
+        return mask
+
+    def page(
+        self,
+        mask: np.ndarray,
+        after_id: int | None = None,
+        limit: int = 20,
+    ) -> tuple[list[dict[str, Any]], int | None, int]:
+        """Return one keyset page of records matching ``mask``.
+
+        Args:
+            mask: Filter mask from ``filter_mask``
+            after_id: Return records with id strictly greater than this cursor
+            limit: Maximum records per page
+
+        Returns:
+            Tuple of (records, next_cursor, total_matches)
+        """
+        start = 0
+        if after_id is not None:
+            start = int(np.searchsorted(self.ids, after_id, side="right"))
+
+        positions = np.flatnonzero(mask[start:]) + start
+        total = int(mask.sum())
+
+        selected = positions[:limit]
+        items = [self.records[i] for i in selected]
+
+        next_cursor = None
+        if len(positions) > limit:
+            next_cursor = int(self.ids[selected[-1]])
+
+        return items, next_cursor, total
+
+
+# ============================================================================
+# Process-wide snapshot cache
+# ============================================================================
+
+_snapshot: AttractionSnapshot | None = None
+_snapshot_lock = threading.Lock()
+
+
+def current_snapshot(max_age_seconds: float | None = None) -> AttractionSnapshot | None:
+    """Get the cached snapshot if it exists and is fresh, without touching the database.
+
+    Args:
+        max_age_seconds: Treat the snapshot as stale after this (None = never)
+
+    Returns:
+        Fresh snapshot, or None if it must be (re)built
+    """
+    snapshot = _snapshot
+    if snapshot is not None and (
+        max_age_seconds is None or time.monotonic() - snapshot.built_at < max_age_seconds
+    ):
+        return snapshot
+    return None
+
+
+def get_snapshot(db: Session, max_age_seconds: float | None = None) -> AttractionSnapshot:
+    """Get the cached snapshot, building it on first use or when it is stale.
+
+    Args:
+        db: Database session used only when the snapshot must be (re)built
+        max_age_seconds: Rebuild if the snapshot is older than this (None = never)
+
+    Returns:
+        Current attraction snapshot
+    """
+    global _snapshot
+
+    snapshot = current_snapshot(max_age_seconds)
+    if snapshot is not None:
+        return snapshot
+
+    snapshot = _snapshot
+    with _snapshot_lock:
+        # Another request may have rebuilt the snapshot while we waited
+        if _snapshot is not snapshot:
+            return _snapshot
+        _snapshot = AttractionSnapshot.from_db(db)
+        return _snapshot
+
+
+def refresh_snapshot(db: Session) -> AttractionSnapshot:
+    """Rebuild the cached snapshot from the database."""
+    global _snapshot
+
+    with _snapshot_lock:
+        _snapshot = AttractionSnapshot.from_db(db)
+        return _snapshot
+
+
+def invalidate_snapshot() -> None:
+    """Drop the cached snapshot so the next request rebuilds it."""
+    global _snapshot
+
+    with _snapshot_lock:
+        _snapshot = None
@@ -0,0 +1,29 @@
+"""Transit travel-time subsystem (precomputed attraction matrix + estimators)."""
+
+from app.transit.estimator import estimate_travel_minutes
+from app.transit.matrix import (
+    TravelTimeMatrix,
+    build_travel_time_matrix,
+    get_travel_time_matrix,
+    invalidate_travel_time_matrix,
+    travel_minutes,
+)
+from app.transit.providers import (
+    EstimatedTravelTimeProvider,
+    RoutingTravelTimeProvider,
+    TravelTimeProvider,
+    get_travel_time_provider,
+)
+
+__all__ = [
+    "EstimatedTravelTimeProvider",
+    "RoutingTravelTimeProvider",
+    "TravelTimeMatrix",
+    "TravelTimeProvider",
+    "build_travel_time_matrix",
+    "estimate_travel_minutes",
+    "get_travel_time_matrix",
+    "get_travel_time_provider",
+    "invalidate_travel_time_matrix",
+    "travel_minutes",
+]
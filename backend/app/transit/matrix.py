@@ -0,0 +1,208 @@
+"""Precomputed pairwise travel-time matrix between tourist attractions.
+
+The matrix is built offline (scripts/build_travel_time_matrix.py) and stored as
+two files in a directory:
+- ``minutes.npy``: (N, N) uint16 minutes, loaded memory-mapped
+- ``index.json``: attraction ids in row order plus build metadata
+
+Lookups by attraction id are O(1) and never touch the network.
+"""
+
+import json
+import logging
+import threading
+from datetime import UTC, datetime
+from pathlib import Path
+
+import numpy as np
+
+from app.config import settings
+from app.geo.distance import haversine_km
+from app.transit.estimator import estimate_travel_minutes
+from app.transit.providers import TravelTimeProvider
+
+logger = logging.getLogger(__name__)
+
+MINUTES_FILE = "minutes.npy"
+INDEX_FILE = "index.json"
+
+# Stored for pairs the provider could not route
+UNREACHABLE = np.iinfo(np.uint16).max
+
+BACKEND_DIR = Path(__file__).parent.parent.parent
+
+
+class TravelTimeMatrix:
+    """Travel minutes between attractions, indexed by attraction id."""
+
+    def __init__(
+        self,
+        ids: list[int],
+        minutes: np.ndarray,
+        provider: str = "estimate",
+        built_at: str | None = None,
+    ):
+        """Wrap a minutes array.
+
+        Args:
+            ids: Attraction ids in row/column order
+            minutes: (N, N) travel minutes (any integer dtype, or a memmap)
+            provider: Name of the provider that produced the matrix
+            built_at: ISO timestamp of the build
+        """
+        if minutes.shape != (len(ids), len(ids)):
+            raise ValueError(f"Matrix shape {minutes.shape} does not match {len(ids)} ids")
+
+        self.ids = list(ids)
+        self.minutes = minutes
+        self.provider = provider
+        self.built_at = built_at or datetime.now(UTC).isoformat()
+        self.index = {attraction_id: row for row, attraction_id in enumerate(self.ids)}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, attraction_id: object) -> bool:
+        return attraction_id in self.index
+
+    def get(self, origin_id: int, destination_id: int) -> int | None:
+        """Travel minutes between two attractions.
+
+        Returns:
+            Minutes, or None if either id is unknown or the pair is unreachable
+        """
+        row = self.index.get(origin_id)
+        col = self.index.get(destination_id)
+        if row is None or col is None:
+            return None
+        value = int(self.minutes[row, col])
+        return None if value == UNREACHABLE else value
+
+    def save(self, directory: str | Path) -> None:
+        """Write ``minutes.npy`` and ``index.json`` into a directory."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        np.save(directory / MINUTES_FILE, np.asarray(self.minutes, dtype=np.uint16))
+        metadata = {"ids": self.ids, "provider": self.provider, "built_at": self.built_at}
+        (directory / INDEX_FILE).write_text(json.dumps(metadata), encoding="utf-8")
+
+    @classmethod
+    def load(cls, directory: str | Path) -> "TravelTimeMatrix":
+        """Load a saved matrix with the minutes array memory-mapped read-only."""
+        directory = Path(directory)
+        metadata = json.loads((directory / INDEX_FILE).read_text(encoding="utf-8"))
+        minutes = np.load(directory / MINUTES_FILE, mmap_mode="r")
+        return cls(
+            ids=metadata["ids"],
+            minutes=minutes,
+            provider=metadata.get("provider", "unknown"),
+            built_at=metadata.get("built_at"),
+        )
+
+
+async def build_travel_time_matrix(
+    attractions: list[dict],
+    provider: TravelTimeProvider,
+) -> TravelTimeMatrix:
+    """Build the matrix for all attractions with coordinates.
+
+    Args:
+        attractions: Dicts with id/latitude/longitude
+        provider: Travel-time provider to query
+
+    Returns:
+        TravelTimeMatrix with uint16 minutes
+    """
+    located = [
+        a for a in sorted(attractions, key=lambda a: a["id"])
+        if a.get("latitude") is not None and a.get("longitude") is not None
+    ]
+    minutes = await provider.matrix(
+        [a["latitude"] for a in located],
+        [a["longitude"] for a in located],
+    )
+    minutes = np.clip(np.asarray(minutes), 0, UNREACHABLE).astype(np.uint16)
+    return TravelTimeMatrix([a["id"] for a in located], minutes, provider=provider.name)
+
+
+# ============================================================================
+# Process-wide matrix
+# ============================================================================
+
+_matrix: TravelTimeMatrix | None = None
+_loaded = False
+_lock = threading.Lock()
+
+
+def matrix_directory() -> Path:
+    """Resolve settings.TRAVEL_TIME_MATRIX_DIR relative to the backend directory."""
+    directory = Path(settings.TRAVEL_TIME_MATRIX_DIR)
+    return directory if directory.is_absolute() else BACKEND_DIR / directory
+
+
+def get_travel_time_matrix() -> TravelTimeMatrix | None:
+    """Return the shared matrix, loading it on first use.
+
+    Returns:
+        The matrix, or None if it has not been built yet
+    """
+    global _matrix, _loaded
+
+    if _loaded:
+        return _matrix
+
+    with _lock:
+        if not _loaded:
+            directory = matrix_directory()
+            if (directory / INDEX_FILE).exists():
+                _matrix = TravelTimeMatrix.load(directory)
+                logger.info(
+                    f"🚇 Loaded travel time matrix: {len(_matrix)} attractions "
+                    f"({_matrix.provider}, built {_matrix.built_at})"
+                )
+            else:
+                logger.info(f"🚇 No travel time matrix at {directory}; using estimates")
+            _loaded = True
+    return _matrix
+
+
+def invalidate_travel_time_matrix() -> None:
+    """Drop the shared matrix so the next lookup reloads it from disk."""
+    global _matrix, _loaded
+    with _lock:
+        _matrix = None
+        _loaded = False
+
+
+def travel_minutes(
+    origin: dict,
+    destination: dict,
+    matrix: TravelTimeMatrix | None = None,
+) -> int | None:
+    """Travel minutes between two venues.
+
+    Uses the precomputed matrix when both venues are attractions in it, and
+    falls back to the distance-based estimate otherwise (e.g. restaurants).
+
+    Args:
+        origin: Venue dict with optional id and latitude/longitude
+        destination: Venue dict with optional id and latitude/longitude
+        matrix: Matrix to use (defaults to the shared matrix)
+
+    Returns:
+        Minutes, or None if neither source can answer
+    """
+    matrix = matrix if matrix is not None else get_travel_time_matrix()
+    if matrix is not None:
+        minutes = matrix.get(origin.get("id"), destination.get("id"))
+        if minutes is not None:
+            return minutes
+
+    coords = (
+        origin.get("latitude"), origin.get("longitude"),
+        destination.get("latitude"), destination.get("longitude"),
+    )
+    if any(value is None for value in coords):
+        return None
+    return int(estimate_travel_minutes(haversine_km(*coords)))
@@ -0,0 +1,92 @@
+"""Pluggable travel-time providers for building the attraction matrix."""
+
+import logging
+from typing import TYPE_CHECKING, Protocol
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from app.config import settings
+from app.geo.distance import haversine_matrix
+from app.transit.estimator import estimate_travel_minutes
+
+if TYPE_CHECKING:
+    from app.routing import RoutingClient
+
+logger = logging.getLogger(__name__)
+
+
+class TravelTimeProvider(Protocol):
+    """Computes a full pairwise travel-time matrix in minutes."""
+
+    name: str
+
+    async def matrix(self, latitudes: ArrayLike, longitudes: ArrayLike) -> np.ndarray:
+        """Return an (N, N) matrix of travel minutes between the given points."""
+        ...
+
+
+class EstimatedTravelTimeProvider:
+    """Local distance-based stand-in; needs no network access."""
+
+    name = "estimate"
+
+    async def matrix(self, latitudes: ArrayLike, longitudes: ArrayLike) -> np.ndarray:
+        """Estimate travel minutes for every pair from haversine distances."""
+        return estimate_travel_minutes(haversine_matrix(latitudes, longitudes))
+
+
+class RoutingTravelTimeProvider:
+    """Travel times from a live routing API (ODsay transit or Kakao driving).
+
+    Travel time is treated as symmetric, so only the upper triangle is
+    requested, as one deduplicated batch through the routing client. Walkable
+    pairs and failed requests fall back to the local estimator.
+    """
+
+    def __init__(self, client: "RoutingClient"):
+        """Initialize with a routing client (see app.routing)."""
+        self.client = client
+        self.name = client.backend.name
+
+    async def matrix(self, latitudes: ArrayLike, longitudes: ArrayLike) -> np.ndarray:
+        """Request travel times for every pair."""
+        from app.routing import Leg
+
+        lats = np.asarray(latitudes, dtype=np.float64)
+        lons = np.asarray(longitudes, dtype=np.float64)
+        minutes = np.zeros((len(lats), len(lats)), dtype=np.int64)
+
+        pairs = [(i, j) for i in range(len(lats)) for j in range(i + 1, len(lats))]
+        legs = [Leg((lats[i], lons[i]), (lats[j], lons[j])) for i, j in pairs]
+        results = await self.client.batch(legs)
+
+        for (i, j), result in zip(pairs, results, strict=True):
+            minutes[i, j] = minutes[j, i] = result
+
+        stats = self.client.stats
+        logger.info(
+            f"{self.name} matrix: {len(pairs)} pairs, {stats.upstream_requests} upstream requests, "
+            f"{stats.upstream_failures} failed (estimated)"
+        )
+        return minutes
+
+
+def get_travel_time_provider(name: str | None = None) -> TravelTimeProvider:
+    """Create a provider by name ("estimate", "odsay" or "kakao").
+
+    Args:
+        name: Provider name (defaults to settings.TRAVEL_TIME_PROVIDER)
+
+    Raises:
+        ValueError: If the provider name is unknown
+    """
+    name = name or settings.TRAVEL_TIME_PROVIDER
+    if name == "estimate":
+        return EstimatedTravelTimeProvider()
+    if name in ("odsay", "kakao"):
+        from app.routing import KakaoMobilityBackend, ODsayBackend, RoutingClient
+
+        backend = ODsayBackend() if name == "odsay" else KakaoMobilityBackend()
+        return RoutingTravelTimeProvider(RoutingClient(backend))
+    raise ValueError(f"Unknown travel time provider: {name}")
@@ -0,0 +1,113 @@
+"""Benchmark per-call LLM client overhead: per-call construction vs pooled clients.
+
+Usage:
+    python scripts/benchmark_llm_clients.py [--calls 200]
+
+"before" builds a new ChatOpenAI and structured-output runnable for every
+call (the former get_llm behaviour); "after" uses the pooled
+get_structured_llm. Calls go to an in-process mock transport that returns a
+fixed completion, so only client-side overhead is measured.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import httpx
+from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_openai import ChatOpenAI
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.ai.agents import utils
+from app.ai.agents.planner.models import TravelInfoExtraction
+from app.config import settings
+
+COMPLETION = {
+    "id": "chatcmpl-benchmark",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-4o-mini",
+    "choices": [{
+        "index": 0,
+        "finish_reason": "stop",
+        "message": {
+            "role": "assistant",
+            "content": json.dumps({"dates": None, "budget": 500000, "interests": ["palace"]}),
+        },
+    }],
+    "usage": {"prompt_tokens": 100, "completion_tokens": 20, "total_tokens": 120},
+}
+
+MESSAGES = [SystemMessage(content="Extract travel info."), HumanMessage(content="3일 고궁 여행, 50만원")]
+
+
+def mock_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json=COMPLETION)))
+
+
+async def run(label: str, call, calls: int) -> list[float]:
+    await call()  # warm-up (imports, tokenizer, first client)
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - start) * 1000)
+    print(
+        f"{label:<28} mean {statistics.mean(samples):6.3f} ms   "
+        f"p50 {statistics.median(samples):6.3f} ms   p95 {sorted(samples)[int(len(samples) * 0.95)]:6.3f} ms"
+    )
+    return samples
+
+
+async def main(calls: int) -> None:
+    settings.OPENAI_API_KEY = settings.OPENAI_API_KEY or "sk-benchmark"
+    http_client = mock_client()
+
+    def new_llm(model: str, temperature: float) -> ChatOpenAI:
+        return ChatOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            model=model,
+            temperature=temperature,
+            http_async_client=http_client,
+        )
+
+    async def before_construct():
+        new_llm(settings.OPENAI_MODEL, 0).with_structured_output(TravelInfoExtraction)
+
+    async def after_construct():
+        utils.get_structured_llm(TravelInfoExtraction, temperature=0)
+
+    async def before_call():
+        await new_llm(settings.OPENAI_MODEL, 0).with_structured_output(TravelInfoExtraction).ainvoke(MESSAGES)
+
+    async def after_call():
+        await utils.get_structured_llm(TravelInfoExtraction, temperature=0).ainvoke(MESSAGES)
+
+    # Pooled clients use the mock transport too
+    utils._create_llm = new_llm
+    utils.clear_llm_clients()
+
+    print(f"Per-call overhead over {calls} calls (mock transport, no network)\n")
+    before = await run("before: construct per call", before_construct, calls)
+    after = await run("after: pooled lookup", after_construct, calls)
+    print(f"{'construction saved':<28} {statistics.mean(before) - statistics.mean(after):6.3f} ms per call\n")
+
+    before = await run("before: construct + invoke", before_call, calls)
+    after = await run("after: pooled + invoke", after_call, calls)
+    print(f"{'end-to-end saved':<28} {statistics.mean(before) - statistics.mean(after):6.3f} ms per call")
+
+    await http_client.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.calls))
@@ -0,0 +1,80 @@
+"""Build the pairwise transit travel-time matrix between tourist attractions.
+
+Usage:
+    python scripts/build_travel_time_matrix.py [--provider estimate|odsay|kakao] [--output DIR]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.database import SessionLocal
+from app.tourist_attraction.models import TouristAttraction
+from app.transit.matrix import build_travel_time_matrix, matrix_directory
+from app.transit.providers import get_travel_time_provider
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def build_matrix(provider_name: str | None, output: str | None) -> bool:
+    """Build and save the travel-time matrix for all attractions in the database."""
+    logger.info("=" * 70)
+    logger.info("Building Travel Time Matrix")
+    logger.info("=" * 70)
+
+    db = SessionLocal()
+
+    try:
+        # Step 1: Load attraction coordinates
+        logger.info("\n[Step 1] Loading tourist attractions from database...")
+        attractions = [
+            {"id": a.id, "latitude": a.latitude, "longitude": a.longitude}
+            for a in db.query(TouristAttraction).all()
+        ]
+        logger.info(f"Found {len(attractions)} attractions")
+
+        if not attractions:
+            logger.error("No attractions found in database!")
+            return False
+
+        # Step 2: Query the provider
+        provider = get_travel_time_provider(provider_name)
+        logger.info(f"\n[Step 2] Computing travel times with provider '{provider.name}'...")
+        started = time.perf_counter()
+        matrix = asyncio.run(build_travel_time_matrix(attractions, provider))
+        logger.info(f"Computed {len(matrix)}x{len(matrix)} matrix in {time.perf_counter() - started:.1f}s")
+
+        # Step 3: Save
+        directory = Path(output) if output else matrix_directory()
+        logger.info(f"\n[Step 3] Saving matrix to {directory}...")
+        matrix.save(directory)
+
+        logger.info("\n" + "=" * 70)
+        logger.info("✅ Travel time matrix built successfully!")
+        logger.info("=" * 70)
+        return True
+
+    except Exception as e:
+        logger.error(f"❌ Failed to build travel time matrix: {e}", exc_info=True)
+        return False
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--provider", help="Travel time provider (default: settings.TRAVEL_TIME_PROVIDER)")
+    parser.add_argument("--output", help="Output directory (default: settings.TRAVEL_TIME_MATRIX_DIR)")
+    args = parser.parse_args()
+
+    success = build_matrix(args.provider, args.output)
+    sys.exit(0 if success else 1)
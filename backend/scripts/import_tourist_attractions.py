@@ -6,6 +6,7 @@ from pathlib import Path
 
 # Import Base to create tables
 from app.database import Base, SessionLocal, engine
+from app.geo.districts import resolve_district
 from app.tourist_attraction.models import TouristAttraction
 
 logging.basicConfig(level=logging.INFO)
@@ -58,12 +59,20 @@ def import_attractions():
                 except (ValueError, TypeError):
                     parking = None
 
+                # Precompute district offline (address first, then coordinates)
+                district = resolve_district(
+                    latitude,
+                    longitude,
+                    record.get("소재지도로명주소") or record.get("소재지지번주소"),
+                )
+
                 # Create attraction instance
                 attraction = TouristAttraction(
                     name=record["관광지명"],
                     category=record.get("관광지구분", "관광지"),
                     road_address=record.get("소재지도로명주소"),
                     jibun_address=record.get("소재지지번주소"),
+                    district=district,
                     latitude=latitude,
                     longitude=longitude,
                     area=record.get("면적"),
@@ -0,0 +1,91 @@
+"""Offline throughput test for the routing client against the fake server.
+
+Usage:
+    python scripts/load_test_routing.py [--plans 200] [--legs 12] [--latency-ms 30]
+        [--concurrency 8] [--url http://localhost:8099]
+
+Without --url the fake server runs in-process over an ASGI transport.
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import httpx
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.geo.districts import SEOUL_DISTRICTS
+from app.routing import Leg, ODsayBackend, RoutingClient
+from app.routing.client import RoutingStats
+from app.routing.fake_server import create_fake_routing_app
+
+logging.basicConfig(level=logging.INFO)
+logging.getLogger("httpx").setLevel(logging.WARNING)
+logger = logging.getLogger(__name__)
+
+# Popular stops shared by synthetic plans (district anchors)
+STOPS = [(lat, lon) for _, lat, lon in SEOUL_DISTRICTS[:20]]
+
+
+def random_plan_legs(rng: random.Random, legs_per_plan: int) -> list[Leg]:
+    """Legs of one synthetic plan hopping between district anchors."""
+    start = datetime(2025, 7, 1, 9, 0) + timedelta(days=rng.randrange(7))
+    stops = [rng.choice(STOPS) for _ in range(legs_per_plan + 1)]
+    return [
+        Leg(stops[i], stops[i + 1], start + timedelta(minutes=90 * i))
+        for i in range(legs_per_plan)
+    ]
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Resolve many plans concurrently and report throughput."""
+    fake_app = create_fake_routing_app(latency_ms=args.latency_ms)
+    if args.url:
+        http_client = httpx.AsyncClient(base_url=args.url)
+        base_url = args.url
+    else:
+        http_client = httpx.AsyncClient(transport=httpx.ASGITransport(app=fake_app))
+        base_url = "http://fake-routing"
+
+    client = RoutingClient(
+        ODsayBackend(api_key="load-test", base_url=base_url),
+        http_client=http_client,
+        max_concurrency=args.concurrency,
+    )
+    rng = random.Random(42)
+    plans = [random_plan_legs(rng, args.legs) for _ in range(args.plans)]
+
+    # First round starts cold; the second replays the same plans against a warm cache
+    for round_name in ("cold", "warm"):
+        client.stats = RoutingStats()
+        started = time.perf_counter()
+        await asyncio.gather(*(client.batch(legs) for legs in plans))
+        elapsed = time.perf_counter() - started
+
+        stats = client.stats
+        logger.info(f"[{round_name}] Resolved {stats.legs} legs from {args.plans} plans in {elapsed:.2f}s")
+        logger.info(f"  Throughput:        {stats.legs / elapsed:,.0f} legs/s")
+        logger.info(f"  Upstream requests: {stats.upstream_requests} ({stats.upstream_failures} failed)")
+        logger.info(f"  Cache hits:        {stats.cache_hits}")
+        logger.info(f"  Deduplicated:      {stats.deduplicated}")
+        logger.info(f"  Walking (local):   {stats.walking}")
+
+    await http_client.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--plans", type=int, default=200)
+    parser.add_argument("--legs", type=int, default=12)
+    parser.add_argument("--latency-ms", type=float, default=30.0)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--url", help="Base URL of an external fake server")
+    asyncio.run(run(parser.parse_args()))
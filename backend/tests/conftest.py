@@ -54,6 +54,11 @@ def client(test_db_session):
     from app.auth import router as auth_router
     from app.config import settings
     from app.plan import router as plan_router
+    from app.tourist_attraction import router as attraction_router
+    from app.tourist_attraction.snapshot import invalidate_snapshot
+
+    # Each test has its own database, so never reuse a previous snapshot
+    invalidate_snapshot()
 
     # Create app without lifespan to avoid table creation conflicts
     app = FastAPI(
@@ -75,6 +80,7 @@ def client(test_db_session):
     app.include_router(ai_router, prefix="/api/ai", tags=["AI"])
     app.include_router(auth_router, prefix="/api/auth", tags=["Authentication"])
     app.include_router(plan_router, prefix="/api/plans", tags=["Travel Plans"])
+    app.include_router(attraction_router, prefix="/api/attractions", tags=["Tourist Attractions"])
 
     # Override database dependency
     def override_get_db():
@@ -0,0 +1 @@
+"""AI router integration tests."""
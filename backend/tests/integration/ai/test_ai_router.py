@@ -0,0 +1,268 @@
+"""Integration tests for AI Router endpoints."""
+
+import pytest
+
+PLAN = {
+    "title": "서울 1일 여행",
+    "total_days": 1,
+    "total_cost": 3000,
+    "summary": "",
+    "itinerary": [
+        {
+            "day": 1,
+            "date": "2025-07-01",
+            "theme": "궁궐",
+            "activities": [
+                {
+                    "time": "10:00",
+                    "venue_name": "경복궁",
+                    "venue_type": "attraction",
+                    "duration_minutes": 90,
+                    "estimated_cost": 3000,
+                    "notes": "",
+                }
+            ],
+            "daily_cost": 3000,
+        }
+    ],
+    "accommodation": {"name": "", "cost_per_night": 0, "total_nights": 0},
+}
+
+
+@pytest.fixture
+def review_sessions(monkeypatch):
+    """Fresh in-memory review sessions."""
+    from app.ai.agents import checkpoints
+    from app.ai.ai_service import ai_service
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "CHECKPOINT_DB_PATH", "")
+    monkeypatch.setattr(checkpoints, "_checkpointer", None)
+    monkeypatch.setattr(ai_service, "_review_session_graph", None)
+
+
+class TestReviewRouterSessions:
+    """Test POST /api/ai/plans/review sessions."""
+
+    def test_session_continues_with_feedback_only(self, client, review_sessions):
+        """Test the second round needs only feedback and the session id."""
+        first = client.post(
+            "/api/ai/plans/review",
+            json={"request": {"user_feedback": "좋아요"}, "original_plan": PLAN},
+        )
+        assert first.status_code == 200
+        session_id = first.json()["session_id"]
+
+        second = client.post(
+            "/api/ai/plans/review",
+            json={"request": {"user_feedback": "이대로 확정", "session_id": session_id}},
+        )
+
+        assert second.status_code == 200
+        assert second.json()["plan"] == PLAN
+        assert second.json()["session_id"] == session_id
+
+    def test_unknown_session_is_not_found(self, client, review_sessions):
+        """Test feedback without a plan or session returns 404."""
+        response = client.post(
+            "/api/ai/plans/review",
+            json={"request": {"user_feedback": "좋아요", "session_id": "missing"}},
+        )
+
+        assert response.status_code == 404
+
+    def test_session_belongs_to_its_user(self, client, review_sessions):
+        """Test another user (or no user) cannot continue a user's session."""
+        session_id = client.post(
+            "/api/ai/plans/review?user_id=1",
+            json={"request": {"user_feedback": "좋아요"}, "original_plan": PLAN},
+        ).json()["session_id"]
+
+        for query in ("?user_id=2", ""):
+            response = client.post(
+                f"/api/ai/plans/review{query}",
+                json={"request": {"user_feedback": "이대로 확정", "session_id": session_id}},
+            )
+            assert response.status_code == 403
+
+        owner = client.post(
+            "/api/ai/plans/review?user_id=1",
+            json={"request": {"user_feedback": "이대로 확정", "session_id": session_id}},
+        )
+        assert owner.status_code == 200
+
+    def test_plan_session_id_requires_its_plan(self, client, review_sessions):
+        """Test guessable plan session ids are rejected without the plan_id."""
+        for path in ("/api/ai/plans/review", "/api/ai/jobs/review"):
+            response = client.post(
+                path,
+                json={"request": {"user_feedback": "좋아요", "session_id": "plan-42"}, "original_plan": PLAN},
+            )
+            assert response.status_code == 400
+
+
+class TestGenerateStreamRouter:
+    """Test POST /api/ai/plans/generate/stream."""
+
+    REQUEST = {
+        "user_request": "1일 서울 여행",
+        "start_date": "2025-07-01",
+        "end_date": "2025-07-01",
+        "budget": 100000,
+    }
+
+    @staticmethod
+    def _events(body: str) -> list[tuple[str, dict]]:
+        import json
+
+        events = []
+        for frame in body.strip().split("\n\n"):
+            event_line, data_line = frame.split("\n")
+            events.append((event_line.removeprefix("event: "), json.loads(data_line.removeprefix("data: "))))
+        return events
+
+    def test_streams_events_and_saves_final_plan(self, client, monkeypatch):
+        """Test events are sent as SSE frames and the plan event carries the saved plan id."""
+        from app.ai.ai_service import ai_service
+
+        plan = {**PLAN, "accommodation": {"name": "명동 호텔", "cost_per_night": 90000, "total_nights": 1}}
+
+        async def fake_stream(**kwargs):
+            yield "progress", {"node": "collect_info", "status": "started"}
+            yield "day", plan["itinerary"][0]
+            yield "plan", {"plan": plan}
+
+        monkeypatch.setattr(ai_service, "stream_initial_plan", fake_stream)
+
+        response = client.post("/api/ai/plans/generate/stream?user_id=1", json=self.REQUEST)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = self._events(response.text)
+        assert [name for name, _ in events] == ["progress", "day", "plan"]
+        assert events[-1][1]["plan"] == plan
+        assert events[-1][1]["plan_id"] is not None
+
+    def test_failure_is_an_error_event(self, client, monkeypatch):
+        """Test generation errors end the stream with an error event."""
+        from app.ai.ai_service import ai_service
+
+        async def fake_stream(**kwargs):
+            yield "progress", {"node": "generate_plan", "status": "started"}
+            raise ValueError("No plan generated")
+
+        monkeypatch.setattr(ai_service, "stream_initial_plan", fake_stream)
+
+        response = client.post("/api/ai/plans/generate/stream?user_id=1&save_to_db=false", json=self.REQUEST)
+
+        assert self._events(response.text)[-1] == ("error", {"detail": "No plan generated", "status_code": 400})
+
+
+@pytest.fixture
+def job_pool(client, monkeypatch):
+    """In-memory job queue (and checkpoints) whose workers run on the test client's event loop."""
+    from app.ai import jobs
+    from app.ai.agents import checkpoints
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "JOB_QUEUE_BACKEND", "memory")
+    monkeypatch.setattr(settings, "CHECKPOINT_DB_PATH", "")
+    monkeypatch.setattr(checkpoints, "_checkpointer", None)
+    monkeypatch.setattr(jobs, "_job_pool", None)
+    yield
+    client.portal.call(jobs.close_job_pool)
+
+
+class TestJobRouter:
+    """Test the /api/ai/jobs endpoints."""
+
+    REQUEST = TestGenerateStreamRouter.REQUEST
+
+    def test_generate_job_returns_result_when_polled(self, client, job_pool, monkeypatch):
+        """Test enqueue returns 202 with a job id and long polling returns the plan."""
+        from app.ai.ai_service import ai_service
+
+        threads = []
+
+        async def fake_generate(**kwargs):
+            threads.append(kwargs["thread_id"])
+            return PLAN
+
+        monkeypatch.setattr(ai_service, "generate_initial_plan", fake_generate)
+
+        queued = client.post("/api/ai/jobs/generate?user_id=1&save_to_db=false", json=self.REQUEST)
+        assert queued.status_code == 202
+        job_id = queued.json()["job_id"]
+
+        done = client.get(f"/api/ai/jobs/{job_id}?wait=5").json()
+
+        assert done["status"] == "succeeded"
+        assert done["result"] == {"plan": PLAN, "plan_id": None, "session_id": None}
+        assert threads == [f"job-{job_id}"]
+
+    def test_finished_generate_job_deletes_its_checkpoints(self, client, job_pool, monkeypatch):
+        """Test a generate job's thread is removed once the job succeeds or fails."""
+        from app.ai.ai_service import ai_service
+
+        deleted = []
+
+        async def fake_delete(thread_id):
+            deleted.append(thread_id)
+
+        async def fake_generate(**kwargs):
+            if len(deleted) == 1:
+                raise ValueError("No plan generated")
+            return PLAN
+
+        monkeypatch.setattr(ai_service, "generate_initial_plan", fake_generate)
+        monkeypatch.setattr("app.ai.ai_router.delete_thread", fake_delete)
+
+        job_ids = []
+        for status in ("succeeded", "failed"):
+            job_id = client.post("/api/ai/jobs/generate?user_id=1&save_to_db=false", json=self.REQUEST).json()["job_id"]
+            assert client.get(f"/api/ai/jobs/{job_id}?wait=5").json()["status"] == status
+            job_ids.append(job_id)
+
+        assert deleted == [f"job-{job_id}" for job_id in job_ids]
+
+    def test_job_events_end_with_final_status(self, client, job_pool, monkeypatch):
+        """Test the events stream sends status changes and closes when the job finishes."""
+        from app.ai.ai_service import ai_service
+
+        async def fake_generate(**kwargs):
+            raise ValueError("No plan generated")
+
+        monkeypatch.setattr(ai_service, "generate_initial_plan", fake_generate)
+
+        job_id = client.post("/api/ai/jobs/generate?user_id=1&save_to_db=false", json=self.REQUEST).json()["job_id"]
+        response = client.get(f"/api/ai/jobs/{job_id}/events")
+
+        events = TestGenerateStreamRouter._events(response.text)
+        assert events[-1][0] == "failed"
+        assert events[-1][1]["error"] == "No plan generated"
+
+    def test_review_job_without_session_is_rejected_upfront(self, client, job_pool, review_sessions):
+        """Test review jobs are validated before they are queued."""
+        response = client.post(
+            "/api/ai/jobs/review",
+            json={"request": {"user_feedback": "좋아요", "session_id": "missing"}},
+        )
+
+        assert response.status_code == 404
+
+    def test_review_job_runs_in_session(self, client, job_pool, review_sessions):
+        """Test a review job result carries the session for later rounds."""
+        job_id = client.post(
+            "/api/ai/jobs/review",
+            json={"request": {"user_feedback": "좋아요"}, "original_plan": PLAN},
+        ).json()["job_id"]
+
+        done = client.get(f"/api/ai/jobs/{job_id}?wait=5").json()
+
+        assert done["status"] == "succeeded"
+        assert done["result"]["plan"] == PLAN
+        assert done["result"]["session_id"].startswith("review-")
+
+    def test_unknown_job_is_not_found(self, client, job_pool):
+        """Test unknown job ids return 404."""
+        assert client.get("/api/ai/jobs/missing").status_code == 404
@@ -0,0 +1 @@
+"""Tourist Attraction domain integration tests."""
@@ -0,0 +1,189 @@
+"""Integration tests for Tourist Attraction Router endpoints."""
+
+import pytest
+
+
+@pytest.fixture
+def seeded_attractions(test_db_session):
+    """Insert a handful of attractions across two districts."""
+    from app.tourist_attraction.models import TouristAttraction
+
+    rows = [
+        ("경복궁", "관광지", "서울특별시 종로구 사직로 161", 37.5796, 126.9770),
+        ("창덕궁", "관광지", "서울특별시 종로구 율곡로 99", 37.5794, 126.9910),
+        ("국립중앙박물관", "박물관", "서울특별시 용산구 서빙고로 137", 37.5240, 126.9803),
+        ("전쟁기념관", "박물관", "서울특별시 용산구 이태원로 29", 37.5366, 126.9772),
+        ("N서울타워", "관광지", "서울특별시 용산구 남산공원길 105", 37.5512, 126.9882),
+    ]
+    attractions = [
+        TouristAttraction(name=name, category=category, road_address=address,
+                          latitude=lat, longitude=lon)
+        for name, category, address, lat, lon in rows
+    ]
+    test_db_session.add_all(attractions)
+    test_db_session.commit()
+    return attractions
+
+
+class TestAttractionRouterList:
+    """Test GET /attractions endpoint."""
+
+    def test_list_attractions(self, client, seeded_attractions):
+        """Test listing returns every attraction in id order."""
+        response = client.get("/api/attractions")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 5
+        assert [item["name"] for item in data["items"]][0] == "경복궁"
+        assert data["next_cursor"] is None
+
+    def test_keyset_pagination(self, client, seeded_attractions):
+        """Test walking pages with the cursor visits each attraction once."""
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 2}
+            if cursor is not None:
+                params["cursor"] = cursor
+            data = client.get("/api/attractions", params=params).json()
+            seen.extend(item["id"] for item in data["items"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == sorted(a.id for a in seeded_attractions)
+
+    def test_filter_by_category_and_district(self, client, seeded_attractions):
+        """Test category and district filters combine."""
+        data = client.get(
+            "/api/attractions", params={"category": "박물관", "district": "용산구"}
+        ).json()
+
+        assert data["total"] == 2
+        assert {item["name"] for item in data["items"]} == {"국립중앙박물관", "전쟁기념관"}
+
+    def test_filter_by_bbox(self, client, seeded_attractions):
+        """Test bounding-box filter keeps only points inside the viewport."""
+        data = client.get(
+            "/api/attractions", params={"bbox": "37.57,126.97,37.59,127.00"}
+        ).json()
+
+        assert {item["name"] for item in data["items"]} == {"경복궁", "창덕궁"}
+
+    def test_invalid_bbox(self, client, seeded_attractions):
+        """Test malformed bounding box returns 400."""
+        response = client.get("/api/attractions", params={"bbox": "1,2,3"})
+
+        assert response.status_code == 400
+
+    def test_field_projection(self, client, seeded_attractions):
+        """Test fields parameter limits returned keys and always keeps id."""
+        data = client.get("/api/attractions", params={"fields": "name,latitude"}).json()
+
+        assert set(data["items"][0].keys()) == {"id", "name", "latitude"}
+
+    def test_unknown_field_projection(self, client, seeded_attractions):
+        """Test unknown fields return 400."""
+        response = client.get("/api/attractions", params={"fields": "name,secret"})
+
+        assert response.status_code == 400
+
+    def test_etag_not_modified(self, client, seeded_attractions):
+        """Test conditional request with matching ETag returns 304."""
+        first = client.get("/api/attractions", params={"limit": 2})
+        etag = first.headers["ETag"]
+
+        assert "max-age" in first.headers["Cache-Control"]
+
+        second = client.get(
+            "/api/attractions", params={"limit": 2}, headers={"If-None-Match": etag}
+        )
+        assert second.status_code == 304
+
+        other = client.get(
+            "/api/attractions", params={"limit": 3}, headers={"If-None-Match": etag}
+        )
+        assert other.status_code == 200
+
+
+class TestAttractionRouterDetail:
+    """Test GET /attractions/{id} and /attractions/facets endpoints."""
+
+    def test_get_attraction(self, client, seeded_attractions):
+        """Test getting a single attraction."""
+        attraction = seeded_attractions[2]
+        response = client.get(f"/api/attractions/{attraction.id}")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["name"] == "국립중앙박물관"
+        assert data["district"] == "용산구"
+        assert "ETag" in response.headers
+
+    def test_get_attraction_not_found(self, client, seeded_attractions):
+        """Test getting a missing attraction returns 404."""
+        response = client.get("/api/attractions/99999")
+
+        assert response.status_code == 404
+
+    def test_get_facets(self, client, seeded_attractions):
+        """Test facets list distinct categories and districts."""
+        data = client.get("/api/attractions/facets").json()
+
+        assert data["categories"] == ["관광지", "박물관"]
+        assert data["districts"] == ["용산구", "종로구"]
+        assert data["total"] == 5
+
+
+class TestAttractionRouterClusters:
+    """Test GET /attractions/clusters endpoint."""
+
+    def test_low_zoom_clusters_everything(self, client, seeded_attractions):
+        """Test a city-wide view at low zoom returns a single cluster."""
+        data = client.get(
+            "/api/attractions/clusters", params={"bbox": "37.4,126.7,37.8,127.3", "zoom": 5}
+        ).json()
+
+        assert data["zoom"] == 5
+        assert len(data["clusters"]) == 1
+        assert data["clusters"][0]["type"] == "cluster"
+        assert data["clusters"][0]["count"] == 5
+
+    def test_high_zoom_returns_points(self, client, seeded_attractions):
+        """Test max zoom returns individual attractions with names."""
+        data = client.get(
+            "/api/attractions/clusters", params={"bbox": "37.4,126.7,37.8,127.3", "zoom": 18}
+        ).json()
+
+        assert {c["type"] for c in data["clusters"]} == {"point"}
+        assert {c["name"] for c in data["clusters"]} == {a.name for a in seeded_attractions}
+
+    def test_clusters_require_bbox(self, client, seeded_attractions):
+        """Test missing bbox returns 422."""
+        response = client.get("/api/attractions/clusters", params={"zoom": 10})
+
+        assert response.status_code == 422
+
+
+class TestAttractionSnapshotDependency:
+    """Test the snapshot dependency."""
+
+    def test_fresh_snapshot_opens_no_session(self, client, seeded_attractions):
+        """Test the database is only used when the snapshot is (re)built."""
+        from app.database import get_db
+
+        opened = []
+        override = client.app.dependency_overrides[get_db]
+
+        def counting_get_db():
+            opened.append(1)
+            yield from override()
+
+        client.app.dependency_overrides[get_db] = counting_get_db
+
+        assert client.get("/api/attractions").status_code == 200
+        assert client.get("/api/attractions/facets").status_code == 200
+        assert client.get("/api/attractions").status_code == 200
+
+        assert opened == [1]
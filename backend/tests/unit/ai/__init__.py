@@ -0,0 +1 @@
+"""AI agent unit tests."""
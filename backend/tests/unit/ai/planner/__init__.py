@@ -0,0 +1 @@
+"""Planner agent unit tests."""
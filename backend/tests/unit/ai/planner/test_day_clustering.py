@@ -0,0 +1,60 @@
+"""Test geographic day clustering of planner attractions."""
+
+
+def _attraction(name, latitude, longitude):
+    return {"name": name, "latitude": latitude, "longitude": longitude}
+
+
+ATTRACTIONS = [
+    _attraction("코엑스", 37.5116, 127.0595),
+    _attraction("경복궁", 37.5796, 126.9770),
+    _attraction("봉은사", 37.5150, 127.0573),
+    _attraction("창덕궁", 37.5794, 126.9910),
+]
+
+RESTAURANTS = [
+    {"name": "삼청동 식당", "near_attraction": "경복궁"},
+    {"name": "삼성동 식당", "near_attraction": "코엑스"},
+]
+
+
+class TestBuildDayBuckets:
+    """Test build_day_buckets."""
+
+    def test_groups_nearby_attractions_on_the_same_day(self):
+        """Test palaces and Gangnam sights land on different days."""
+        from app.ai.agents.planner.day_clustering import build_day_buckets
+
+        buckets = build_day_buckets(ATTRACTIONS, RESTAURANTS, num_days=2, start_date="2025-07-01")
+
+        names = [{a["name"] for a in bucket["attractions"]} for bucket in buckets]
+        assert {"경복궁", "창덕궁"} in names
+        assert {"코엑스", "봉은사"} in names
+
+    def test_buckets_are_ordered_west_to_east_with_dates(self):
+        """Test day order and dates are deterministic."""
+        from app.ai.agents.planner.day_clustering import build_day_buckets
+
+        buckets = build_day_buckets(ATTRACTIONS, RESTAURANTS, num_days=2, start_date="2025-07-01")
+
+        assert [b["day"] for b in buckets] == [1, 2]
+        assert [b["date"] for b in buckets] == ["2025-07-01", "2025-07-02"]
+        assert {a["name"] for a in buckets[0]["attractions"]} == {"경복궁", "창덕궁"}
+
+    def test_restaurants_follow_their_attraction(self):
+        """Test restaurants are attached to the bucket of their attraction."""
+        from app.ai.agents.planner.day_clustering import build_day_buckets
+
+        buckets = build_day_buckets(ATTRACTIONS, RESTAURANTS, num_days=2, start_date="2025-07-01")
+
+        assert [r["name"] for r in buckets[0]["restaurants"]] == ["삼청동 식당"]
+        assert [r["name"] for r in buckets[1]["restaurants"]] == ["삼성동 식당"]
+
+    def test_empty_attractions(self):
+        """Test every day still gets a bucket without attractions."""
+        from app.ai.agents.planner.day_clustering import build_day_buckets
+
+        buckets = build_day_buckets([], [], num_days=3, start_date="2025-07-01")
+
+        assert len(buckets) == 3
+        assert all(bucket["attractions"] == [] for bucket in buckets)
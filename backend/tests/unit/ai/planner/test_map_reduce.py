@@ -0,0 +1,168 @@
+"""Test map-reduce plan generation."""
+
+import asyncio
+
+BUCKETS = [
+    {
+        "day": day,
+        "date": f"2025-07-0{day}",
+        "attractions": [{"name": f"관광지{day}", "district": "종로구"}],
+        "restaurants": [{"name": f"식당{day}"}],
+    }
+    for day in (1, 2, 3)
+]
+ACCOMMODATIONS = [{"name": "명동 호텔"}, {"name": "홍대 호텔"}]
+REQUEST = {
+    "user_request": "서울 3일 여행",
+    "start_date": "2025-07-01",
+    "end_date": "2025-07-03",
+    "num_days": 3,
+    "interests": "역사",
+}
+
+
+def _day(day, date, cost, times=("14:00", "10:00")):
+    return {
+        "day": day,
+        "date": date,
+        "theme": "LLM theme",
+        "activities": [
+            {
+                "time": t,
+                "venue_name": f"장소{i}",
+                "venue_type": "attraction",
+                "duration_minutes": 60,
+                "estimated_cost": cost,
+                "notes": "",
+            }
+            for i, t in enumerate(times)
+        ],
+        "daily_cost": 999999,
+    }
+
+
+class TestSplitBudget:
+    """Test split_budget."""
+
+    def test_splits_spending_after_lodging(self):
+        """Test days share the non-lodging budget and sum to it."""
+        from app.ai.agents.planner.map_reduce import split_budget
+
+        budgets = split_budget(500000, num_days=3, lodging_total=200000)
+
+        assert sum(budgets) == 300000
+        assert budgets == [100000, 100000, 100000]
+
+
+class TestMergeDays:
+    """Test merge_days."""
+
+    def test_merge_is_deterministic_and_consistent(self):
+        """Test numbering, dates, sorting and totals are fixed during merge."""
+        from app.ai.agents.planner.map_reduce import merge_days
+        from app.ai.agents.planner.models import TravelPlan
+
+        skeleton = {
+            "title": "서울 여행",
+            "summary": "요약",
+            "days": [{"day": 1, "theme": "궁궐"}, {"day": 2, "theme": "남산"}, {"day": 3, "theme": "한강"}],
+        }
+        days = [_day(7, "YYYY-MM-DD", 1000), _day(1, "2025-07-02", 2000), None]
+        accommodation = {"name": "명동 호텔", "cost_per_night": 100000, "total_nights": 2}
+
+        plan = merge_days(skeleton, days, BUCKETS, accommodation)
+
+        TravelPlan.model_validate(plan)
+        assert [d["day"] for d in plan["itinerary"]] == [1, 2, 3]
+        assert plan["itinerary"][0]["date"] == "2025-07-01"
+        assert plan["itinerary"][0]["theme"] == "궁궐"
+        assert [a["time"] for a in plan["itinerary"][0]["activities"]] == ["10:00", "14:00"]
+        assert plan["itinerary"][0]["daily_cost"] == 2000
+        assert plan["itinerary"][2]["activities"] == []
+        assert plan["total_cost"] == 2000 + 4000 + 200000
+
+
+class TestGeneratePlanMapReduce:
+    """Test generate_plan_map_reduce."""
+
+    async def test_days_run_concurrently_under_cap(self, monkeypatch):
+        """Test per-day calls overlap in time but never exceed the cap."""
+        from app.ai.agents.planner import map_reduce
+
+        running = 0
+        peak = 0
+
+        async def fake_skeleton(request, day_buckets, accommodations, deadline=None):
+            return map_reduce.default_skeleton(request["num_days"], day_buckets, accommodations)
+
+        async def fake_day(semaphore, request, skeleton, bucket, day_budget, accommodation, deadline=None, issues=None):
+            nonlocal running, peak
+            async with semaphore:
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+            return _day(bucket["day"], bucket["date"], 1000)
+
+        monkeypatch.setattr(map_reduce, "generate_skeleton", fake_skeleton)
+        monkeypatch.setattr(map_reduce, "generate_day", fake_day)
+
+        plan = await map_reduce.generate_plan_map_reduce(
+            REQUEST, BUCKETS, ACCOMMODATIONS, budget=500000, max_concurrency=2
+        )
+
+        assert peak == 2
+        assert plan["accommodation"]["name"] == "명동 호텔"
+        assert plan["total_days"] == 3
+
+    async def test_retry_regenerates_only_days_with_issues(self, monkeypatch):
+        """Test a retry keeps valid days and passes each day its issues."""
+        from app.ai.agents.planner import map_reduce
+
+        async def fail_skeleton(*args, **kwargs):
+            raise AssertionError("retries reuse the previous skeleton")
+
+        calls = {}
+
+        async def fake_day(semaphore, request, skeleton, bucket, day_budget, accommodation, deadline=None, issues=None):
+            calls[bucket["day"]] = issues
+            return _day(bucket["day"], bucket["date"], 2000)
+
+        monkeypatch.setattr(map_reduce, "generate_skeleton", fail_skeleton)
+        monkeypatch.setattr(map_reduce, "generate_day", fake_day)
+
+        previous = map_reduce.merge_days(
+            map_reduce.default_skeleton(3, BUCKETS, ACCOMMODATIONS),
+            [_day(b["day"], b["date"], 1000) for b in BUCKETS],
+            BUCKETS,
+            {"name": "명동 호텔", "cost_per_night": 100000, "total_nights": 2},
+        )
+
+        plan = await map_reduce.generate_plan_map_reduce(
+            REQUEST, BUCKETS, ACCOMMODATIONS, budget=500000, max_concurrency=2,
+            previous_plan=previous, day_issues={2: ["Day 2 has no activities"]},
+        )
+
+        assert calls == {2: ["Day 2 has no activities"]}
+        assert [d["daily_cost"] for d in plan["itinerary"]] == [2000, 4000, 2000]
+        assert plan["accommodation"]["name"] == "명동 호텔"
+
+    async def test_generate_day_prompt_includes_issues(self, monkeypatch):
+        """Test the per-day prompt carries the previous attempt's issues."""
+        from app.ai.agents.planner import map_reduce
+
+        prompts = []
+
+        async def fake_invoke(task, schema, messages, **kwargs):
+            prompts.append(messages[-1].content)
+            return map_reduce.DayItinerary.model_validate(_day(1, "2025-03-01", 1000))
+
+        monkeypatch.setattr(map_reduce, "invoke_structured", fake_invoke)
+
+        skeleton = map_reduce.default_skeleton(3, BUCKETS, ACCOMMODATIONS)
+        await map_reduce.generate_day(
+            asyncio.Semaphore(1), REQUEST, skeleton, BUCKETS[0], 100000, "명동 호텔",
+            issues=["Day 1: 경복궁 overlaps 창덕궁"],
+        )
+
+        assert "- Day 1: 경복궁 overlaps 창덕궁" in prompts[0]
@@ -0,0 +1,216 @@
+"""Test the rule-based travel request parser and the collect_info fast path."""
+
+from datetime import date, timedelta
+
+# A Wednesday
+TODAY = date(2025, 6, 18)
+
+
+class TestParseDates:
+    """Test date and trip length extraction."""
+
+    def test_trip_length_without_start_starts_tomorrow(self):
+        """Test "3일" alone becomes a three-day trip from tomorrow."""
+        from app.ai.agents.planner.request_parser import parse_travel_request
+
+        parsed = parse_travel_request("3일 서울 여행 50만원 궁궐 맛집", today=TODAY)
+
+        assert parsed.dates == ("2025-06-19", "2025-06-21")
+
+    def test_nights_and_days_with_korean_start_date(self):
+        """Test N박M일 combined with an absolute Korean date."""
+        from app.ai.agents.planner.request_parser import parse_travel_request
+
+        assert parse_travel_request("7월 1일부터 2박3일", today=TODAY).dates == ("2025-07-01", "2025-07-03")
+        assert parse_travel_request("7월 1일부터 2박", today=TODAY).dates == ("2025-07-01", "2025-07-03")
+
+    def test_day_ranges(self):
+        """Test ranges ending on a bare day, in Korean and English."""
+        from app.ai.agents.planner.request_parser import parse_travel_request
+
+        for text in ("7월 1일~3일 여행", "7월 1일부터 3일까지", "July 1-3 trip", "2025-07-01 ~ 2025-07-03", "7/1 - 7/3"):
+            assert parse_travel_request(text, today=TODAY).dates == ("2025-07-01", "2025-07-03"), text
+
+    def test_date_inside_range_is_not_a_trip_length(self):
+        """Test "3일" in "7월 3일" is read as a date, not a duration."""
+        from app.ai.agents.planner.request_parser import parse_travel_request
+
+        assert parse_travel_request("7월 3일 서울", today=TODAY).dates is None
+
+    def test_past_dates_roll_into_next_year(self):
+        """Test year-less dates that already passed refer to next year."""
+        from app.ai.agents.planner.request_parser import parse_travel_request
+
+        parsed = parse_travel_request("12월 30일 ~ 1월 2일", today=TODAY)
+
+        assert parsed.dates == ("2025-12-30", "2026-01-02")
+
+    def test_relative_dates(self):
+        """Test relative start dates in Korean and English."""
+        from app.ai.agents.planner.request_parser import parse_travel_request
+
+        assert parse_travel_request("내일 당일치기", today=TODAY).dates == ("2025-06-19", "2025-06-19")
+        assert parse_travel_request("모레부터 이틀", today=TODAY).dates == ("2025-06-20", "2025-06-21")
+        assert parse_travel_request("이번 주말", today=TODAY).dates == ("2025-06-21", "2025-06-22")
+        assert parse_travel_request("다음 주말", today=TODAY).dates == ("2025-06-28", "2025-06-29")
+        assert parse_travel_request("다음 주 금요일부터 3일간", today=TODAY).dates == ("2025-06-27", "2025-06-29")
+        assert parse_travel_request("3 days from friday", today=TODAY).dates == ("2025-06-20", "2025-06-22")
+        assert parse_travel_request("2 nights from Aug 5th", today=TODAY).dates == ("2025-08-05", "2025-08-07")
+
+    def test_start_without_length_is_unresolved(self):
+        """Test a start date alone is left for the LLM."""
+        from app.ai.agents.planner.request_parser import parse_travel_request
+
+        assert parse_travel_request("내일 서울 여행", today=TODAY).dates is None
+
+
+class TestParseBudget:
+    """Test budget extraction."""
+
+    def test_korean_and_english_amounts(self):
+        """Test 만원/원/KRW forms."""
+        from app.ai.agents.planner.request_parser import parse_travel_request
+
+        cases = {
+            "50만원": 500000,
+            "1.5만 원": 15000,
+            "2백만원": 2000000,
+            "예산 1,500,000원": 1500000,
+            "₩300,000": 300000,
+            "500,000 KRW": 500000,
+            "500k won": 500000,
+        }
+        for text, expected in cases.items():
+            assert parse_travel_request(text, today=TODAY).budget == expected, text
+
+    def test_total_budget_is_largest_amount(self):
+        """Test per-item prices do not override the total budget."""
+        from app.ai.agents.planner.request_parser import parse_travel_request
+
+        parsed = parse_travel_request("예산 30만원, 입장료는 3000원 이하", today=TODAY)
+
+        assert parsed.budget == 300000
+
+    def test_per_day_amounts_are_multiplied_by_trip_length(self):
+        """Test daily budgets become trip totals and do not set the trip length."""
+        from app.ai.agents.planner.request_parser import parse_travel_request
+
+        cases = {
+            "3일간 여행, 하루 10만원": 300000,
+            "2박3일 일당 5만원": 150000,
+            "7월 1일~3일, 10만원/일": 300000,
+            "3 days, 100k won per day": 300000,
+            "2박3일 총 50만원, 하루 10만원": 500000,
+        }
+        for text, expected in cases.items():
+            assert parse_travel_request(text, today=TODAY).budget == expected, text
+        assert parse_travel_request("하루 10만원으로 서울 여행", today=TODAY).budget is None
+
+    def test_per_person_amounts_are_left_to_llm(self):
+        """Test per-person budgets are unresolved (the party size is unknown)."""
+        from app.ai.agents.planner.request_parser import parse_travel_request
+
+        for text in ("2박3일 1인당 30만원", "3 days, 300,000 won per person"):
+            parsed = parse_travel_request(text, today=TODAY)
+            assert parsed.budget is None, text
+            assert parsed.dates is not None, text
+
+    def test_years_are_not_budgets(self):
+        """Test digits consumed by dates are not read as amounts."""
+        from app.ai.agents.planner.request_parser import parse_travel_request
+
+        parsed = parse_travel_request("Jul 10th to Jul 12th, 300000 won", today=TODAY)
+
+        assert parsed.dates == ("2025-07-10", "2025-07-12")
+        assert parsed.budget == 300000
+
+
+class TestExtractInterests:
+    """Test interest keyword mapping."""
+
+    def test_maps_keywords_to_taxonomy_in_mention_order(self):
+        """Test Korean and English keywords map to the interest labels."""
+        from app.ai.agents.planner.request_parser import extract_interests
+
+        assert extract_interests("궁궐이랑 맛집, 한강 야경") == ["역사", "맛집", "자연", "야경"]
+        assert extract_interests("Museums and coffee, maybe a musical") == ["문화", "카페", "공연"]
+
+    def test_english_keywords_match_whole_words(self):
+        """Test "park" does not match inside other words."""
+        from app.ai.agents.planner.request_parser import extract_interests
+
+        assert extract_interests("start early, parking included") == []
+
+    def test_everyday_english_words_are_not_interests(self):
+        """Test ambiguous words like "show", "class" or "art" are ignored."""
+        from app.ai.agents.planner.request_parser import extract_interests
+
+        assert extract_interests("show me a 3 day trip with 500,000 KRW") == []
+        assert extract_interests("business class flight, state of the art hotel by the river") == []
+        assert extract_interests("a cooking class and a Han River picnic") == ["체험", "자연"]
+
+
+class TestCollectInfoFastPath:
+    """Test collect_info skips the LLM when rules resolve every field."""
+
+    async def test_resolved_request_skips_llm(self, monkeypatch):
+        """Test no LLM call is made for a fully parseable request."""
+        from app.ai.agents.planner import nodes
+
+        async def fail(*args, **kwargs):
+            raise AssertionError("LLM should not be called")
+
+        monkeypatch.setattr(nodes, "cached_structured_call", fail)
+
+        command = await nodes.collect_info({"user_request": "3일 서울 여행 50만원 궁궐 맛집"})
+
+        assert command.update["budget"] == 500000
+        assert command.update["interests"] == ["역사", "맛집"]
+        assert len(command.update["dates"]) == 2
+
+    async def test_llm_fills_only_unresolved_fields(self, monkeypatch):
+        """Test the LLM result is used only for fields rules missed."""
+        from app.ai.agents.planner import nodes
+        from app.ai.agents.planner.models import TravelInfoExtraction
+
+        calls = []
+
+        async def fake_call(task, schema, messages, temperature=0, cache=None, deadline=None):
+            calls.append(task)
+            return TravelInfoExtraction(dates=("2025-07-01", "2025-07-02"), budget=1, interests=["맛집"])
+
+        monkeypatch.setattr(nodes, "cached_structured_call", fake_call)
+
+        command = await nodes.collect_info({"user_request": "서울 여행 50만원 궁궐"})
+
+        assert calls == ["collect_info"]
+        assert command.update == {
+            "dates": ("2025-07-01", "2025-07-02"),
+            "budget": 500000,
+            "interests": ["역사"],
+        }
+
+    async def test_cached_extraction_is_keyed_by_date(self, monkeypatch):
+        """Test the same relative request on another day misses the LLM cache."""
+        from app.ai.agents import llm_cache
+        from app.ai.agents.planner import nodes
+        from app.ai.agents.planner.models import TravelInfoExtraction
+
+        calls = []
+
+        async def fake_invoke(task, schema, messages, temperature=0.7, deadline=None):
+            calls.append(messages[-1].content)
+            return TravelInfoExtraction(dates=None, budget=None, interests=None)
+
+        monkeypatch.setattr(llm_cache, "invoke_structured", fake_invoke)
+        cache = llm_cache.LLMResponseCache()
+        monkeypatch.setattr(llm_cache, "get_llm_cache", lambda: cache)
+        monkeypatch.setattr(nodes.settings, "COLLECT_INFO_FAST_PATH_ENABLED", False)
+
+        for today in (TODAY, TODAY, TODAY + timedelta(days=1)):
+            monkeypatch.setattr(nodes, "seoul_today", lambda today=today: today)
+            await nodes.collect_info({"user_request": "내일부터 2박3일"})
+
+        assert len(calls) == 2
+        assert TODAY.isoformat() in calls[0]
+        assert (TODAY + timedelta(days=1)).isoformat() in calls[1]
@@ -0,0 +1,147 @@
+"""Test deterministic route optimization of planner itineraries."""
+
+import time
+
+
+def _venue(name, latitude, longitude):
+    return {"name": name, "latitude": latitude, "longitude": longitude}
+
+
+def _activity(time_str, name, venue_type="attraction", duration=60):
+    return {
+        "time": time_str,
+        "venue_name": name,
+        "venue_type": venue_type,
+        "duration_minutes": duration,
+        "estimated_cost": 0,
+        "notes": "",
+    }
+
+
+VENUES = [
+    _venue("경복궁", 37.5796, 126.9770),
+    _venue("코엑스", 37.5116, 127.0595),
+    _venue("창덕궁", 37.5794, 126.9910),
+    _venue("봉은사", 37.5150, 127.0573),
+    _venue("삼청동 식당", 37.5830, 126.9820),
+]
+
+
+class TestOptimizeDay:
+    """Test optimize_day."""
+
+    def test_removes_backtracking_between_neighbourhoods(self):
+        """Test zig-zag order across the river is untangled."""
+        from app.ai.agents.planner.route_optimizer import VenueLocator, optimize_day
+
+        activities = [
+            _activity("09:00", "경복궁"),
+            _activity("10:30", "코엑스"),
+            _activity("12:00", "창덕궁"),
+            _activity("13:30", "봉은사"),
+        ]
+
+        result, before, after = optimize_day(activities, VenueLocator(VENUES))
+
+        names = [a["venue_name"] for a in result]
+        assert after < before
+        assert abs(names.index("경복궁") - names.index("창덕궁")) == 1
+        assert abs(names.index("코엑스") - names.index("봉은사")) == 1
+
+    def test_meal_anchor_keeps_position_and_window(self):
+        """Test restaurants stay in place and never start earlier than planned."""
+        from app.ai.agents.planner.route_optimizer import VenueLocator, optimize_day
+
+        activities = [
+            _activity("09:00", "코엑스"),
+            _activity("10:30", "경복궁"),
+            _activity("12:00", "삼청동 식당", venue_type="restaurant"),
+            _activity("13:30", "봉은사"),
+        ]
+
+        result, _, _ = optimize_day(activities, VenueLocator(VENUES))
+
+        assert result[2]["venue_name"] == "삼청동 식당"
+        assert result[2]["time"] >= "12:00"
+        assert {a["venue_name"] for a in result[:2]} == {"코엑스", "경복궁"}
+
+    def test_times_are_restamped_in_order(self):
+        """Test start times increase and include duration plus travel."""
+        from app.ai.agents.planner.route_optimizer import VenueLocator, optimize_day
+
+        activities = [
+            _activity("09:00", "경복궁", duration=90),
+            _activity("09:30", "창덕궁"),
+        ]
+
+        result, _, _ = optimize_day(activities, VenueLocator(VENUES))
+
+        assert result[0]["time"] == "09:00"
+        assert result[1]["time"] >= "10:30"
+
+    def test_unknown_venues_stay_in_place(self):
+        """Test activities without coordinates act as anchors."""
+        from app.ai.agents.planner.route_optimizer import VenueLocator, optimize_day
+
+        activities = [
+            _activity("09:00", "경복궁"),
+            _activity("10:30", "알 수 없는 장소"),
+            _activity("12:00", "코엑스"),
+        ]
+
+        result, _, _ = optimize_day(activities, VenueLocator(VENUES))
+
+        assert [a["venue_name"] for a in result] == ["경복궁", "알 수 없는 장소", "코엑스"]
+
+    def test_runs_under_a_millisecond_per_day(self):
+        """Test optimization of a typical day stays sub-millisecond on average."""
+        from app.ai.agents.planner.route_optimizer import VenueLocator, optimize_day
+
+        locator = VenueLocator(VENUES)
+        activities = [
+            _activity("09:00", "경복궁"),
+            _activity("10:30", "코엑스"),
+            _activity("12:00", "삼청동 식당", venue_type="restaurant"),
+            _activity("13:30", "창덕궁"),
+            _activity("15:00", "봉은사"),
+        ]
+
+        optimize_day(activities, locator)
+        start = time.perf_counter()
+        for _ in range(100):
+            optimize_day(activities, locator)
+        elapsed_ms = (time.perf_counter() - start) * 1000 / 100
+
+        assert elapsed_ms < 1.0
+
+
+class TestOptimizeItinerary:
+    """Test optimize_itinerary."""
+
+    def test_reports_distance_saved(self):
+        """Test route statistics are aggregated across days."""
+        from app.ai.agents.planner.route_optimizer import optimize_itinerary
+
+        plan = {
+            "title": "서울 여행",
+            "itinerary": [
+                {
+                    "day": 1,
+                    "date": "2025-07-01",
+                    "activities": [
+                        _activity("09:00", "경복궁"),
+                        _activity("10:30", "코엑스"),
+                        _activity("12:00", "창덕궁"),
+                        _activity("13:30", "봉은사"),
+                    ],
+                    "daily_cost": 0,
+                }
+            ],
+        }
+
+        optimized, stats = optimize_itinerary(plan, VENUES)
+
+        assert stats["saved_km"] > 0
+        assert stats["per_day"][0]["day"] == 1
+        assert len(optimized["itinerary"][0]["activities"]) == 4
+        assert plan["itinerary"][0]["activities"][1]["venue_name"] == "코엑스"
@@ -0,0 +1,189 @@
+"""Test the deterministic day scheduler."""
+
+
+def _venue(name, latitude, longitude, **extra):
+    return {"name": name, "latitude": latitude, "longitude": longitude, **extra}
+
+
+BUCKETS = [
+    {
+        "day": 1,
+        "date": "2025-07-01",
+        "attractions": [
+            _venue("경복궁", 37.5796, 126.9770, district="종로구"),
+            _venue("국립민속박물관", 37.5815, 126.9790, district="종로구"),
+            _venue("창덕궁", 37.5794, 126.9910, district="종로구"),
+        ],
+        "restaurants": [
+            _venue("삼청동 식당", 37.5830, 126.9820),
+            _venue("인사동 식당", 37.5740, 126.9850),
+        ],
+    },
+    {
+        "day": 2,
+        "date": "2025-07-02",
+        "attractions": [
+            _venue("N서울타워", 37.5512, 126.9882, district="용산구"),
+            _venue("전쟁기념관", 37.5365, 126.9772, district="용산구"),
+        ],
+        "restaurants": [_venue("이태원 식당", 37.5345, 126.9940)],
+    },
+]
+HOTELS = [_venue("명동 호텔", 37.5630, 126.9850)]
+
+
+def _minutes(time_str):
+    hours, minutes = time_str.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+class TestAttractionProfile:
+    """Test attraction_profile."""
+
+    def test_matches_name_keywords(self):
+        """Test category profiles are inferred from names."""
+        from app.ai.agents.planner.scheduler import attraction_profile
+
+        assert attraction_profile("전쟁기념관").kind == "museum"
+        assert attraction_profile("남산&N서울타워").kind == "observatory"
+        assert attraction_profile("길상사").kind == "religious"
+        assert attraction_profile("새남터").kind == "landmark"
+
+
+class TestScheduleTrip:
+    """Test schedule_trip."""
+
+    def test_builds_valid_travel_plan(self):
+        """Test output validates as a TravelPlan with consistent totals."""
+        from app.ai.agents.planner.models import TravelPlan
+        from app.ai.agents.planner.scheduler import schedule_trip
+
+        plan = schedule_trip(BUCKETS, HOTELS, budget=500000, num_days=2)
+
+        travel_plan = TravelPlan.model_validate(plan)
+        assert travel_plan.total_days == 2
+        assert [d.date for d in travel_plan.itinerary] == ["2025-07-01", "2025-07-02"]
+        for day in plan["itinerary"]:
+            assert day["daily_cost"] == sum(a["estimated_cost"] for a in day["activities"])
+        nights = plan["accommodation"]["total_nights"]
+        assert nights == 1
+        assert plan["total_cost"] == (
+            sum(d["daily_cost"] for d in plan["itinerary"]) + plan["accommodation"]["cost_per_night"] * nights
+        )
+
+    def test_activities_do_not_overlap(self):
+        """Test each activity starts after the previous one ends."""
+        from app.ai.agents.planner.scheduler import schedule_trip
+
+        plan = schedule_trip(BUCKETS, HOTELS, budget=500000, num_days=2)
+
+        for day in plan["itinerary"]:
+            activities = day["activities"]
+            for previous, current in zip(activities, activities[1:], strict=False):
+                assert _minutes(current["time"]) >= _minutes(previous["time"]) + previous["duration_minutes"]
+
+    def test_meals_fall_inside_meal_windows(self):
+        """Test lunch and dinner start within their windows."""
+        from app.ai.agents.planner.scheduler import MEALS, schedule_trip
+
+        plan = schedule_trip(BUCKETS, HOTELS, budget=500000, num_days=2)
+
+        day_one = [a for a in plan["itinerary"][0]["activities"] if a["venue_type"] == "restaurant"]
+        assert len(day_one) == len(MEALS)
+        for meal, activity in zip(MEALS, day_one, strict=True):
+            assert meal.earliest <= _minutes(activity["time"]) <= meal.latest
+
+    def test_full_days_have_lunch_and_dinner(self):
+        """Test attractions leave time to reach a restaurant before the lunch window closes."""
+        from app.ai.agents.planner.scheduler import schedule_trip
+        from app.ai.agents.planner.validator import check_plan
+
+        buckets = [{
+            "day": 1,
+            "date": "2025-07-01",
+            "attractions": [
+                _venue("경복궁", 37.5796, 126.9770),
+                _venue("국립민속박물관", 37.5815, 126.9790),
+                _venue("북촌한옥마을", 37.5826, 126.9836),
+                _venue("N서울타워", 37.5512, 126.9882),
+            ],
+            "restaurants": [_venue("토속촌", 37.5779, 126.9714), _venue("명동교자", 37.5626, 126.9856)],
+        }]
+
+        plan = schedule_trip(buckets, [], budget=0, num_days=1)
+
+        meals = [a["notes"] for a in plan["itinerary"][0]["activities"] if a["venue_type"] == "restaurant"]
+        assert meals == ["점심 식사", "저녁 식사"]
+        for scheduled in (plan, schedule_trip(BUCKETS, HOTELS, budget=500000, num_days=2)):
+            assert [i for i in check_plan(scheduled) if i.code == "missing_meal"] == []
+
+    def test_museums_respect_opening_hours(self):
+        """Test museum visits start after opening and end before closing."""
+        from app.ai.agents.planner.scheduler import attraction_profile, schedule_trip
+
+        plan = schedule_trip(BUCKETS, HOTELS, budget=500000, num_days=2)
+
+        for day in plan["itinerary"]:
+            for activity in day["activities"]:
+                if activity["venue_type"] != "attraction":
+                    continue
+                profile = attraction_profile(activity["venue_name"])
+                start = _minutes(activity["time"])
+                assert profile.opens <= start
+                assert start + activity["duration_minutes"] <= profile.closes
+
+    def test_uses_the_accommodation_price_when_known(self):
+        """Test the nightly rate comes from the candidate, never from the budget."""
+        from app.ai.agents.planner.scheduler import schedule_trip
+        from app.ai.agents.planner.validator import check_plan
+
+        priced = schedule_trip(BUCKETS, [{**HOTELS[0], "cost_per_night": 70000}], budget=500000, num_days=2)
+        unpriced = schedule_trip(BUCKETS, HOTELS, budget=80000, num_days=2)
+
+        assert priced["accommodation"]["cost_per_night"] == 70000
+        assert unpriced["accommodation"]["cost_per_night"] == 0
+        assert unpriced["total_cost"] == sum(d["daily_cost"] for d in unpriced["itinerary"])
+        assert "budget_exceeded" not in {i.code for i in check_plan(unpriced, budget=80000)}
+
+    def test_breakfast_at_hotel_from_day_two(self):
+        """Test the traveller wakes up at the accommodation after day 1."""
+        from app.ai.agents.planner.scheduler import schedule_trip
+
+        plan = schedule_trip(BUCKETS, HOTELS, budget=500000, num_days=2)
+
+        assert plan["itinerary"][0]["activities"][-1]["venue_name"] == "명동 호텔"
+        assert plan["itinerary"][1]["activities"][0]["venue_name"] == "명동 호텔"
+
+    def test_is_deterministic(self):
+        """Test identical inputs give identical plans."""
+        from app.ai.agents.planner.scheduler import schedule_trip
+
+        first = schedule_trip(BUCKETS, HOTELS, budget=500000, num_days=2)
+        second = schedule_trip(BUCKETS, HOTELS, budget=500000, num_days=2)
+
+        assert first == second
+
+
+class TestApplyNarrative:
+    """Test apply_narrative."""
+
+    def test_only_prose_is_changed(self):
+        """Test themes and notes are merged without touching the schedule."""
+        from app.ai.agents.planner.scheduler import apply_narrative, schedule_trip
+
+        plan = schedule_trip(BUCKETS, HOTELS, budget=500000, num_days=2)
+        narrative = {
+            "title": "궁궐과 남산",
+            "summary": "요약",
+            "days": [{"day": 1, "theme": "궁궐 산책", "notes": ["한복 추천"]}],
+        }
+
+        result = apply_narrative(plan, narrative)
+
+        assert result["title"] == "궁궐과 남산"
+        assert result["itinerary"][0]["theme"] == "궁궐 산책"
+        assert result["itinerary"][0]["activities"][0]["notes"] == "한복 추천"
+        assert result["itinerary"][1]["theme"] == plan["itinerary"][1]["theme"]
+        assert [a["time"] for a in result["itinerary"][0]["activities"]] == [
+            a["time"] for a in plan["itinerary"][0]["activities"]
+        ]
@@ -0,0 +1,141 @@
+"""Test streamed plan generation events."""
+
+import json
+
+import pytest
+
+PLAN = {
+    "title": "서울 2일 여행",
+    "total_days": 2,
+    "total_cost": 6000,
+    "itinerary": [
+        {
+            "day": day,
+            "date": f"2025-07-0{day}",
+            "theme": "궁궐 {산책}",
+            "activities": [
+                {
+                    "time": "10:00",
+                    "venue_name": "경복궁",
+                    "venue_type": "attraction",
+                    "duration_minutes": 90,
+                    "estimated_cost": 3000,
+                    "notes": "\"한복\" 착용 시 무료 [입장]",
+                }
+            ],
+            "daily_cost": 3000,
+        }
+        for day in (1, 2)
+    ],
+    "accommodation": {"name": "명동 호텔", "cost_per_night": 0, "total_nights": 1},
+    "summary": "",
+}
+
+
+def _fake_planner_graph():
+    """Planner-shaped graph: fetch_venues emits attractions, generate_plan streams an LLM reply."""
+    from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+    from langchain_core.messages import AIMessage
+    from langgraph.graph import START, StateGraph
+    from langgraph.types import Command
+
+    from app.ai.agents.planner.state import PlanningState
+    from app.ai.agents.planner.streaming import attraction_summary, emit
+
+    async def fetch_venues(state):
+        emit("attractions", attraction_summary([{"id": 1, "name": "경복궁", "description": "궁궐"}]))
+        return Command(update={"attractions": []}, goto="generate_plan")
+
+    async def generate_plan(state):
+        llm = GenericFakeChatModel(messages=iter([AIMessage(content=json.dumps(PLAN, ensure_ascii=False))]))
+        reply = await llm.ainvoke("plan")
+        return {"travel_plan": json.loads(reply.content)}
+
+    graph = StateGraph(PlanningState)
+    graph.add_node("fetch_venues", fetch_venues)
+    graph.add_node("generate_plan", generate_plan)
+    graph.add_edge(START, "fetch_venues")
+    return graph.compile()
+
+
+class TestItineraryStreamParser:
+    """Test incremental extraction of itinerary days."""
+
+    def test_days_are_emitted_when_they_close(self):
+        """Test each day is returned once, complete, as soon as its object closes."""
+        from app.ai.agents.planner.streaming import ItineraryStreamParser
+
+        text = json.dumps(PLAN, ensure_ascii=False)
+        second_day_end = text.index('"accommodation"')
+        parser = ItineraryStreamParser()
+
+        emitted = []
+        for position, char in enumerate(text):
+            for day in parser.feed(char):
+                emitted.append((position, day))
+
+        assert [day for _, day in emitted] == PLAN["itinerary"]
+        assert emitted[0][0] < text.index('"day": 2')
+        assert emitted[1][0] < second_day_end
+
+    def test_ignores_other_schemas(self):
+        """Test JSON without an itinerary yields nothing."""
+        from app.ai.agents.planner.streaming import ItineraryStreamParser
+
+        parser = ItineraryStreamParser()
+
+        assert parser.feed('{"title": "t", "days": [{"day": 1, "theme": "x"}]}') == []
+
+
+class TestPlanEventStream:
+    """Test translation of astream chunks into client events."""
+
+    def test_translates_tasks_and_deduplicates_days(self):
+        """Test node progress events and one day event per day number."""
+        from app.ai.agents.planner.streaming import PlanEventStream
+
+        stream = PlanEventStream()
+        day = PLAN["itinerary"][0]
+
+        assert stream.translate("tasks", {"name": "fetch_venues", "input": {}}) == [
+            ("progress", {"node": "fetch_venues", "status": "started"})
+        ]
+        assert stream.translate("tasks", {"name": "fetch_venues", "error": None, "result": {}}) == [
+            ("progress", {"node": "fetch_venues", "status": "completed"})
+        ]
+        assert stream.translate("custom", {"event": "day", "data": day}) == [("day", day)]
+        assert stream.translate("custom", {"event": "day", "data": day}) == []
+        assert stream.translate("values", {"travel_plan": PLAN}) == []
+        assert stream.final_state == {"travel_plan": PLAN}
+
+    def test_emit_outside_graph_is_noop(self):
+        """Test nodes can emit when run directly (e.g. in unit tests)."""
+        from app.ai.agents.planner.streaming import emit
+
+        emit("day", {"day": 1})
+
+
+class TestStreamInitialPlan:
+    """Test AIService.stream_initial_plan."""
+
+    @pytest.fixture
+    def fake_graph(self, monkeypatch):
+        from app.ai.agents import planner
+        from app.config import settings
+
+        monkeypatch.setattr(settings, "PLAN_CACHE_ENABLED", False)
+        monkeypatch.setattr(planner, "planner_graph", _fake_planner_graph())
+
+    async def test_streams_progress_then_matches_non_streaming_plan(self, fake_graph):
+        """Test attractions and days arrive before the final plan, which equals generate_initial_plan."""
+        from app.ai.ai_service import ai_service
+
+        args = ("2일 서울 여행", ("2025-07-01", "2025-07-02"), 100000, ["역사"])
+        events = [event async for event in ai_service.stream_initial_plan(*args)]
+        names = [name for name, _ in events]
+
+        assert names[0] == "progress"
+        assert names.index("attractions") < names.index("day") < names.index("plan")
+        assert [data for name, data in events if name == "day"] == PLAN["itinerary"]
+        assert events[-1] == ("plan", {"plan": await ai_service.generate_initial_plan(*args)})
+        assert events[-1][1]["plan"] == PLAN
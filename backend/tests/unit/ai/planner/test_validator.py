@@ -0,0 +1,307 @@
+"""Test the rule-based plan validator and repairs."""
+
+import copy
+import time
+
+
+def _activity(time_str, name, cost=0, duration=60, venue_type="attraction"):
+    return {
+        "time": time_str,
+        "venue_name": name,
+        "venue_type": venue_type,
+        "duration_minutes": duration,
+        "estimated_cost": cost,
+        "notes": "",
+    }
+
+
+def _plan():
+    return {
+        "title": "서울 여행",
+        "total_days": 2,
+        "total_cost": 240000,
+        "itinerary": [
+            {
+                "day": 1,
+                "date": "2025-07-01",
+                "theme": "궁궐",
+                "activities": [
+                    _activity("10:00", "경복궁", cost=3000, duration=90),
+                    _activity("12:00", "삼청동 식당", cost=15000, venue_type="restaurant"),
+                ],
+                "daily_cost": 18000,
+            },
+            {
+                "day": 2,
+                "date": "2025-07-02",
+                "theme": "남산",
+                "activities": [
+                    _activity("10:00", "N서울타워", cost=21000, duration=90),
+                    _activity("12:00", "이태원 식당", cost=15000, venue_type="restaurant"),
+                ],
+                "daily_cost": 36000,
+            },
+        ],
+        "accommodation": {"name": "명동 호텔", "cost_per_night": 186000, "total_nights": 1},
+        "summary": "",
+    }
+
+
+class TestCheckPlan:
+    """Test check_plan."""
+
+    def test_valid_plan_has_no_issues(self):
+        """Test a consistent plan passes every rule."""
+        from app.ai.agents.planner.validator import check_plan
+
+        assert check_plan(_plan(), budget=300000, num_days=2, start_date="2025-07-01") == []
+
+    def test_detects_each_rule(self):
+        """Test overlaps, placeholder dates, sums and budget are flagged."""
+        from app.ai.agents.planner.validator import check_plan
+
+        plan = _plan()
+        plan["itinerary"][0]["activities"][1]["time"] = "11:00"  # 30 min overlap
+        plan["itinerary"][1]["date"] = "YYYY-MM-DD"
+        plan["itinerary"][1]["daily_cost"] = 1
+        plan["total_days"] = 3
+
+        codes = {issue.code for issue in check_plan(plan, budget=100000, num_days=2, start_date="2025-07-01")}
+
+        assert codes == {
+            "time_overlap",
+            "placeholder_date",
+            "daily_cost_mismatch",
+            "total_days_mismatch",
+            "total_cost_mismatch",
+            "budget_exceeded",
+        }
+
+    def test_small_overlaps_are_tolerated(self):
+        """Test overlaps up to 10 minutes are acceptable."""
+        from app.ai.agents.planner.validator import check_plan
+
+        plan = _plan()
+        plan["itinerary"][0]["activities"][1]["time"] = "11:25"
+
+        assert check_plan(plan) == []
+
+    def test_empty_day_is_not_fixable(self):
+        """Test empty days require regeneration."""
+        from app.ai.agents.planner.validator import check_plan
+
+        plan = _plan()
+        plan["itinerary"][1]["activities"] = []
+        plan["itinerary"][1]["daily_cost"] = 0
+
+        issues = [i for i in check_plan(plan) if i.code == "empty_day"]
+
+        assert len(issues) == 1
+        assert issues[0].fixable is False
+
+    def test_full_day_without_lunch_is_flagged(self):
+        """Test a day running from morning to evening needs both meals."""
+        from app.ai.agents.planner.validator import check_plan
+
+        plan = _plan()
+        plan["itinerary"][0]["activities"] = [
+            _activity("10:00", "N서울타워", cost=21000, duration=90),
+            _activity("11:55", "경복궁", cost=3000, duration=90),
+            _activity("13:30", "국립민속박물관", duration=90),
+            _activity("17:30", "토속촌", cost=25000, duration=90, venue_type="restaurant"),
+        ]
+
+        issues = [i for i in check_plan(plan) if i.code == "missing_meal"]
+
+        assert [(i.day, i.fixable) for i in issues] == [(1, False)]
+        assert "lunch" in issues[0].message
+
+    def test_runs_in_microseconds(self):
+        """Test validation is far cheaper than an LLM round trip."""
+        from app.ai.agents.planner.validator import check_plan
+
+        plan = _plan()
+        start = time.perf_counter()
+        for _ in range(1000):
+            check_plan(plan, budget=300000, num_days=2, start_date="2025-07-01")
+        per_call_us = (time.perf_counter() - start) * 1e6 / 1000
+
+        assert per_call_us < 500
+
+
+class TestValidateAndRepair:
+    """Test validate_and_repair."""
+
+    def test_repairs_fixable_issues(self):
+        """Test overlaps, dates and sums are repaired without retry."""
+        from app.ai.agents.planner.validator import validate_and_repair
+
+        plan = _plan()
+        plan["itinerary"][0]["activities"][1]["time"] = "11:00"
+        plan["itinerary"][1]["date"] = "YYYY-MM-DD"
+        plan["itinerary"][1]["daily_cost"] = 1
+        plan["total_days"] = 5
+        original = copy.deepcopy(plan)
+
+        repaired, issues, remaining = validate_and_repair(
+            plan, budget=300000, num_days=2, start_date="2025-07-01"
+        )
+
+        assert issues and remaining == []
+        assert repaired["itinerary"][0]["activities"][1]["time"] == "11:30"
+        assert repaired["itinerary"][1]["date"] == "2025-07-02"
+        assert repaired["itinerary"][1]["daily_cost"] == 36000
+        assert repaired["total_days"] == 2
+        assert plan == original
+
+    def test_fits_budget_by_dropping_paid_attractions(self):
+        """Test budget overruns are repaired before asking for a retry."""
+        from app.ai.agents.planner.validator import validate_and_repair
+
+        repaired, _, remaining = validate_and_repair(_plan(), budget=190000)
+
+        assert remaining == []
+        assert repaired["total_cost"] == 219000
+        assert "N서울타워" not in [a["venue_name"] for a in repaired["itinerary"][1]["activities"]]
+
+    def test_never_reprices_accommodation(self):
+        """Test an overrun caused by lodging is left for a retry instead of changing the hotel's price."""
+        from app.ai.agents.planner.validator import validate_and_repair
+
+        repaired, _, remaining = validate_and_repair(_plan(), budget=150000)
+
+        assert [i.code for i in remaining] == ["budget_exceeded"]
+        assert repaired["accommodation"]["cost_per_night"] == 186000
+
+    def test_reports_unfixable_issues(self):
+        """Test missing days are left for an LLM retry."""
+        from app.ai.agents.planner.validator import validate_and_repair
+
+        _, _, remaining = validate_and_repair(_plan(), num_days=3, start_date="2025-07-01")
+
+        assert [i.code for i in remaining] == ["missing_days"]
+
+
+class TestValidatePlanRetries:
+    """Test which unfixable issues validate_plan retries."""
+
+    async def test_keeps_scheduled_plan_over_budget(self):
+        """Test a scheduled plan over budget from real prices is not rewritten by the LLM."""
+        from app.ai.agents.planner import nodes
+
+        command = await nodes.validate_plan({
+            "travel_plan": _plan(),
+            "plan_mode": "scheduled",
+            "dates": ("2025-07-01", "2025-07-02"),
+            "budget": 150000,
+            "attempts": 1,
+        })
+
+        assert command.goto == "__end__"
+        assert command.update["travel_plan"]["accommodation"]["cost_per_night"] == 186000
+        assert "errors" not in command.update
+
+    async def test_retries_llm_plan_over_budget(self):
+        """Test an LLM plan still over budget goes back to generate_plan."""
+        from app.ai.agents.planner import nodes
+
+        command = await nodes.validate_plan({
+            "travel_plan": _plan(),
+            "plan_mode": "llm",
+            "dates": ("2025-07-01", "2025-07-02"),
+            "budget": 150000,
+            "attempts": 1,
+        })
+
+        assert command.goto == "generate_plan"
+        assert command.update["validation_issues"]
+
+
+class TestTravelTimes:
+    """Test overlap checks that include live travel minutes."""
+
+    def test_travel_time_turns_a_tight_gap_into_an_overlap(self):
+        """Test a gap shorter than the travel time is flagged and repaired."""
+        from app.ai.agents.planner.validator import check_plan, validate_and_repair
+
+        plan = _plan()
+        travel = {(1, 1): 50}  # 경복궁 ends 11:30, 50 min to 삼청동 식당 at 12:00
+
+        assert check_plan(plan) == []
+        assert [i.code for i in check_plan(plan, travel_minutes=travel)] == ["time_overlap"]
+
+        repaired, _, remaining = validate_and_repair(plan, travel_minutes=travel)
+
+        assert remaining == []
+        assert repaired["itinerary"][0]["activities"][1]["time"] == "12:20"
+        assert repaired["itinerary"][1]["activities"][1]["time"] == "12:00"
+
+    async def test_validate_plan_batches_live_legs(self, monkeypatch):
+        """Test validate_plan resolves all consecutive legs in one routing batch."""
+        from app.ai.agents.planner import nodes
+        from app.routing import client as routing_client
+
+        batches = []
+
+        class FakeClient:
+            class backend:
+                name = "fake"
+
+            async def batch(self, legs):
+                batches.append(legs)
+                return [50] * len(legs)
+
+        monkeypatch.setattr(routing_client, "_routing_client", FakeClient())
+        monkeypatch.setattr(nodes.settings, "PLANNER_LIVE_TRAVEL_TIMES", True)
+        venues = [
+            {"name": name, "latitude": 37.5 + i / 100, "longitude": 127.0}
+            for i, name in enumerate(("경복궁", "삼청동 식당", "N서울타워", "이태원 식당"))
+        ]
+
+        command = await nodes.validate_plan({
+            "travel_plan": _plan(),
+            "attractions": venues[::2],
+            "restaurants": venues[1::2],
+            "dates": ("2025-07-01", "2025-07-02"),
+            "budget": 300000,
+        })
+
+        assert len(batches) == 1 and len(batches[0]) == 2
+        assert command.update["travel_plan"]["itinerary"][0]["activities"][1]["time"] == "12:20"
+
+    async def test_validate_plan_uses_travel_time_matrix(self, monkeypatch):
+        """Test validate_plan reads the matrix by default and makes no routing calls."""
+        import numpy as np
+
+        from app.ai.agents.planner import nodes
+        from app.routing import client as routing_client
+        from app.transit import matrix as transit_matrix
+
+        class FailingClient:
+            async def batch(self, legs):
+                raise AssertionError("live routing is opt-in")
+
+        monkeypatch.setattr(routing_client, "_routing_client", FailingClient())
+        monkeypatch.setattr(transit_matrix, "_matrix", transit_matrix.TravelTimeMatrix(
+            [1, 2], np.array([[0, 50], [50, 0]], dtype=np.uint16),
+        ))
+        monkeypatch.setattr(transit_matrix, "_loaded", True)
+        attractions = [
+            {"id": 1, "name": "경복궁 (Gyeongbokgung)", "latitude": 37.5796, "longitude": 126.9770},
+            {"id": 3, "name": "N서울타워", "latitude": 37.5512, "longitude": 126.9882},
+        ]
+        restaurants = [
+            {"id": 2, "name": "삼청동 식당", "latitude": 37.5800, "longitude": 126.9810},
+            {"id": 4, "name": "이태원 식당", "latitude": 37.5345, "longitude": 126.9946},
+        ]
+
+        command = await nodes.validate_plan({
+            "travel_plan": _plan(),
+            "attractions": attractions,
+            "restaurants": restaurants,
+            "dates": ("2025-07-01", "2025-07-02"),
+            "budget": 300000,
+        })
+
+        assert command.update["travel_plan"]["itinerary"][0]["activities"][1]["time"] == "12:20"
+        assert command.update["travel_plan"]["itinerary"][1]["activities"][1]["time"] == "12:00"
@@ -0,0 +1 @@
+"""Reviewer agent unit tests."""
@@ -0,0 +1,155 @@
+"""Test local feedback classification and the parse_feedback fast path."""
+
+
+class TestClassifyByRules:
+    """Test keyword/regex rules."""
+
+    def test_clear_approvals(self):
+        """Test short approvals are classified with high confidence."""
+        from app.ai.agents.reviewer.feedback_classifier import CLEAR_CONFIDENCE, classify_by_rules
+
+        for text in ("좋아요", "이대로 확정", "완벽해요 감사합니다", "Looks good!"):
+            result = classify_by_rules(text)
+            assert result.parsing.feedback_type == "approve", text
+            assert result.confidence == CLEAR_CONFIDENCE
+
+    def test_negated_approval_is_reject(self):
+        """Test "안 좋아요" is not an approval."""
+        from app.ai.agents.reviewer.feedback_classifier import classify_by_rules
+
+        assert classify_by_rules("안 좋아요").parsing.feedback_type == "reject"
+        assert classify_by_rules("전부 다시 짜주세요").parsing.feedback_type == "reject"
+
+    def test_negated_approval_words_are_left_to_llm(self):
+        """Test approval keywords under a negation cue are never confident approvals."""
+        from app.ai.agents.reviewer.feedback_classifier import classify_by_rules, classify_feedback
+
+        for text in (
+            "확정하지 마세요",
+            "아직 확정 안 할래요",
+            "don't confirm yet",
+            "not perfect",
+            "만족스럽지 않아요",
+            "이대로는 안 돼요",
+            "최고는 아니네요",
+        ):
+            assert classify_by_rules(text).parsing.feedback_type != "approve", text
+            assert classify_feedback(text).confidence < 0.8, text
+
+    def test_approval_words_in_requests_and_questions_are_not_clear(self):
+        """Test approval words inside a request, question or plan topic are left to the LLM."""
+        from app.ai.agents.reviewer.feedback_classifier import (
+            CLEAR_CONFIDENCE,
+            classify_by_rules,
+            classify_feedback,
+        )
+
+        for text in (
+            "괜찮은 식당으로 해주세요",
+            "저는 매운 음식을 좋아해요",
+            "okay, what about vegetarian food?",
+            "확정하기 전에 궁금한데 이동시간은?",
+        ):
+            result = classify_by_rules(text)
+            assert not (result.parsing.feedback_type == "approve" and result.confidence == CLEAR_CONFIDENCE), text
+            assert classify_feedback(text).confidence < 0.8, text
+
+        for text in ("좋아!", "이대로 확정해 주세요", "좋아 이대로 해줘"):
+            assert classify_by_rules(text).confidence == CLEAR_CONFIDENCE, text
+
+    def test_modify_with_category_and_day(self):
+        """Test category and target day are extracted."""
+        from app.ai.agents.reviewer.feedback_classifier import (
+            CATEGORY_CONFIDENCE,
+            classify_by_rules,
+        )
+
+        result = classify_by_rules("2일차 점심 식당 바꿔주세요")
+
+        assert result.parsing.feedback_type == "modify"
+        assert result.parsing.modification_type == "restaurant"
+        assert result.parsing.target_section == "day_2"
+        assert result.confidence == CATEGORY_CONFIDENCE
+
+    def test_last_day_and_section_targets(self):
+        """Test "마지막 날" uses the trip length; accommodation targets its section."""
+        from app.ai.agents.reviewer.feedback_classifier import classify_by_rules
+
+        assert classify_by_rules("마지막 날 박물관 대신 공원", total_days=3).parsing.target_section == "day_3"
+        assert classify_by_rules("숙소 바꿔주세요").parsing.target_section == "accommodation"
+
+    def test_mixed_signals_have_low_confidence(self):
+        """Test ambiguous feedback stays below the LLM threshold."""
+        from app.ai.agents.reviewer.feedback_classifier import classify_by_rules
+
+        assert classify_by_rules("좋은데 점심은 별로").confidence < 0.8
+        assert classify_by_rules("숙소를 좀 더 저렴한 곳으로").parsing.modification_type == "general"
+        assert classify_by_rules("흠 모르겠어요").confidence == 0.0
+
+
+class TestClassifyFeedback:
+    """Test rules combined with the local n-gram model."""
+
+    def test_model_classifies_feedback_without_keywords(self):
+        """Test the model settles paraphrases no rule matches."""
+        from app.ai.agents.reviewer.feedback_classifier import classify_feedback
+
+        result = classify_feedback("이 일정으로 갈게요")
+
+        assert result.source == "model"
+        assert result.parsing.feedback_type == "approve"
+        assert result.confidence >= 0.8
+
+    def test_model_can_be_disabled(self):
+        """Test use_model=False returns the rule result."""
+        from app.ai.agents.reviewer.feedback_classifier import classify_feedback
+
+        result = classify_feedback("이 일정으로 갈게요", use_model=False)
+
+        assert result.source == "rules"
+        assert result.confidence == 0.0
+
+    def test_unrelated_text_is_not_confident(self):
+        """Test text unlike any example is left for the LLM."""
+        from app.ai.agents.reviewer.feedback_classifier import classify_feedback
+
+        assert classify_feedback("흠 모르겠어요").confidence < 0.8
+
+
+class TestParseFeedbackFastPath:
+    """Test parse_feedback skips the LLM for confident local results."""
+
+    async def test_approval_skips_llm(self, monkeypatch):
+        """Test an approval ends the graph without an LLM call."""
+        from app.ai.agents.reviewer import nodes
+
+        async def fail(*args, **kwargs):
+            raise AssertionError("LLM should not be called")
+
+        monkeypatch.setattr(nodes, "cached_structured_call", fail)
+
+        command = await nodes.parse_feedback({"original_plan": {"total_days": 2}, "user_feedback": "이대로 확정"})
+
+        assert command.update["feedback_type"] == "approve"
+        assert command.goto == "__end__"
+
+    async def test_uncertain_feedback_uses_llm(self, monkeypatch):
+        """Test low-confidence feedback is parsed by the LLM."""
+        from app.ai.agents.reviewer import nodes
+        from app.ai.agents.reviewer.models import FeedbackParsing
+
+        calls = []
+
+        async def fake_call(task, schema, messages, temperature=0, cache=None, deadline=None):
+            calls.append(task)
+            return FeedbackParsing(
+                feedback_type="modify", target_section="day_1", modification_type="attraction", reasoning="LLM"
+            )
+
+        monkeypatch.setattr(nodes, "cached_structured_call", fake_call)
+
+        command = await nodes.parse_feedback({"original_plan": {"total_days": 2}, "user_feedback": "흠 모르겠어요"})
+
+        assert calls == ["parse_feedback"]
+        assert command.update["modification_type"] == "attraction"
+        assert command.goto == "fetch_context"
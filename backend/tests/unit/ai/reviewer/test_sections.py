@@ -0,0 +1,138 @@
+"""Test section-scoped plan modification."""
+
+
+def _activity(time, name, venue_type, cost, duration=60):
+    return {
+        "time": time,
+        "venue_name": name,
+        "venue_type": venue_type,
+        "duration_minutes": duration,
+        "estimated_cost": cost,
+        "notes": "",
+    }
+
+
+PLAN = {
+    "title": "서울 2일 여행",
+    "total_days": 2,
+    "total_cost": 213000,
+    "summary": "궁궐과 시장",
+    "itinerary": [
+        {
+            "day": 1,
+            "date": "2025-07-01",
+            "theme": "궁궐",
+            "activities": [_activity("10:00", "경복궁", "attraction", 3000), _activity("12:00", "삼청동 식당", "restaurant", 15000)],
+            "daily_cost": 18000,
+        },
+        {
+            "day": 2,
+            "date": "2025-07-02",
+            "theme": "시장",
+            "activities": [_activity("10:00", "광장시장", "attraction", 0), _activity("12:00", "빈대떡집", "restaurant", 15000)],
+            "daily_cost": 15000,
+        },
+    ],
+    "accommodation": {"name": "명동 호텔", "cost_per_night": 180000, "total_nights": 1},
+}
+
+
+class TestResolveSection:
+    """Test resolve_section."""
+
+    def test_day_and_accommodation_targets(self):
+        """Test existing days and the accommodation are scoped."""
+        from app.ai.agents.reviewer.sections import PlanSection, resolve_section
+
+        assert resolve_section("day_2", "restaurant", PLAN) == PlanSection("day", day=2)
+        assert resolve_section("accommodation", None, PLAN) == PlanSection("accommodation")
+        assert resolve_section(None, "hotel", PLAN) == PlanSection("accommodation")
+
+    def test_whole_plan_edits_are_not_scoped(self):
+        """Test missing days and plan-wide targets fall back to full modification."""
+        from app.ai.agents.reviewer.sections import resolve_section
+
+        assert resolve_section("day_5", "restaurant", PLAN) is None
+        assert resolve_section("budget", "budget", PLAN) is None
+        assert resolve_section(None, "attraction", PLAN) is None
+
+
+class TestMergeSection:
+    """Test merge_section."""
+
+    def test_merges_day_and_recomputes_totals(self):
+        """Test the day is replaced, pinned to its date and totals are recomputed."""
+        from app.ai.agents.reviewer.sections import PlanSection, merge_section
+
+        fragment = {
+            "day": 7,
+            "date": "2030-01-01",
+            "theme": "시장과 맛집",
+            "activities": [_activity("10:00", "광장시장", "attraction", 0), _activity("12:00", "칼국수집", "restaurant", 9000)],
+            "daily_cost": 1,
+        }
+
+        merged = merge_section(PLAN, PlanSection("day", day=2), fragment)
+
+        day = merged["itinerary"][1]
+        assert (day["day"], day["date"]) == (2, "2025-07-02")
+        assert day["activities"][1]["venue_name"] == "칼국수집"
+        assert day["daily_cost"] == 9000
+        assert merged["itinerary"][0] == PLAN["itinerary"][0]
+        assert merged["total_cost"] == 18000 + 9000 + 180000
+        assert PLAN["itinerary"][1]["activities"][1]["venue_name"] == "빈대떡집"
+
+    def test_merges_accommodation_keeping_nights(self):
+        """Test the number of nights comes from the original plan."""
+        from app.ai.agents.reviewer.sections import PlanSection, merge_section
+
+        merged = merge_section(
+            PLAN, PlanSection("accommodation"), {"name": "홍대 게스트하우스", "cost_per_night": 60000, "total_nights": 3}
+        )
+
+        assert merged["accommodation"] == {"name": "홍대 게스트하우스", "cost_per_night": 60000, "total_nights": 1}
+        assert merged["total_cost"] == 18000 + 15000 + 60000
+
+
+class TestModifyPlanScoped:
+    """Test modify_plan sends only the targeted section."""
+
+    async def test_day_edit_regenerates_only_that_day(self, monkeypatch):
+        """Test the LLM sees one day and returns DayItinerary, not the full plan."""
+        from app.ai.agents.planner.models import DayItinerary
+        from app.ai.agents.reviewer import nodes
+
+        calls = []
+
+        async def fake_invoke(task, schema, messages, temperature=0.7, deadline=None):
+            calls.append((task, schema, messages[1].content))
+            return DayItinerary(**{**PLAN["itinerary"][0], "theme": "궁궐 산책"})
+
+        monkeypatch.setattr(nodes, "invoke_structured", fake_invoke)
+
+        command = await nodes.modify_plan({
+            "original_plan": PLAN,
+            "user_feedback": "첫째 날 테마 바꿔줘",
+            "target_section": "day_1",
+            "modification_type": "general",
+        })
+
+        task, schema, prompt = calls[0]
+        assert (task, schema) == ("modify_section", DayItinerary)
+        assert "빈대떡집" in prompt  # other day appears in the outline only
+        assert '"day":2' not in prompt
+        assert command.update["modified_plan"]["itinerary"][0]["theme"] == "궁궐 산책"
+        assert command.update["modified_plan"]["itinerary"][1] == PLAN["itinerary"][1]
+
+
+class TestValidateModification:
+    """Test validate_modification accepts TravelPlan-shaped results."""
+
+    async def test_keeps_modified_plan(self):
+        """Test a plan with an itinerary is not reverted."""
+        from app.ai.agents.reviewer import nodes
+
+        modified = {**PLAN, "title": "수정된 여행"}
+        command = await nodes.validate_modification({"original_plan": PLAN, "modified_plan": modified})
+
+        assert command.update == {}
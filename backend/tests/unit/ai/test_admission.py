@@ -0,0 +1,85 @@
+"""Test token-aware admission control for LLM requests."""
+
+import asyncio
+
+import pytest
+
+
+class TestAdmissionController:
+    """Test AdmissionController."""
+
+    async def test_admits_immediately_within_budget(self):
+        """Test requests under RPM/TPM do not wait."""
+        from app.ai.agents.admission import AdmissionController
+
+        controller = AdmissionController(rpm=10, tpm=1000)
+
+        waits = [await controller.acquire(100) for _ in range(5)]
+
+        assert waits == [0.0] * 5
+        assert controller.snapshot()["window_tokens"] == 500
+
+    async def test_token_budget_queues_until_window_expires(self):
+        """Test a request over TPM waits for older tokens to leave the window."""
+        from app.ai.agents.admission import AdmissionController
+
+        controller = AdmissionController(rpm=10, tpm=1000, window_seconds=0.05)
+        await controller.acquire(800)
+
+        waited = await controller.acquire(400)
+
+        assert waited >= 0.03
+        assert controller.stats.queued == 1
+        assert controller.stats.max_queue_depth == 1
+
+    async def test_interactive_requests_jump_the_queue(self):
+        """Test review calls are admitted before queued bulk generation."""
+        from app.ai.agents.admission import BULK, INTERACTIVE, AdmissionController
+
+        controller = AdmissionController(rpm=1, tpm=10_000, window_seconds=0.03)
+        await controller.acquire(10)
+        order = []
+
+        async def request(name, priority):
+            await controller.acquire(10, priority)
+            order.append(name)
+
+        bulk = [asyncio.create_task(request(f"bulk{i}", BULK)) for i in range(2)]
+        await asyncio.sleep(0)
+        review = asyncio.create_task(request("review", INTERACTIVE))
+        await asyncio.gather(*bulk, review)
+
+        assert order == ["review", "bulk0", "bulk1"]
+        assert controller.snapshot()["wait_seconds_by_priority"][INTERACTIVE] > 0
+
+    async def test_cancelled_waiter_leaves_the_queue(self):
+        """Test a deadline cancelling a queued request frees its place."""
+        from app.ai.agents.admission import AdmissionController
+
+        controller = AdmissionController(rpm=1, tpm=10_000, window_seconds=0.05)
+        await controller.acquire(10)
+
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(controller.acquire(10), timeout=0.01)
+
+        assert controller.queue_depth == 0
+        assert await controller.acquire(10) > 0
+
+    async def test_oversized_request_runs_alone(self):
+        """Test a request larger than TPM is admitted once the window is empty."""
+        from app.ai.agents.admission import AdmissionController
+
+        controller = AdmissionController(rpm=10, tpm=100)
+
+        assert await controller.acquire(500) == 0.0
+
+
+class TestEstimates:
+    """Test token estimates and priorities."""
+
+    def test_estimate_adds_expected_completion(self):
+        """Test completion tokens depend on the task."""
+        from app.ai.agents.admission import OUTPUT_TOKENS, estimate_tokens, task_priority
+
+        assert estimate_tokens("generate_plan", 2000) == 2000 + OUTPUT_TOKENS["generate_plan"]
+        assert task_priority("modify_plan") < task_priority("generate_plan")
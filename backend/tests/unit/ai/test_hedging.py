@@ -0,0 +1,95 @@
+"""Test hedged LLM requests."""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def reset_stats():
+    from app.ai.agents.hedging import hedge_stats
+
+    hedge_stats.reset()
+    yield
+    hedge_stats.reset()
+
+
+def _requests(*delays, fail=()):
+    """Factory returning one coroutine per call with the given delays."""
+    state = {"started": 0, "cancelled": 0}
+
+    def call():
+        index = state["started"]
+        state["started"] += 1
+
+        async def request():
+            try:
+                await asyncio.sleep(delays[index])
+            except asyncio.CancelledError:
+                state["cancelled"] += 1
+                raise
+            if index in fail:
+                raise RuntimeError(f"request {index} failed")
+            return index
+
+        return request()
+
+    return call, state
+
+
+class TestHedgedCall:
+    """Test hedged_call."""
+
+    async def test_fast_call_is_not_hedged(self):
+        """Test no backup is sent when the primary finishes before the delay."""
+        from app.ai.agents.hedging import hedge_stats, hedged_call
+
+        call, state = _requests(0.0, 0.0)
+
+        assert await hedged_call(call, delay=0.1, task="t") == 0
+        assert state["started"] == 1
+        assert hedge_stats.snapshot()["t"]["hedge_rate"] == 0.0
+
+    async def test_backup_wins_and_primary_is_cancelled(self):
+        """Test a slow primary is beaten by the backup and cancelled."""
+        from app.ai.agents.hedging import hedge_stats, hedged_call
+
+        call, state = _requests(1.0, 0.01)
+
+        result = await hedged_call(call, delay=0.02, task="t", tail_estimate=1.0)
+        await asyncio.sleep(0)
+
+        assert result == 1
+        assert state == {"started": 2, "cancelled": 1}
+        stats = hedge_stats.snapshot()["t"]
+        assert stats["hedged"] == 1
+        assert stats["backup_wins"] == 1
+        assert stats["latency_saved_seconds"] > 0.5
+
+    async def test_failed_request_waits_for_the_other(self):
+        """Test the first valid result is used even if the other request errors."""
+        from app.ai.agents.hedging import hedged_call
+
+        call, _ = _requests(0.05, 0.0, fail={1})
+
+        assert await hedged_call(call, delay=0.01, task="t") == 0
+
+    async def test_all_failures_raise(self):
+        """Test the error surfaces when both requests fail."""
+        from app.ai.agents.hedging import hedged_call
+
+        call, _ = _requests(0.03, 0.0, fail={0, 1})
+
+        with pytest.raises(RuntimeError):
+            await hedged_call(call, delay=0.01, task="t")
+
+    async def test_outer_cancellation_cancels_both(self):
+        """Test a deadline timeout cancels the primary and the backup."""
+        from app.ai.agents.hedging import hedged_call
+
+        call, state = _requests(1.0, 1.0)
+
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(hedged_call(call, delay=0.01, task="t"), timeout=0.05)
+        await asyncio.sleep(0)
+        assert state == {"started": 2, "cancelled": 2}
@@ -0,0 +1,186 @@
+"""Test the background job queue, worker pool and resumable graph runs."""
+
+import asyncio
+
+import pytest
+
+
+async def _until_finished(pool, job_id, timeout=5):
+    job = await pool.wait(job_id, timeout)
+    assert job.finished, job
+    return job
+
+
+class TestSqliteJobQueue:
+    """Test the SQLite queue backend."""
+
+    def test_claims_oldest_first_and_persists(self, tmp_path):
+        """Test FIFO claims, and that jobs survive reopening the file."""
+        from app.ai.jobs import Job, SqliteJobQueue
+
+        queue = SqliteJobQueue(tmp_path / "jobs.sqlite3")
+        queue.put(Job(id="a", kind="generate", payload={"n": 1}, created_at=1))
+        queue.put(Job(id="b", kind="generate", payload={"n": 2}, created_at=2))
+
+        claimed = queue.claim()
+        assert (claimed.id, claimed.status, claimed.attempts) == ("a", "running", 1)
+        claimed.status, claimed.result = "succeeded", {"plan": {"title": "서울"}}
+        queue.update(claimed)
+        queue.close()
+
+        reopened = SqliteJobQueue(tmp_path / "jobs.sqlite3")
+        assert reopened.get("a").result == {"plan": {"title": "서울"}}
+        assert reopened.claim().payload == {"n": 2}
+        assert reopened.claim() is None
+
+    def test_requeues_running_jobs(self, tmp_path):
+        """Test jobs left running by a stopped worker are queued again."""
+        from app.ai.jobs import Job, SqliteJobQueue
+
+        queue = SqliteJobQueue(tmp_path / "jobs.sqlite3")
+        queue.put(Job(id="a", kind="review", payload={}))
+        queue.claim()
+
+        assert queue.requeue_running() == 1
+        assert queue.claim().attempts == 2
+
+
+class TestJobWorkerPool:
+    """Test JobWorkerPool."""
+
+    async def test_runs_jobs_with_bounded_concurrency(self):
+        """Test every job finishes and no more than `concurrency` run at once."""
+        from app.ai.jobs import JobWorkerPool, MemoryJobQueue
+
+        running = 0
+        peak = 0
+
+        async def handler(job):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"n": job.payload["n"]}
+
+        pool = JobWorkerPool(MemoryJobQueue(), {"generate": handler}, concurrency=2, poll_interval=0.05)
+        pool.start()
+        jobs = [pool.submit("generate", {"n": n}) for n in range(5)]
+        results = [await _until_finished(pool, job.id) for job in jobs]
+        await pool.stop()
+
+        assert [job.result for job in results] == [{"n": n} for n in range(5)]
+        assert peak == 2
+
+    async def test_failure_is_recorded(self):
+        """Test a handler error fails the job with its message."""
+        from app.ai.jobs import JobWorkerPool, MemoryJobQueue
+
+        async def handler(job):
+            raise ValueError("No plan generated")
+
+        pool = JobWorkerPool(MemoryJobQueue(), {"generate": handler}, concurrency=1, poll_interval=0.05)
+        pool.start()
+        job = await _until_finished(pool, pool.submit("generate", {}).id)
+        await pool.stop()
+
+        assert (job.status, job.error) == ("failed", "No plan generated")
+
+    def test_unknown_kind_is_rejected(self):
+        """Test only registered job kinds can be queued."""
+        from app.ai.jobs import JobWorkerPool, MemoryJobQueue
+
+        pool = JobWorkerPool(MemoryJobQueue(), {}, concurrency=1)
+
+        with pytest.raises(ValueError):
+            pool.submit("generate", {})
+
+    async def test_interrupted_job_resumes_after_restart(self, tmp_path):
+        """Test a job running at shutdown is run again by the next pool."""
+        from app.ai.jobs import JobWorkerPool, SqliteJobQueue
+
+        started = asyncio.Event()
+
+        async def hang(job):
+            started.set()
+            await asyncio.sleep(60)
+
+        async def finish(job):
+            return {"attempt": job.attempts}
+
+        pool = JobWorkerPool(SqliteJobQueue(tmp_path / "jobs.sqlite3"), {"generate": hang}, concurrency=1)
+        pool.start()
+        job = pool.submit("generate", {})
+        await started.wait()
+        await pool.stop()
+        pool.queue.close()
+
+        restarted = JobWorkerPool(
+            SqliteJobQueue(tmp_path / "jobs.sqlite3"), {"generate": finish}, concurrency=1, poll_interval=0.05
+        )
+        restarted.start()
+        result = await _until_finished(restarted, job.id)
+        await restarted.stop()
+
+        assert (result.status, result.result) == ("succeeded", {"attempt": 2})
+
+    async def test_gives_up_after_max_attempts(self):
+        """Test a job interrupted too often is failed instead of rerun."""
+        from app.ai.jobs import Job, JobWorkerPool, MemoryJobQueue
+
+        async def handler(job):
+            raise AssertionError("should not run")
+
+        queue = MemoryJobQueue()
+        queue.put(Job(id="a", kind="generate", payload={}, status="running", attempts=3))
+        pool = JobWorkerPool(queue, {"generate": handler}, concurrency=1, max_attempts=3, poll_interval=0.05)
+        pool.start()
+        job = await _until_finished(pool, "a")
+        await pool.stop()
+
+        assert job.status == "failed"
+        assert "interrupted" in job.error
+
+
+class TestResumableGeneration:
+    """Test checkpointed planner runs continue where they stopped."""
+
+    async def test_resumes_from_last_finished_node(self, monkeypatch):
+        """Test a rerun after a crash skips nodes that already finished."""
+        from langgraph.checkpoint.memory import InMemorySaver
+        from langgraph.graph import START, StateGraph
+        from langgraph.types import Command
+
+        from app.ai.agents.planner.state import PlanningState
+        from app.ai.ai_service import AIService
+        from app.config import settings
+
+        calls = []
+
+        async def fetch_venues(state):
+            calls.append("fetch_venues")
+            return Command(update={"attractions": []}, goto="generate_plan")
+
+        async def generate_plan(state):
+            calls.append("generate_plan")
+            assert state["deadline"] is None
+            if calls.count("generate_plan") == 1:
+                raise RuntimeError("worker stopped")
+            return {"travel_plan": {"title": "서울"}}
+
+        graph = StateGraph(PlanningState)
+        graph.add_node("fetch_venues", fetch_venues)
+        graph.add_node("generate_plan", generate_plan)
+        graph.add_edge(START, "fetch_venues")
+
+        monkeypatch.setattr(settings, "PLAN_CACHE_ENABLED", False)
+        service = AIService()
+        service._planner_job_graph = graph.compile(checkpointer=InMemorySaver())
+        args = ("서울 여행", ("2025-07-01", "2025-07-01"), 100000, [])
+
+        with pytest.raises(RuntimeError):
+            await service.generate_initial_plan(*args, thread_id="job-1")
+        plan = await service.generate_initial_plan(*args, thread_id="job-1")
+
+        assert plan == {"title": "서울"}
+        assert calls == ["fetch_venues", "generate_plan", "generate_plan"]
@@ -0,0 +1,131 @@
+"""Test the exact-match LLM response cache."""
+
+import pytest
+from langchain_core.messages import HumanMessage, SystemMessage
+from pydantic import BaseModel
+
+
+class Extraction(BaseModel):
+    """Structured output used by the tests."""
+
+    budget: int | None = None
+
+
+class FakeStructuredLLM:
+    """Records calls and returns a fixed result."""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def _messages(text="예산 50만원"):
+    return [SystemMessage(content="Extract the budget."), HumanMessage(content=text)]
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    fake = FakeStructuredLLM(Extraction(budget=500000))
+    async def fake_invoke(task, schema, messages, temperature=0.7, deadline=None):
+        return await fake.ainvoke(messages)
+
+    monkeypatch.setattr("app.ai.agents.llm_cache.invoke_structured", fake_invoke)
+    return fake
+
+
+class TestLLMResponseCache:
+    """Test LLMResponseCache tiers, TTL and eviction."""
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test a new process can read entries from SQLite."""
+        from app.ai.agents.llm_cache import LLMResponseCache
+
+        path = tmp_path / "llm_cache.sqlite3"
+        first = LLMResponseCache(path)
+        first.set("key", '{"budget": 1}')
+        first.close()
+
+        second = LLMResponseCache(path)
+        assert second.get("key") == '{"budget": 1}'
+        assert second.get("key") == '{"budget": 1}'
+        assert second.stats == {"memory_hits": 1, "disk_hits": 1, "misses": 0}
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        """Test TTL applies to both tiers."""
+        from app.ai.agents.llm_cache import LLMResponseCache
+
+        cache = LLMResponseCache(tmp_path / "llm_cache.sqlite3", ttl_seconds=-1)
+        cache.set("key", "{}")
+
+        assert cache.get("key") is None
+
+    def test_lru_eviction_keeps_recent_entries(self):
+        """Test the memory tier evicts the least recently used entry."""
+        from app.ai.agents.llm_cache import LLMResponseCache
+
+        cache = LLMResponseCache(max_size=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert len(cache) == 2
+
+
+class TestCachedStructuredCall:
+    """Test cached_structured_call."""
+
+    async def test_repeated_call_is_served_from_cache(self, fake_llm):
+        """Test the second identical call does not reach the LLM."""
+        from app.ai.agents.llm_cache import LLMResponseCache, cached_structured_call
+
+        cache = LLMResponseCache()
+        first = await cached_structured_call("collect_info", Extraction, _messages(), cache=cache)
+        second = await cached_structured_call("collect_info", Extraction, _messages(), cache=cache)
+
+        assert first == second == Extraction(budget=500000)
+        assert fake_llm.calls == 1
+
+    async def test_key_includes_messages_and_schema(self, fake_llm):
+        """Test different messages or schemas miss."""
+        from app.ai.agents.llm_cache import LLMResponseCache, cache_key, cached_structured_call
+
+        class OtherExtraction(Extraction):
+            interests: list[str] = []
+
+        cache = LLMResponseCache()
+        await cached_structured_call("collect_info", Extraction, _messages("예산 50만원"), cache=cache)
+        await cached_structured_call("collect_info", Extraction, _messages("예산 30만원"), cache=cache)
+
+        assert fake_llm.calls == 2
+        assert cache_key("m", 0, Extraction, _messages()) != cache_key("m", 0, OtherExtraction, _messages())
+
+    async def test_non_zero_temperature_bypasses_cache(self, fake_llm):
+        """Test sampled calls are never cached."""
+        from app.ai.agents.llm_cache import LLMResponseCache, cached_structured_call
+
+        cache = LLMResponseCache()
+        await cached_structured_call("collect_info", Extraction, _messages(), temperature=0.5, cache=cache)
+        await cached_structured_call("collect_info", Extraction, _messages(), temperature=0.5, cache=cache)
+
+        assert fake_llm.calls == 2
+        assert len(cache) == 0
+
+    async def test_failures_are_not_cached(self, fake_llm):
+        """Test an exception propagates and leaves no entry."""
+        from app.ai.agents.llm_cache import LLMResponseCache, cached_structured_call
+
+        fake_llm.result = RuntimeError("rate limited")
+        cache = LLMResponseCache()
+
+        with pytest.raises(RuntimeError):
+            await cached_structured_call("collect_info", Extraction, _messages(), cache=cache)
+        assert len(cache) == 0
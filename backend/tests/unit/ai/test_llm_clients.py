@@ -0,0 +1,59 @@
+"""Test the pooled LLM client registry."""
+
+import pytest
+from pydantic import BaseModel
+
+
+class Answer(BaseModel):
+    """Structured output used by the tests."""
+
+    text: str
+
+
+@pytest.fixture(autouse=True)
+def pooled_clients(monkeypatch):
+    from app.ai.agents import utils
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "test-key")
+    utils.clear_llm_clients()
+    yield utils
+    utils.clear_llm_clients()
+
+
+class TestClientRegistry:
+    """Test get_llm / get_structured_llm pooling."""
+
+    def test_same_model_and_temperature_share_a_client(self, pooled_clients):
+        """Test repeated lookups return the same instance."""
+        assert pooled_clients.get_llm(temperature=0) is pooled_clients.get_llm(temperature=0.0)
+        assert pooled_clients.get_llm(temperature=0) is not pooled_clients.get_llm(temperature=0.5)
+        assert pooled_clients.get_llm(0, model="gpt-4o") is not pooled_clients.get_llm(0)
+
+    def test_structured_runnables_are_cached_per_schema(self, pooled_clients):
+        """Test with_structured_output runs once per (model, temperature, schema)."""
+
+        class Other(BaseModel):
+            value: int
+
+        first = pooled_clients.get_structured_llm(Answer, temperature=0)
+
+        assert pooled_clients.get_structured_llm(Answer, temperature=0) is first
+        assert pooled_clients.get_structured_llm(Other, temperature=0) is not first
+        assert pooled_clients.get_structured_llm(Answer, temperature=0.5) is not first
+
+    def test_clear_drops_pooled_clients(self, pooled_clients):
+        """Test clear_llm_clients forces new instances."""
+        llm = pooled_clients.get_llm(temperature=0)
+        pooled_clients.clear_llm_clients()
+
+        assert pooled_clients.get_llm(temperature=0) is not llm
+
+    async def test_warm_up_without_api_key_is_a_no_op(self, pooled_clients, monkeypatch):
+        """Test startup warm-up skips when no key is configured."""
+        from app.config import settings
+
+        monkeypatch.setattr(settings, "OPENAI_API_KEY", "")
+        await pooled_clients.warm_up_llm_clients()
+
+        assert pooled_clients._clients == {}
@@ -0,0 +1,158 @@
+"""Test per-task model routing and latency-budget fallback."""
+
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+
+class Answer(BaseModel):
+    """Structured output used by the tests."""
+
+    model: str
+
+
+class FakeModels:
+    """Fake get_structured_llm: each model answers after a configured delay."""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.calls = []
+
+    def __call__(self, schema, temperature=0.7, model=None):
+        fake = self
+
+        class Runnable:
+            async def ainvoke(self, messages):
+                fake.calls.append(model)
+                await asyncio.sleep(fake.delays.get(model, 0))
+                return schema(model=model)
+
+        return Runnable()
+
+
+@pytest.fixture
+def routing(monkeypatch):
+    from app.ai.agents import llm_router
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "OPENAI_MODEL", "big")
+    monkeypatch.setattr(settings, "OPENAI_FAST_MODEL", "small")
+    monkeypatch.setattr(settings, "LLM_TASK_MODELS", {"collect_info": "small"})
+    monkeypatch.setattr(settings, "LLM_TASK_LATENCY_BUDGETS_SECONDS", {"generate_plan": 0.05})
+    llm_router.latency_stats.reset()
+    yield llm_router
+    llm_router.latency_stats.reset()
+
+
+class TestInvokeStructured:
+    """Test invoke_structured."""
+
+    async def test_routes_tasks_to_configured_models(self, routing, monkeypatch):
+        """Test routed tasks use their model and others the default."""
+        fake = FakeModels({})
+        monkeypatch.setattr(routing, "get_structured_llm", fake)
+
+        extraction = await routing.invoke_structured("collect_info", Answer, [])
+        plan = await routing.invoke_structured("modify_plan", Answer, [])
+
+        assert extraction.model == "small"
+        assert plan.model == "big"
+
+    async def test_falls_back_to_fast_model_over_budget(self, routing, monkeypatch):
+        """Test a call exceeding its budget is cancelled and retried on the fast model."""
+        fake = FakeModels({"big": 1.0, "small": 0})
+        monkeypatch.setattr(routing, "get_structured_llm", fake)
+
+        result = await routing.invoke_structured("generate_plan", Answer, [])
+
+        assert result.model == "small"
+        assert fake.calls == ["big", "small"]
+        stats = routing.latency_stats.snapshot()["generate_plan"]
+        assert stats["fallbacks"] == 1
+        assert stats["p95_seconds"] < 0.5
+
+    async def test_within_budget_keeps_primary_model(self, routing, monkeypatch):
+        """Test fast enough calls are not retried."""
+        fake = FakeModels({"big": 0})
+        monkeypatch.setattr(routing, "get_structured_llm", fake)
+
+        result = await routing.invoke_structured("generate_plan", Answer, [])
+
+        assert result.model == "big"
+        assert routing.latency_stats.snapshot()["generate_plan"]["fallbacks"] == 0
+
+
+class TestLatencyStats:
+    """Test LatencyStats percentiles."""
+
+    def test_percentiles(self):
+        """Test p50/p95 from recorded samples."""
+        from app.ai.agents.llm_router import LatencyStats
+
+        stats = LatencyStats()
+        for i in range(1, 101):
+            stats.record("task", i / 100)
+
+        assert stats.percentile("task", 50) == 0.51
+        assert stats.percentile("task", 95) == 0.96
+        assert stats.percentile("missing", 95) is None
+
+
+class TestDeadlines:
+    """Test request deadlines."""
+
+    async def test_expired_deadline_fails_fast(self, routing, monkeypatch):
+        """Test no request is sent once the deadline has passed."""
+        import time
+
+        fake = FakeModels({})
+        monkeypatch.setattr(routing, "get_structured_llm", fake)
+
+        with pytest.raises(routing.DeadlineExceeded):
+            await routing.invoke_structured("modify_plan", Answer, [], deadline=time.time() - 1)
+        assert fake.calls == []
+
+    async def test_deadline_shorter_than_budget_skips_fallback(self, routing, monkeypatch):
+        """Test a call cut off by the deadline is not retried on the fast model."""
+        import time
+
+        fake = FakeModels({"big": 1.0})
+        monkeypatch.setattr(routing, "get_structured_llm", fake)
+
+        with pytest.raises(routing.DeadlineExceeded):
+            await routing.invoke_structured("generate_plan", Answer, [], deadline=time.time() + 0.02)
+        assert fake.calls == ["big"]
+
+    async def test_admission_wait_is_outside_the_budget(self, routing, monkeypatch):
+        """Test queueing for admission does not count against the latency budget."""
+        fake = FakeModels({})
+        monkeypatch.setattr(routing, "get_structured_llm", fake)
+
+        async def slow_admit(task, prompt_tokens):
+            await asyncio.sleep(0.1)
+            return 0.1
+
+        monkeypatch.setattr(routing, "admit", slow_admit)
+
+        result = await routing.invoke_structured("generate_plan", Answer, [])
+
+        assert result.model == "big"
+        assert fake.calls == ["big"]
+
+    async def test_admission_wait_is_bounded_by_deadline(self, routing, monkeypatch):
+        """Test a request still queued at the deadline is never sent."""
+        import time
+
+        fake = FakeModels({})
+        monkeypatch.setattr(routing, "get_structured_llm", fake)
+
+        async def stuck_admit(task, prompt_tokens):
+            await asyncio.sleep(1.0)
+            return 1.0
+
+        monkeypatch.setattr(routing, "admit", stuck_admit)
+
+        with pytest.raises(routing.DeadlineExceeded):
+            await routing.invoke_structured("generate_plan", Answer, [], deadline=time.time() + 0.02)
+        assert fake.calls == []
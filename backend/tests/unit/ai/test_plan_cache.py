@@ -0,0 +1,148 @@
+"""Test the plan template cache."""
+
+import time
+
+PLAN = {
+    "title": "고궁과 맛집 3일",
+    "total_days": 3,
+    "total_cost": 480000,
+    "itinerary": [
+        {"day": i, "date": f"2025-07-0{i}", "theme": "", "activities": [], "daily_cost": 0}
+        for i in (1, 2, 3)
+    ],
+    "accommodation": {"name": "종로 호텔", "cost_per_night": 100000, "total_nights": 2},
+    "summary": "",
+}
+
+EMBEDDINGS = {
+    "3일 고궁이랑 맛집 여행": [1.0, 0.0, 0.0],
+    "고궁과 맛집 위주 3일 여행": [0.96, 0.28, 0.0],
+    "3일 쇼핑 여행": [0.0, 0.0, 1.0],
+}
+
+
+async def fake_embed(text):
+    return EMBEDDINGS[text]
+
+
+class TestPlanTemplateCache:
+    """Test PlanTemplateCache."""
+
+    async def test_exact_hit_is_rebased_onto_new_dates(self):
+        """Test same length, budget bucket and interests reuse the plan."""
+        from app.ai.plan_cache import PlanTemplateCache
+
+        cache = PlanTemplateCache()
+        await cache.store(PLAN, "3일 고궁이랑 맛집 여행", ("2025-07-01", "2025-07-03"), 500000, ["Palace", "food"])
+
+        start = time.perf_counter()
+        plan = await cache.lookup("다른 문장", ("2025-10-10", "2025-10-12"), 520000, ["food", "palace "])
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        assert [d["date"] for d in plan["itinerary"]] == ["2025-10-10", "2025-10-11", "2025-10-12"]
+        assert plan["title"] == PLAN["title"]
+        assert PLAN["itinerary"][0]["date"] == "2025-07-01"
+        assert cache.stats["exact_hits"] == 1
+        assert elapsed_ms < 5
+
+    async def test_different_length_or_budget_misses(self):
+        """Test trip length and budget bucket are part of the key."""
+        from app.ai.plan_cache import PlanTemplateCache
+
+        cache = PlanTemplateCache()
+        await cache.store(PLAN, "3일 고궁이랑 맛집 여행", ("2025-07-01", "2025-07-03"), 500000, ["palace"])
+
+        assert await cache.lookup("", ("2025-07-01", "2025-07-04"), 500000, ["palace"]) is None
+        assert await cache.lookup("", ("2025-07-01", "2025-07-03"), 900000, ["palace"]) is None
+        assert await cache.lookup("", ("2025-07-01", "2025-07-03"), 500000, ["shopping"]) is None
+
+    async def test_semantic_fallback_on_similar_request(self):
+        """Test a paraphrased request without interests hits by embedding similarity."""
+        from app.ai.plan_cache import PlanTemplateCache
+
+        cache = PlanTemplateCache(embed=fake_embed)
+        await cache.store(PLAN, "3일 고궁이랑 맛집 여행", ("2025-07-01", "2025-07-03"), 500000, [])
+
+        hit = await cache.lookup("고궁과 맛집 위주 3일 여행", ("2025-08-01", "2025-08-03"), 500000, [])
+        miss = await cache.lookup("3일 쇼핑 여행", ("2025-08-01", "2025-08-03"), 500000, [])
+
+        assert hit["itinerary"][0]["date"] == "2025-08-01"
+        assert miss is None
+        assert cache.stats == {"exact_hits": 0, "semantic_hits": 1, "misses": 1}
+
+    async def test_semantic_fallback_respects_explicit_interests(self):
+        """Test a similar request naming other interests does not reuse the template."""
+        from app.ai.plan_cache import PlanTemplateCache
+
+        cache = PlanTemplateCache(embed=fake_embed)
+        await cache.store(PLAN, "3일 고궁이랑 맛집 여행", ("2025-07-01", "2025-07-03"), 500000, ["palace"])
+
+        miss = await cache.lookup(
+            "고궁과 맛집 위주 3일 여행", ("2025-08-01", "2025-08-03"), 500000, ["shopping", "nightlife"]
+        )
+        hit = await cache.lookup("고궁과 맛집 위주 3일 여행", ("2025-08-01", "2025-08-03"), 500000, [])
+
+        assert miss is None
+        assert hit is not None
+
+    async def test_plans_over_budget_are_not_reused(self):
+        """Test a template from the same budget bucket that costs more than the budget misses."""
+        from app.ai.plan_cache import PlanTemplateCache
+
+        cache = PlanTemplateCache(embed=fake_embed)
+        await cache.store(
+            {**PLAN, "total_cost": 549000}, "3일 고궁이랑 맛집 여행", ("2025-07-01", "2025-07-03"), 549000, []
+        )
+
+        assert await cache.lookup("3일 고궁이랑 맛집 여행", ("2025-08-01", "2025-08-03"), 451000, []) is None
+        assert await cache.lookup("고궁과 맛집 위주 3일 여행", ("2025-08-01", "2025-08-03"), 451000, []) is None
+        assert await cache.lookup("3일 고궁이랑 맛집 여행", ("2025-08-01", "2025-08-03"), 549000, []) is not None
+
+    async def test_uncacheable_requests_are_skipped(self):
+        """Test invalid dates, missing budget or mismatched plans are not stored."""
+        from app.ai.plan_cache import PlanTemplateCache
+
+        cache = PlanTemplateCache()
+        await cache.store(PLAN, "x", ("", ""), 500000, ["palace"])
+        await cache.store(PLAN, "x", ("2025-07-01", "2025-07-03"), None, ["palace"])
+        await cache.store(PLAN, "x", ("2025-07-01", "2025-07-02"), 500000, ["palace"])
+
+        assert len(cache) == 0
+
+    async def test_expired_templates_are_evicted(self):
+        """Test TTL expiry."""
+        from app.ai.plan_cache import PlanTemplateCache
+
+        cache = PlanTemplateCache(ttl_seconds=-1)
+        await cache.store(PLAN, "x", ("2025-07-01", "2025-07-03"), 500000, ["palace"])
+
+        assert await cache.lookup("x", ("2025-07-01", "2025-07-03"), 500000, ["palace"]) is None
+        assert len(cache) == 0
+
+    async def test_embeddings_client_is_created_once(self, monkeypatch):
+        """Test the process-wide cache reuses one embeddings client."""
+        import langchain_openai
+
+        from app.ai import plan_cache
+        from app.config import settings
+
+        created = []
+
+        class FakeEmbeddings:
+            def __init__(self, **kwargs):
+                created.append(kwargs)
+
+            async def aembed_query(self, text):
+                return [1.0, 0.0]
+
+        monkeypatch.setattr(langchain_openai, "OpenAIEmbeddings", FakeEmbeddings)
+        monkeypatch.setattr(settings, "PLAN_CACHE_ENABLED", True)
+        monkeypatch.setattr(settings, "OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr(plan_cache, "_plan_cache", None)
+
+        cache = plan_cache.get_plan_cache()
+        await cache.store(PLAN, "3일 고궁 여행", ("2025-07-01", "2025-07-03"), 500000, [])
+        await cache.lookup("3일 궁궐 여행", ("2025-08-01", "2025-08-03"), 500000, [])
+
+        assert plan_cache.get_plan_cache() is cache
+        assert len(created) == 1
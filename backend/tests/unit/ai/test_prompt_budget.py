@@ -0,0 +1,149 @@
+"""Test token-budgeted venue context construction."""
+
+import json
+
+
+def _attraction(name, similarity, description="", district="종로구"):
+    return {
+        "id": 1,
+        "name": name,
+        "category": "관광지",
+        "description": description or "정보 없음",
+        "address": "서울특별시 종로구 사직로 161",
+        "district": district,
+        "phone": "",
+        "latitude": 37.5796,
+        "longitude": 126.9770,
+        "similarity_score": similarity,
+    }
+
+
+def _restaurant(name, near, distance_km):
+    return {
+        "name": name,
+        "category": "한식>육류,고기요리",
+        "address": "서울특별시 종로구 삼청로 1",
+        "phone": "02-000-0000",
+        "latitude": 37.58,
+        "longitude": 126.98,
+        "description": "카테고리: 한식>육류,고기요리",
+        "near_attraction": near,
+        "distance_km": distance_km,
+    }
+
+
+def _buckets():
+    long_text = "조선 왕조의 법궁으로 근정전과 경회루 등 아름다운 전각이 남아 있는 곳입니다. " * 10
+    return [
+        {
+            "day": 1,
+            "date": "2025-07-01",
+            "attractions": [
+                _attraction("경복궁", 0.9, long_text),
+                _attraction("창덕궁", 0.5, long_text),
+            ],
+            "restaurants": [
+                _restaurant("삼청동 식당", "경복궁", 0.3),
+                _restaurant("원서동 식당", "창덕궁", 0.8),
+            ],
+        },
+        {
+            "day": 2,
+            "date": "2025-07-02",
+            "attractions": [_attraction("코엑스", 0.7, long_text, "강남구")],
+            "restaurants": [_restaurant("삼성동 식당", "코엑스", 0.4)],
+        },
+    ]
+
+
+ACCOMMODATIONS = [
+    {"name": "종로 호텔", "category": "호텔", "address": "", "distance_km": 0.5},
+    {"name": "광화문 호텔", "category": "호텔", "address": "", "distance_km": 1.5},
+]
+
+
+class TestBuildVenueContext:
+    """Test build_venue_context."""
+
+    def test_compact_context_is_much_smaller_than_raw_json(self):
+        """Test compact keys, truncation and dropped fields cut prompt tokens."""
+        from app.ai.agents.prompt_budget import build_venue_context, count_tokens
+
+        raw = count_tokens(json.dumps(_buckets(), ensure_ascii=False))
+        context = build_venue_context(_buckets(), ACCOMMODATIONS, token_budget=10_000, max_description_chars=60)
+
+        assert context.pruned == 0
+        assert context.tokens < raw / 2
+
+    def test_uses_id_references_and_drops_empty_fields(self):
+        """Test restaurants point at attraction ids and placeholders are removed."""
+        from app.ai.agents.prompt_budget import build_venue_context
+
+        buckets = _buckets()
+        buckets[1]["attractions"][0]["description"] = "정보 없음"
+        context = build_venue_context(buckets, ACCOMMODATIONS, token_budget=10_000, max_description_chars=20)
+
+        days = json.loads(context.day_buckets)
+        assert days[0]["attractions"][0]["id"] == "A1"
+        assert days[0]["restaurants"][1]["near"] == "A2"
+        assert "d" not in days[1]["attractions"][0]
+        assert len(days[0]["attractions"][0]["d"]) <= 20
+        assert "similarity_score" not in context.day_buckets
+        assert json.loads(context.accommodations)[0] == {"id": "H1", "n": "종로 호텔", "c": "호텔", "km": 0.5}
+
+    def test_prunes_lowest_relevance_venues_to_budget(self):
+        """Test the farthest hotel, then the weakest attraction and its restaurant go first."""
+        from app.ai.agents.prompt_budget import build_venue_context, count_tokens
+
+        full = build_venue_context(_buckets(), ACCOMMODATIONS, token_budget=10_000, max_description_chars=60)
+        budget = full.tokens - 1
+        context = build_venue_context(_buckets(), ACCOMMODATIONS, token_budget=budget, max_description_chars=60)
+
+        assert context.pruned >= 1
+        assert context.tokens <= budget
+        assert context.tokens == count_tokens(context.day_buckets) + count_tokens(context.accommodations)
+        assert "광화문 호텔" not in context.accommodations
+        assert "종로 호텔" in context.accommodations
+
+        tight = build_venue_context(_buckets(), ACCOMMODATIONS, token_budget=1, max_description_chars=60)
+        days = json.loads(tight.day_buckets)
+        assert [a["n"] for a in days[0]["attractions"]] == ["경복궁"]
+        assert len(days[0]["restaurants"]) == 1
+        assert len(days[1]["attractions"]) == 1
+
+    def test_does_not_modify_inputs(self):
+        """Test pruning works on copies."""
+        from app.ai.agents.prompt_budget import build_venue_context
+
+        buckets = _buckets()
+        accommodations = list(ACCOMMODATIONS)
+        build_venue_context(buckets, accommodations, token_budget=1)
+
+        assert len(buckets[0]["attractions"]) == 2
+        assert len(accommodations) == 2
+
+
+class TestCountTokens:
+    """Test token counting helpers."""
+
+    def test_message_tokens_include_overhead(self):
+        """Test each message adds the chat format overhead."""
+        from langchain_core.messages import HumanMessage, SystemMessage
+
+        from app.ai.agents.prompt_budget import (
+            MESSAGE_OVERHEAD_TOKENS,
+            count_message_tokens,
+            count_tokens,
+        )
+
+        messages = [SystemMessage(content="You are a planner."), HumanMessage(content="서울 2박 3일 여행")]
+
+        expected = sum(count_tokens(m.content) for m in messages) + 2 * MESSAGE_OVERHEAD_TOKENS
+        assert count_message_tokens(messages) == expected
+
+    def test_truncate_adds_ellipsis(self):
+        """Test truncation collapses whitespace and marks the cut."""
+        from app.ai.agents.prompt_budget import truncate
+
+        assert truncate("경복궁  은\n조선의 법궁", 100) == "경복궁 은 조선의 법궁"
+        assert truncate("abcdefghij", 5) == "abcd…"
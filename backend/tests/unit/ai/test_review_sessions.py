@@ -0,0 +1,222 @@
+"""Test server-side review sessions backed by LangGraph checkpoints."""
+
+import pytest
+
+PLAN = {
+    "title": "서울 1일 여행",
+    "total_days": 1,
+    "total_cost": 18000,
+    "summary": "",
+    "itinerary": [
+        {
+            "day": 1,
+            "date": "2025-07-01",
+            "theme": "궁궐",
+            "activities": [
+                {
+                    "time": "10:00",
+                    "venue_name": "경복궁",
+                    "venue_type": "attraction",
+                    "duration_minutes": 90,
+                    "estimated_cost": 3000,
+                    "notes": "",
+                },
+                {
+                    "time": "12:00",
+                    "venue_name": "삼청동 식당",
+                    "venue_type": "restaurant",
+                    "duration_minutes": 60,
+                    "estimated_cost": 15000,
+                    "notes": "",
+                },
+            ],
+            "daily_cost": 18000,
+        }
+    ],
+    "accommodation": {"name": "", "cost_per_night": 0, "total_nights": 0},
+}
+
+
+@pytest.fixture
+async def checkpoint_db(monkeypatch, tmp_path):
+    """Point checkpoints at a temporary SQLite file."""
+    from app.ai.agents import checkpoints
+    from app.config import settings
+
+    await checkpoints.close_checkpointer()
+    monkeypatch.setattr(settings, "CHECKPOINT_DB_PATH", str(tmp_path / "checkpoints.sqlite3"))
+    yield tmp_path / "checkpoints.sqlite3"
+    await checkpoints.close_checkpointer()
+
+
+@pytest.fixture
+def theme_edit(monkeypatch):
+    """Answer modify_section calls by renaming the day's theme."""
+    from app.ai.agents.planner.models import DayItinerary
+    from app.ai.agents.reviewer import nodes
+
+    calls = []
+
+    async def fake_invoke(task, schema, messages, temperature=0.7, deadline=None):
+        calls.append(messages[1].content)
+        return DayItinerary(**{**PLAN["itinerary"][0], "theme": f"수정 {len(calls)}"})
+
+    monkeypatch.setattr(nodes, "invoke_structured", fake_invoke)
+    return calls
+
+
+class TestReviewSessions:
+    """Test AIService.review_in_session."""
+
+    async def test_later_rounds_send_feedback_only(self, checkpoint_db, theme_edit):
+        """Test the session keeps the modified plan between rounds."""
+        from app.ai.ai_service import AIService
+
+        service = AIService()
+
+        first = await service.review_in_session("plan-1", "1일차 출발 시간 늦게 바꿔줘", original_plan=PLAN)
+        second = await service.review_in_session("plan-1", "1일차 출발 시간 조금 더 늦게 바꿔줘")
+        approved = await service.review_in_session("plan-1", "이대로 확정")
+
+        assert first["itinerary"][0]["theme"] == "수정 1"
+        assert '"theme":"수정 1"' in theme_edit[1]  # second round edits the first round's result
+        assert second["itinerary"][0]["theme"] == "수정 2"
+        assert approved == second
+
+        session = await service.get_review_session("plan-1")
+        assert session["iteration"] == 3
+
+    async def test_unknown_session_requires_plan(self, checkpoint_db):
+        """Test a session cannot start from feedback alone."""
+        from app.ai.ai_service import AIService
+
+        with pytest.raises(LookupError):
+            await AIService().review_in_session("missing", "좋아요")
+
+    async def test_other_users_cannot_continue_a_session(self, checkpoint_db, theme_edit):
+        """Test every round is checked against the session owner."""
+        from app.ai.ai_service import AIService
+
+        service = AIService()
+        await service.review_in_session("review-a", "1일차 출발 시간 늦게 바꿔줘", original_plan=PLAN, owner_id=1)
+
+        with pytest.raises(PermissionError):
+            await service.review_in_session("review-a", "이대로 확정", owner_id=2)
+        with pytest.raises(PermissionError):
+            await service.review_in_session("review-a", "좋아요", original_plan=PLAN)
+
+        assert (await service.get_review_session("review-a"))["owner_id"] == 1
+
+    async def test_sessions_survive_reopening(self, checkpoint_db, theme_edit):
+        """Test session state is read back from the SQLite file."""
+        from app.ai.agents import checkpoints
+        from app.ai.ai_service import AIService
+
+        await AIService().review_in_session("plan-2", "1일차 출발 시간 늦게 바꿔줘", original_plan=PLAN)
+        await checkpoints.close_checkpointer()
+
+        session = await AIService().get_review_session("plan-2")
+
+        assert checkpoint_db.exists()
+        assert session["modified_plan"]["itinerary"][0]["theme"] == "수정 1"
+
+
+    async def test_idle_sessions_expire_when_reopened(self, checkpoint_db, theme_edit, monkeypatch):
+        """Test sessions idle for longer than the TTL are deleted at startup."""
+        from app.ai.agents import checkpoints
+        from app.ai.ai_service import AIService
+        from app.config import settings
+
+        await AIService().review_in_session("plan-3", "1일차 출발 시간 늦게 바꿔줘", original_plan=PLAN)
+        await checkpoints.close_checkpointer()
+        monkeypatch.setattr(settings, "REVIEW_SESSION_TTL_SECONDS", 0)
+
+        assert await AIService().get_review_session("plan-3") is None
+
+    async def test_delete_thread_removes_checkpoints(self, checkpoint_db, theme_edit):
+        """Test a deleted thread has no stored state."""
+        from app.ai.agents import checkpoints
+        from app.ai.ai_service import AIService
+
+        service = AIService()
+        await service.review_in_session("job-1", "1일차 출발 시간 늦게 바꿔줘", original_plan=PLAN)
+        await checkpoints.delete_thread("job-1")
+
+        assert await service.get_review_session("job-1") is None
+
+
+class TestFetchContextReuse:
+    """Test fetched context is reused within a session."""
+
+    async def test_cached_restaurants_skip_search(self, monkeypatch):
+        """Test a cached area is not searched again."""
+        from app.ai.agents.reviewer import nodes
+        from app.geo.districts import lookup_district
+
+        area = lookup_district(37.4979, 127.0276)
+        cached = [{"name": "캐시된 식당"}]
+
+        command = await nodes.fetch_context({
+            "original_plan": PLAN,
+            "user_feedback": "점심 식당 바꿔줘",
+            "modification_type": "restaurant",
+            "context_cache": {f"restaurants:{area}:점심 식당 바꿔줘": cached},
+        })
+
+        assert command.update["restaurants"] == cached
+
+    async def test_new_query_in_same_area_searches_again(self, monkeypatch):
+        """Test cached restaurants are keyed by the query as well as the area."""
+        from app.ai.agents.reviewer import nodes
+        from app.geo.districts import lookup_district
+        from app.naver import client
+
+        area = lookup_district(37.4979, 127.0276)
+        queries = []
+
+        class FakeNaverClient:
+            async def search_nearby_restaurants(self, **kwargs):
+                queries.append(kwargs["query"])
+                return [{"name": "채식 식당"}]
+
+        monkeypatch.setattr(client, "NaverLocalClient", FakeNaverClient)
+
+        command = await nodes.fetch_context({
+            "original_plan": PLAN,
+            "user_feedback": "저녁은 채식 식당으로",
+            "modification_type": "restaurant",
+            "context_cache": {f"restaurants:{area}:점심 식당 바꿔줘": [{"name": "캐시된 식당"}]},
+        })
+
+        assert queries == ["저녁은 채식 식당으로"]
+        assert command.update["restaurants"] == [{"name": "채식 식당"}]
+        assert len(command.update["context_cache"]) == 2
+
+    async def test_area_prefers_activity_address(self, monkeypatch):
+        """Test the search area comes from the activity address before its coordinates."""
+        from app.ai.agents.reviewer import nodes
+        from app.naver import client
+
+        keywords = []
+
+        class FakeNaverClient:
+            async def search_nearby_restaurants(self, **kwargs):
+                keywords.append(kwargs["location_keyword"])
+                return []
+
+        monkeypatch.setattr(client, "NaverLocalClient", FakeNaverClient)
+        activity = {
+            **PLAN["itinerary"][0]["activities"][0],
+            "address": "서울특별시 종로구 대학로 104",
+            "location": {"latitude": 37.5636, "longitude": 126.9869},  # 명동 (중구)
+        }
+        plan = {**PLAN, "itinerary": [{**PLAN["itinerary"][0], "activities": [activity]}]}
+
+        await nodes.fetch_context({
+            "original_plan": plan,
+            "user_feedback": "점심 식당 바꿔줘",
+            "modification_type": "restaurant",
+        })
+
+        assert keywords == ["종로구"]
+
@@ -0,0 +1,105 @@
+"""Test token usage recording and the static/dynamic prompt layout."""
+
+from uuid import uuid4
+
+
+def _result(input_tokens, cached, output_tokens):
+    from langchain_core.messages import AIMessage
+    from langchain_core.outputs import ChatGeneration, LLMResult
+
+    message = AIMessage(
+        content="",
+        usage_metadata={
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+            "input_token_details": {"cache_read": cached},
+        },
+    )
+    return LLMResult(generations=[[ChatGeneration(message=message)]])
+
+
+class TestTokenUsageRecorder:
+    """Test TokenUsageRecorder."""
+
+    def test_records_cached_tokens_per_node(self):
+        """Test usage is grouped by the langgraph_node run metadata."""
+        from app.ai.agents.usage import TokenUsageRecorder
+
+        recorder = TokenUsageRecorder()
+        for cached in (0, 1024):
+            run_id = uuid4()
+            recorder.on_chat_model_start({}, [[]], run_id=run_id, metadata={"langgraph_node": "generate_plan"})
+            recorder.on_llm_end(_result(1500, cached, 300), run_id=run_id)
+
+        usage = recorder.snapshot()["generate_plan"]
+        assert usage["calls"] == 2
+        assert usage["prompt_tokens"] == 3000
+        assert usage["cached_tokens"] == 1024
+        assert usage["completion_tokens"] == 600
+        assert usage["cache_hit_ratio"] == round(1024 / 3000, 3)
+
+    def test_falls_back_to_llm_output_token_usage(self):
+        """Test OpenAI-style token_usage is read when messages carry no usage."""
+        from langchain_core.outputs import LLMResult
+
+        from app.ai.agents.usage import TokenUsageRecorder
+
+        recorder = TokenUsageRecorder()
+        run_id = uuid4()
+        recorder.on_chat_model_start({}, [[]], run_id=run_id)
+        recorder.on_llm_end(
+            LLMResult(
+                generations=[[]],
+                llm_output={"token_usage": {
+                    "prompt_tokens": 2048,
+                    "completion_tokens": 10,
+                    "prompt_tokens_details": {"cached_tokens": 1920},
+                }},
+            ),
+            run_id=run_id,
+        )
+
+        assert recorder.snapshot()["default"]["cached_tokens"] == 1920
+
+    def test_get_llm_attaches_recorder(self, monkeypatch):
+        """Test every configured LLM reports to the shared recorder."""
+        from app.ai.agents.usage import usage_recorder
+        from app.ai.agents.utils import get_llm
+        from app.config import settings
+
+        monkeypatch.setattr(settings, "OPENAI_API_KEY", "test-key")
+        llm = get_llm(temperature=0)
+
+        assert usage_recorder in llm.callbacks
+
+
+class TestPromptLayout:
+    """Test prompts keep request data out of the static prefix."""
+
+    def test_system_prompts_are_static(self):
+        """Test system prompts contain no format placeholders."""
+        from app.ai.agents.planner import prompts as planner_prompts
+        from app.ai.agents.reviewer import prompts as reviewer_prompts
+
+        system_prompts = [
+            value
+            for module in (planner_prompts, reviewer_prompts)
+            for name, value in vars(module).items()
+            if name.endswith("_SYSTEM_PROMPT")
+        ]
+
+        assert len(system_prompts) == 8
+        for prompt in system_prompts:
+            assert "{" not in prompt
+
+    def test_planner_calls_share_a_common_prefix(self):
+        """Test planner system prompts start with the same role block."""
+        from app.ai.agents.planner.prompts import (
+            GENERATE_DAY_SYSTEM_PROMPT,
+            GENERATE_PLAN_SYSTEM_PROMPT,
+            PLANNER_ROLE,
+        )
+
+        assert GENERATE_PLAN_SYSTEM_PROMPT.startswith(PLANNER_ROLE)
+        assert GENERATE_DAY_SYSTEM_PROMPT.startswith(PLANNER_ROLE)
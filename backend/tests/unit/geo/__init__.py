@@ -0,0 +1 @@
+"""Geospatial utility unit tests."""
@@ -0,0 +1,36 @@
+"""Test haversine distance helpers."""
+
+import pytest
+
+
+class TestHaversine:
+    """Test haversine_km and haversine_matrix."""
+
+    def test_known_distance(self):
+        """Test Gyeongbokgung → N Seoul Tower is about 3.3 km."""
+        from app.geo.distance import haversine_km
+
+        distance = haversine_km(37.5796, 126.9770, 37.5512, 126.9882)
+
+        assert float(distance) == pytest.approx(3.3, abs=0.1)
+
+    def test_broadcasts_one_origin_to_many(self):
+        """Test a single origin against an array of destinations."""
+        from app.geo.distance import haversine_km
+
+        distances = haversine_km(37.5796, 126.9770, [37.5796, 37.5512], [126.9770, 126.9882])
+
+        assert distances.shape == (2,)
+        assert distances[0] == pytest.approx(0.0)
+
+    def test_matrix_is_symmetric_with_zero_diagonal(self):
+        """Test pairwise matrix properties."""
+        import numpy as np
+
+        from app.geo.distance import haversine_matrix
+
+        matrix = haversine_matrix([37.5796, 37.5512, 37.5240], [126.9770, 126.9882, 126.9803])
+
+        assert matrix.shape == (3, 3)
+        assert np.allclose(matrix, matrix.T)
+        assert np.allclose(np.diag(matrix), 0.0)
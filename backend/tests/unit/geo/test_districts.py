@@ -0,0 +1,82 @@
+"""Test offline reverse geocoding to Seoul districts."""
+
+import pytest
+
+
+class TestLookupDistrict:
+    """Test coordinate → district lookup."""
+
+    @pytest.mark.parametrize(
+        ("latitude", "longitude", "expected"),
+        [
+            (37.5796, 126.9770, "종로구"),  # 경복궁
+            (37.5636, 126.9869, "중구"),  # 명동
+            (37.5240, 126.9803, "용산구"),  # 국립중앙박물관
+            (37.5111, 127.0982, "송파구"),  # 롯데월드
+            (37.5116, 127.0595, "강남구"),  # 코엑스
+            (37.5563, 126.9220, "마포구"),  # 홍대입구
+            (37.5219, 126.9245, "영등포구"),  # 여의도
+            (37.5822, 127.0019, "종로구"),  # 혜화역 (대학로)
+            (37.5701, 126.9996, "종로구"),  # 광장시장
+            (37.5199, 126.9403, "영등포구"),  # 63빌딩
+            (37.5142, 126.9425, "동작구"),  # 노량진역
+            (37.5088, 126.8912, "구로구"),  # 신도림역
+            (37.4815, 126.8827, "금천구"),  # 가산디지털단지역
+            (37.5512, 126.9882, "용산구"),  # N서울타워
+            (37.5672, 127.0095, "중구"),  # 동대문디자인플라자
+            (37.5884, 127.0060, "성북구"),  # 한성대입구역
+            (37.6133, 127.0300, "강북구"),  # 미아사거리역
+            (37.5604, 127.1300, "강동구"),  # 암사동 유적
+        ],
+    )
+    def test_landmarks(self, latitude, longitude, expected):
+        """Test well-known landmarks resolve to their district."""
+        from app.geo.districts import lookup_district
+
+        assert lookup_district(latitude, longitude) == expected
+
+    def test_districts_do_not_overlap(self):
+        """Test no point on a grid over Seoul lies in two district polygons."""
+        from app.geo.districts import SEOUL_DISTRICT_BOUNDARIES, point_in_polygon
+
+        assert len(SEOUL_DISTRICT_BOUNDARIES) == 25
+        for i in range(0, 200, 3):
+            for j in range(0, 300, 3):
+                latitude, longitude = 37.43 + i * 0.0014, 126.77 + j * 0.0014
+                matches = [
+                    name for name, polygon in SEOUL_DISTRICT_BOUNDARIES.items()
+                    if point_in_polygon(latitude, longitude, polygon)
+                ]
+                assert len(matches) <= 1, (latitude, longitude, matches)
+
+    def test_outside_seoul(self):
+        """Test coordinates outside the Seoul boundary return None."""
+        from app.geo.districts import lookup_district
+
+        assert lookup_district(37.4563, 126.7052) is None  # 인천
+        assert lookup_district(37.2636, 127.0286) is None  # 수원
+
+    def test_missing_coordinates(self):
+        """Test missing coordinates return None."""
+        from app.geo.districts import lookup_district
+
+        assert lookup_district(None, 126.97) is None
+
+
+class TestResolveDistrict:
+    """Test address-first district resolution."""
+
+    def test_prefers_address(self):
+        """Test address district wins over coordinates."""
+        from app.geo.districts import resolve_district
+
+        district = resolve_district(37.5796, 126.9770, "서울특별시 용산구 한강대로40길 46")
+
+        assert district == "용산구"
+
+    def test_falls_back_to_coordinates(self):
+        """Test missing or malformed addresses use the coordinate lookup."""
+        from app.geo.districts import resolve_district
+
+        assert resolve_district(37.5796, 126.9770, None) == "종로구"
+        assert resolve_district(37.5796, 126.9770, "경복궁") == "종로구"
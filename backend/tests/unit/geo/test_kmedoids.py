@@ -0,0 +1,63 @@
+"""Test vectorized k-medoids clustering."""
+
+
+def _two_blobs():
+    """Six points: three around Jongno, three around Gangnam."""
+    latitudes = [37.5796, 37.5794, 37.5740, 37.5116, 37.5172, 37.4979]
+    longitudes = [126.9770, 126.9910, 126.9856, 127.0595, 127.0473, 127.0276]
+    return latitudes, longitudes
+
+
+class TestKMedoids:
+    """Test k_medoids."""
+
+    def test_separates_distant_groups(self):
+        """Test two well-separated blobs end up in different clusters."""
+        from app.geo.distance import haversine_matrix
+        from app.geo.kmedoids import k_medoids
+
+        labels, medoids = k_medoids(haversine_matrix(*_two_blobs()), k=2)
+
+        assert len(medoids) == 2
+        assert len(set(labels[:3])) == 1
+        assert len(set(labels[3:])) == 1
+        assert labels[0] != labels[3]
+
+    def test_balanced_caps_cluster_size(self):
+        """Test balanced mode keeps clusters at ceil(n / k)."""
+        import numpy as np
+
+        from app.geo.distance import haversine_matrix
+        from app.geo.kmedoids import k_medoids
+
+        latitudes, longitudes = _two_blobs()
+        # Five points near Jongno and one in Gangnam
+        latitudes[3:5] = [37.5800, 37.5780]
+        longitudes[3:5] = [126.9800, 126.9830]
+
+        labels, _ = k_medoids(haversine_matrix(latitudes, longitudes), k=3, balanced=True)
+
+        assert np.bincount(labels, minlength=3).max() <= 2
+
+    def test_more_clusters_than_points(self):
+        """Test k is clamped to the number of points."""
+        from app.geo.distance import haversine_matrix
+        from app.geo.kmedoids import k_medoids
+
+        labels, medoids = k_medoids(haversine_matrix([37.57, 37.51], [126.97, 127.05]), k=5)
+
+        assert len(medoids) == 2
+        assert sorted(labels.tolist()) == [0, 1]
+
+    def test_deterministic(self):
+        """Test repeated runs give identical results."""
+        from app.geo.distance import haversine_matrix
+        from app.geo.kmedoids import k_medoids
+
+        distances = haversine_matrix(*_two_blobs())
+
+        first = k_medoids(distances, k=2, balanced=True)
+        second = k_medoids(distances, k=2, balanced=True)
+
+        assert first[0].tolist() == second[0].tolist()
+        assert first[1].tolist() == second[1].tolist()
@@ -0,0 +1,88 @@
+"""Test hierarchical map marker clustering."""
+
+import random
+
+SEOUL_BBOX = (37.40, 126.70, 37.75, 127.25)
+
+
+def _random_points(count, seed=7):
+    rng = random.Random(seed)
+    return [
+        (37.45 + rng.random() * 0.25, 126.80 + rng.random() * 0.40, 1000 + i)
+        for i in range(count)
+    ]
+
+
+class TestKDBush:
+    """Test the static KD-tree."""
+
+    def test_range_matches_brute_force(self):
+        """Test box query returns exactly the points inside the box."""
+        import numpy as np
+
+        from app.geo.kdbush import KDBush
+
+        rng = np.random.default_rng(0)
+        xs, ys = rng.random(500), rng.random(500)
+        index = KDBush(xs, ys, node_size=8)
+
+        found = sorted(index.range(0.2, 0.3, 0.5, 0.6))
+        expected = [i for i in range(500) if 0.2 <= xs[i] <= 0.5 and 0.3 <= ys[i] <= 0.6]
+        assert found == expected
+
+    def test_within_radius(self):
+        """Test radius query excludes box corners."""
+        import numpy as np
+
+        from app.geo.kdbush import KDBush
+
+        index = KDBush(np.array([0.0, 1.0, 0.8]), np.array([0.0, 0.0, 0.8]))
+
+        assert sorted(index.within(0.0, 0.0, 1.0)) == [0, 1]
+
+
+class TestSupercluster:
+    """Test Supercluster index."""
+
+    def test_counts_are_preserved_at_every_zoom(self):
+        """Test every zoom level accounts for all points exactly once."""
+        from app.geo.supercluster import Supercluster
+
+        points = _random_points(300)
+        index = Supercluster(points)
+
+        for zoom in (0, 8, 11, 14, 17):
+            features = index.get_clusters(SEOUL_BBOX, zoom)
+            assert sum(f.count for f in features) == len(points)
+
+    def test_clusters_shrink_as_zoom_increases(self):
+        """Test low zoom returns fewer markers than high zoom."""
+        from app.geo.supercluster import Supercluster
+
+        index = Supercluster(_random_points(300))
+
+        low = index.get_clusters(SEOUL_BBOX, 9)
+        high = index.get_clusters(SEOUL_BBOX, 17)
+
+        assert len(low) < len(high)
+        assert len(high) == 300
+        assert all(not f.is_cluster for f in high)
+
+    def test_cluster_expansion_zoom(self):
+        """Test clusters report a zoom above their current one."""
+        from app.geo.supercluster import Supercluster
+
+        index = Supercluster(_random_points(300))
+
+        clusters = [f for f in index.get_clusters(SEOUL_BBOX, 10) if f.is_cluster]
+        assert clusters
+        assert all(f.expansion_zoom > 10 for f in clusters)
+
+    def test_single_points_keep_caller_ids(self):
+        """Test unclustered features return the supplied point IDs."""
+        from app.geo.supercluster import Supercluster
+
+        index = Supercluster([(37.5796, 126.9770, 1), (37.5240, 126.9803, 2)])
+
+        features = index.get_clusters(SEOUL_BBOX, 16)
+        assert sorted(f.point_id for f in features) == [1, 2]
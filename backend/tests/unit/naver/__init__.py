@@ -0,0 +1 @@
+"""Naver API client unit tests."""
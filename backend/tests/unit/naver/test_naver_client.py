@@ -0,0 +1,91 @@
+"""Test NaverLocalClient radius filtering."""
+
+import pytest
+
+
+def _place(title, latitude, longitude):
+    return {
+        "title": title,
+        "roadAddress": f"서울특별시 {title}",
+        "latitude": latitude,
+        "longitude": longitude,
+    }
+
+
+@pytest.fixture
+def naver_client(monkeypatch):
+    """Client whose search_local returns canned pages."""
+    from app.naver.client import NaverLocalClient
+
+    client = NaverLocalClient(client_id="test-id", client_secret="test-secret")
+    pages = {
+        ("random", 1): [
+            _place("far", 37.6500, 127.0500),
+            _place("near", 37.5800, 126.9780),
+        ],
+        ("comment", 1): [
+            _place("near", 37.5800, 126.9780),  # duplicate across sort orders
+            _place("closest", 37.5797, 126.9771),
+            _place("mid", 37.5850, 126.9800),
+        ],
+    }
+
+    async def fake_search_local(query, display=5, start=1, sort="random"):
+        if start > 1:
+            raise RuntimeError("start offset not supported")
+        return [dict(item) for item in pages.get((sort, start), [])]
+
+    monkeypatch.setattr(client, "search_local", fake_search_local)
+    return client
+
+
+class TestNaverRadiusSearch:
+    """Test haversine radius filtering in nearby searches."""
+
+    async def test_filters_by_radius_and_sorts_by_distance(self, naver_client):
+        """Test results are within radius, deduplicated and nearest first."""
+        results = await naver_client.search_nearby_restaurants(
+            latitude=37.5796, longitude=126.9770, radius_km=1.0, limit=5
+        )
+
+        assert [r["title"] for r in results] == ["closest", "near", "mid"]
+        assert all(r["distance_km"] <= 1.0 for r in results)
+        assert results == sorted(results, key=lambda r: r["distance_km"])
+
+    async def test_limit_applies_after_sorting(self, naver_client):
+        """Test limit keeps the nearest results."""
+        results = await naver_client.search_nearby_accommodations(
+            latitude=37.5796, longitude=126.9770, radius_km=20.0, limit=2
+        )
+
+        assert [r["title"] for r in results] == ["closest", "near"]
+
+    async def test_location_keyword_is_prepended(self, naver_client, monkeypatch):
+        """Test area keyword is added to the Naver query."""
+        queries = []
+
+        async def recording_search_local(query, display=5, start=1, sort="random"):
+            queries.append(query)
+            return []
+
+        monkeypatch.setattr(naver_client, "search_local", recording_search_local)
+
+        await naver_client.search_nearby_restaurants(
+            latitude=37.5796, longitude=126.9770, location_keyword="종로구"
+        )
+
+        assert set(queries) == {"종로구 맛집"}
+
+    async def test_requests_only_the_first_page(self, naver_client, monkeypatch):
+        """Test only start=1 is requested (Naver rejects other offsets), once per sort order."""
+        requests = []
+
+        async def recording_search_local(query, display=5, start=1, sort="random"):
+            requests.append((sort, start))
+            return []
+
+        monkeypatch.setattr(naver_client, "search_local", recording_search_local)
+
+        await naver_client.search_nearby_restaurants(latitude=37.5796, longitude=126.9770)
+
+        assert sorted(requests) == [("comment", 1), ("random", 1)]
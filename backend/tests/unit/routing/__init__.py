@@ -0,0 +1 @@
+"""Routing client unit tests."""
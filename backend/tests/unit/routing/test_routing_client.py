@@ -0,0 +1,136 @@
+"""Test the batched, cached routing client against the in-repo fake server."""
+
+from datetime import datetime
+
+import httpx
+import pytest
+
+GYEONGBOKGUNG = (37.5796, 126.9770)
+COEX = (37.5116, 127.0595)
+N_SEOUL_TOWER = (37.5512, 126.9882)
+GWANGHWAMUN = (37.5760, 126.9769)
+
+
+@pytest.fixture
+def fake_routing():
+    """Fake routing app and an HTTP client bound to it in-process."""
+    from app.routing.fake_server import create_fake_routing_app
+
+    app = create_fake_routing_app()
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app))
+    return app, client
+
+
+def _client(http_client, backend="odsay", **kwargs):
+    from app.routing import KakaoMobilityBackend, ODsayBackend, RoutingClient
+
+    backend_cls = ODsayBackend if backend == "odsay" else KakaoMobilityBackend
+    return RoutingClient(
+        backend_cls(api_key="test", base_url="http://fake"),
+        http_client=http_client,
+        **kwargs,
+    )
+
+
+class TestRoutingClient:
+    """Test RoutingClient batching, deduplication and caching."""
+
+    async def test_batch_deduplicates_legs(self, fake_routing):
+        """Test identical legs in one batch hit the server once."""
+        from app.routing import Leg
+
+        app, http_client = fake_routing
+        client = _client(http_client)
+        leg = Leg(GYEONGBOKGUNG, COEX, datetime(2025, 7, 1, 10, 0))
+
+        results = await client.batch([leg, leg, Leg(COEX, N_SEOUL_TOWER)])
+
+        assert results[0] == results[1] > 0
+        assert app.state.request_count == 2
+        assert client.stats.deduplicated == 1
+
+    async def test_cache_key_uses_cells_and_time_buckets(self, fake_routing):
+        """Test nearby points in the same time bucket share a cache entry."""
+        from app.routing import Leg
+
+        app, http_client = fake_routing
+        client = _client(http_client)
+
+        await client.batch([Leg(GYEONGBOKGUNG, COEX, datetime(2025, 7, 1, 10, 5))])
+        nearby = (GYEONGBOKGUNG[0] + 0.0002, GYEONGBOKGUNG[1])
+        await client.batch([Leg(nearby, COEX, datetime(2025, 7, 2, 10, 40))])
+        await client.batch([Leg(GYEONGBOKGUNG, COEX, datetime(2025, 7, 1, 18, 0))])
+
+        assert client.stats.cache_hits == 1
+        assert app.state.request_count == 2
+
+    async def test_walkable_legs_stay_local(self, fake_routing):
+        """Test short legs are estimated without an upstream request."""
+        from app.routing import Leg
+
+        app, http_client = fake_routing
+        client = _client(http_client)
+
+        [minutes] = await client.batch([Leg(GYEONGBOKGUNG, GWANGHWAMUN)])
+
+        assert minutes > 0
+        assert app.state.request_count == 0
+        assert client.stats.walking == 1
+
+    async def test_failures_fall_back_to_estimate(self):
+        """Test upstream errors are estimated and not cached."""
+        from app.routing import Leg
+
+        def fail(request):
+            return httpx.Response(500)
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(fail))
+        client = _client(http_client)
+
+        [minutes] = await client.batch([Leg(GYEONGBOKGUNG, COEX)])
+
+        assert minutes > 0
+        assert client.stats.upstream_failures == 1
+        assert len(client.cache) == 0
+
+    async def test_kakao_backend(self, fake_routing):
+        """Test Kakao Mobility responses are converted to minutes."""
+        from app.routing import Leg
+
+        _, http_client = fake_routing
+        client = _client(http_client, backend="kakao")
+
+        [minutes] = await client.batch([Leg(GYEONGBOKGUNG, COEX, datetime(2025, 7, 1, 10, 0))])
+
+        assert 15 < minutes < 60
+
+
+class TestItineraryLegs:
+    """Test itinerary_legs."""
+
+    def test_builds_legs_between_located_activities(self):
+        """Test legs link adjacent located activities, keyed by destination position."""
+        from app.routing import itinerary_legs
+
+        coords = {"경복궁": GYEONGBOKGUNG, "코엑스": COEX, "남산타워": N_SEOUL_TOWER}
+        plan = {
+            "itinerary": [
+                {
+                    "day": 1,
+                    "date": "2025-07-01",
+                    "activities": [
+                        {"time": "09:00", "venue_name": "경복궁", "duration_minutes": 90},
+                        {"time": "11:00", "venue_name": "코엑스", "duration_minutes": 30},
+                        {"time": "13:00", "venue_name": "어딘가", "duration_minutes": 60},
+                        {"time": "15:00", "venue_name": "남산타워", "duration_minutes": 60},
+                    ],
+                }
+            ]
+        }
+
+        legs = itinerary_legs(plan, coords.get)
+
+        assert list(legs) == [(1, 1)]
+        assert legs[(1, 1)].origin == GYEONGBOKGUNG
+        assert legs[(1, 1)].destination == COEX
+        assert legs[(1, 1)].departure == datetime(2025, 7, 1, 10, 30)
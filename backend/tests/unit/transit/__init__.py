@@ -0,0 +1 @@
+"""Transit travel-time unit tests."""
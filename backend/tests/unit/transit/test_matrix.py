@@ -0,0 +1,91 @@
+"""Test the precomputed transit travel-time matrix."""
+
+import numpy as np
+import pytest
+
+ATTRACTIONS = [
+    {"id": 3, "latitude": 37.5116, "longitude": 127.0595},  # 코엑스
+    {"id": 1, "latitude": 37.5796, "longitude": 126.9770},  # 경복궁
+    {"id": 2, "latitude": 37.5794, "longitude": 126.9910},  # 창덕궁
+    {"id": 4, "latitude": None, "longitude": None},
+]
+
+
+class TestEstimateTravelMinutes:
+    """Test estimate_travel_minutes."""
+
+    def test_walking_and_transit_legs(self):
+        """Test short legs are walked and long legs pay transit overhead."""
+        from app.transit.estimator import estimate_travel_minutes
+
+        minutes = estimate_travel_minutes([0.0, 0.5, 5.0])
+
+        assert minutes[0] == 0
+        assert 5 <= minutes[1] <= 10
+        assert minutes[2] > minutes[1]
+
+
+class TestTravelTimeMatrix:
+    """Test building, saving and loading the matrix."""
+
+    async def test_build_with_estimate_provider(self):
+        """Test the matrix covers located attractions in id order."""
+        from app.transit import EstimatedTravelTimeProvider, build_travel_time_matrix
+
+        matrix = await build_travel_time_matrix(ATTRACTIONS, EstimatedTravelTimeProvider())
+
+        assert matrix.ids == [1, 2, 3]
+        assert matrix.minutes.dtype == np.uint16
+        assert matrix.get(1, 1) == 0
+        assert matrix.get(1, 2) < matrix.get(1, 3)
+        assert matrix.get(1, 3) == matrix.get(3, 1)
+        assert matrix.get(1, 4) is None
+
+    async def test_save_and_load_memory_mapped(self, tmp_path):
+        """Test a saved matrix round-trips as a read-only memmap."""
+        from app.transit import (
+            EstimatedTravelTimeProvider,
+            TravelTimeMatrix,
+            build_travel_time_matrix,
+        )
+
+        matrix = await build_travel_time_matrix(ATTRACTIONS, EstimatedTravelTimeProvider())
+        matrix.save(tmp_path)
+
+        loaded = TravelTimeMatrix.load(tmp_path)
+
+        assert isinstance(loaded.minutes, np.memmap)
+        assert loaded.ids == matrix.ids
+        assert loaded.provider == "estimate"
+        assert loaded.get(2, 3) == matrix.get(2, 3)
+
+    def test_shape_mismatch_raises(self):
+        """Test ids and array shape must agree."""
+        from app.transit import TravelTimeMatrix
+
+        with pytest.raises(ValueError):
+            TravelTimeMatrix([1, 2], np.zeros((3, 3), dtype=np.uint16))
+
+
+class TestTravelMinutes:
+    """Test travel_minutes lookups."""
+
+    def test_prefers_matrix_for_attractions(self):
+        """Test matrix values win over estimates when both ids are known."""
+        from app.transit import TravelTimeMatrix, travel_minutes
+
+        matrix = TravelTimeMatrix([1, 3], np.array([[0, 42], [42, 0]], dtype=np.uint16))
+
+        assert travel_minutes(ATTRACTIONS[1], ATTRACTIONS[0], matrix=matrix) == 42
+
+    def test_falls_back_to_estimate_for_unknown_venues(self):
+        """Test venues outside the matrix (e.g. restaurants) use coordinates."""
+        from app.transit import TravelTimeMatrix, travel_minutes
+
+        matrix = TravelTimeMatrix([1], np.zeros((1, 1), dtype=np.uint16))
+        restaurant = {"name": "삼청동 식당", "latitude": 37.5830, "longitude": 126.9820}
+
+        minutes = travel_minutes(ATTRACTIONS[1], restaurant, matrix=matrix)
+
+        assert minutes is not None and minutes > 0
+        assert travel_minutes(ATTRACTIONS[1], ATTRACTIONS[3], matrix=matrix) is None